@@ -1,4 +1,6 @@
+import asyncio
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import logfire
@@ -9,6 +11,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from app.api.endpoints import (
+    ats,
     auth,
     claude_code,  # Main Claude Code endpoints for resume customization
     export,
@@ -19,7 +22,12 @@ from app.api.endpoints import (
 )
 from app.core.config import settings
 from app.core.logging import configure_logging
+from app.core.nltk_init import warm_up_nlp
 from app.db.session import Base, engine
+from app.services.ats.corpus import ensure_job_corpus
+from app.services.ats.executor import get_ats_executor, shutdown_ats_executor
+from app.services.claude_code.scheduler import get_customization_scheduler
+from app.services.diff_service import DIFF_PRECOMPUTER
 
 # Configure Logfire - this is just the basic configuration
 # The main.py file will handle the full instrumentation setup
@@ -46,6 +54,25 @@ templates_dir = Path("./templates")
 static_dir.mkdir(exist_ok=True)
 templates_dir.mkdir(exist_ok=True)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and pre-warm the ATS process pool, and shut down background workers on exit"""
+    # Warm up in the background so startup isn't blocked on worker spawns
+    # or model loads
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(None, get_ats_executor().start)
+    if settings.NLP_WARM_UP_ON_STARTUP:
+        loop.run_in_executor(None, warm_up_nlp)
+    if settings.ATS_CORPUS_WEIGHTING:
+        loop.run_in_executor(None, ensure_job_corpus)
+    yield
+    shutdown_ats_executor()
+    DIFF_PRECOMPUTER.shutdown(wait=False)
+    # Stop queued and running customizations and their Claude Code processes
+    await get_customization_scheduler().shutdown()
+
+
 # Create FastAPI application
 # The actual Logfire instrumentation will be done in main.py
 app = FastAPI(
@@ -57,6 +84,7 @@ app = FastAPI(
     redoc_url=f"{settings.API_V1_STR}/redoc",
     # Increased timeout limits to support longer customization operations (30 minutes)
     default_response_class=JSONResponse,
+    lifespan=lifespan,
     # Add more parameters for timeout handling
 )
 
@@ -92,6 +120,7 @@ api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(resumes.router, prefix="/resumes", tags=["resumes"])
 api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
 api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(ats.router, prefix="/ats", tags=["ats"])
 api_router.include_router(
     requirements.router, prefix="/requirements", tags=["requirements"]
 )
@@ -0,0 +1,247 @@
+import json
+from typing import Any, Tuple
+
+import logfire
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.nltk_init import NLP_REGISTRY
+from app.core.security import get_optional_current_user
+from app.db.session import get_db
+from app.models.job import JobDescription
+from app.models.resume import Resume, ResumeVersion
+from app.models.user import User
+from app.schemas.ats import (
+    ATSAnalysisRequest,
+    ATSAnalysisResult,
+    BatchATSRequest,
+    BatchATSResponse,
+)
+from app.services.ats.executor import (
+    analyze_resume_for_ats,
+    get_ats_executor,
+    run_ats_analysis,
+    stream_ats_analysis,
+)
+from app.services.ats_service import analyze_resume_for_ats_batch
+
+router = APIRouter()
+
+
+def _get_analysis_inputs(
+    request: ATSAnalysisRequest, db: Session, current_user: User
+) -> Tuple[ResumeVersion, JobDescription]:
+    """Load the resume version and job description to analyze, checking access"""
+    resume = db.query(Resume).filter(Resume.id == request.resume_id).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    # Check ownership if user is authenticated and the resume belongs to a user
+    if current_user and resume.user_id and resume.user_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to access this resume"
+        )
+
+    query = db.query(ResumeVersion).filter(ResumeVersion.resume_id == request.resume_id)
+    if request.version_id is not None:
+        version = query.filter(ResumeVersion.id == request.version_id).first()
+    else:
+        version = query.order_by(ResumeVersion.version_number.desc()).first()
+    if not version:
+        raise HTTPException(status_code=404, detail="Resume version not found")
+
+    job = (
+        db.query(JobDescription)
+        .filter(JobDescription.id == request.job_description_id)
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job description not found")
+    if current_user and job.user_id and job.user_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to access this job description"
+        )
+
+    return version, job
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format a server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+@router.post("/analyze", response_model=ATSAnalysisResult)
+async def analyze_resume(
+    request: ATSAnalysisRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """
+    Score a resume version against a job description.
+
+    - **resume_id**: ID of the resume to score
+    - **job_description_id**: ID of the job description to score against
+    - **version_id**: Optional resume version; defaults to the latest version
+    - **incremental**: Only recompute the sections that changed since an
+      earlier analysis (intended for editors re-scoring on every save)
+    """
+    version, job = _get_analysis_inputs(request, db, current_user)
+
+    return await analyze_resume_for_ats(
+        version.content, job.description, db, incremental=request.incremental
+    )
+
+
+@router.post("/analyze/stream")
+async def analyze_resume_stream(
+    request: ATSAnalysisRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """
+    Score a resume version against a job description, streaming each stage.
+
+    Takes the same request as `/analyze` and responds with server-sent
+    events, so the score can be shown before the suggestions are ready:
+
+    - **score**: match_score, confidence, job_type, keyword_density and bm25_score
+    - **sections**: section_scores
+    - **keywords**: matching_keywords and missing_keywords
+    - **improvements**: improvements
+    - **complete**: the full analysis result, as returned by `/analyze`
+
+    If the analysis fails partway through, an **error** event with a
+    `detail` message ends the stream.
+    """
+    version, job = _get_analysis_inputs(request, db, current_user)
+    resume_content, job_description = version.content, job.description
+
+    async def events():
+        try:
+            async for stage, data in stream_ats_analysis(
+                resume_content, job_description, db, incremental=request.incremental
+            ):
+                if stage == "complete":
+                    # Same shape as the /analyze response
+                    data = ATSAnalysisResult.model_validate(data)
+                yield _sse_event(stage, data)
+        except Exception as e:
+            logfire.error("Streaming ATS analysis failed", error=str(e))
+            yield _sse_event("error", {"detail": "ATS analysis failed"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/batch", response_model=BatchATSResponse)
+async def analyze_resume_batch(
+    request: BatchATSRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """
+    Score the latest version of a resume against many job descriptions.
+
+    - **resume_id**: ID of the resume to score
+    - **job_description_ids**: Optional job descriptions to score against.
+      Defaults to all job descriptions accessible to the caller.
+    - **limit**: Optional number of top-ranked results to return
+    """
+    resume = db.query(Resume).filter(Resume.id == request.resume_id).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    # Check ownership if user is authenticated and the resume belongs to a user
+    if current_user and resume.user_id and resume.user_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to access this resume"
+        )
+
+    latest_version = (
+        db.query(ResumeVersion)
+        .filter(ResumeVersion.resume_id == request.resume_id)
+        .order_by(ResumeVersion.version_number.desc())
+        .first()
+    )
+    if not latest_version:
+        raise HTTPException(status_code=404, detail="Resume has no versions")
+
+    query = db.query(JobDescription)
+    if request.job_description_ids is not None:
+        query = query.filter(JobDescription.id.in_(request.job_description_ids))
+    elif current_user:
+        query = query.filter(JobDescription.user_id == current_user.id)
+    else:
+        query = query.filter(JobDescription.user_id.is_(None))
+    jobs = query.all()
+
+    if request.job_description_ids is not None:
+        found_ids = {job.id for job in jobs}
+        missing_ids = [
+            job_id for job_id in request.job_description_ids if job_id not in found_ids
+        ]
+        if missing_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Job descriptions not found: {', '.join(missing_ids)}",
+            )
+        if current_user and any(
+            job.user_id and job.user_id != current_user.id for job in jobs
+        ):
+            raise HTTPException(
+                status_code=403,
+                detail="Not authorized to access these job descriptions",
+            )
+
+    # Scoring is CPU-bound, so it runs in the ATS process pool
+    results = await run_ats_analysis(
+        analyze_resume_for_ats_batch,
+        (latest_version.content, [(job.id, job.description) for job in jobs]),
+        [job.description for job in jobs],
+        db,
+    )
+
+    jobs_by_id = {job.id: job for job in jobs}
+    for result in results:
+        job = jobs_by_id[result["job_description_id"]]
+        result["title"] = job.title
+        result["company"] = job.company
+
+    # Per-result times are amortized, so their sum is the batch time
+    processing_time = sum(result["processing_time"] for result in results)
+
+    if request.limit is not None:
+        results = results[: request.limit]
+
+    return BatchATSResponse(
+        resume_id=request.resume_id,
+        job_count=len(jobs),
+        results=results,
+        processing_time=processing_time,
+    )
+
+
+@router.get("/executor/metrics")
+def get_executor_metrics():
+    """
+    Get ATS process pool metrics for sizing the pool.
+
+    Includes queue depth, active workers, utilization and task timings.
+    """
+    return get_ats_executor().metrics()
+
+
+@router.get("/nlp/status")
+def get_nlp_status():
+    """
+    Get the NLP resources loaded in the API process.
+
+    Lists each NLTK and spaCy resource loaded so far, whether it is
+    available and how long it took to load.
+    """
+    return {"resources": NLP_REGISTRY.report()}
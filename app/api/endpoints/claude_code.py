@@ -29,6 +29,11 @@ from app.services.claude_code.executor import (
     get_claude_code_executor,
 )
 from app.services.claude_code.progress_tracker import progress_tracker
+from app.services.claude_code.scheduler import (
+    CustomizationCancelledError,
+    QueueFullError,
+    get_customization_scheduler,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -66,6 +71,7 @@ async def customize_resume(
     request: ClaudeCodeCustomizeRequest,
     x_operation_timeout: Optional[int] = Header(None, ge=60, le=1800),  # 1-30 min range
     x_operation_id: Optional[str] = Header(None),  # Operation ID for tracking
+    x_priority: Optional[int] = Header(None, ge=0, le=10),  # Higher runs sooner
     db: Session = Depends(get_db),
     # current_user: User = Depends(deps.get_current_user),
 ):
@@ -74,11 +80,13 @@ async def customize_resume(
 
     This endpoint executes the customization synchronously and returns the result directly.
     For long-running operations, consider using the async endpoint instead.
+    The request waits in the customization queue while all worker slots are busy.
 
     Args:
         request: Resume and job description for customization
         x_operation_timeout: Optional custom timeout in seconds (60-1800s, default: 900s)
         x_operation_id: Optional operation ID for tracking/logging
+        x_priority: Optional queue priority (0-10, default 0); higher starts sooner
         db: Database session
 
     Returns:
@@ -157,13 +165,19 @@ async def customize_resume(
         else:
             logger.info(f"Using existing progress tracker task with ID: {task_id}")
 
-        # Execute the customization with logs and timeout
-        result = executor.customize_resume(
-            resume_path=resume_path,
-            job_description_path=job_description_path,
-            output_path=output_path,
-            task_id=task_id,
-            timeout=timeout_seconds,
+        # Execute the customization with logs and timeout once a worker slot
+        # is free, without blocking the event loop while Claude Code runs
+        task.update("queued", 0, "Waiting for a free customization slot")
+        result = await get_customization_scheduler().run(
+            task_id,
+            lambda: executor.customize_resume_async(
+                resume_path=resume_path,
+                job_description_path=job_description_path,
+                output_path=output_path,
+                task_id=task_id,
+                timeout=timeout_seconds,
+            ),
+            priority=x_priority or 0,
         )
 
         # Read the output files
@@ -189,6 +203,13 @@ async def customize_resume(
             "customization_id": customization_id,
         }
 
+    except QueueFullError as e:
+        logger.warning(f"Rejected customization: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
+
+    except CustomizationCancelledError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
     except ClaudeCodeExecutionError as e:
         logger.error(f"Claude Code customization error: {str(e)}")
         # Log to console for real-time visibility
@@ -226,17 +247,21 @@ async def customize_resume_async(
     request: ClaudeCodeCustomizeRequest,
     x_operation_timeout: Optional[int] = Header(None, ge=60, le=1800),  # 1-30 min range
     x_operation_id: Optional[str] = Header(None),  # Operation ID for tracking
+    x_priority: Optional[int] = Header(None, ge=0, le=10),  # Higher runs sooner
     db: Session = Depends(get_db),
 ):
     """
     Start an asynchronous resume customization task.
 
     This endpoint returns immediately with a task ID for tracking progress.
-    Uses a default timeout of 900 seconds (15 minutes).
+    Uses a default timeout of 900 seconds (15 minutes). The task waits in the
+    customization queue while all worker slots are busy; its status reports
+    the queue position and an ETA.
 
     Args:
         request: Resume customization request
         x_operation_timeout: Optional custom timeout in seconds (60-1800s, default: 900s)
+        x_priority: Optional queue priority (0-10, default 0); higher starts sooner
         db: Database session
 
     Returns:
@@ -279,12 +304,17 @@ async def customize_resume_async(
             resume_path=resume_path,
             job_description_path=job_description_path,
             output_path=output_path,
-            timeout=timeout_seconds
+            timeout=timeout_seconds,
+            priority=x_priority or 0,
         )
         
         # The executor handles everything in the background
         return {"task_id": result["task_id"], "status": "processing"}
 
+    except QueueFullError as e:
+        logger.warning(f"Rejected customization: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
+
     except Exception as e:
         logger.error(f"Error starting async customization: {str(e)}")
         raise HTTPException(
@@ -336,6 +366,11 @@ async def get_customize_status(
     if status_data.get("error"):
         response_data["error"] = status_data["error"]
 
+    # Place in line and expected completion while queued or running
+    scheduler = get_customization_scheduler()
+    response_data["queue_position"] = scheduler.position(task_id)
+    response_data["eta_seconds"] = scheduler.eta_seconds(task_id)
+
     if include_logs:
         logs = log_streamer.get_logs(task_id, max_logs=max_logs)
         response_data["logs"] = logs
@@ -347,6 +382,35 @@ async def get_customize_status(
     return response_data
 
 
+@router.post("/customize-resume/cancel/{task_id}", response_model=QueuedTaskResponse)
+async def cancel_customization(task_id: str):
+    """
+    Cancel a queued or running customization task.
+
+    A queued task is removed from the queue; a running task has its
+    Claude Code process terminated.
+
+    Args:
+        task_id: ID of the task to cancel
+
+    Returns:
+        The task ID with status "cancelled"
+    """
+    task = progress_tracker.get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    cancelled_while = get_customization_scheduler().cancel(task_id)
+    if cancelled_while is None:
+        raise HTTPException(
+            status_code=409, detail=f"Task is not queued or running (status: {task.status})"
+        )
+
+    task.update("cancelled", message=f"Cancelled while {cancelled_while}")
+    logger.info(f"Cancelled customization {task_id} while {cancelled_while}")
+    return {"task_id": task_id, "status": "cancelled"}
+
+
 import threading
 
 
@@ -356,6 +420,7 @@ async def customize_resume_with_task(
     request: ClaudeCodeCustomizeRequest,
     x_operation_timeout: Optional[int] = Header(None, ge=60, le=1800),
     x_operation_id: Optional[str] = Header(None),
+    x_priority: Optional[int] = Header(None, ge=0, le=10),
     db: Session = Depends(get_db),
 ):
     """
@@ -369,6 +434,7 @@ async def customize_resume_with_task(
         request: Resume customization request
         x_operation_timeout: Optional custom timeout in seconds
         x_operation_id: Optional operation ID for tracking
+        x_priority: Optional queue priority (0-10, default 0)
         db: Database session
 
     Returns:
@@ -379,5 +445,6 @@ async def customize_resume_with_task(
         request=request,
         x_operation_timeout=x_operation_timeout,
         x_operation_id=x_operation_id,
+        x_priority=x_priority,
         db=db,
     )
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.security import get_optional_current_user
@@ -14,6 +14,7 @@ from app.schemas.job import (
     JobDescriptionCreate,
     JobDescriptionUpdate,
 )
+from app.services.ats.corpus import sync_job_corpus
 
 router = APIRouter()
 
@@ -23,6 +24,7 @@ router = APIRouter()
 )
 def create_job_description(
     job: JobDescriptionCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_optional_current_user),
 ):
@@ -48,6 +50,9 @@ def create_job_description(
     db.commit()
     db.refresh(db_job)
 
+    # Corpus statistics are updated after the job is saved, off the request path
+    background_tasks.add_task(sync_job_corpus, db.get_bind(), added=db_job.description)
+
     return db_job
 
 
@@ -109,6 +114,7 @@ def get_job_description(
 def update_job_description(
     job_id: str,
     job_update: JobDescriptionUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_optional_current_user),
 ):
@@ -133,7 +139,16 @@ def update_job_description(
         db_job.title = job_update.title
     if job_update.company is not None:
         db_job.company = job_update.company
-    if job_update.description is not None:
+    if (
+        job_update.description is not None
+        and job_update.description != db_job.description
+    ):
+        background_tasks.add_task(
+            sync_job_corpus,
+            db.get_bind(),
+            removed=db_job.description,
+            added=job_update.description,
+        )
         db_job.description = job_update.description
 
     db.commit()
@@ -145,6 +160,7 @@ def update_job_description(
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_job_description(
     job_id: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_optional_current_user),
 ):
@@ -161,8 +177,11 @@ def delete_job_description(
             status_code=403, detail="Not authorized to delete this job description"
         )
 
+    description = db_job.description
     db.delete(db_job)
     db.commit()
 
+    background_tasks.add_task(sync_job_corpus, db.get_bind(), removed=description)
+
     return None
 
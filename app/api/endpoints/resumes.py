@@ -1,15 +1,18 @@
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, defer
 
+from app.core.config import settings
 from app.core.security import get_optional_current_user
 from app.db.session import get_db
 from app.models.resume import Resume, ResumeVersion
 from app.models.user import User
 from app.schemas.resume import Resume as ResumeSchema
 from app.schemas.resume import (
+    KeywordTimelineResponse,
     ResumeCreate,
     ResumeDetail,
     ResumeDiffResponse,
@@ -18,10 +21,18 @@ from app.schemas.resume import (
     HtmlDiffResponse,
 )
 from app.schemas.resume import ResumeVersion as ResumeVersionSchema
+from app.repositories.resume import ResumeRepository
+from app.services.diff.cache import DiffCacheKey
 from app.services.diff_service import (
-    generate_resume_diff,
-    get_diff_statistics,
-    DiffGenerator,
+    DIFF_CACHE,
+    DIFF_PRECOMPUTER,
+    KEYWORD_CACHE,
+    configured_diff_generator,
+    get_keyword_timeline,
+    get_version_diff,
+    get_version_html_diff,
+    iter_diff_bundle,
+    iter_diff_html_document,
 )
 
 router = APIRouter()
@@ -273,6 +284,9 @@ def delete_resume(
         )
 
     db.delete(db_resume)
+    # Cached diffs between its versions go with it, in the same transaction
+    DIFF_CACHE.invalidate_resume(resume_id, db)
+    KEYWORD_CACHE.invalidate_resume(resume_id)
     db.commit()
 
     return None
@@ -325,6 +339,11 @@ def create_resume_version(
     db.commit()
     db.refresh(db_version)
 
+    # Diff against the base version now, so the first diff view only reads
+    # the stored result
+    if settings.DIFF_PRECOMPUTE_ON_CREATE and db_version.is_customized:
+        DIFF_PRECOMPUTER.enqueue(db_version.id)
+
     return db_version
 
 
@@ -357,6 +376,39 @@ def get_resume_versions(
     return versions
 
 
+@router.get("/{resume_id}/keywords/timeline", response_model=KeywordTimelineResponse)
+def get_keyword_timeline_for_resume(
+    resume_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """
+    Get the keywords added and removed at each version of a resume.
+
+    Keyword counts are cached per version, so only versions not seen before
+    have their content loaded and analyzed.
+    """
+    db_resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    if not db_resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    # Check ownership if user is authenticated and the resume belongs to a user
+    if current_user and db_resume.user_id and db_resume.user_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to access versions of this resume"
+        )
+
+    versions = (
+        db.query(ResumeVersion)
+        .options(defer(ResumeVersion.content))
+        .filter(ResumeVersion.resume_id == resume_id)
+        .order_by(ResumeVersion.version_number)
+        .all()
+    )
+
+    return {"resume_id": resume_id, "versions": get_keyword_timeline(versions)}
+
+
 @router.get("/{resume_id}/versions/{version_id}", response_model=ResumeVersionSchema)
 def get_resume_version(
     resume_id: str,
@@ -453,52 +505,19 @@ def get_resume_version_diff(
                 status_code=404, detail="Original resume version not found"
             )
     else:
-        # Find the most recent non-customized version before this one
-        original_version = (
-            db.query(ResumeVersion)
-            .filter(
-                ResumeVersion.resume_id == resume_id,
-                ResumeVersion.version_number < customized_version.version_number,
-                ResumeVersion.is_customized == 0,
-            )
-            .order_by(ResumeVersion.version_number.desc())
-            .first()
-        )
+        # Use the most recent non-customized version before this one
+        original_version = ResumeRepository(db).get_base_version(customized_version)
 
         if not original_version:
-            # If no previous non-customized version found, try to find any previous version
-            original_version = (
-                db.query(ResumeVersion)
-                .filter(
-                    ResumeVersion.resume_id == resume_id,
-                    ResumeVersion.version_number < customized_version.version_number,
-                )
-                .order_by(ResumeVersion.version_number.desc())
-                .first()
+            raise HTTPException(
+                status_code=404,
+                detail="No previous version found to compare against",
             )
 
-            if not original_version:
-                raise HTTPException(
-                    status_code=404,
-                    detail="No previous version found to compare against",
-                )
-
-    # Generate the diff content
-    diff_content = generate_resume_diff(
-        original_version.content, customized_version.content
-    )
-
-    # Get diff statistics
-    diff_stats = get_diff_statistics(
-        original_version.content, customized_version.content
-    )
-
-    # Get section-level analysis
-    from app.services.diff_service import analyze_section_changes
-
-    section_analysis = analyze_section_changes(
-        original_version.content, customized_version.content
-    )
+    # Compare once per version pair; repeated views are served from the cache
+    diff = get_version_diff(original_version, customized_version, configured_diff_generator(), db)
+    # Persist a newly computed diff
+    db.commit()
 
     # Return the diff response
     return ResumeDiffResponse(
@@ -506,22 +525,31 @@ def get_resume_version_diff(
         title=db_resume.title,
         original_content=original_version.content,
         customized_content=customized_version.content,
-        diff_content=diff_content,
-        diff_statistics=diff_stats,
-        section_analysis=section_analysis,
+        diff_content=diff["diff_content"],
+        diff_statistics=diff["diff_statistics"],
+        section_analysis=diff["section_analysis"],
         is_diff_view=True,
     )
   
 
-@router.get("/{resume_id}/diff", response_model=HtmlDiffResponse)
-def compare_resume_versions(
+@router.get("/diff-precompute/metrics")
+def get_diff_precompute_metrics():
+    """
+    Get background diff precomputation metrics.
+
+    Includes queue depth, task counts and queue lag.
+    """
+    return DIFF_PRECOMPUTER.metrics()
+
+
+def _get_version_pair(
+    db: Session,
     resume_id: str,
     source_version_id: str,
     target_version_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_optional_current_user),
-):
-    """Return an HTML diff between two resume versions."""
+    current_user: Optional[User],
+) -> Tuple[ResumeVersion, ResumeVersion]:
+    """Load two versions of a resume, checking the resume exists and is accessible."""
     resume = db.query(Resume).filter(Resume.id == resume_id).first()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -543,7 +571,84 @@ def compare_resume_versions(
     if not source_version or not target_version:
         raise HTTPException(status_code=404, detail="Resume version not found")
 
-    diff_html = DiffGenerator().html_diff_view(
-        source_version.content, target_version.content
+    return source_version, target_version
+
+
+@router.get("/{resume_id}/diff", response_model=HtmlDiffResponse)
+def compare_resume_versions(
+    resume_id: str,
+    source_version_id: str,
+    target_version_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """Return an HTML diff between two resume versions."""
+    source_version, target_version = _get_version_pair(
+        db, resume_id, source_version_id, target_version_id, current_user
+    )
+
+    diff_html = get_version_html_diff(
+        source_version, target_version, configured_diff_generator(), db
     )
+    # Persist a newly computed diff
+    db.commit()
     return HtmlDiffResponse(diff_html=diff_html)
+
+
+@router.get("/{resume_id}/diff/document")
+def stream_resume_diff_document(
+    resume_id: str,
+    source_version_id: str,
+    target_version_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """
+    Stream the full HTML diff document between two resume versions.
+
+    The document is sent as it is rendered, so the browser can start
+    displaying it before the whole comparison is finished. A document
+    already in the diff cache is sent as stored.
+    """
+    source_version, target_version = _get_version_pair(
+        db, resume_id, source_version_id, target_version_id, current_user
+    )
+
+    generator = configured_diff_generator()
+    key = DiffCacheKey(source_version.id, target_version.id, f"html:{generator.cache_variant}")
+    cached = DIFF_CACHE.peek(key, db if settings.DIFF_CACHE_PERSIST else None)
+    if cached is not None:
+        chunks = iter([cached])
+    else:
+        chunks = iter_diff_html_document(
+            generator.diff(source_version.content, target_version.content)
+        )
+    return StreamingResponse(chunks, media_type="text/html")
+
+
+@router.get("/{resume_id}/diff/bundle")
+def stream_resume_diff_bundle(
+    resume_id: str,
+    source_version_id: str,
+    target_version_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_optional_current_user),
+):
+    """
+    Stream a ZIP archive of every diff artifact between two resume versions.
+
+    The archive contains the HTML document, the full diff data and
+    statistics as JSON, a Markdown diff and the side-by-side rows, all
+    built from one comparison.
+    """
+    source_version, target_version = _get_version_pair(
+        db, resume_id, source_version_id, target_version_id, current_user
+    )
+
+    diff = configured_diff_generator().diff(source_version.content, target_version.content)
+    filename = f"resume-diff-v{source_version.version_number}-v{target_version.version_number}.zip"
+    return StreamingResponse(
+        iter_diff_bundle(diff),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
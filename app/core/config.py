@@ -55,6 +55,9 @@ class Settings(BaseSettings):
     CLAUDE_CODE_MAX_TIMEOUT: int = int(
         os.getenv("CLAUDE_CODE_MAX_TIMEOUT", "3600")
     )  # 60 minutes max
+    # Customizations running at once; further submissions wait in a queue
+    CLAUDE_CODE_MAX_CONCURRENT: int = int(os.getenv("CLAUDE_CODE_MAX_CONCURRENT", "2"))
+    CLAUDE_CODE_MAX_QUEUE: int = int(os.getenv("CLAUDE_CODE_MAX_QUEUE", "50"))
     ENABLE_FALLBACK: bool = False  # Disable fallback to legacy customization
     FALLBACK_THRESHOLD: int = int(
         os.getenv("FALLBACK_THRESHOLD", "3")
@@ -70,6 +73,64 @@ class Settings(BaseSettings):
     # Database - SQLite only
     DATABASE_URL: str = "sqlite:///./resume_app.db"
 
+    # ATS job description analysis cache
+    ATS_JD_CACHE_SIZE: int = int(os.getenv("ATS_JD_CACHE_SIZE", "512"))
+    # Persist parsed job descriptions in the database so they survive restarts
+    ATS_JD_CACHE_PERSIST: bool = (
+        os.getenv("ATS_JD_CACHE_PERSIST", "true").lower() == "true"
+    )
+
+    # Per-section cache for incremental re-scoring of edited resumes
+    ATS_SECTION_CACHE_SIZE: int = int(os.getenv("ATS_SECTION_CACHE_SIZE", "4096"))
+
+    # Weight job keywords by IDF over the stored job descriptions (BM25)
+    ATS_CORPUS_WEIGHTING: bool = (
+        os.getenv("ATS_CORPUS_WEIGHTING", "true").lower() == "true"
+    )
+    # Below this many job descriptions, document frequencies are too noisy to use
+    ATS_CORPUS_MIN_DOCUMENTS: int = int(os.getenv("ATS_CORPUS_MIN_DOCUMENTS", "20"))
+    ATS_BM25_K1: float = float(os.getenv("ATS_BM25_K1", "1.2"))
+    ATS_BM25_B: float = float(os.getenv("ATS_BM25_B", "0.75"))
+
+    # ATS process pool; analyses run in worker processes off the event loop
+    ATS_PROCESS_POOL_SIZE: int = int(
+        os.getenv("ATS_PROCESS_POOL_SIZE", str(min(4, os.cpu_count() or 1)))
+    )
+    ATS_PROCESS_POOL_START_METHOD: str = os.getenv(
+        "ATS_PROCESS_POOL_START_METHOD", "spawn"
+    )
+
+    # Load NLTK and spaCy resources in the background at startup instead of
+    # on the first request that needs them
+    NLP_WARM_UP_ON_STARTUP: bool = (
+        os.getenv("NLP_WARM_UP_ON_STARTUP", "true").lower() == "true"
+    )
+
+    # spaCy batch processing for keyword extraction
+    SPACY_BATCH_SIZE: int = int(os.getenv("SPACY_BATCH_SIZE", "32"))
+    # Keep at 1 inside the ATS process pool workers
+    SPACY_N_PROCESS: int = int(os.getenv("SPACY_N_PROCESS", "1"))
+
+    # Resume diff backend: "difflib" or "myers" (cost-capped line/word diff)
+    DIFF_BACKEND: str = os.getenv("DIFF_BACKEND", "difflib")
+    # Edit steps the Myers diff searches before reporting a block as replaced
+    DIFF_MAX_COST: int = int(os.getenv("DIFF_MAX_COST", "2000"))
+    # Computed diffs between resume versions, keyed by version pair
+    DIFF_CACHE_SIZE: int = int(os.getenv("DIFF_CACHE_SIZE", "256"))
+    # Persist computed diffs in the database so they survive restarts
+    DIFF_CACHE_PERSIST: bool = (
+        os.getenv("DIFF_CACHE_PERSIST", "true").lower() == "true"
+    )
+    # Keyword counts of resume versions, for keyword timelines
+    KEYWORD_VECTOR_CACHE_SIZE: int = int(os.getenv("KEYWORD_VECTOR_CACHE_SIZE", "1024"))
+    # Compute the diff of a new customized version against its base version
+    # in the background, so the first diff view reads a stored result
+    DIFF_PRECOMPUTE_ON_CREATE: bool = (
+        os.getenv("DIFF_PRECOMPUTE_ON_CREATE", "true").lower() == "true"
+    )
+    DIFF_PRECOMPUTE_WORKERS: int = int(os.getenv("DIFF_PRECOMPUTE_WORKERS", "1"))
+    DIFF_PRECOMPUTE_QUEUE_SIZE: int = int(os.getenv("DIFF_PRECOMPUTE_QUEUE_SIZE", "1000"))
+
     # File size limits
     MAX_UPLOAD_SIZE: int = 5 * 1024 * 1024  # 5MB
 
@@ -0,0 +1,264 @@
+"""
+Lazy NLP resource registry.
+
+NLTK corpora and the spaCy model are expensive to load, and most processes
+(tests, API workers that never hit an NLP endpoint) don't need them. Resources
+are registered by name and loaded on first use, once per process, behind a
+per-resource lock. ``warm_up_nlp`` loads them eagerly for production startup
+and reports what loaded and how long each piece took.
+"""
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import logfire
+
+STOPWORDS_RESOURCE = "nltk:stopwords"
+PUNKT_RESOURCE = "nltk:punkt"
+
+# NLTK resources: registry name -> (package, data path)
+NLTK_RESOURCES = {
+    STOPWORDS_RESOURCE: ("stopwords", "corpora/stopwords"),
+    PUNKT_RESOURCE: ("punkt", "tokenizers/punkt"),
+}
+
+SPACY_MODEL_NAME = "en_core_web_sm"
+SPACY_RESOURCE = f"spacy:{SPACY_MODEL_NAME}"
+
+
+@dataclass
+class ResourceLoad:
+    """Outcome of loading one NLP resource."""
+
+    name: str
+    available: bool
+    seconds: float
+    error: Optional[str] = None
+
+
+class NLPRegistry:
+    """
+    Thread-safe registry of lazily loaded NLP resources.
+
+    Each resource is loaded at most once per process. Failed loads are
+    remembered too (as None) so a missing model isn't retried on every call;
+    ``reset`` forgets a resource so it can be loaded again.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._values: Dict[str, Any] = {}
+        self._loads: Dict[str, ResourceLoad] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """
+        Register a resource loader.
+
+        Args:
+            name: Resource name
+            loader: Function returning the resource (None or False if unavailable)
+        """
+        with self._lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all registered resources."""
+        return list(self._loaders)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a resource, loading it on first use.
+
+        Args:
+            name: Resource name
+
+        Returns:
+            The loaded resource, or None if it failed to load
+        """
+        if name in self._values:
+            return self._values[name]
+
+        with self._lock:
+            loader = self._loaders[name]
+            lock = self._locks[name]
+
+        # Loading one resource doesn't block lookups of the others
+        with lock:
+            if name in self._values:
+                return self._values[name]
+
+            start_time = time.perf_counter()
+            error = None
+            try:
+                value = loader()
+            except Exception as e:
+                value = None
+                error = f"{type(e).__name__}: {e}"
+                logfire.warning(f"Failed to load NLP resource '{name}'", error=error)
+
+            self._loads[name] = ResourceLoad(
+                name=name,
+                available=value is not None and value is not False,
+                seconds=time.perf_counter() - start_time,
+                error=error,
+            )
+            self._values[name] = value
+            return value
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a load of the resource has been attempted."""
+        return name in self._values
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> List[ResourceLoad]:
+        """
+        Load resources eagerly.
+
+        Args:
+            names: Resources to load (defaults to all registered resources)
+
+        Returns:
+            Load records for the requested resources
+        """
+        names = list(names) if names is not None else self.names
+        for name in names:
+            self.get(name)
+        return [self._loads[name] for name in names if name in self._loads]
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Report the resources loaded so far.
+
+        Returns:
+            One dictionary per attempted load with availability, time and error
+        """
+        with self._lock:
+            return [asdict(load) for load in self._loads.values()]
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        Forget loaded resources so they are loaded again on next use.
+
+        Args:
+            name: Resource to forget (defaults to all)
+        """
+        with self._lock:
+            names = [name] if name is not None else list(self._values)
+            for resource in names:
+                self._values.pop(resource, None)
+                self._loads.pop(resource, None)
+
+
+def ensure_nltk_resource(package: str, path: str) -> bool:
+    """
+    Ensure an NLTK resource is available, downloading it if needed.
+
+    Args:
+        package: NLTK download package name
+        path: Data path used to look the resource up
+
+    Returns:
+        True if the resource is available, False otherwise
+    """
+    import nltk
+
+    try:
+        nltk.data.find(path)
+        return True
+    except LookupError:
+        pass
+
+    try:
+        return bool(nltk.download(package, quiet=True))
+    except Exception as e:
+        logfire.warning(f"Could not download NLTK resource '{package}': {str(e)}")
+        return False
+
+
+def load_spacy_model():
+    """
+    Load the spaCy English model if it is installed.
+
+    Returns:
+        The loaded spaCy Language object, or None if unavailable
+    """
+    try:
+        import spacy
+
+        return spacy.load(SPACY_MODEL_NAME)
+    except ImportError:
+        logfire.info("spaCy not available, using NLTK keyword extraction")
+        return None
+    except OSError:
+        logfire.warning(f"spaCy model {SPACY_MODEL_NAME} not found, using NLTK keyword extraction")
+        return None
+
+
+NLP_REGISTRY = NLPRegistry()
+for _name, (_package, _path) in NLTK_RESOURCES.items():
+    NLP_REGISTRY.register(
+        _name, lambda package=_package, path=_path: ensure_nltk_resource(package, path)
+    )
+NLP_REGISTRY.register(SPACY_RESOURCE, load_spacy_model)
+
+
+def get_spacy_model():
+    """
+    Get the shared spaCy model, loading it on first use.
+
+    Returns:
+        The spaCy Language object, or None if unavailable
+    """
+    return NLP_REGISTRY.get(SPACY_RESOURCE)
+
+
+def ensure_nltk_stopwords() -> bool:
+    """Make sure the NLTK stopwords corpus is available."""
+    return bool(NLP_REGISTRY.get(STOPWORDS_RESOURCE))
+
+
+def ensure_nltk_punkt() -> bool:
+    """Make sure the NLTK punkt sentence tokenizer is available."""
+    return bool(NLP_REGISTRY.get(PUNKT_RESOURCE))
+
+
+def warm_up_nlp(names: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Load NLP resources eagerly and log a startup-time report.
+
+    Args:
+        names: Resources to load (defaults to all registered resources)
+
+    Returns:
+        One dictionary per resource with availability, load time and error
+    """
+    start_time = time.perf_counter()
+    loads = NLP_REGISTRY.warm_up(names)
+    report = [asdict(load) for load in loads]
+
+    logfire.info(
+        "NLP warm-up report",
+        total_seconds=round(time.perf_counter() - start_time, 3),
+        resources=[
+            f"{load.name}: {'loaded' if load.available else 'unavailable'} in {load.seconds:.3f}s"
+            for load in loads
+        ],
+    )
+    return report
+
+
+def initialize_nlp():
+    """
+    Initialize NLP resources for the ATS service.
+
+    Kept for callers that want everything loaded up front; new code should
+    use get_spacy_model / ensure_nltk_stopwords, which load lazily.
+
+    Returns:
+        Tuple of (nltk_initialized, spacy_model)
+    """
+    return ensure_nltk_stopwords(), get_spacy_model()
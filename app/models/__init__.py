@@ -1,4 +1,4 @@
 # Import models to make them available via app.models
 from app.models.user import User
-from app.models.resume import Resume, ResumeVersion
-from app.models.job import JobDescription
+from app.models.resume import Resume, ResumeDiff, ResumeVersion
+from app.models.job import JobCorpusStats, JobCorpusTerm, JobDescription, JobDescriptionAnalysis
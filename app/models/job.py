@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -21,3 +21,35 @@ class JobDescription(Base):
     # Relationships
     user = relationship("User", back_populates="job_descriptions")
     resume_versions = relationship("ResumeVersion", back_populates="job_description")
+
+
+class JobDescriptionAnalysis(Base):
+    """Parsed ATS analysis of a job description, keyed by a hash of its text."""
+
+    __tablename__ = "job_description_analyses"
+
+    content_hash = Column(String, primary_key=True, index=True)
+    job_type = Column(String, nullable=False)
+    elements = Column(Text, nullable=False)  # JSON-encoded job description elements
+    ngrams = Column(Text, nullable=False)  # JSON-encoded n-gram frequencies
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class JobCorpusTerm(Base):
+    """Number of stored job descriptions containing an ATS keyword."""
+
+    __tablename__ = "job_corpus_terms"
+
+    term = Column(String, primary_key=True, index=True)
+    document_frequency = Column(Integer, nullable=False, default=0)
+
+
+class JobCorpusStats(Base):
+    """Totals over the stored job descriptions, kept in a single row."""
+
+    __tablename__ = "job_corpus_stats"
+
+    id = Column(Integer, primary_key=True)
+    document_count = Column(Integer, nullable=False, default=0)
+    total_length = Column(Integer, nullable=False, default=0)  # Sum of token counts
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
@@ -56,3 +56,22 @@ class ResumeVersion(Base):
         """Convert boolean to integer for database storage."""
         self._is_customized = 1 if value else 0
 
+
+
+class ResumeDiff(Base):
+    """Computed diff between two resume versions, stored as JSON."""
+
+    __tablename__ = "resume_diffs"
+
+    original_version_id = Column(
+        String, ForeignKey("resume_versions.id", ondelete="CASCADE"), primary_key=True
+    )
+    customized_version_id = Column(
+        String, ForeignKey("resume_versions.id", ondelete="CASCADE"), primary_key=True
+    )
+    diff_format = Column(String, primary_key=True)
+    resume_id = Column(
+        String, ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    payload = Column(Text, nullable=False)  # JSON-encoded diff result
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,17 +1,38 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.orm import Session
 
 from app.repositories.base import BaseRepository
 from app.models.job import JobDescription
 from app.schemas.job import JobDescriptionCreate, JobDescriptionUpdate
+from app.services.ats import corpus
 
 
 class JobRepository(BaseRepository[JobDescription, JobDescriptionCreate, JobDescriptionUpdate]):
-    """Repository for JobDescription model"""
+    """
+    Repository for JobDescription model.
+    
+    Job descriptions written here aren't analyzed, so writes mark the ATS
+    corpus statistics stale in the same transaction; they're rebuilt by the
+    next job description endpoint write or at startup.
+    """
     
     def __init__(self, db: Session):
         super().__init__(db, JobDescription)
     
+    def create(self, *, obj_in: Union[JobDescriptionCreate, Dict[str, Any]], user_id: Optional[str] = None) -> JobDescription:
+        corpus.mark_stale(self.db)
+        return super().create(obj_in=obj_in, user_id=user_id)
+    
+    def update(
+        self, *, db_obj: JobDescription, obj_in: Union[JobDescriptionUpdate, Dict[str, Any]]
+    ) -> JobDescription:
+        corpus.mark_stale(self.db)
+        return super().update(db_obj=db_obj, obj_in=obj_in)
+    
+    def delete(self, *, id: str) -> Optional[JobDescription]:
+        corpus.mark_stale(self.db)
+        return super().delete(id=id)
+    
     def get_user_jobs(self, user_id: str, skip: int = 0, limit: int = 100) -> List[JobDescription]:
         """
         Get all job descriptions for a user.
@@ -56,6 +77,7 @@ class JobRepository(BaseRepository[JobDescription, JobDescriptionCreate, JobDesc
         Returns:
             Created job description
         """
+        corpus.mark_stale(self.db)
         db_obj = JobDescription(
             id=obj_in.get("id"),
             title=obj_in.get("title"),
@@ -154,3 +154,38 @@ class ResumeRepository(BaseRepository[Resume, ResumeCreate, ResumeUpdate]):
             .first()
         )
 
+
+    def get_base_version(self, version: ResumeVersion) -> Optional[ResumeVersion]:
+        """
+        Get the version a customized version is compared against by default.
+
+        This is the most recent non-customized version before it, or failing
+        that the most recent earlier version of any kind.
+
+        Args:
+            version: The customized version
+
+        Returns:
+            The base version if one exists, None otherwise
+        """
+        base_version = (
+            self.db.query(ResumeVersion)
+            .filter(
+                ResumeVersion.resume_id == version.resume_id,
+                ResumeVersion.version_number < version.version_number,
+                ResumeVersion._is_customized == 0,
+            )
+            .order_by(desc(ResumeVersion.version_number))
+            .first()
+        )
+        if base_version is None:
+            base_version = (
+                self.db.query(ResumeVersion)
+                .filter(
+                    ResumeVersion.resume_id == version.resume_id,
+                    ResumeVersion.version_number < version.version_number,
+                )
+                .order_by(desc(ResumeVersion.version_number))
+                .first()
+            )
+        return base_version
@@ -0,0 +1,91 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class KeywordMatch(BaseModel):
+    """Schema for a keyword found (or missing) in a resume"""
+
+    keyword: str
+    count_in_resume: int
+    count_in_job: int
+    is_match: bool
+
+
+class ATSImprovement(BaseModel):
+    """Schema for an ATS improvement suggestion"""
+
+    category: str
+    suggestion: str
+    priority: int = Field(..., description="1 is the highest priority")
+
+
+class SectionScore(BaseModel):
+    """Schema for the score of a single resume section"""
+
+    section: str
+    score: float
+    weight: float
+
+
+class ATSAnalysisResult(BaseModel):
+    """Schema for the ATS analysis of a resume against one job description"""
+
+    match_score: int
+    matching_keywords: List[KeywordMatch]
+    missing_keywords: List[KeywordMatch]
+    improvements: List[ATSImprovement]
+    job_type: str
+    section_scores: List[SectionScore]
+    confidence: str
+    keyword_density: float
+    processing_time: float
+    bm25_score: Optional[float] = Field(
+        None, description="BM25 relevance against the stored job description corpus"
+    )
+
+
+class ATSAnalysisRequest(BaseModel):
+    """Schema for scoring one resume version against one job description"""
+
+    resume_id: str
+    job_description_id: str
+    version_id: Optional[str] = Field(
+        None, description="Resume version to score; defaults to the latest version"
+    )
+    incremental: bool = Field(
+        False,
+        description=(
+            "Reuse cached results for sections unchanged since earlier versions; "
+            "scores in the API process, so only editors re-scoring on every save "
+            "should set it"
+        ),
+    )
+
+
+class BatchATSRequest(BaseModel):
+    """Schema for scoring one resume against many job descriptions"""
+
+    resume_id: str
+    job_description_ids: Optional[List[str]] = Field(
+        None,
+        description="Job descriptions to score against; defaults to all accessible job descriptions",
+    )
+    limit: Optional[int] = Field(None, ge=1, description="Only return the top N results")
+
+
+class BatchATSResult(ATSAnalysisResult):
+    """Schema for one ranked result of a batch ATS analysis"""
+
+    job_description_id: str
+    title: Optional[str] = None
+    company: Optional[str] = None
+
+
+class BatchATSResponse(BaseModel):
+    """Schema for a batch ATS analysis response"""
+
+    resume_id: str
+    job_count: int
+    results: List[BatchATSResult]
+    processing_time: float
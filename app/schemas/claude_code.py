@@ -162,11 +162,14 @@ class TaskStatusResponse(BaseModel):
         result: Optional task result data (only present when status is "completed")
         error: Optional error message (only present when status is "error")
         logs: Optional list of log messages (only present if include_logs=True)
+        queue_position: Place in the customization queue while waiting for a slot
+        eta_seconds: Estimated seconds until the task finishes while queued or running
     """
 
     task_id: str = Field(..., description="Unique identifier for the task")
     status: str = Field(
-        ..., description="Current status (initializing, in_progress, completed, error)"
+        ...,
+        description="Current status (initializing, queued, in_progress, completed, error, cancelled)",
     )
     message: str = Field(..., description="Human-readable status message")
     result: Optional[Dict[str, Any]] = Field(
@@ -185,6 +188,12 @@ class TaskStatusResponse(BaseModel):
         None,
         description="Log messages from the execution (only present if include_logs=True)",
     )
+    queue_position: Optional[int] = Field(
+        None, description="Place in the queue, 1 being next (only present while queued)"
+    )
+    eta_seconds: Optional[float] = Field(
+        None, description="Estimated seconds until completion (only present while queued or running)"
+    )
 
 
 class ClaudeCodeError(BaseModel):
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -92,6 +92,28 @@ class ResumeDiffResponse(BaseModel):
     is_diff_view: bool = True
 
 
+class KeywordTimelineEntry(BaseModel):
+    """Schema for the keyword changes made by one resume version"""
+
+    version_id: str
+    version_number: int
+    is_customized: bool
+    job_description_id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    keyword_count: int
+    top_keywords: List[str]
+    added_keywords: List[str]
+    removed_keywords: List[str]
+    count_changes: Dict[str, int]
+
+
+class KeywordTimelineResponse(BaseModel):
+    """Schema for the keyword history of a resume"""
+
+    resume_id: str
+    versions: List[KeywordTimelineEntry]
+
+
 class ResumeUpdate(BaseModel):
     """Schema for updating a resume"""
 
@@ -0,0 +1,30 @@
+"""
+ATS analysis engine components.
+
+This package holds the lower-level building blocks used by
+``app.services.ats_service`` for keyword matching and scoring, plus the
+process pool that runs its analyses (``executor``) and the corpus statistics
+kept over stored job descriptions (``corpus``).
+"""
+
+from app.services.ats.corpus import BM25Scorer, IDFTable
+from app.services.ats.executor import ATSExecutor
+from app.services.ats.jd_cache import JobAnalysis, JobAnalysisCache
+from app.services.ats.keyword_matcher import KeywordAutomaton
+from app.services.ats.keyword_matrix import KeywordMatrix
+from app.services.ats.section_cache import SectionCache
+from app.services.ats.taxonomy import SKILLS_TAXONOMY, TAXONOMY_INDEX, SkillsTaxonomyIndex
+
+__all__ = [
+    'ATSExecutor',
+    'BM25Scorer',
+    'IDFTable',
+    'JobAnalysis',
+    'JobAnalysisCache',
+    'KeywordAutomaton',
+    'KeywordMatrix',
+    'SKILLS_TAXONOMY',
+    'SectionCache',
+    'TAXONOMY_INDEX',
+    'SkillsTaxonomyIndex',
+]
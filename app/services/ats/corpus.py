@@ -0,0 +1,510 @@
+"""
+Corpus statistics over stored job descriptions.
+
+ATS keyword weights come from heuristics inside a single job description, so
+a generic term that appears in every posting counts as much as a rare,
+discriminative skill. This module keeps document frequencies of ATS keywords
+across the ``job_descriptions`` table in the database, updated as job
+descriptions are created, edited and deleted. Scoring reads only the
+frequencies of the terms it needs (an IDF table), never the whole corpus.
+
+The ``*_job_corpus`` functions keep the statistics in sync with the stored
+job descriptions, counting the keywords of each one's cached ATS analysis.
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple, Union
+
+import logfire
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.job import JobCorpusStats, JobCorpusTerm, JobDescription
+from app.services.ats.jd_cache import JobAnalysis
+from app.utils.tokenizer import tokenize
+
+# The totals row of job_corpus_stats
+_STATS_ID = 1
+
+# SQLite limits the number of bound parameters per statement (999 in
+# older versions); inserts bind two per term
+_QUERY_CHUNK_SIZE = 400
+
+
+@dataclass(frozen=True)
+class IDFTable:
+    """Document frequencies for a set of terms, with the corpus totals."""
+
+    document_count: int
+    average_length: float
+    document_frequencies: Dict[str, int]
+
+    def idf(self, term: str) -> float:
+        """
+        Get the BM25 inverse document frequency of a term.
+
+        Args:
+            term: The term
+
+        Returns:
+            ln(1 + (N - df + 0.5) / (df + 0.5)), which is always positive
+        """
+        frequency = self.document_frequencies.get(term, 0)
+        return math.log(1 + (self.document_count - frequency + 0.5) / (frequency + 0.5))
+
+
+class BM25Scorer:
+    """
+    BM25 scoring of a resume against job description keywords.
+
+    The job description keywords are the query and the resume is the
+    document. Document frequencies come from the job description corpus, which
+    also supplies the average length used for length normalization.
+    """
+
+    def __init__(self, idf_table: IDFTable, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize the scorer.
+
+        Args:
+            idf_table: Document frequencies of the terms being scored
+            k1: Term frequency saturation
+            b: Strength of document length normalization
+        """
+        self.idf_table = idf_table
+        self.k1 = k1
+        self.b = b
+
+    def keyword_weights(self, weights: Mapping[str, float]) -> Dict[str, float]:
+        """
+        Scale keyword weights by their IDF.
+
+        The scaled weights keep the same total as the input, so scores built
+        on them stay on the same scale; weight just moves from generic terms
+        to discriminative ones.
+
+        Args:
+            weights: Keyword weights from a job description
+
+        Returns:
+            Dictionary mapping each keyword to its IDF-scaled weight
+        """
+        idf = {term: self.idf_table.idf(term) for term in weights}
+        scaled_total = sum(weight * idf[term] for term, weight in weights.items())
+        if scaled_total <= 0:
+            return dict(weights)
+
+        factor = sum(weights.values()) / scaled_total
+        return {term: weight * idf[term] * factor for term, weight in weights.items()}
+
+    def weight_elements(self, jd_elements: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy job description elements with IDF-scaled keyword weights.
+
+        Args:
+            jd_elements: Dictionary of job description elements
+
+        Returns:
+            Copy of the elements whose keyword weights are scaled by IDF
+        """
+        keywords = jd_elements['keywords']
+        scaled = type(keywords)(float) if hasattr(keywords, 'default_factory') else {}
+        scaled.update(self.keyword_weights(keywords))
+        return {**jd_elements, 'keywords': scaled}
+
+    def score(
+        self,
+        term_frequencies: Mapping[str, int],
+        document_length: int,
+        query_terms: Iterable[str]
+    ) -> float:
+        """
+        Compute the BM25 score of a document for a query.
+
+        Args:
+            term_frequencies: Occurrences of each query term in the document
+            document_length: Number of tokens in the document
+            query_terms: The query terms
+
+        Returns:
+            The BM25 score
+        """
+        average_length = self.idf_table.average_length or document_length or 1
+        norm = self.k1 * (1 - self.b + self.b * document_length / average_length)
+
+        total = 0.0
+        for term in query_terms:
+            frequency = term_frequencies.get(term, 0)
+            if frequency:
+                total += (
+                    self.idf_table.idf(term)
+                    * frequency * (self.k1 + 1) / (frequency + norm)
+                )
+        return total
+
+
+def corpus_totals(db: Session) -> Optional[Tuple[int, int]]:
+    """
+    Get the corpus totals.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Tuple of (document count, total length), or None if the corpus
+        statistics have not been built
+    """
+    totals = (
+        db.query(JobCorpusStats.document_count, JobCorpusStats.total_length)
+        .filter(JobCorpusStats.id == _STATS_ID)
+        .first()
+    )
+    return tuple(totals) if totals is not None else None
+
+
+def add_document(db: Session, terms: Iterable[str], length: int) -> bool:
+    """
+    Count a new job description in the corpus statistics.
+
+    Changes are made in the caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        terms: The job description's distinct keywords
+        length: The job description's token count
+
+    Returns:
+        False if the statistics have not been built yet (a rebuild will
+        include the document), True otherwise
+    """
+    return _apply(db, terms, length, 1)
+
+
+def remove_document(db: Session, terms: Iterable[str], length: int) -> bool:
+    """
+    Remove a deleted or replaced job description from the corpus statistics.
+
+    Changes are made in the caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        terms: The job description's distinct keywords
+        length: The job description's token count
+
+    Returns:
+        False if the statistics have not been built yet, True otherwise
+    """
+    return _apply(db, terms, length, -1)
+
+
+def rebuild(db: Session, documents: Iterable[Tuple[Iterable[str], int]]) -> int:
+    """
+    Recompute the corpus statistics from scratch.
+
+    Changes are made in the caller's transaction; the caller commits.
+
+    Args:
+        db: Database session
+        documents: (distinct keywords, token count) for every job description
+
+    Returns:
+        Number of documents counted
+    """
+    frequencies: Dict[str, int] = {}
+    document_count = 0
+    total_length = 0
+    for terms, length in documents:
+        document_count += 1
+        total_length += length
+        for term in set(terms):
+            frequencies[term] = frequencies.get(term, 0) + 1
+
+    db.query(JobCorpusTerm).delete()
+    db.query(JobCorpusStats).delete()
+    db.bulk_insert_mappings(
+        JobCorpusTerm,
+        [
+            {"term": term, "document_frequency": frequency}
+            for term, frequency in frequencies.items()
+        ],
+    )
+    db.add(JobCorpusStats(
+        id=_STATS_ID,
+        document_count=document_count,
+        total_length=total_length,
+    ))
+    db.flush()
+    return document_count
+
+
+def mark_stale(db: Session) -> None:
+    """
+    Mark the corpus statistics as out of date.
+
+    The totals are dropped, so the statistics are neither used nor updated
+    incrementally until they are rebuilt. Changes are made in the caller's
+    transaction; the caller commits.
+
+    Args:
+        db: Database session
+    """
+    db.query(JobCorpusStats).filter(JobCorpusStats.id == _STATS_ID).delete(
+        synchronize_session=False
+    )
+
+
+def load_idf_table(db: Session, terms: Iterable[str]) -> Optional[IDFTable]:
+    """
+    Read the document frequencies of some terms.
+
+    Args:
+        db: Database session
+        terms: Terms to look up
+
+    Returns:
+        The IDF table, or None if the corpus statistics have not been built
+    """
+    totals = corpus_totals(db)
+    if totals is None:
+        return None
+    document_count, total_length = totals
+
+    terms = list(set(terms))
+    frequencies = {}
+    for start in range(0, len(terms), _QUERY_CHUNK_SIZE):
+        chunk = terms[start:start + _QUERY_CHUNK_SIZE]
+        rows = (
+            db.query(JobCorpusTerm.term, JobCorpusTerm.document_frequency)
+            .filter(JobCorpusTerm.term.in_(chunk))
+            .all()
+        )
+        frequencies.update(rows)
+
+    return IDFTable(
+        document_count=document_count,
+        average_length=total_length / document_count if document_count else 0.0,
+        document_frequencies=frequencies,
+    )
+
+
+def job_corpus_document(job_description: str, db: Optional[Session] = None) -> Tuple[Set[str], int]:
+    """
+    Get what a job description contributes to the corpus statistics.
+    
+    Args:
+        job_description: The job description text
+        db: Optional database session for the persistent analysis cache
+        
+    Returns:
+        Tuple of (distinct ATS keywords, token count)
+    """
+    from app.services.ats_service import get_job_analysis
+
+    keywords = get_job_analysis(job_description, db).elements['keywords']
+    return set(keywords), len(tokenize(job_description).tokens)
+
+
+def add_job_to_corpus(job_description: str, db: Session) -> None:
+    """
+    Count a new or edited job description in the corpus statistics.
+    
+    Also analyzes the job description, so the analysis is cached before the
+    first ATS request needs it. The caller commits.
+    
+    Args:
+        job_description: The job description text
+        db: Database session
+    """
+    add_document(db, *job_corpus_document(job_description, db))
+
+
+def remove_job_from_corpus(job_description: str, db: Session) -> None:
+    """
+    Remove a deleted or replaced job description from the corpus statistics.
+    
+    The caller commits.
+    
+    Args:
+        job_description: The job description text
+        db: Database session
+    """
+    remove_document(db, *job_corpus_document(job_description, db))
+
+
+def job_corpus_is_current(db: Session) -> bool:
+    """
+    Check whether the corpus statistics count every stored job description.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        False if the statistics are missing, marked stale or count a different
+        number of job descriptions than are stored
+    """
+    totals = corpus_totals(db)
+    return totals is not None and totals[0] == db.query(JobDescription).count()
+
+
+def rebuild_job_corpus(db: Session) -> int:
+    """
+    Recompute the corpus statistics from every stored job description.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Number of job descriptions counted
+    """
+    descriptions = [description for (description,) in db.query(JobDescription.description)]
+    count = rebuild(
+        db, [job_corpus_document(description, db) for description in descriptions]
+    )
+    db.commit()
+    
+    logfire.info("Rebuilt job description corpus statistics", document_count=count)
+    return count
+
+
+def sync_job_corpus(
+    bind: Union[Engine, Connection],
+    removed: Optional[str] = None,
+    added: Optional[str] = None
+) -> None:
+    """
+    Update the corpus statistics for a committed job description change.
+    
+    Runs as a background task once the job description is committed, in a
+    session of its own, so analyzing the text never delays or fails the
+    request. Statistics that have drifted from the stored job descriptions
+    are rebuilt. Failures are logged and mark the statistics stale.
+    
+    Args:
+        bind: Engine or connection of the request's session
+        removed: Text of a deleted or replaced job description
+        added: Text of a new or edited job description
+    """
+    from app.services.ats_service import invalidate_job_analysis
+
+    db = Session(bind=bind)
+    try:
+        if removed is not None:
+            remove_job_from_corpus(removed, db)
+            # The cached ATS analysis of the old text is no longer needed
+            invalidate_job_analysis(removed, db)
+        if added is not None:
+            add_job_to_corpus(added, db)
+        db.commit()
+        if not job_corpus_is_current(db):
+            rebuild_job_corpus(db)
+    except Exception as e:
+        db.rollback()
+        logfire.error("Failed to update job description corpus statistics", error=str(e))
+        try:
+            mark_stale(db)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logfire.error("Failed to mark job description corpus statistics stale", error=str(e))
+    finally:
+        db.close()
+
+
+def ensure_job_corpus() -> None:
+    """
+    Build the corpus statistics if they are missing or out of date.
+    
+    Job descriptions created before the statistics existed, or written
+    without updating them, are counted by the rebuild; afterwards the job
+    description endpoints keep the statistics current.
+    """
+    from app.db.session import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        if not job_corpus_is_current(db):
+            rebuild_job_corpus(db)
+    except Exception as e:
+        db.rollback()
+        logfire.error("Failed to build job description corpus statistics", error=str(e))
+    finally:
+        db.close()
+
+
+def corpus_weighting_enabled(db: Session) -> bool:
+    """
+    Check whether job keywords should be weighted by corpus IDF.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        True if weighting is enabled and the corpus is large enough
+    """
+    if not settings.ATS_CORPUS_WEIGHTING:
+        return False
+    totals = corpus_totals(db)
+    return totals is not None and totals[0] >= settings.ATS_CORPUS_MIN_DOCUMENTS
+
+
+def get_corpus_scorer(db: Session, job_analyses: Iterable[JobAnalysis]) -> Optional[BM25Scorer]:
+    """
+    Build a BM25 scorer for the keywords of some job descriptions.
+    
+    Only the document frequencies of those keywords are read.
+    
+    Args:
+        db: Database session
+        job_analyses: Analyses of the job descriptions being scored
+        
+    Returns:
+        The scorer, or None if the corpus statistics have not been built
+    """
+    terms = set()
+    for analysis in job_analyses:
+        terms.update(analysis.elements['keywords'])
+    
+    idf_table = load_idf_table(db, terms)
+    if idf_table is None:
+        return None
+    return BM25Scorer(idf_table, k1=settings.ATS_BM25_K1, b=settings.ATS_BM25_B)
+
+
+def _apply(db: Session, terms: Iterable[str], length: int, delta: int) -> bool:
+    # Atomic increments, so concurrent requests don't lose updates
+    updated = db.query(JobCorpusStats).filter(JobCorpusStats.id == _STATS_ID).update(
+        {
+            JobCorpusStats.document_count: JobCorpusStats.document_count + delta,
+            JobCorpusStats.total_length: JobCorpusStats.total_length + delta * length,
+        },
+        synchronize_session=False,
+    )
+    if not updated:
+        return False
+
+    terms = list(set(terms))
+    if delta > 0 and terms:
+        for start in range(0, len(terms), _QUERY_CHUNK_SIZE):
+            chunk = terms[start:start + _QUERY_CHUNK_SIZE]
+            statement = sqlite_insert(JobCorpusTerm).values(
+                [{"term": term, "document_frequency": delta} for term in chunk]
+            )
+            db.execute(statement.on_conflict_do_update(
+                index_elements=[JobCorpusTerm.term],
+                set_={"document_frequency": JobCorpusTerm.document_frequency + delta},
+            ))
+    elif terms:
+        for start in range(0, len(terms), _QUERY_CHUNK_SIZE):
+            chunk = terms[start:start + _QUERY_CHUNK_SIZE]
+            db.query(JobCorpusTerm).filter(JobCorpusTerm.term.in_(chunk)).update(
+                {JobCorpusTerm.document_frequency: JobCorpusTerm.document_frequency + delta},
+                synchronize_session=False,
+            )
+        db.query(JobCorpusTerm).filter(JobCorpusTerm.document_frequency <= 0).delete(
+            synchronize_session=False
+        )
+
+    db.flush()
+    return True
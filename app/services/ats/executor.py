@@ -0,0 +1,541 @@
+"""
+Process pool for CPU-bound ATS analysis.
+
+ATS analysis is pure Python CPU work (regexes, n-grams, spaCy). Running it
+inline in an ``async`` endpoint blocks the event loop, so ``ATSExecutor`` runs
+it in a pool of worker processes that are pre-warmed with the NLP resources,
+and lets coroutines await the result. It also tracks queue depth and worker
+utilization so the pool can be sized.
+
+The shared pool and the coroutines that run ``app.services.ats_service``
+analyses in it (reading and writing the job description cache and the corpus
+statistics around each pooled call) live here too.
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor
+from concurrent.futures import wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import logfire
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.nltk_init import SPACY_RESOURCE, STOPWORDS_RESOURCE, warm_up_nlp
+# ats_service imports this package, so its attributes are only looked up
+# when the functions below run
+from app.services import ats_service
+from app.services.ats.corpus import corpus_weighting_enabled, get_corpus_scorer
+from app.services.ats.jd_cache import JobAnalysis
+
+
+def _timed_call(fn: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Any, float, float]:
+    """Run a function in a worker and report when it started and finished."""
+    started_at = time.time()
+    result = fn(*args, **kwargs)
+    return result, started_at, time.time()
+
+
+def _ping() -> float:
+    """No-op task used to make sure a worker process is running."""
+    return time.time()
+
+
+class ATSExecutor:
+    """
+    Process pool that runs ATS analysis off the event loop.
+
+    The pool is created on ``start`` (or on first use). Workers run the
+    ``initializer`` once when they start, so NLP models are loaded before the
+    first analysis rather than during it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Optional[Callable[[], None]] = None,
+        start_method: str = "spawn",
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of worker processes
+            initializer: Picklable function run once in each worker process
+            start_method: multiprocessing start method for the workers
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.start_method = start_method
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._warm_up_seconds = 0.0
+
+        self._in_flight = 0
+        self._peak_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._busy_seconds = 0.0
+        self._wait_seconds = 0.0
+
+    @property
+    def started(self) -> bool:
+        """Whether the worker pool exists."""
+        return self._pool is not None
+
+    def start(self, warm: bool = True) -> None:
+        """
+        Create the worker pool.
+
+        Args:
+            warm: Start every worker and wait for its initializer to finish
+        """
+        pool = self._ensure_pool()
+        if not warm:
+            return
+
+        warm_start = time.time()
+        # Enough no-op tasks to occupy every worker, so each one is spawned
+        futures = [pool.submit(_ping) for _ in range(self.max_workers)]
+        wait_futures(futures)
+        self._warm_up_seconds = time.time() - warm_start
+
+        logfire.info(
+            "ATS process pool warmed up",
+            workers=self.max_workers,
+            warm_up_seconds=round(self._warm_up_seconds, 2),
+        )
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        """
+        Submit a function to the pool.
+
+        Args:
+            fn: Picklable function to run in a worker
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Future resolving to the function's result
+        """
+        pool = self._ensure_pool()
+        submitted_at = time.time()
+
+        with self._lock:
+            self._submitted += 1
+            self._in_flight += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queue_depth())
+
+        try:
+            timed = pool.submit(_timed_call, fn, args, kwargs)
+        except BrokenProcessPool:
+            with self._lock:
+                self._in_flight -= 1
+                self._failed += 1
+            self._reset_pool()
+            raise
+
+        result: "Future[Any]" = Future()
+        timed.add_done_callback(lambda done: self._finish(done, result, submitted_at))
+        # Cancelling the result drops the task if no worker has picked it up yet
+        result.add_done_callback(lambda done: done.cancelled() and timed.cancel())
+        return result
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a function in the pool and await its result.
+
+        Args:
+            fn: Picklable function to run in a worker
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            The function's result
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get pool sizing metrics.
+
+        Returns:
+            Dictionary with queue depth, active workers, instantaneous and
+            cumulative utilization, and task counts and timings
+        """
+        with self._lock:
+            active = min(self._in_flight, self.max_workers)
+            uptime = time.time() - self._started_at if self._started_at else 0.0
+            return {
+                "max_workers": self.max_workers,
+                "started": self.started,
+                "queue_depth": self._queue_depth(),
+                "peak_queue_depth": self._peak_queue_depth,
+                "active_workers": active,
+                "utilization": active / self.max_workers,
+                "busy_ratio": (
+                    self._busy_seconds / (self.max_workers * uptime) if uptime > 0 else 0.0
+                ),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "average_wait_seconds": (
+                    self._wait_seconds / self._completed if self._completed else 0.0
+                ),
+                "average_run_seconds": (
+                    self._busy_seconds / self._completed if self._completed else 0.0
+                ),
+                "warm_up_seconds": self._warm_up_seconds,
+                "uptime_seconds": uptime,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the worker pool.
+
+        Args:
+            wait: Wait for running analyses to finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._started_at = None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _queue_depth(self) -> int:
+        # Tasks beyond the number of workers are waiting for a free worker
+        return max(self._in_flight - self.max_workers, 0)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=self.initializer,
+                )
+                self._started_at = time.time()
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        logfire.error("ATS process pool is broken, recreating it on next use")
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, timed: "Future[Tuple[Any, float, float]]", result: "Future[Any]", submitted_at: float) -> None:
+        error = None if timed.cancelled() else timed.exception()
+
+        with self._lock:
+            self._in_flight -= 1
+            if timed.cancelled() or error is not None:
+                self._failed += 1
+            else:
+                _, started_at, finished_at = timed.result()
+                self._completed += 1
+                self._busy_seconds += finished_at - started_at
+                self._wait_seconds += max(started_at - submitted_at, 0.0)
+
+        if isinstance(error, BrokenProcessPool):
+            self._reset_pool()
+
+        try:
+            if timed.cancelled():
+                result.cancel()
+            elif error is not None:
+                result.set_exception(error)
+            else:
+                result.set_result(timed.result()[0])
+        except InvalidStateError:
+            # The caller cancelled while the task was running
+            pass
+
+
+_ats_executor: Optional[ATSExecutor] = None
+_ats_executor_lock = threading.Lock()
+
+
+def warm_ats_worker() -> None:
+    """
+    Prepare an ATS worker process.
+    
+    Loads NLTK and spaCy, the stopword lists, the tokenized skills taxonomy
+    and the spaCy keyword extractor so the first analysis in the worker
+    doesn't pay for them.
+    """
+    warm_up_nlp([STOPWORDS_RESOURCE, SPACY_RESOURCE])
+    ats_service.get_combined_stopwords()
+    ats_service._taxonomy_patterns()
+    ats_service.get_spacy_keyword_extractor()
+
+
+def get_ats_executor() -> ATSExecutor:
+    """
+    Get the shared ATS process pool, creating it on first use.
+    
+    Returns:
+        The ATS executor configured from settings
+    """
+    global _ats_executor
+    with _ats_executor_lock:
+        if _ats_executor is None:
+            _ats_executor = ATSExecutor(
+                max_workers=settings.ATS_PROCESS_POOL_SIZE,
+                initializer=warm_ats_worker,
+                start_method=settings.ATS_PROCESS_POOL_START_METHOD
+            )
+        return _ats_executor
+
+
+def shutdown_ats_executor(wait: bool = True) -> None:
+    """
+    Shut down the shared ATS process pool if it was started.
+    
+    Args:
+        wait: Wait for running analyses to finish
+    """
+    global _ats_executor
+    with _ats_executor_lock:
+        executor, _ats_executor = _ats_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def run_ats_task(
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    job_descriptions: Sequence[str],
+    known_analyses: Sequence[Optional[JobAnalysis]],
+    kwargs: Optional[Dict[str, Any]] = None
+) -> Tuple[Any, List[Optional[JobAnalysis]]]:
+    """
+    Run an ATS analysis function inside a worker process (or, for in-process
+    analyses, on a thread of the API process).
+    
+    Job description analyses already cached by the caller are seeded into the
+    worker's cache, and the ones the worker had to compute are sent back so the
+    caller can cache (and persist) them.
+    
+    Args:
+        fn: Analysis function to run
+        args: Positional arguments for the function
+        job_descriptions: Job description texts the function will analyze
+        known_analyses: Caller's cached analysis for each text, or None
+        kwargs: Optional keyword arguments for the function
+        
+    Returns:
+        Tuple of (function result, newly computed analysis for each text or None)
+    """
+    for analysis in known_analyses:
+        if analysis is not None:
+            ats_service.JOB_ANALYSIS_CACHE.put(analysis)
+    
+    result = fn(*args, **(kwargs or {}))
+    
+    computed = [
+        ats_service.JOB_ANALYSIS_CACHE.get(text) if known is None else None
+        for text, known in zip(job_descriptions, known_analyses)
+    ]
+    return result, computed
+
+
+def analyze_job_descriptions(job_descriptions: Sequence[str]) -> List[JobAnalysis]:
+    """
+    Analyze job descriptions inside a worker process.
+    
+    Args:
+        job_descriptions: Job description texts
+        
+    Returns:
+        The analysis of each text
+    """
+    return [ats_service.JOB_ANALYSIS_CACHE.get(text) for text in job_descriptions]
+
+
+def _peek_job_analyses(job_descriptions: Sequence[str],
+                       db: Optional[Session]) -> List[Optional[JobAnalysis]]:
+    return [ats_service.JOB_ANALYSIS_CACHE.peek(text, db) for text in job_descriptions]
+
+
+def _store_job_analyses(analyses: Iterable[JobAnalysis], db: Optional[Session]) -> None:
+    stored = set()
+    for analysis in analyses:
+        if analysis.content_hash not in stored:
+            ats_service.JOB_ANALYSIS_CACHE.put(analysis, db)
+            stored.add(analysis.content_hash)
+    if stored and db is not None:
+        db.commit()
+
+
+async def run_ats_analysis(
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    job_descriptions: Sequence[str],
+    db: Optional[Session] = None,
+    in_process: bool = False
+) -> Any:
+    """
+    Run an ATS analysis function in the process pool.
+    
+    Database sessions can't cross process boundaries, so the persistent job
+    description cache is read before and written after the pooled call here,
+    using the caller's session; newly stored analyses are committed. The
+    corpus IDF table is also read here and passed to the function as a
+    ``scorer`` keyword argument. Database access runs on a worker thread and
+    job description analysis in the process pool, so neither blocks the
+    event loop.
+    
+    Functions relying on caches of the API process (incremental scoring and
+    its section cache) run with ``in_process`` on a thread of the API
+    process instead; each pool worker would have a cache of its own.
+    
+    Args:
+        fn: Picklable analysis function
+        args: Positional arguments for the function
+        job_descriptions: Job description texts the function will analyze
+        db: Optional database session for the persistent analysis cache and
+            the job description corpus statistics
+        in_process: Run the function on a thread of the API process; job
+            descriptions are still analyzed in the pool
+        
+    Returns:
+        The function's result
+    """
+    cache_db = db if settings.ATS_JD_CACHE_PERSIST else None
+    executor = get_ats_executor()
+    
+    known_analyses = await asyncio.to_thread(_peek_job_analyses, job_descriptions, cache_db)
+    new_analyses: List[JobAnalysis] = []
+    
+    kwargs = {}
+    weighting = db is not None and await asyncio.to_thread(corpus_weighting_enabled, db)
+    if weighting or in_process:
+        # IDF lookups need every job's keywords up front; jobs are usually
+        # analyzed when they're saved, so this is rarely more than a few
+        missing = list(dict.fromkeys(
+            text for text, known in zip(job_descriptions, known_analyses) if known is None
+        ))
+        if missing:
+            new_analyses = await executor.run(analyze_job_descriptions, missing)
+            analyzed = dict(zip(missing, new_analyses))
+            known_analyses = [
+                known or analyzed[text]
+                for text, known in zip(job_descriptions, known_analyses)
+            ]
+    if weighting:
+        kwargs['scorer'] = await asyncio.to_thread(get_corpus_scorer, db, known_analyses)
+    
+    if in_process:
+        result, computed = await asyncio.to_thread(
+            run_ats_task, fn, args, job_descriptions, known_analyses, kwargs
+        )
+    else:
+        result, computed = await executor.run(
+            run_ats_task, fn, args, job_descriptions, known_analyses, kwargs
+        )
+    
+    new_analyses.extend(analysis for analysis in computed if analysis is not None)
+    if new_analyses:
+        await asyncio.to_thread(_store_job_analyses, new_analyses, cache_db)
+    
+    return result
+
+
+async def analyze_resume_for_ats(
+    resume_content: str,
+    job_description: str,
+    db: Optional[Session] = None,
+    incremental: bool = False
+) -> Dict[str, Any]:
+    """
+    Enhanced analysis of a resume against a job description for ATS compatibility.
+    
+    The analysis runs in the ATS process pool so it doesn't block the event
+    loop. Incremental analyses run on a thread of the API process, where the
+    section cache is shared between requests.
+    
+    Args:
+        resume_content: The content of the resume in Markdown format
+        job_description: The job description text
+        db: Optional database session for the persistent job description cache
+        incremental: Reuse cached per-section results from earlier versions of
+            the resume (see ats_service.analyze_resume_for_ats_incremental)
+    
+    Returns:
+        Dictionary with match score, matching keywords, missing keywords, and improvements
+    """
+    return await run_ats_analysis(
+        (ats_service.analyze_resume_for_ats_incremental if incremental
+         else ats_service.analyze_resume_for_ats_sync),
+        (resume_content, job_description),
+        [job_description],
+        db,
+        in_process=incremental
+    )
+
+
+# Fields of each streamed ATS analysis stage, in the order they're sent
+ATS_STREAM_STAGES = {
+    "score": ("match_score", "confidence", "job_type", "keyword_density", "bm25_score"),
+    "sections": ("section_scores",),
+    "keywords": ("matching_keywords", "missing_keywords"),
+}
+
+
+async def stream_ats_analysis(
+    resume_content: str,
+    job_description: str,
+    db: Optional[Session] = None,
+    incremental: bool = False
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Analyze a resume against a job description, yielding results by stage.
+    
+    Scoring and suggestion generation run as separate process pool calls, so
+    the score, section scores and keywords are yielded while the suggestions
+    are still being generated. Stages are yielded in order: "score",
+    "sections", "keywords", "improvements", then "complete" with the same
+    result analyze_resume_for_ats returns.
+    
+    Args:
+        resume_content: The content of the resume in Markdown format
+        job_description: The job description text
+        db: Optional database session for the persistent job description cache
+        incremental: Reuse cached per-section results from earlier versions of
+            the resume
+    
+    Yields:
+        Tuples of (stage name, stage fields)
+    """
+    start_time = time.time()
+    
+    scoring = await run_ats_analysis(
+        (ats_service.score_resume_for_ats_incremental if incremental
+         else ats_service.score_resume_for_ats),
+        (resume_content, job_description),
+        [job_description],
+        db,
+        in_process=incremental
+    )
+    result = ats_service.format_ats_scoring(scoring, [], 0.0)
+    for stage, fields in ATS_STREAM_STAGES.items():
+        yield stage, {name: result[name] for name in fields if name in result}
+    
+    improvements = await get_ats_executor().run(
+        ats_service.suggest_ats_improvements, resume_content, job_description, scoring
+    )
+    yield "improvements", {"improvements": improvements}
+    
+    result["improvements"] = improvements
+    result["processing_time"] = time.time() - start_time
+    yield "complete", result
@@ -0,0 +1,216 @@
+"""
+Content-addressed cache for parsed job descriptions.
+
+The same job description is usually analysed against many resumes and resume
+versions. Its parsed elements, detected job type and n-grams depend only on the
+text, so they are cached under a hash of the text: an in-memory LRU in front
+of an optional persistent tier in the application database.
+"""
+import json
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import logfire
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.job import JobDescriptionAnalysis
+from app.utils.lru import LRUCache
+from app.utils.tokenizer import text_fingerprint
+
+# (job_type, job description elements, n-gram frequencies) for a text
+AnalysisTuple = Tuple[str, Dict[str, Any], Dict[str, int]]
+
+
+@dataclass(frozen=True)
+class JobAnalysis:
+    """
+    Cached analysis of one job description text.
+
+    The elements and n-grams are shared between callers and must not be
+    modified.
+    """
+
+    content_hash: str
+    job_type: str
+    elements: Dict[str, Any]
+    ngrams: Dict[str, int]
+
+
+class JobAnalysisCache:
+    """
+    LRU cache of job description analyses keyed by content hash.
+
+    When a database session is passed, analyses are also read from and
+    written to the ``job_description_analyses`` table, so they survive
+    restarts and are shared between application processes. Writes are made
+    in a savepoint of the caller's transaction and become durable when the
+    caller commits; the cache never commits or rolls back that transaction.
+    """
+
+    def __init__(self, analyzer: Callable[[str], AnalysisTuple], max_size: int = 512):
+        """
+        Initialize the cache.
+
+        Args:
+            analyzer: Function computing (job_type, elements, ngrams) for a text
+            max_size: Maximum number of analyses kept in memory
+        """
+        self.analyzer = analyzer
+        self.max_size = max_size
+        self._memory: "LRUCache[str, JobAnalysis]" = LRUCache(max_size)
+        # Guards the persistent hit and miss counts; the LRU counts memory hits
+        self._lock = threading.Lock()
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def get(self, text: str, db: Optional[Session] = None) -> JobAnalysis:
+        """
+        Get the analysis for a job description, computing it if needed.
+
+        Args:
+            text: The job description text
+            db: Optional database session enabling the persistent tier
+
+        Returns:
+            The cached or freshly computed analysis
+        """
+        analysis = self.peek(text, db)
+        if analysis is not None:
+            return analysis
+
+        job_type, elements, ngrams = self.analyzer(text)
+        analysis = JobAnalysis(text_fingerprint(text), job_type, elements, ngrams)
+        with self._lock:
+            self.misses += 1
+        self.put(analysis, db)
+        return analysis
+
+    def peek(self, text: str, db: Optional[Session] = None) -> Optional[JobAnalysis]:
+        """
+        Look up a cached analysis without computing it.
+
+        Args:
+            text: The job description text
+            db: Optional database session enabling the persistent tier
+
+        Returns:
+            The cached analysis, or None if it has not been computed
+        """
+        content_hash = text_fingerprint(text)
+        analysis = self._memory.lookup(content_hash)
+        if analysis is not None:
+            return analysis
+
+        if db is not None:
+            analysis = self._load(db, content_hash)
+            if analysis is not None:
+                with self._lock:
+                    self.persistent_hits += 1
+                self._memory.put(content_hash, analysis)
+                return analysis
+
+        return None
+
+    def put(self, analysis: JobAnalysis, db: Optional[Session] = None) -> None:
+        """
+        Add an analysis computed elsewhere (e.g. in a worker process).
+
+        Args:
+            analysis: The analysis to cache
+            db: Optional database session; the analysis is persisted too,
+                when the caller commits
+        """
+        self._memory.put(analysis.content_hash, analysis)
+        if db is not None:
+            self._store(db, analysis)
+
+    def invalidate(self, text: str, db: Optional[Session] = None) -> None:
+        """
+        Drop the cached analysis for a job description text.
+
+        Args:
+            text: The job description text whose analysis is stale
+            db: Optional database session; the persisted row is deleted too,
+                when the caller commits
+        """
+        content_hash = text_fingerprint(text)
+        self._memory.pop(content_hash)
+
+        if db is not None:
+            try:
+                with db.begin_nested():
+                    db.query(JobDescriptionAnalysis).filter(
+                        JobDescriptionAnalysis.content_hash == content_hash
+                    ).delete()
+            except SQLAlchemyError as e:
+                logfire.warning(
+                    "Failed to delete cached job description analysis",
+                    content_hash=content_hash,
+                    error=str(e),
+                )
+
+    def clear(self) -> None:
+        """Drop all in-memory analyses and reset the statistics."""
+        self._memory.clear()
+        with self._lock:
+            self.persistent_hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, persistent hit and miss counts and current size
+        """
+        memory = self._memory.info()
+        with self._lock:
+            return {
+                "hits": memory["hits"],
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "size": memory["size"],
+                "max_size": self.max_size,
+            }
+
+    def _load(self, db: Session, content_hash: str) -> Optional[JobAnalysis]:
+        try:
+            row = db.get(JobDescriptionAnalysis, content_hash)
+        except SQLAlchemyError as e:
+            logfire.warning(
+                "Failed to load cached job description analysis",
+                content_hash=content_hash,
+                error=str(e),
+            )
+            return None
+        if row is None:
+            return None
+
+        elements = json.loads(row.elements)
+        elements["keywords"] = defaultdict(float, elements["keywords"])
+        ngrams = defaultdict(int, json.loads(row.ngrams))
+        return JobAnalysis(content_hash, row.job_type, elements, ngrams)
+
+    def _store(self, db: Session, analysis: JobAnalysis) -> None:
+        try:
+            # A failed write only rolls back its savepoint, not the caller's
+            # pending changes
+            with db.begin_nested():
+                db.merge(
+                    JobDescriptionAnalysis(
+                        content_hash=analysis.content_hash,
+                        job_type=analysis.job_type,
+                        elements=json.dumps(analysis.elements),
+                        ngrams=json.dumps(analysis.ngrams),
+                    )
+                )
+        except SQLAlchemyError as e:
+            # Another worker may have stored the same analysis first
+            logfire.warning(
+                "Failed to persist job description analysis",
+                content_hash=analysis.content_hash,
+                error=str(e),
+            )
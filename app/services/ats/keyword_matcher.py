@@ -0,0 +1,168 @@
+"""
+Multi-pattern keyword matching for ATS analysis.
+
+Implements an Aho-Corasick automaton over token sequences. Patterns are
+multi-word keywords (already split into tokens) and the automaton finds every
+occurrence of every pattern in a single left-to-right pass over the resume
+tokens, so matching time scales with the resume length rather than with the
+number of keywords times the size of the skills taxonomy.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton whose alphabet is whole tokens."""
+
+    def __init__(self):
+        # State 0 is the root; each state maps a token to the next state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Patterns ending at each state as (pattern, token length) pairs;
+        # _output additionally holds the patterns reachable via failure links
+        self._terminal: List[List[Tuple[str, int]]] = [[]]
+        self._output: List[List[Tuple[str, int]]] = [[]]
+        self._patterns: Set[str] = set()
+        self._built = False
+        # Token length of the longest pattern
+        self.max_length = 0
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self._patterns
+
+    def add(self, pattern: str, tokens: Sequence[str]) -> None:
+        """
+        Add a pattern to the automaton.
+
+        Args:
+            pattern: The keyword reported when the pattern matches
+            tokens: The token sequence that spells the pattern
+        """
+        if not tokens or pattern in self._patterns:
+            return
+
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append([])
+            state = next_state
+
+        self._terminal[state].append((pattern, len(tokens)))
+        self._patterns.add(pattern)
+        self.max_length = max(self.max_length, len(tokens))
+        self._built = False
+
+    def build(self) -> "KeywordAutomaton":
+        """
+        Compute failure links so the automaton can be used for scanning.
+
+        Returns:
+            The automaton itself, to allow chaining
+        """
+        self._output = [list(patterns) for patterns in self._terminal]
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                # Follow failure links until a state with a transition on token
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+
+                # Inherit the patterns recognised by the failure state
+                if self._output[self._fail[next_state]]:
+                    self._output[next_state] = (
+                        self._output[next_state] + self._output[self._fail[next_state]]
+                    )
+
+        self._built = True
+        return self
+
+    def iter_matches(self, tokens: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        """
+        Scan a token sequence and yield every pattern occurrence.
+
+        Args:
+            tokens: The tokens to scan
+
+        Yields:
+            Tuples of (start token index, pattern)
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for pattern, length in output[state]:
+                yield index - length + 1, pattern
+
+    def find_all(self, tokens: Iterable[str]) -> Dict[str, List[int]]:
+        """
+        Scan a token sequence and collect the positions of every pattern.
+
+        Args:
+            tokens: The tokens to scan
+
+        Returns:
+            Dictionary mapping each matched pattern to its start positions in order
+        """
+        positions: Dict[str, List[int]] = {}
+        for start, pattern in self.iter_matches(tokens):
+            positions.setdefault(pattern, []).append(start)
+        return positions
+
+    def find_crossing(self, tokens: Sequence[str], split: int) -> Dict[str, List[int]]:
+        """
+        Collect the pattern occurrences that span a split point.
+
+        Used to stitch together matches found in separately scanned pieces of
+        a token sequence: an occurrence crosses the split if it starts before
+        ``split`` and ends at or after it.
+
+        Args:
+            tokens: The tokens to scan
+            split: Index of the first token after the split point
+
+        Returns:
+            Dictionary mapping each crossing pattern to its start positions
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        positions: Dict[str, List[int]] = {}
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if index < split:
+                continue
+            for pattern, length in output[state]:
+                start = index - length + 1
+                if start < split:
+                    positions.setdefault(pattern, []).append(start)
+        return positions
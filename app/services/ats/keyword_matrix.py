@@ -0,0 +1,89 @@
+"""
+Sparse keyword-weight matrix over a shared vocabulary.
+
+Batch ATS scoring compares one resume against many job descriptions. Each job
+description's weighted keywords become a row of a CSR matrix whose columns are
+a vocabulary shared by every job, so per-term facts about the resume (is it
+present, how often, in which section) are computed once and combined with all
+jobs in a single sparse matrix-vector product.
+"""
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+from scipy import sparse
+
+
+class KeywordMatrix:
+    """
+    Job keyword weights as a sparse matrix.
+
+    Attributes:
+        terms: Vocabulary terms, indexed by column
+        vocabulary: Term -> column index
+        weights: CSR matrix of shape (jobs, terms) holding keyword weights
+        indicator: CSR matrix with 1.0 wherever a job has a keyword
+        keyword_counts: Number of keywords per job
+    """
+
+    def __init__(self, keyword_weights: Sequence[Mapping[str, float]]):
+        self.vocabulary: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self._row_columns: List[np.ndarray] = []
+        self._row_weights: List[np.ndarray] = []
+
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for keywords in keyword_weights:
+            columns = []
+            for term, weight in keywords.items():
+                column = self.vocabulary.get(term)
+                if column is None:
+                    column = len(self.terms)
+                    self.vocabulary[term] = column
+                    self.terms.append(term)
+                columns.append(column)
+                data.append(float(weight))
+            indices.extend(columns)
+            indptr.append(len(indices))
+            # Keep each job's keywords in their original order for ranking
+            self._row_columns.append(np.asarray(columns, dtype=np.int64))
+            self._row_weights.append(np.asarray(data[indptr[-2]:], dtype=np.float64))
+
+        shape = (len(indptr) - 1, len(self.terms))
+        self.weights = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr)),
+            shape=shape,
+        )
+        self.weights.sort_indices()
+        self.indicator = self.weights.copy()
+        self.indicator.data = np.ones_like(self.indicator.data)
+        self.keyword_counts = np.diff(self.weights.indptr)
+
+    def __len__(self) -> int:
+        return self.weights.shape[0]
+
+    def term_vector(self, values: Mapping[str, float]) -> np.ndarray:
+        """
+        Build a dense vector over the vocabulary.
+
+        Args:
+            values: Term -> value; terms outside the vocabulary are ignored
+
+        Returns:
+            Array with one entry per vocabulary term (0 where no value is given)
+        """
+        vector = np.zeros(len(self.terms), dtype=np.float64)
+        for term, value in values.items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = value
+        return vector
+
+    def row_columns(self, row: int) -> np.ndarray:
+        """Return the column indices of a job's keywords in their original order."""
+        return self._row_columns[row]
+
+    def row_weights(self, row: int) -> np.ndarray:
+        """Return a job's keyword weights aligned with row_columns."""
+        return self._row_weights[row]
@@ -0,0 +1,21 @@
+"""
+Per-section cache for incremental ATS re-scoring.
+
+Saving a new resume version usually changes one section. Work that depends
+only on a section's text (its tokens and keyword counts), or on the section
+text and the job description (keyword hits and the section score), is cached
+under the section's content hash so re-scoring only recomputes the sections
+that changed.
+"""
+from typing import Any, Hashable
+
+from app.utils.lru import LRUCache
+
+
+class SectionCache(LRUCache[Hashable, Any]):
+    """
+    LRU cache of per-section analysis results.
+
+    Keys are normally built from section and job description hashes. Cached
+    values are shared between callers and must not be modified.
+    """
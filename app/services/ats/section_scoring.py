@@ -0,0 +1,231 @@
+"""
+Vectorized section scoring and score calibration.
+
+Section scores come from a (keyword x section) presence matrix: a section's
+match total is the weighted sum of the job keywords it contains, divided by
+the job's keyword count and scaled by a per-job-type section weight.
+Calibration turns per-job match statistics into the overall ATS score with
+elementwise array operations. Single and batch scoring share these
+functions, so they produce the same results.
+
+Match totals are summed sequentially in each job's keyword order (a
+cumulative sum rather than a pairwise-summed dot product), and rounding is
+done with Python's round(), so the scores are bit-for-bit identical to
+summing the keywords one at a time.
+"""
+import math
+from typing import Any, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from app.utils.tokenizer import tokenize
+
+# Sections whose presence counts towards the coverage part of the score
+IMPORTANT_SECTIONS = ('experience', 'skills', 'education', 'summary')
+
+# Keyword density (percent of resume tokens) that earns the full density score
+OPTIMAL_DENSITY = 5.0
+
+
+def keyword_presence(section_contents: Sequence[str], terms: Sequence[str]) -> np.ndarray:
+    """
+    Find which terms each section contains.
+
+    Single words must be a section token; multi-word terms must appear in the
+    section's space-joined tokens.
+
+    Args:
+        section_contents: Section texts
+        terms: Keyword terms
+
+    Returns:
+        Float array of shape (terms, sections), 1.0 where the section contains the term
+    """
+    presence = np.zeros((len(terms), len(section_contents)))
+    word_rows: Dict[str, List[int]] = {}
+    phrases = []
+    for row, term in enumerate(terms):
+        if ' ' in term:
+            phrases.append((row, term))
+        else:
+            word_rows.setdefault(term, []).append(row)
+    words = set(word_rows)
+
+    for index, content in enumerate(section_contents):
+        if not content.strip():
+            continue
+        tokens = tokenize(content).tokens
+        # Set intersection walks the smaller of the section and the keywords
+        rows = [row for word in words.intersection(tokens) for row in word_rows[word]]
+        if phrases:
+            section_text = ' '.join(tokens)
+            rows += [row for row, phrase in phrases if phrase in section_text]
+        presence[rows, index] = 1.0
+    return presence
+
+
+def section_weight_matrix(
+    job_types: Sequence[str],
+    section_names: Sequence[str],
+    weights_by_job_type: Mapping[str, Mapping[str, float]]
+) -> np.ndarray:
+    """
+    Look up the section weights of each job's type.
+
+    Args:
+        job_types: Job type of each job
+        section_names: Resume section names
+        weights_by_job_type: Section weights per job type, with a 'default' entry
+
+    Returns:
+        Array of shape (jobs, sections); sections without a weight get 1.0
+    """
+    rows = {}
+    for job_type in set(job_types):
+        weights = weights_by_job_type.get(job_type, weights_by_job_type['default'])
+        rows[job_type] = [weights.get(name, 1.0) for name in section_names]
+    return np.array([rows[job_type] for job_type in job_types], dtype=np.float64).reshape(
+        len(job_types), len(section_names)
+    )
+
+
+def section_match_totals(
+    presence: np.ndarray,
+    keyword_columns: Sequence[np.ndarray],
+    keyword_weights: Sequence[np.ndarray]
+) -> np.ndarray:
+    """
+    Sum each job's matched keyword weights per section.
+
+    Args:
+        presence: Presence matrix of shape (terms, sections)
+        keyword_columns: For each job, the presence rows of its keywords in keyword order
+        keyword_weights: For each job, its keyword weights aligned with keyword_columns
+
+    Returns:
+        Array of shape (jobs, sections)
+    """
+    jobs = len(keyword_columns)
+    width = max((len(columns) for columns in keyword_columns), default=0)
+    sections = presence.shape[1]
+    if jobs == 0 or width == 0 or sections == 0:
+        return np.zeros((jobs, sections))
+
+    # Pad every job to the same keyword count; padding adds 0.0, which
+    # doesn't change a sum
+    columns = np.zeros((jobs, width), dtype=np.int64)
+    weights = np.zeros((jobs, width))
+    for row, (row_columns, row_weights) in enumerate(zip(keyword_columns, keyword_weights)):
+        columns[row, :len(row_columns)] = row_columns
+        weights[row, :len(row_weights)] = row_weights
+
+    contributions = weights[:, :, np.newaxis] * presence[columns]
+    return np.cumsum(contributions, axis=1)[:, -1, :]
+
+
+def section_scores(
+    section_names: Sequence[str],
+    section_contents: Sequence[str],
+    match_totals: np.ndarray,
+    keyword_counts: np.ndarray,
+    section_weights: np.ndarray
+) -> List[Dict[str, float]]:
+    """
+    Turn per-section match totals into section scores.
+
+    Args:
+        section_names: Resume section names
+        section_contents: Section texts, aligned with section_names
+        match_totals: Matched keyword weight per (job, section)
+        keyword_counts: Number of keywords per job
+        section_weights: Section weight per (job, section)
+
+    Returns:
+        One dictionary per job mapping section names to scores (0 to 100)
+    """
+    keyword_counts = np.asarray(keyword_counts, dtype=np.float64).reshape(-1, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weighted = (match_totals / keyword_counts) * 100 * section_weights
+    scored = (keyword_counts > 0) & np.array(
+        [bool(content.strip()) for content in section_contents], dtype=bool
+    )
+
+    results = []
+    for row in range(weighted.shape[0]):
+        results.append({
+            name: min(round(float(weighted[row, index]), 2), 100) if scored[row, index] else 0
+            for index, name in enumerate(section_names)
+        })
+    return results
+
+
+# NumPy's SIMD exp can differ from the C library's by an ulp; math.exp keeps
+# calibrated scores identical to the scalar formula
+_exp = np.frompyfunc(math.exp, 1, 1)
+
+
+def calibration_features(
+    match_results: Mapping[str, Any],
+    section_scores: Mapping[str, float]
+) -> List[float]:
+    """
+    Extract the match statistics the calibrated score is built from.
+
+    Args:
+        match_results: Dictionary with matching results
+        section_scores: Dictionary with section scores
+
+    Returns:
+        [weighted match score, job keyword count, semantic match count,
+        keyword density, covered important sections, high-value matches]
+    """
+    top_matching = match_results.get('top_matching_keywords', [])[:5]
+    return [
+        match_results['weighted_match_score'],
+        match_results['total_job_keywords'],
+        len(match_results['semantic_matches']),
+        match_results.get('keyword_density', 0),
+        sum(1 for section in IMPORTANT_SECTIONS if section_scores.get(section, 0) > 0),
+        sum(1 for keyword in match_results.get('exact_matches', {}) if keyword in top_matching),
+    ]
+
+
+def calibrated_scores(features: np.ndarray) -> np.ndarray:
+    """
+    Compute calibrated ATS scores.
+
+    Args:
+        features: Array of shape (jobs, 6) with rows from calibration_features
+
+    Returns:
+        Array of overall scores between 0 and 100
+    """
+    features = np.asarray(features, dtype=np.float64).reshape(-1, 6)
+    weighted_match, total_keywords, semantic_count, density, covered, high_value = features.T
+
+    # Exact match component: a steep sigmoid of the weighted match ratio
+    has_keywords = total_keywords > 0
+    ratio = np.divide(
+        weighted_match, total_keywords * 2,
+        out=np.zeros_like(weighted_match), where=has_keywords
+    )
+    sigmoid = 1 / (1 + _exp(-12 * (ratio - 0.4)).astype(np.float64))
+    exact_match_score = np.where(has_keywords, sigmoid * 55, 0.0)
+
+    section_coverage_score = (covered / len(IMPORTANT_SECTIONS)) * 12
+    semantic_match_score = np.minimum(semantic_count * 1.8, 18)
+
+    # Keyword density peaks at the optimum, with a mild penalty above it
+    density_score = np.where(
+        density <= OPTIMAL_DENSITY,
+        (density / OPTIMAL_DENSITY) * 10,
+        10 - np.minimum(((density - OPTIMAL_DENSITY) / 7) * 10, 8)
+    )
+    high_value_bonus = np.minimum(high_value * 1.5, 5)
+
+    # Industry-calibrated baseline and scaling
+    raw_score = 30 + (
+        exact_match_score + semantic_match_score + section_coverage_score +
+        density_score + high_value_bonus
+    ) * 0.8
+    return np.clip(raw_score, 0, 100)
@@ -0,0 +1,100 @@
+"""
+Skills taxonomy and its precomputed lookup index.
+
+The taxonomy maps a category (which may itself be a skill, e.g. "python") to
+related skills. ``TAXONOMY_INDEX`` is built once at import so that callers can
+answer "is this a known skill?" and "which categories relate to this term?"
+with dictionary lookups instead of walking the whole taxonomy. Its terms are
+normalized with the skill alias table, so "node.js" and "ci/cd" are indexed as
+"node" and "cicd", the spellings the tokenizer produces.
+"""
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from app.utils.skill_aliases import SKILL_ALIASES
+
+# Skills taxonomy and hierarchy
+SKILLS_TAXONOMY = {
+    # Programming Languages family relationships
+    "programming": ["python", "java", "javascript", "c++", "c#", "ruby", "php", "typescript", "go", "swift"],
+    "python": ["django", "flask", "fastapi", "pyramid", "numpy", "pandas", "scikit-learn", "tensorflow", "pytorch"],
+    "java": ["spring", "hibernate", "maven", "junit", "struts", "jsf", "jpa", "jdbc"],
+    "javascript": ["node.js", "react", "angular", "vue", "express", "jquery", "typescript", "nextjs", "nuxt"],
+    "web_development": ["html", "css", "javascript", "react", "angular", "vue", "django", "flask", "node", "express"],
+
+    # Data Science and Analytics
+    "data_science": ["machine learning", "deep learning", "statistics", "data mining", "nlp", "computer vision",
+                     "predictive modeling", "python", "r", "tensorflow", "pytorch", "sklearn"],
+    "data_analysis": ["sql", "data visualization", "etl", "data cleaning", "excel", "tableau", "power bi",
+                      "python", "r", "pandas", "numpy", "statistical analysis"],
+
+    # DevOps and Cloud
+    "devops": ["ci/cd", "jenkins", "docker", "kubernetes", "terraform", "ansible", "aws", "azure", "gcp",
+               "monitoring", "git", "github actions", "gitlab ci", "circleci"],
+    "cloud": ["aws", "azure", "gcp", "cloud architecture", "serverless", "lambda", "ec2", "s3", "dynamodb",
+              "cloud security", "cloud migration", "docker", "kubernetes"],
+
+    # Management and Leadership
+    "leadership": ["team management", "strategy", "project management", "people management", "mentoring",
+                   "team building", "cross-functional", "stakeholder management"],
+    "project_management": ["agile", "scrum", "kanban", "waterfall", "jira", "project planning", "risk management",
+                           "budgeting", "stakeholder communication"]
+}
+
+
+class SkillsTaxonomyIndex:
+    """
+    Immutable lookup structures derived from a skills taxonomy.
+
+    Attributes:
+        terms: Every category and skill name
+        term_categories: Term -> categories it relates to, in taxonomy order. A
+            category is related to a term when the term is one of its skills or
+            is the category itself.
+        category_skills: Category -> its skills
+    """
+
+    def __init__(
+        self,
+        taxonomy: Mapping[str, List[str]],
+        normalize: Optional[Callable[[str], str]] = None
+    ):
+        terms = set()
+        term_categories: Dict[str, List[str]] = {}
+        category_skills: Dict[str, Tuple[str, ...]] = {}
+
+        for category, skills in taxonomy.items():
+            if normalize is not None:
+                category = normalize(category)
+                # Two spellings of one skill collapse into a single entry
+                skills = list(dict.fromkeys(normalize(skill) for skill in skills))
+            category_skills[category] = tuple(skills)
+            terms.add(category)
+            terms.update(skills)
+
+            term_categories.setdefault(category, []).append(category)
+            for skill in skills:
+                related = term_categories.setdefault(skill, [])
+                if category not in related:
+                    related.append(category)
+
+        self.terms: FrozenSet[str] = frozenset(terms)
+        self.term_categories: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {term: tuple(categories) for term, categories in term_categories.items()}
+        )
+        self.category_skills: Mapping[str, Tuple[str, ...]] = MappingProxyType(category_skills)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.terms
+
+    def is_category(self, term: str) -> bool:
+        """Return True if the term is a taxonomy category."""
+        return term in self.category_skills
+
+    def related_categories(self, term: str) -> Tuple[str, ...]:
+        """Return the categories related to a term, in taxonomy order."""
+        return self.term_categories.get(term, ())
+
+
+# Built once at import; the taxonomy is static
+TAXONOMY_INDEX = SkillsTaxonomyIndex(SKILLS_TAXONOMY, normalize=SKILL_ALIASES.canonical_term)
@@ -1,23 +1,31 @@
 import re
-import nltk
 import os
-import math
 import time
 import logfire
-from typing import List, Dict, Any, Optional, Set, Tuple
+import numpy as np
+from typing import List, Dict, Any, Container, FrozenSet, Iterable, Optional, Sequence, Set, Tuple
 from collections import defaultdict, Counter
-from nltk.util import ngrams
+from dataclasses import dataclass, field
+from functools import lru_cache
+from sqlalchemy.orm import Session
 
-# Import NLP initialization
-from app.core.nltk_init import initialize_nlp
+from app.core.config import settings
 
-# Initialize NLP resources
-nltk_initialized, spacy_model = initialize_nlp()
-
-# Now import NLTK modules after initialization
-from nltk.corpus import stopwords
+# NLP resources are loaded lazily on first use; NLTK itself is slow to
+# import, so it is imported where it's needed
+from app.core.nltk_init import ensure_nltk_stopwords, get_spacy_model
 
 from app.schemas.ats import KeywordMatch, ATSImprovement
+from app.services.ats.corpus import BM25Scorer
+from app.services.ats.jd_cache import JobAnalysis, JobAnalysisCache
+from app.services.ats.keyword_matcher import KeywordAutomaton
+from app.services.ats.keyword_matrix import KeywordMatrix
+from app.services.ats import section_scoring
+from app.services.ats.section_cache import SectionCache
+from app.services.ats.taxonomy import SKILLS_TAXONOMY, TAXONOMY_INDEX
+from app.utils.skill_aliases import SKILL_ALIASES
+from app.utils.spacy_pipeline import KEYWORD_COMPONENTS, SpacyBatchExtractor
+from app.utils.tokenizer import text_fingerprint, tokenize
 
 # Resume section patterns for detection
 RESUME_SECTIONS = {
@@ -100,48 +108,25 @@ SECTION_WEIGHTS = {
     }
 }
 
-# Skills taxonomy and hierarchy
-SKILLS_TAXONOMY = {
-    # Programming Languages family relationships
-    "programming": ["python", "java", "javascript", "c++", "c#", "ruby", "php", "typescript", "go", "swift"],
-    "python": ["django", "flask", "fastapi", "pyramid", "numpy", "pandas", "scikit-learn", "tensorflow", "pytorch"],
-    "java": ["spring", "hibernate", "maven", "junit", "struts", "jsf", "jpa", "jdbc"],
-    "javascript": ["node.js", "react", "angular", "vue", "express", "jquery", "typescript", "nextjs", "nuxt"],
-    "web_development": ["html", "css", "javascript", "react", "angular", "vue", "django", "flask", "node", "express"],
-    
-    # Data Science and Analytics
-    "data_science": ["machine learning", "deep learning", "statistics", "data mining", "nlp", "computer vision", 
-                     "predictive modeling", "python", "r", "tensorflow", "pytorch", "sklearn"],
-    "data_analysis": ["sql", "data visualization", "etl", "data cleaning", "excel", "tableau", "power bi", 
-                      "python", "r", "pandas", "numpy", "statistical analysis"],
-    
-    # DevOps and Cloud
-    "devops": ["ci/cd", "jenkins", "docker", "kubernetes", "terraform", "ansible", "aws", "azure", "gcp", 
-               "monitoring", "git", "github actions", "gitlab ci", "circleci"],
-    "cloud": ["aws", "azure", "gcp", "cloud architecture", "serverless", "lambda", "ec2", "s3", "dynamodb", 
-              "cloud security", "cloud migration", "docker", "kubernetes"],
-    
-    # Management and Leadership
-    "leadership": ["team management", "strategy", "project management", "people management", "mentoring", 
-                   "team building", "cross-functional", "stakeholder management"],
-    "project_management": ["agile", "scrum", "kanban", "waterfall", "jira", "project planning", "risk management", 
-                           "budgeting", "stakeholder communication"]
-}
-
 
-async def analyze_resume_for_ats(
+def analyze_resume_for_ats_sync(
     resume_content: str,
-    job_description: str
+    job_description: str,
+    db: Optional[Session] = None,
+    scorer: Optional[BM25Scorer] = None
 ) -> Dict[str, Any]:
     """
     Enhanced analysis of a resume against a job description for ATS compatibility.
     
     This implementation uses algorithmic analysis rather than an AI model, so it won't
-    depend on the model provider configuration.
+    depend on the model provider configuration. It is CPU-bound; async callers
+    should use analyze_resume_for_ats.
     
     Args:
         resume_content: The content of the resume in Markdown format
         job_description: The job description text
+        db: Optional database session used to persist the job description analysis
+        scorer: Optional corpus BM25 scorer; job keywords are weighted by IDF
     
     Returns:
         Dictionary with match score, matching keywords, missing keywords, and improvements
@@ -149,26 +134,75 @@ async def analyze_resume_for_ats(
     # Start tracking processing time
     start_time = time.time()
     
-    # Detect job type based on job description
-    job_type = detect_job_type(job_description)
+    scoring = score_resume_for_ats(resume_content, job_description, db, scorer)
+    improvements = suggest_ats_improvements(resume_content, job_description, scoring)
+    
+    # Calculate processing time
+    processing_time = time.time() - start_time
+    
+    # Log performance metrics
+    logfire.info(
+        "ATS analysis performance metrics",
+        processing_time=round(processing_time, 2),
+        resume_size=len(resume_content),
+        job_description_size=len(job_description),
+        match_score=round(scoring.overall_score),
+        **scoring.stats
+    )
+    
+    return format_ats_scoring(scoring, improvements, processing_time)
+
+
+@dataclass
+class ATSScoring:
+    """Everything an ATS analysis computes before its improvement suggestions."""
+    
+    overall_score: float
+    resume_keywords: Dict[str, int]
+    jd_elements: Dict[str, Any]
+    match_results: Dict[str, Any]
+    section_scores: Dict[str, float]
+    job_type: str
+    # Counters for performance logging
+    stats: Dict[str, int] = field(default_factory=dict)
+
+
+def score_resume_for_ats(
+    resume_content: str,
+    job_description: str,
+    db: Optional[Session] = None,
+    scorer: Optional[BM25Scorer] = None
+) -> ATSScoring:
+    """
+    Score a resume against a job description, without suggestions.
+    
+    Args:
+        resume_content: The content of the resume in Markdown format
+        job_description: The job description text
+        db: Optional database session used to persist the job description analysis
+        scorer: Optional corpus BM25 scorer; job keywords are weighted by IDF
+    
+    Returns:
+        The scoring, to be passed to suggest_ats_improvements
+    """
+    # Detect job type and extract key elements (cached per job description text)
+    job_analysis = get_job_analysis(job_description, db)
+    job_type = job_analysis.job_type
+    jd_elements = job_analysis.elements
+    if scorer is not None:
+        jd_elements = scorer.weight_elements(jd_elements)
     
     # Identify sections in the resume
     resume_sections = identify_sections(resume_content)
     
-    # Process job description to extract key elements
-    jd_elements = process_job_description(job_description)
-    
-    # Extract all keywords from both documents
-    resume_keywords = extract_keywords(resume_content)
-    job_keywords = extract_keywords(job_description)
+    # Extract all keywords from both documents in one pass
+    resume_keywords, job_keywords = extract_keywords_batch([resume_content, job_description])
     
-    # Extract n-grams for more accurate matching
-    resume_ngrams = extract_ngrams(resume_content)
-    job_ngrams = extract_ngrams(job_description)
+    job_ngrams = job_analysis.ngrams
     
     # Perform matching with semantic relationship recognition
-    match_results = perform_matching(resume_content, resume_sections, resume_ngrams, 
-                                    job_description, jd_elements, job_ngrams)
+    match_results = perform_matching(resume_content, resume_sections,
+                                    job_description, jd_elements, job_ngrams, scorer)
     
     # Calculate section-based scores
     section_scores = calculate_section_scores(resume_sections, jd_elements, job_type)
@@ -176,6 +210,96 @@ async def analyze_resume_for_ats(
     # Calculate overall score with calibration
     overall_score = calculate_calibrated_score(match_results, section_scores)
     
+    return ATSScoring(
+        overall_score=overall_score,
+        resume_keywords=resume_keywords,
+        jd_elements=jd_elements,
+        match_results=match_results,
+        section_scores=section_scores,
+        job_type=job_type,
+        stats={'section_count': len(resume_sections)}
+    )
+
+
+def suggest_ats_improvements(
+    resume_content: str,
+    job_description: str,
+    scoring: ATSScoring
+) -> List[ATSImprovement]:
+    """
+    Generate improvement suggestions for a scored resume.
+    
+    Args:
+        resume_content: The content of the resume in Markdown format
+        job_description: The job description text
+        scoring: The resume's scoring against the job description
+    
+    Returns:
+        List of improvement suggestions
+    """
+    return generate_enhanced_suggestions(
+        resume_content,
+        job_description,
+        scoring.match_results,
+        scoring.section_scores,
+        scoring.job_type
+    )
+
+
+def format_ats_scoring(
+    scoring: ATSScoring,
+    improvements: List[ATSImprovement],
+    processing_time: float
+) -> Dict[str, Any]:
+    """
+    Build the ATS analysis response from a scoring and its suggestions.
+    
+    Args:
+        scoring: The resume's scoring against the job description
+        improvements: Improvement suggestions
+        processing_time: Time spent on the analysis in seconds
+        
+    Returns:
+        Dictionary with match score, matching keywords, missing keywords, and improvements
+    """
+    return format_analysis_result(
+        scoring.overall_score,
+        scoring.resume_keywords,
+        scoring.jd_elements,
+        scoring.match_results,
+        scoring.section_scores,
+        improvements,
+        scoring.job_type,
+        processing_time
+    )
+
+
+def format_analysis_result(
+    overall_score: float,
+    resume_keywords: Dict[str, int],
+    jd_elements: Dict[str, Any],
+    match_results: Dict[str, Any],
+    section_scores: Dict[str, float],
+    improvements: List[ATSImprovement],
+    job_type: str,
+    processing_time: float
+) -> Dict[str, Any]:
+    """
+    Build the ATS analysis response for one resume/job description pair.
+    
+    Args:
+        overall_score: Calibrated ATS score
+        resume_keywords: Keywords extracted from the resume
+        jd_elements: Dictionary of job description elements
+        match_results: Dictionary with matching results
+        section_scores: Dictionary with section scores
+        improvements: Improvement suggestions
+        job_type: The job type
+        processing_time: Time spent on the analysis in seconds
+        
+    Returns:
+        Dictionary with match score, matching keywords, missing keywords, and improvements
+    """
     # Format matching keywords for the response
     matching = []
     for keyword in match_results['top_matching_keywords']:
@@ -197,39 +321,18 @@ async def analyze_resume_for_ats(
             is_match=False
         ))
     
-    # Generate improved suggestions
-    improvements = generate_enhanced_suggestions(
-        resume_content, 
-        job_description, 
-        match_results, 
-        section_scores, 
-        job_type
-    )
-    
     # Add section analysis to the response
+    section_weights = SECTION_WEIGHTS.get(job_type, SECTION_WEIGHTS['default'])
     section_analysis = []
     for section, score in section_scores.items():
-        if section in SECTION_WEIGHTS.get(job_type, SECTION_WEIGHTS['default']):
+        if section in section_weights:
             section_analysis.append({
                 'section': section.capitalize(),
                 'score': score,
-                'weight': SECTION_WEIGHTS.get(job_type, SECTION_WEIGHTS['default']).get(section, 1.0)
+                'weight': section_weights.get(section, 1.0)
             })
     
-    # Calculate processing time
-    processing_time = time.time() - start_time
-    
-    # Log performance metrics
-    logfire.info(
-        "ATS analysis performance metrics",
-        processing_time=round(processing_time, 2),
-        resume_size=len(resume_content),
-        job_description_size=len(job_description),
-        section_count=len(resume_sections),
-        match_score=round(overall_score)
-    )
-    
-    return {
+    result = {
         "match_score": round(overall_score),
         "matching_keywords": matching,
         "missing_keywords": missing,
@@ -240,6 +343,406 @@ async def analyze_resume_for_ats(
         "keyword_density": match_results.get('keyword_density', 0),
         "processing_time": processing_time
     }
+    if 'bm25_score' in match_results:
+        result["bm25_score"] = match_results['bm25_score']
+    
+    return result
+
+
+# Per-section tokens, keyword counts, keyword hits and scores for incremental re-scoring
+SECTION_CACHE = SectionCache(max_size=settings.ATS_SECTION_CACHE_SIZE)
+
+
+def analyze_resume_for_ats_incremental(
+    resume_content: str,
+    job_description: str,
+    db: Optional[Session] = None,
+    scorer: Optional[BM25Scorer] = None
+) -> Dict[str, Any]:
+    """
+    Re-score an edited resume against a job description incrementally.
+    
+    Gives the same result as analyze_resume_for_ats_sync, with the scoring
+    done by score_resume_for_ats_incremental.
+    
+    Args:
+        resume_content: The content of the resume in Markdown format
+        job_description: The job description text
+        db: Optional database session used to persist the job description analysis
+        scorer: Optional corpus BM25 scorer; job keywords are weighted by IDF
+    
+    Returns:
+        Dictionary with match score, matching keywords, missing keywords, and improvements
+    """
+    start_time = time.time()
+    
+    scoring = score_resume_for_ats_incremental(resume_content, job_description, db, scorer)
+    improvements = suggest_ats_improvements(resume_content, job_description, scoring)
+    
+    processing_time = time.time() - start_time
+    
+    logfire.info(
+        "Incremental ATS analysis performance metrics",
+        processing_time=round(processing_time, 3),
+        resume_size=len(resume_content),
+        match_score=round(scoring.overall_score),
+        **scoring.stats
+    )
+    
+    return format_ats_scoring(scoring, improvements, processing_time)
+
+
+def score_resume_for_ats_incremental(
+    resume_content: str,
+    job_description: str,
+    db: Optional[Session] = None,
+    scorer: Optional[BM25Scorer] = None
+) -> ATSScoring:
+    """
+    Score an edited resume incrementally, without suggestions.
+    
+    Gives the same scoring as score_resume_for_ats, but the resume is
+    split into section blocks and each block's tokens, keyword counts,
+    keyword hits and section score are cached under its content hash. Saving
+    a version that changes one section only recomputes that section, the
+    keyword hits spanning its boundaries and the aggregate score.
+    
+    Keyword counts are summed per section, so a phrase running across a
+    section header can be counted differently than in a full analysis.
+    
+    Args:
+        resume_content: The content of the resume in Markdown format
+        job_description: The job description text
+        db: Optional database session used to persist the job description analysis
+        scorer: Optional corpus BM25 scorer; job keywords are weighted by IDF
+    
+    Returns:
+        The scoring, to be passed to suggest_ats_improvements
+    """
+    job_analysis = get_job_analysis(job_description, db)
+    job_type = job_analysis.job_type
+    jd_elements = job_analysis.elements
+    jd_hash = weights_hash = job_analysis.content_hash
+    if scorer is not None:
+        jd_elements = scorer.weight_elements(jd_elements)
+        # Section scores depend on the weights, which change with the corpus
+        weights_hash = text_fingerprint(repr(sorted(jd_elements['keywords'].items())))
+    weighted_job_keywords = jd_elements['keywords']
+    matcher = SECTION_CACHE.get(
+        ("matcher", jd_hash),
+        lambda: build_keyword_matcher(weighted_job_keywords)
+    )
+    
+    lines = resume_content.split('\n')
+    resume_sections = {}
+    resume_tokens: List[str] = []
+    found_terms: Dict[str, List[int]] = defaultdict(list)
+    keyword_counts: Counter = Counter()
+    boundaries = []
+    recomputed = 0
+    
+    for section_name, block_start, content_start, end in section_blocks(lines):
+        if end > content_start:
+            resume_sections[section_name] = '\n'.join(lines[content_start:end])
+        if end == block_start:
+            continue
+        
+        block = '\n'.join(lines[block_start:end])
+        block_hash = text_fingerprint(block)
+        misses = SECTION_CACHE.misses
+        tokens, counts = SECTION_CACHE.get(
+            ("block", block_hash),
+            lambda: (tokenize(block).tokens, extract_keyword_counts_batch([block])[0])
+        )
+        hits = SECTION_CACHE.get(
+            ("hits", block_hash, jd_hash),
+            lambda: matcher.find_all(tokens)
+        )
+        recomputed += SECTION_CACHE.misses > misses
+        
+        # Tokenization is line-local, so block tokens concatenate to the resume tokens
+        offset = len(resume_tokens)
+        for term, positions in hits.items():
+            found_terms[term].extend(offset + position for position in positions)
+        keyword_counts.update(counts)
+        resume_tokens.extend(tokens)
+        boundaries.append(offset)
+    
+    # Add the multi-word matches that span block boundaries
+    reach = max(matcher.max_length - 1, 0)
+    crossing = set()
+    for boundary in sorted(set(boundaries[1:])):
+        window_start = max(boundary - reach, 0)
+        window = resume_tokens[window_start:boundary + reach]
+        for term, positions in matcher.find_crossing(window, boundary - window_start).items():
+            crossing.update((term, window_start + position) for position in positions)
+    for term, position in crossing:
+        found_terms[term].append(position)
+    for positions in found_terms.values():
+        positions.sort()
+    
+    match_results = summarize_matches(found_terms, len(resume_tokens), weighted_job_keywords, scorer)
+    
+    section_scores = {}
+    for section_name, section_content in resume_sections.items():
+        score = SECTION_CACHE.get(
+            ("score", text_fingerprint(section_content), weights_hash, job_type, section_name),
+            lambda: calculate_section_scores(
+                {section_name: section_content}, jd_elements, job_type
+            ).get(section_name)
+        )
+        if score is not None:
+            section_scores[section_name] = score
+    
+    overall_score = calculate_calibrated_score(match_results, section_scores)
+    
+    return ATSScoring(
+        overall_score=overall_score,
+        resume_keywords=filter_technical_terms(keyword_counts),
+        jd_elements=jd_elements,
+        match_results=match_results,
+        section_scores=section_scores,
+        job_type=job_type,
+        stats={'block_count': len(boundaries), 'recomputed_blocks': recomputed}
+    )
+
+
+def analyze_resume_for_ats_batch(
+    resume_content: str,
+    job_descriptions: Sequence[Tuple[str, str]],
+    db: Optional[Session] = None,
+    scorer: Optional[BM25Scorer] = None
+) -> List[Dict[str, Any]]:
+    """
+    Analyze one resume against many job descriptions and rank the results.
+    
+    Produces the same fields as analyze_resume_for_ats for every job. The
+    resume is scanned and sectioned once; each job's weighted keywords become
+    a row of a sparse matrix over a shared vocabulary, so exact, taxonomy and
+    section matches for all jobs come from a few matrix-vector products.
+    
+    Args:
+        resume_content: The content of the resume in Markdown format
+        job_descriptions: Sequence of (job_description_id, job description text)
+        db: Optional database session used to persist job description analyses
+        scorer: Optional corpus BM25 scorer; job keywords are weighted by IDF
+    
+    Returns:
+        Analysis dictionaries with a job_description_id key, sorted by
+        match_score (highest first). processing_time is the batch time
+        amortized over the jobs.
+    """
+    start_time = time.time()
+    if not job_descriptions:
+        return []
+    
+    # Resume-side work is shared by every job
+    resume_sections = identify_sections(resume_content)
+    resume_keywords = extract_keywords(resume_content)
+    resume_tokens = tokenize(resume_content).tokens
+    
+    job_analyses = [get_job_analysis(text, db) for _, text in job_descriptions]
+    job_types = [analysis.job_type for analysis in job_analyses]
+    jd_elements_list = [analysis.elements for analysis in job_analyses]
+    if scorer is not None:
+        jd_elements_list = [scorer.weight_elements(jd_elements) for jd_elements in jd_elements_list]
+    matrix = KeywordMatrix([jd_elements['keywords'] for jd_elements in jd_elements_list])
+    terms = matrix.terms
+    
+    # Scan the resume once for the keywords of every job
+    found_terms = build_keyword_matcher(terms).find_all(resume_tokens)
+    frequency = matrix.term_vector({term: len(positions) for term, positions in found_terms.items()})
+    exact = frequency > 0
+    
+    # Taxonomy credit depends only on the term, so resolve it once per term
+    semantic_credit = np.zeros(len(terms))
+    last_semantic = {}
+    for column in np.flatnonzero(~exact):
+        taxonomy_matches = find_taxonomy_matches(terms[column], found_terms)
+        if taxonomy_matches:
+            semantic_credit[column] = sum(factor for _, factor, _ in taxonomy_matches)
+            last_semantic[column] = taxonomy_matches[-1]
+    has_semantic = semantic_credit > 0
+    
+    credit = exact + semantic_credit
+    weighted_match_scores = matrix.weights @ credit
+    matched_job_keywords = matrix.indicator @ credit
+    matched_frequency = matrix.indicator @ frequency
+    
+    # Section scores: which terms each section contains, weighted per job
+    section_names = [name for name in resume_sections if name != "unknown"]
+    section_contents = [resume_sections[name] for name in section_names]
+    presence = section_scoring.keyword_presence(section_contents, terms)
+    match_totals = section_scoring.section_match_totals(
+        presence,
+        [matrix.row_columns(row) for row in range(len(matrix))],
+        [matrix.row_weights(row) for row in range(len(matrix))]
+    )
+    section_scores_list = section_scoring.section_scores(
+        section_names,
+        section_contents,
+        match_totals,
+        matrix.keyword_counts,
+        section_scoring.section_weight_matrix(job_types, section_names, SECTION_WEIGHTS)
+    )
+    
+    match_results_list = []
+    for row in range(len(job_descriptions)):
+        jd_elements = jd_elements_list[row]
+        columns = matrix.row_columns(row)
+        row_weights = matrix.row_weights(row)
+        total_keywords = int(matrix.keyword_counts[row])
+        
+        exact_mask = exact[columns]
+        semantic_mask = has_semantic[columns]
+        exact_matches = {
+            terms[column]: {
+                'weight': weight,
+                'frequency': int(frequency[column]),
+                'positions': found_terms[terms[column]]
+            }
+            for column, weight in zip(columns[exact_mask], row_weights[exact_mask])
+        }
+        semantic_matches = {}
+        for column, weight in zip(columns[semantic_mask], row_weights[semantic_mask]):
+            matched_with, factor, confidence = last_semantic[column]
+            semantic_matches[terms[column]] = {
+                'matched_with': matched_with,
+                'weight': weight * factor,
+                'confidence': confidence
+            }
+        
+        # Rank matches the same way as perform_matching: exact then semantic,
+        # stable within equal keys
+        ranked = list(exact_matches) + list(semantic_matches)
+        rank_keys = np.concatenate((
+            row_weights[exact_mask] * frequency[columns[exact_mask]],
+            [match['weight'] for match in semantic_matches.values()]
+        ))
+        top_matching = [ranked[i] for i in np.argsort(-rank_keys, kind='stable')[:15]]
+        
+        missing_mask = ~(exact_mask | semantic_mask)
+        missing_columns = columns[missing_mask]
+        missing_order = np.argsort(-row_weights[missing_mask], kind='stable')[:15]
+        top_missing = [terms[missing_columns[i]] for i in missing_order]
+        
+        match_results = {
+            'exact_matches': exact_matches,
+            'semantic_matches': semantic_matches,
+            'total_job_keywords': total_keywords,
+            'matched_job_keywords': float(matched_job_keywords[row]),
+            'weighted_match_score': float(weighted_match_scores[row]),
+            'top_matching_keywords': top_matching,
+            'top_missing_keywords': top_missing,
+            'keyword_density': (
+                float(matched_frequency[row]) / len(resume_tokens) * 100 if resume_tokens else 0
+            )
+        }
+        if scorer is not None:
+            match_results['bm25_score'] = scorer.score(
+                {terms[column]: frequency[column] for column in columns[exact_mask]},
+                len(resume_tokens),
+                jd_elements['keywords']
+            )
+        match_results_list.append(match_results)
+    
+    overall_scores = section_scoring.calibrated_scores([
+        section_scoring.calibration_features(match_results, section_scores)
+        for match_results, section_scores in zip(match_results_list, section_scores_list)
+    ])
+    
+    results = []
+    for row, (job_id, job_description) in enumerate(job_descriptions):
+        job_type = job_types[row]
+        jd_elements = jd_elements_list[row]
+        match_results = match_results_list[row]
+        section_scores = section_scores_list[row]
+        overall_score = float(overall_scores[row])
+        improvements = generate_enhanced_suggestions(
+            resume_content,
+            job_description,
+            match_results,
+            section_scores,
+            job_type
+        )
+        
+        result = format_analysis_result(
+            overall_score,
+            resume_keywords,
+            jd_elements,
+            match_results,
+            section_scores,
+            improvements,
+            job_type,
+            0.0
+        )
+        result['job_description_id'] = job_id
+        results.append(result)
+    
+    processing_time = time.time() - start_time
+    for result in results:
+        result['processing_time'] = processing_time / len(results)
+    
+    logfire.info(
+        "Batch ATS analysis performance metrics",
+        processing_time=round(processing_time, 2),
+        resume_size=len(resume_content),
+        job_count=len(job_descriptions),
+        vocabulary_size=len(terms)
+    )
+    
+    return sorted(results, key=lambda result: result['match_score'], reverse=True)
+
+
+def analyze_job_description(job_description: str) -> Tuple[str, Dict[str, Any], Dict[str, int]]:
+    """
+    Run the resume-independent analysis of a job description.
+    
+    Args:
+        job_description: The job description text
+        
+    Returns:
+        Tuple of (job type, job description elements, n-gram frequencies)
+    """
+    return (
+        detect_job_type(job_description),
+        process_job_description(job_description),
+        extract_ngrams(job_description)
+    )
+
+
+# Parsed job descriptions, keyed by a hash of their text
+JOB_ANALYSIS_CACHE = JobAnalysisCache(analyze_job_description, max_size=settings.ATS_JD_CACHE_SIZE)
+
+
+def get_job_analysis(job_description: str, db: Optional[Session] = None) -> JobAnalysis:
+    """
+    Get the cached analysis of a job description.
+    
+    Args:
+        job_description: The job description text
+        db: Optional database session; when given (and persistence is enabled)
+            the analysis is also loaded from and stored in the database
+        
+    Returns:
+        The job description analysis
+    """
+    if not settings.ATS_JD_CACHE_PERSIST:
+        db = None
+    return JOB_ANALYSIS_CACHE.get(job_description, db)
+
+
+def invalidate_job_analysis(job_description: str, db: Optional[Session] = None) -> None:
+    """
+    Drop the cached analysis of a job description whose text has changed.
+    
+    Args:
+        job_description: The previous job description text
+        db: Optional database session used to delete the persisted analysis
+    """
+    if not settings.ATS_JD_CACHE_PERSIST:
+        db = None
+    JOB_ANALYSIS_CACHE.invalidate(job_description, db)
 
 
 def detect_job_type(job_description: str) -> str:
@@ -301,64 +804,74 @@ def identify_sections(text: str) -> Dict[str, str]:
     """
     sections = {}
     lines = text.split('\n')
+    for section_name, _, content_start, end in section_blocks(lines):
+        if end > content_start:
+            sections[section_name] = '\n'.join(lines[content_start:end])
+    
+    return sections
+
+
+def section_blocks(lines: Sequence[str]) -> List[Tuple[str, int, int, int]]:
+    """
+    Split resume lines into consecutive section blocks.
+    
+    Each block covers lines[block_start:end]: the header line (if any) followed by
+    the section content lines[content_start:end]. Together the blocks cover every
+    line in order, so the text of a block is a stable unit for caching.
+    
+    Args:
+        lines: The resume text split into lines
+        
+    Returns:
+        List of (section name, block start, content start, end) line indexes
+    """
+    blocks = []
     current_section = "unknown"
-    section_content = []
+    block_start = content_start = 0
+    
+    for index, line in enumerate(lines):
+        header = _section_header(line.strip().lower())
+        if header is not None:
+            blocks.append((current_section, block_start, content_start, index))
+            current_section = header
+            block_start, content_start = index, index + 1
+    
+    blocks.append((current_section, block_start, content_start, len(lines)))
+    return blocks
+
+
+@lru_cache(maxsize=4096)
+def _section_header(line_lower: str) -> Optional[str]:
+    """
+    Get the section a line starts, if it is a section header.
+    
+    Args:
+        line_lower: The stripped, lowercased line
+        
+    Returns:
+        The section name, or None if the line is not a header
+    """
+    header = None
     
     # Check for sections based on common headers and patterns
-    for line in lines:
-        line_lower = line.strip().lower()
+    for section_name, section_patterns in RESUME_SECTIONS.items():
+        # Check exact matches first
+        if line_lower in section_patterns:
+            return section_name
         
-        # Check if line is a section header
-        found_section = False
-        for section_name, section_patterns in RESUME_SECTIONS.items():
-            # Check exact matches first
-            if line_lower in section_patterns:
-                # Save previous section
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                
-                # Start new section
-                current_section = section_name
-                section_content = []
-                found_section = True
-                break
-            
-            # Check for header patterns (all caps, followed by colon, etc)
-            elif any(pattern in line_lower for pattern in section_patterns):
-                # Save previous section
-                if section_content:
-                    sections[current_section] = '\n'.join(section_content)
-                
-                # Start new section
-                current_section = section_name
-                section_content = []
-                found_section = True
-                break
-            
-            # Check for markdown-style headers
-            elif line_lower.startswith(('#')):
-                header_text = re.sub(r'^#+\s*', '', line_lower)
-                for section_name, section_patterns in RESUME_SECTIONS.items():
-                    if any(pattern in header_text for pattern in section_patterns):
-                        # Save previous section
-                        if section_content:
-                            sections[current_section] = '\n'.join(section_content)
-                        
-                        # Start new section
-                        current_section = section_name
-                        section_content = []
-                        found_section = True
-                        break
+        # Check for header patterns (all caps, followed by colon, etc)
+        elif any(pattern in line_lower for pattern in section_patterns):
+            return section_name
         
-        # If not a section header, add to current section content
-        if not found_section:
-            section_content.append(line)
-    
-    # Add the last section
-    if section_content:
-        sections[current_section] = '\n'.join(section_content)
+        # Check for markdown-style headers
+        elif line_lower.startswith(('#')):
+            header_text = re.sub(r'^#+\s*', '', line_lower)
+            for markdown_section, markdown_patterns in RESUME_SECTIONS.items():
+                if any(pattern in header_text for pattern in markdown_patterns):
+                    header = markdown_section
+                    break
     
-    return sections
+    return header
 
 
 def process_job_description(text: str) -> Dict[str, Any]:
@@ -393,11 +906,14 @@ def process_job_description(text: str) -> Dict[str, Any]:
             # First line, relatively short, not a header
             elements['title'] = line.strip()
     
+    # Tokenize the whole description once; tokens never span lines
+    line_tokens = tokenize(text).line_tokens()
+    
     # Process sections
     current_section = "general"
     section_content = []
     
-    for line in lines:
+    for line, tokens in zip(lines, line_tokens):
         line_lower = line.lower().strip()
         
         # Check if line is a section header
@@ -433,7 +949,7 @@ def process_job_description(text: str) -> Dict[str, Any]:
                 elements['responsibilities'].append(item)
         
         # Process each line for weighted keywords
-        extract_weighted_keywords(line, elements['keywords'], current_section)
+        extract_weighted_keywords(line, elements['keywords'], current_section, tokens)
     
     # Save the last section
     if section_content:
@@ -442,7 +958,12 @@ def process_job_description(text: str) -> Dict[str, Any]:
     return elements
 
 
-def extract_weighted_keywords(line: str, keywords_dict: Dict[str, float], section_name: str):
+def extract_weighted_keywords(
+    line: str,
+    keywords_dict: Dict[str, float],
+    section_name: str,
+    tokens: Optional[Sequence[str]] = None
+):
     """
     Extract keywords from a line and assign weights based on position and context.
     
@@ -450,6 +971,7 @@ def extract_weighted_keywords(line: str, keywords_dict: Dict[str, float], sectio
         line: The line of text
         keywords_dict: Dictionary to update with keywords and weights
         section_name: Current section name
+        tokens: Optional pre-computed tokens for the line
     """
     # Position weights
     HEADER_WEIGHT = 2.0
@@ -478,7 +1000,8 @@ def extract_weighted_keywords(line: str, keywords_dict: Dict[str, float], sectio
         weight *= 1.3
     
     # Process the text with n-grams
-    tokens = process_text(line_lower)
+    if tokens is None:
+        tokens = tokenize(line_lower).tokens
     
     # Add single tokens with their weights
     stop_words = get_combined_stopwords()
@@ -488,7 +1011,7 @@ def extract_weighted_keywords(line: str, keywords_dict: Dict[str, float], sectio
     
     # Process n-grams
     for n in range(2, 4):  # 2-3 grams
-        n_grams = list(ngrams(tokens, n))
+        n_grams = list(zip(*(tokens[i:] for i in range(n))))
         for gram in n_grams:
             if all(token not in stop_words for token in gram):
                 gram_text = ' '.join(gram)
@@ -510,13 +1033,7 @@ def is_technical_term(term: str) -> bool:
     Returns:
         True if term is in the skills taxonomy, False otherwise
     """
-    # Flatten the skills taxonomy
-    all_skills = set()
-    for category, skills in SKILLS_TAXONOMY.items():
-        all_skills.add(category)
-        all_skills.update(skills)
-    
-    return term.lower() in all_skills
+    return SKILL_ALIASES.canonical_term(term) in TAXONOMY_INDEX.terms
 
 
 def process_text(text: str) -> List[str]:
@@ -529,24 +1046,7 @@ def process_text(text: str) -> List[str]:
     Returns:
         List of processed tokens
     """
-    # Remove URLs and HTML-like content
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-    text = re.sub(r'\[.*?\]', '', text)
-    text = re.sub(r'\(.*?\)', '', text)
-    
-    # Replace non-alphanumeric with space
-    text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-    
-    # Tokenize and lowercase
-    tokens = re.findall(r'\b\w+\b', text.lower())
-    
-    # Keep only meaningful words
-    tokens = [
-        word for word in tokens 
-        if any(c.isalnum() for c in word) 
-        and len(word) > 2  # Filter out very short words
-    ]
-    return tokens
+    return list(tokenize(text).tokens)
 
 
 def extract_ngrams(text: str) -> Dict[str, int]:
@@ -559,45 +1059,164 @@ def extract_ngrams(text: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping n-grams to frequencies
     """
-    result = defaultdict(int)
+    return defaultdict(int, tokenize(text).ngram_counts(get_combined_stopwords()))
+
+
+def _matchable_tokens(term: str, stop_words: Set[str]) -> Optional[List[str]]:
+    """
+    Tokenize a term for the keyword automaton.
     
-    # Convert to lowercase and tokenize
-    tokens = process_text(text.lower())
+    Returns None for terms that can never appear in the resume n-grams
+    produced by extract_ngrams, so automaton matches agree with n-gram lookups.
+    """
+    if len(term) <= 3:
+        return None
+    tokens = process_text(term)
+    # Skip terms that tokenization would alter (e.g. "node.js", "ci/cd")
+    if ' '.join(tokens) != term:
+        return None
+    if len(tokens) > 1 and any(token in stop_words for token in tokens):
+        return None
+    return tokens
+
+
+@lru_cache(maxsize=1)
+def _taxonomy_patterns() -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Tokenize the skills taxonomy terms once for automaton construction."""
     stop_words = get_combined_stopwords()
+    patterns = []
+    for term in sorted(TAXONOMY_INDEX.terms):
+        tokens = _matchable_tokens(term, stop_words)
+        if tokens:
+            patterns.append((term, tuple(tokens)))
+    return tuple(patterns)
+
+
+def build_keyword_matcher(job_keywords: Iterable[str]) -> KeywordAutomaton:
+    """
+    Build a keyword automaton over the job keywords and the skills taxonomy.
     
-    # Extract n-grams of different sizes
-    for n in range(1, 4):  # 1-3 grams
-        n_grams = list(ngrams(tokens, n))
-        for gram in n_grams:
-            # Filter out n-grams with stop words
-            if n > 1 and any(token in stop_words for token in gram):
-                continue
+    Args:
+        job_keywords: Keywords extracted from the job description
+        
+    Returns:
+        Compiled automaton recognising job keywords and taxonomy terms
+    """
+    stop_words = get_combined_stopwords()
+    automaton = KeywordAutomaton()
+    
+    for term in job_keywords:
+        tokens = _matchable_tokens(term, stop_words)
+        if tokens:
+            automaton.add(term, tokens)
+    
+    for term, tokens in _taxonomy_patterns():
+        automaton.add(term, tokens)
+    
+    return automaton.build()
+
+
+def find_taxonomy_matches(
+    job_keyword: str,
+    found_terms: Container[str]
+) -> List[Tuple[str, float, str]]:
+    """
+    Find taxonomy relationships between a job keyword and terms in the resume.
+    
+    Each related category is checked in taxonomy order. A keyword can pick up
+    credit from more than one category; callers accumulate every match and
+    keep the last one as the reported relationship.
+    
+    Args:
+        job_keyword: Job keyword that was not matched exactly
+        found_terms: Terms found in the resume
+        
+    Returns:
+        List of (matched_with, weight factor, confidence) tuples
+    """
+    matches = []
+    
+    # Visit only the categories related to this keyword, in taxonomy order
+    for category in TAXONOMY_INDEX.related_categories(job_keyword):
+        skills = TAXONOMY_INDEX.category_skills[category]
+        
+        # If job keyword is in a category's skills
+        if job_keyword != category:
+            # Check if resume has the category or any of its skills
+            if category in found_terms:
+                # Reduce weight for category match
+                matches.append((category, 0.8, 'medium'))
+                break
             
-            gram_text = ' '.join(gram)
-            if len(gram_text) > 3:  # Avoid very short n-grams
-                result[gram_text] += 1
+            # Check for sibling skills
+            for skill in skills:
+                if skill != job_keyword and skill in found_terms:
+                    # Reduce weight for sibling match
+                    matches.append((skill, 0.7, 'medium'))
+                    break
+                    
+        # If job keyword is a category
+        else:
+            # Check if resume has any of its skills
+            for skill in skills:
+                if skill in found_terms:
+                    # Higher match for skill under category
+                    matches.append((skill, 0.85, 'high'))
+                    break
     
-    return result
+    return matches
 
 
 def perform_matching(
     resume_text: str, 
     resume_sections: Dict[str, str], 
-    resume_ngrams: Dict[str, int], 
     job_description: str, 
     jd_elements: Dict[str, Any], 
-    job_ngrams: Dict[str, int]
+    job_ngrams: Dict[str, int],
+    scorer: Optional[BM25Scorer] = None
 ) -> Dict[str, Any]:
     """
     Perform weighted matching between resume and job description.
     
+    Job keywords are found by scanning resume_text once with a keyword
+    automaton.
+    
     Args:
         resume_text: The resume text
         resume_sections: Dictionary of resume sections
-        resume_ngrams: Dictionary of resume n-grams
         job_description: The job description text
         jd_elements: Dictionary of job description elements
         job_ngrams: Dictionary of job description n-grams
+        scorer: Optional corpus BM25 scorer; adds a bm25_score to the results
+        
+    Returns:
+        Dictionary with matching results
+    """
+    weighted_job_keywords = jd_elements['keywords']
+    
+    # Scan the resume once for every job keyword and taxonomy term
+    resume_tokens = tokenize(resume_text).tokens
+    matcher = build_keyword_matcher(weighted_job_keywords)
+    found_terms = matcher.find_all(resume_tokens)
+    
+    return summarize_matches(found_terms, len(resume_tokens), weighted_job_keywords, scorer)
+
+
+def summarize_matches(
+    found_terms: Dict[str, List[int]],
+    token_count: int,
+    weighted_job_keywords: Dict[str, float],
+    scorer: Optional[BM25Scorer] = None
+) -> Dict[str, Any]:
+    """
+    Score the keyword and taxonomy terms found in a resume.
+    
+    Args:
+        found_terms: Start positions of each job keyword and taxonomy term
+            found in the resume tokens
+        token_count: Number of resume tokens scanned
+        weighted_job_keywords: Job description keywords with their weights
+        scorer: Optional corpus BM25 scorer; adds a bm25_score to the results
         
     Returns:
         Dictionary with matching results
@@ -605,7 +1224,7 @@ def perform_matching(
     result = {
         'exact_matches': {},
         'semantic_matches': {},
-        'total_job_keywords': 0,
+        'total_job_keywords': len(weighted_job_keywords),
         'matched_job_keywords': 0,
         'weighted_match_score': 0,
         'top_matching_keywords': [],
@@ -613,17 +1232,15 @@ def perform_matching(
         'keyword_density': 0
     }
     
-    # Get weighted job keywords
-    weighted_job_keywords = jd_elements['keywords']
-    result['total_job_keywords'] = len(weighted_job_keywords)
-    
     # 1. Exact matching with n-grams
     for job_keyword, job_weight in weighted_job_keywords.items():
-        if job_keyword in resume_ngrams:
+        positions = found_terms.get(job_keyword)
+        if positions:
             match_weight = job_weight
             result['exact_matches'][job_keyword] = {
                 'weight': match_weight,
-                'frequency': resume_ngrams[job_keyword]
+                'frequency': len(positions),
+                'positions': positions
             }
             result['matched_job_keywords'] += 1
             result['weighted_match_score'] += match_weight
@@ -634,49 +1251,17 @@ def perform_matching(
         if job_keyword in result['exact_matches']:
             continue
         
-        # Check if this is a skill with related skills
-        for category, skills in SKILLS_TAXONOMY.items():
-            # If job keyword is in a category's skills
-            if job_keyword in skills:
-                # Check if resume has the category or any of its skills
-                if category in resume_ngrams:
-                    result['semantic_matches'][job_keyword] = {
-                        'matched_with': category,
-                        'weight': job_weight * 0.8,  # Reduce weight for category match
-                        'confidence': 'medium'
-                    }
-                    result['weighted_match_score'] += job_weight * 0.8
-                    result['matched_job_keywords'] += 0.8  # Partial match
-                    break
-                
-                # Check for sibling skills
-                for skill in skills:
-                    if skill != job_keyword and skill in resume_ngrams:
-                        result['semantic_matches'][job_keyword] = {
-                            'matched_with': skill,
-                            'weight': job_weight * 0.7,  # Reduce weight for sibling match
-                            'confidence': 'medium'
-                        }
-                        result['weighted_match_score'] += job_weight * 0.7
-                        result['matched_job_keywords'] += 0.7  # Partial match
-                        break
-                        
-            # If job keyword is a category
-            elif job_keyword == category:
-                # Check if resume has any of its skills
-                for skill in skills:
-                    if skill in resume_ngrams:
-                        result['semantic_matches'][job_keyword] = {
-                            'matched_with': skill,
-                            'weight': job_weight * 0.85,  # Higher match for skill under category
-                            'confidence': 'high'
-                        }
-                        result['weighted_match_score'] += job_weight * 0.85
-                        result['matched_job_keywords'] += 0.85  # Strong partial match
-                        break
+        for matched_with, factor, confidence in find_taxonomy_matches(job_keyword, found_terms):
+            result['semantic_matches'][job_keyword] = {
+                'matched_with': matched_with,
+                'weight': job_weight * factor,
+                'confidence': confidence
+            }
+            result['weighted_match_score'] += job_weight * factor
+            result['matched_job_keywords'] += factor  # Partial match
     
     # Calculate keyword density
-    total_resume_words = len(process_text(resume_text))
+    total_resume_words = token_count
     if total_resume_words > 0:
         matched_keywords_count = sum(data['frequency'] for data in result['exact_matches'].values())
         result['keyword_density'] = (matched_keywords_count / total_resume_words) * 100
@@ -700,6 +1285,13 @@ def perform_matching(
     sorted_missing = sorted(missing_keywords.items(), key=lambda x: x[1], reverse=True)
     result['top_missing_keywords'] = [keyword for keyword, _ in sorted_missing[:15]]
     
+    if scorer is not None:
+        result['bm25_score'] = scorer.score(
+            {keyword: data['frequency'] for keyword, data in result['exact_matches'].items()},
+            token_count,
+            weighted_job_keywords
+        )
+    
     return result
 
 
@@ -719,49 +1311,24 @@ def calculate_section_scores(
     Returns:
         Dictionary mapping section names to scores
     """
-    section_scores = {}
-    section_weights = SECTION_WEIGHTS.get(job_type, SECTION_WEIGHTS['default'])
-    
-    # Process each resume section
-    for section_name, section_content in resume_sections.items():
-        if section_name == "unknown":
-            continue
-            
-        # Get the appropriate weight for this section
-        section_weight = section_weights.get(section_name, 1.0)
-        
-        # Skip empty sections
-        if not section_content.strip():
-            section_scores[section_name] = 0
-            continue
-        
-        # Calculate match score for this section
-        section_tokens = process_text(section_content.lower())
-        section_text = ' '.join(section_tokens)
-        
-        matches = 0
-        total_keywords = 0
-        
-        # Check matches against job keywords
-        for keyword, weight in jd_elements['keywords'].items():
-            total_keywords += 1
-            if ' ' in keyword:  # Multi-word keyword
-                if keyword in section_text:
-                    matches += weight
-            else:  # Single word
-                if keyword in section_tokens:
-                    matches += weight
-        
-        # Calculate section score
-        if total_keywords > 0:
-            raw_score = (matches / total_keywords) * 100
-            # Apply section weight
-            weighted_score = raw_score * section_weight
-            section_scores[section_name] = min(round(weighted_score, 2), 100)
-        else:
-            section_scores[section_name] = 0
-    
-    return section_scores
+    section_names = [name for name in resume_sections if name != "unknown"]
+    section_contents = [resume_sections[name] for name in section_names]
+    keywords = jd_elements['keywords']
+    
+    # One job: every keyword is a row of the presence matrix, in keyword order
+    presence = section_scoring.keyword_presence(section_contents, list(keywords))
+    match_totals = section_scoring.section_match_totals(
+        presence,
+        [np.arange(len(keywords))],
+        [np.fromiter(keywords.values(), dtype=np.float64, count=len(keywords))]
+    )
+    return section_scoring.section_scores(
+        section_names,
+        section_contents,
+        match_totals,
+        [len(keywords)],
+        section_scoring.section_weight_matrix([job_type], section_names, SECTION_WEIGHTS)
+    )[0]
 
 
 def calculate_calibrated_score(
@@ -778,53 +1345,8 @@ def calculate_calibrated_score(
     Returns:
         Calibrated ATS score
     """
-    # Base factors
-    exact_match_score = 0
-    semantic_match_score = 0
-    section_coverage_score = 0
-    density_score = 0
-    
-    # Calculate exact match component - MORE RESPONSIVE SIGMOID CURVE
-    if match_results['total_job_keywords'] > 0:
-        raw_match_ratio = match_results['weighted_match_score'] / (match_results['total_job_keywords'] * 2)
-        # Modified sigmoid with steeper curve for more responsiveness
-        exact_match_score = (1 / (1 + math.exp(-12 * (raw_match_ratio - 0.4)))) * 55
-    
-    # Calculate section coverage component
-    important_sections = ['experience', 'skills', 'education', 'summary']
-    covered_sections = sum(1 for section in important_sections if section in section_scores and section_scores[section] > 0)
-    section_coverage_score = (covered_sections / len(important_sections)) * 12
-    
-    # Calculate semantic match component
-    semantic_matches_count = len(match_results['semantic_matches'])
-    semantic_match_score = min(semantic_matches_count * 1.8, 18)
-    
-    # Calculate keyword density component
-    optimal_density = 5.0  # 5% is generally considered optimal
-    density = match_results.get('keyword_density', 0)
-    if density <= optimal_density:
-        density_score = (density / optimal_density) * 10
-    else:
-        # Less penalization for keyword density over optimal
-        density_score = 10 - min(((density - optimal_density) / 7) * 10, 8)
-    
-    # Calculate bonus for high-value keywords
-    high_value_keywords = sum(1 for kw in match_results.get('exact_matches', {}) 
-                          if kw in match_results.get('top_matching_keywords', [])[:5])
-    high_value_bonus = min(high_value_keywords * 1.5, 5)
-    
-    # Calculate overall score with industry-calibrated baseline
-    base_score_adjustment = 30
-    scaling_factor = 0.8
-    raw_score = base_score_adjustment + (
-        exact_match_score + semantic_match_score + section_coverage_score + 
-        density_score + high_value_bonus
-    ) * scaling_factor
-    
-    # Ensure score is within 0-100 range
-    final_score = max(0, min(100, raw_score))
-    
-    return final_score
+    features = section_scoring.calibration_features(match_results, section_scores)
+    return float(section_scoring.calibrated_scores([features])[0])
 
 
 def calculate_confidence(match_results: Dict[str, Any]) -> str:
@@ -997,15 +1519,75 @@ def extract_keywords(text: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping keywords to their frequency
     """
+    return extract_keywords_batch([text])[0]
+
+
+def extract_keywords_batch(texts: Sequence[str], n_process: Optional[int] = None) -> List[Dict[str, int]]:
+    """
+    Extract keywords from several texts in one pass.
+    
+    With spaCy available, all texts go through a single ``nlp.pipe`` call with
+    the components keyword extraction doesn't read disabled, and results are
+    cached by text hash.
+    
+    Args:
+        texts: The texts to extract keywords from
+        n_process: Number of processes for spaCy (defaults to SPACY_N_PROCESS)
+    
+    Returns:
+        One dictionary mapping keywords to their frequency per text
+    """
+    return [
+        filter_technical_terms(counts)
+        for counts in extract_keyword_counts_batch(texts, n_process)
+    ]
+
+
+def extract_keyword_counts_batch(texts: Sequence[str], n_process: Optional[int] = None) -> List[Dict[str, int]]:
+    """
+    Count candidate keywords in several texts, before frequency filtering.
+    
+    Counts from different parts of a document can be summed and then passed
+    to filter_technical_terms.
+    
+    Args:
+        texts: The texts to count keywords in
+        n_process: Number of processes for spaCy (defaults to SPACY_N_PROCESS)
+    
+    Returns:
+        One dictionary mapping candidate keywords to their frequency per text
+        (shared with the spaCy cache; do not mutate)
+    """
     # Convert to lowercase
-    text = text.lower()
+    texts = [text.lower() for text in texts]
     
     # Try to use spaCy for enhanced NLP if available
-    if spacy_model is not None:
-        return extract_keywords_with_spacy(text)
+    extractor = get_spacy_keyword_extractor()
+    if extractor is not None:
+        return extractor.extract(texts, n_process)
     else:
         # Fallback to basic NLTK approach
-        return extract_keywords_with_nltk(text)
+        return [keyword_counts_with_nltk(text) for text in texts]
+
+
+@lru_cache(maxsize=1)
+def get_spacy_keyword_extractor() -> Optional[SpacyBatchExtractor]:
+    """
+    Get the batched spaCy keyword extractor, if spaCy is available.
+    
+    Returns:
+        The extractor, or None when no spaCy model is loaded
+    """
+    spacy_model = get_spacy_model()
+    if spacy_model is None:
+        return None
+    return SpacyBatchExtractor(
+        spacy_model,
+        keyword_counts_from_doc,
+        KEYWORD_COMPONENTS,
+        batch_size=settings.SPACY_BATCH_SIZE,
+        n_process=settings.SPACY_N_PROCESS
+    )
 
 
 def extract_keywords_with_spacy(text: str) -> Dict[str, int]:
@@ -1018,8 +1600,33 @@ def extract_keywords_with_spacy(text: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping keywords to their frequency
     """
-    # Process the text with spaCy
-    doc = spacy_model(text)
+    return filter_technical_terms(get_spacy_keyword_extractor().extract([text])[0])
+
+
+def keywords_from_doc(doc) -> Dict[str, int]:
+    """
+    Extract keywords from a text processed by spaCy.
+    
+    Args:
+        doc: The processed spaCy Doc
+    
+    Returns:
+        Dictionary mapping keywords to their frequency
+    """
+    return filter_technical_terms(keyword_counts_from_doc(doc))
+
+
+def keyword_counts_from_doc(doc) -> Dict[str, int]:
+    """
+    Count candidate keywords in a text processed by spaCy.
+    
+    Args:
+        doc: The processed spaCy Doc
+    
+    Returns:
+        Dictionary mapping candidate keywords to their frequency
+    """
+    text = doc.text
     
     # Get stopwords from both spaCy and NLTK for better filtering
     stop_words = get_combined_stopwords()
@@ -1063,10 +1670,7 @@ def extract_keywords_with_spacy(text: str) -> Dict[str, int]:
         else:
             keyword_freq[element] = 1
     
-    # Filter to keep only keywords appearing more than once or technical terms
-    filtered_keywords = filter_technical_terms(keyword_freq)
-    
-    return filtered_keywords
+    return keyword_freq
 
 
 def extract_keywords_with_nltk(text: str) -> Dict[str, int]:
@@ -1079,27 +1683,33 @@ def extract_keywords_with_nltk(text: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping keywords to their frequency
     """
-    # Simple tokenization approach - split by whitespace and punctuation
-    tokens = re.findall(r'\b\w+\b', text)
+    # Filter to keep only keywords appearing more than once or technical terms
+    return filter_technical_terms(keyword_counts_with_nltk(text))
+
+
+def keyword_counts_with_nltk(text: str) -> Dict[str, int]:
+    """
+    Count candidate keywords using basic NLTK and regex tokenization.
+    
+    Args:
+        text: The text to count keywords in
+    
+    Returns:
+        Dictionary mapping candidate keywords to their frequency
+    """
+    tokenized = tokenize(text)
     
     # Remove stopwords and short words
-    stop_words = set(stopwords.words('english'))
+    stop_words = get_english_stopwords()
     filtered_tokens = [
-        token for token in tokens 
+        token for token in tokenized.words 
         if token not in stop_words 
         and token.isalpha() 
         and len(token) > 2
     ]
     
-    # Extract phrases (2-3 word combinations) that might be important
-    phrases = []
-    for i in range(len(tokens) - 1):
-        if tokens[i].isalpha() and tokens[i+1].isalpha():
-            phrases.append(f"{tokens[i]} {tokens[i+1]}")
-    
-    for i in range(len(tokens) - 2):
-        if tokens[i].isalpha() and tokens[i+1].isalpha() and tokens[i+2].isalpha():
-            phrases.append(f"{tokens[i]} {tokens[i+1]} {tokens[i+2]}")
+    # Extract phrases (2-3 word combinations) that occur in the text
+    phrases = tokenized.word_phrases(2, 3)
     
     # Count keyword frequencies
     keyword_freq = {}
@@ -1111,27 +1721,40 @@ def extract_keywords_with_nltk(text: str) -> Dict[str, int]:
     
     # Add important phrases
     for phrase in phrases:
-        if phrase in text.lower():
-            if phrase in keyword_freq:
-                keyword_freq[phrase] += 1
-            else:
-                keyword_freq[phrase] = 1
+        if phrase in keyword_freq:
+            keyword_freq[phrase] += 1
+        else:
+            keyword_freq[phrase] = 1
     
-    # Filter to keep only keywords appearing more than once or technical terms
-    filtered_keywords = filter_technical_terms(keyword_freq)
+    return keyword_freq
+
+
+@lru_cache(maxsize=1)
+def get_english_stopwords() -> FrozenSet[str]:
+    """
+    Get the NLTK English stopword list, loaded once.
     
-    return filtered_keywords
+    Returns:
+        Set of stopwords
+    """
+    from nltk.corpus import stopwords
+
+    ensure_nltk_stopwords()
+    return frozenset(stopwords.words('english'))
 
 
-def get_combined_stopwords() -> Set[str]:
+@lru_cache(maxsize=1)
+def get_combined_stopwords() -> FrozenSet[str]:
     """
     Get a combined set of stopwords from NLTK and custom additions.
     
+    The set is built once and shared, so callers must not modify it.
+    
     Returns:
         Set of stopwords
     """
     # Get NLTK stopwords
-    stop_words = set(stopwords.words('english'))
+    stop_words = get_english_stopwords()
     
     # Add custom stopwords relevant to resumes and job descriptions
     custom_stopwords = {
@@ -1158,19 +1781,7 @@ def extract_ngrams_from_tokens(text: str, tokens: List[str], min_n: int = 2, max
     Returns:
         List of extracted phrases
     """
-    # Simple tokenization for phrase extraction
-    words = re.findall(r'\b\w+\b', text)
-    phrases = []
-    
-    # Extract phrases of different lengths
-    for n in range(min_n, max_n + 1):
-        for i in range(len(words) - n + 1):
-            if all(words[i+j].isalpha() for j in range(n)):
-                phrase = ' '.join(words[i:i+n])
-                if phrase in text.lower():
-                    phrases.append(phrase)
-    
-    return phrases
+    return tokenize(text).word_phrases(min_n, max_n)
 
 
 def filter_technical_terms(keyword_freq: Dict[str, int]) -> Dict[str, int]:
@@ -1183,17 +1794,20 @@ def filter_technical_terms(keyword_freq: Dict[str, int]) -> Dict[str, int]:
     Returns:
         Filtered dictionary of keywords
     """
-    # Technical terms pattern - expanded to include more technologies and skills
-    technical_pattern = r'(python|java|javascript|typescript|react|node|sql|nosql|aws|azure|gcp|docker|kubernetes|machine learning|data science|artificial intelligence|blockchain|devops|agile|scrum|kanban|html|css|api|rest|graphql|mongodb|express|vue|angular|swift|kotlin|c\+\+|ruby|php|golang|rust|scala|hadoop|spark|tensorflow|pytorch|nlp|ci\/cd|git|github|gitlab|bitbucket|jira|confluence|jenkins|terraform|ansible|chef|puppet|linux|unix|windows|macos|ios|android|cloud|saas|paas|iaas|frontend|backend|fullstack|database|security|testing|qa|ux|ui|design|product|project|management|leadership|communication|teamwork|problem solving|critical thinking|creativity|innovation|analytical|detail oriented|results driven|customer focused|strategic thinking|negotiation|presentation|mentoring|coaching|training)'
-    
     filtered_keywords = {}
     for keyword, count in keyword_freq.items():
-        if count > 1 or re.search(technical_pattern, keyword.lower()):
+        if count > 1 or _mentions_technical_term(keyword):
             filtered_keywords[keyword] = count
     
     return filtered_keywords
 
 
+@lru_cache(maxsize=16384)
+def _mentions_technical_term(keyword: str) -> bool:
+    """Whether a keyword contains one of the technical terms in the skill alias table."""
+    return SKILL_ALIASES.mentions_technical_term(keyword)
+
+
 def generate_improvement_suggestions(
     resume_content: str, 
     job_description: str, 
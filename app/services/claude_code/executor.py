@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import shutil
@@ -9,9 +10,11 @@ import subprocess
 import tempfile
 import threading
 import uuid
-from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
 
 from app.services.claude_code import output_parser, prompt_manager, subprocess_runner
+from app.services.claude_code.scheduler import QueueFullError, get_customization_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,19 @@ class ClaudeCodeExecutionError(Exception):
     """Exception raised when Claude Code execution fails."""
 
 
+@dataclass
+class _CustomizationRun:
+    """State of one customization between starting and collecting results."""
+
+    task: Any
+    task_id: str
+    log_streamer: Any
+    temp_dir: str
+    prompt: str
+    command: List[str]
+    timeout_seconds: int
+
+
 class ClaudeCodeExecutor:
     """Service for running Claude Code resume customization tasks."""
 
@@ -45,15 +61,14 @@ class ClaudeCodeExecutor:
         os.makedirs(temp_dir, exist_ok=True)
         return temp_dir
 
-    def customize_resume(
+    def _start_run(
         self,
         resume_path: str,
         job_description_path: str,
-        output_path: str,
-        task_id: Optional[str] = None,
-        timeout: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Execute resume customization using Claude Code."""
+        task_id: Optional[str],
+        timeout: Optional[int],
+    ) -> _CustomizationRun:
+        """Set up the task, logs, workspace and command of one customization."""
         from app.core.config import settings
         from app.services.claude_code.log_streamer import get_log_streamer
         from app.services.claude_code.progress_tracker import progress_tracker
@@ -97,25 +112,87 @@ class ClaudeCodeExecutor:
         if mcp_config_path:
             command.extend(["--mcp-config", mcp_config_path])
 
+        return _CustomizationRun(
+            task=task,
+            task_id=task_id,
+            log_streamer=log_streamer,
+            temp_dir=temp_dir,
+            prompt=prompt,
+            command=command,
+            timeout_seconds=timeout_seconds,
+        )
+
+    def _execution_error(
+        self, run: _CustomizationRun, exc: subprocess.SubprocessError
+    ) -> ClaudeCodeExecutionError:
+        """Log a failed Claude Code process and convert its error."""
+        if isinstance(exc, subprocess.TimeoutExpired):
+            run.log_streamer.add_log(
+                run.task_id, "ERROR: Claude Code execution timed out", level="error"
+            )
+            return ClaudeCodeExecutionError("Claude Code execution timed out")
+        run.log_streamer.add_log(
+            run.task_id, f"Process failed with code {exc.returncode}", level="error"
+        )
+        return ClaudeCodeExecutionError("Claude Code process failed")
+
+    def customize_resume(
+        self,
+        resume_path: str,
+        job_description_path: str,
+        output_path: str,
+        task_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Execute resume customization using Claude Code."""
+        run = self._start_run(resume_path, job_description_path, task_id, timeout)
         try:
             stdout_content = subprocess_runner.run_claude_subprocess(
-                command=command,
-                temp_dir=temp_dir,
-                prompt=prompt,
-                log_streamer=log_streamer,
-                task_id=task_id,
-                timeout_seconds=timeout_seconds,
-            )
-        except subprocess.TimeoutExpired:
-            log_streamer.add_log(
-                task_id, "ERROR: Claude Code execution timed out", level="error"
+                command=run.command,
+                temp_dir=run.temp_dir,
+                prompt=run.prompt,
+                log_streamer=run.log_streamer,
+                task_id=run.task_id,
+                timeout_seconds=run.timeout_seconds,
             )
-            raise ClaudeCodeExecutionError("Claude Code execution timed out")
-        except subprocess.CalledProcessError as exc:
-            log_streamer.add_log(
-                task_id, f"Process failed with code {exc.returncode}", level="error"
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as exc:
+            raise self._execution_error(run, exc)
+
+        return self._finish_run(run, resume_path, output_path, stdout_content)
+
+    async def customize_resume_async(
+        self,
+        resume_path: str,
+        job_description_path: str,
+        output_path: str,
+        task_id: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Execute resume customization using Claude Code on the running event loop."""
+        run = self._start_run(resume_path, job_description_path, task_id, timeout)
+        try:
+            stdout_content = await subprocess_runner.run_claude_subprocess_async(
+                command=run.command,
+                temp_dir=run.temp_dir,
+                prompt=run.prompt,
+                log_streamer=run.log_streamer,
+                task_id=run.task_id,
+                timeout_seconds=run.timeout_seconds,
             )
-            raise ClaudeCodeExecutionError("Claude Code process failed")
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as exc:
+            raise self._execution_error(run, exc)
+
+        return self._finish_run(run, resume_path, output_path, stdout_content)
+
+    def _finish_run(
+        self,
+        run: _CustomizationRun,
+        resume_path: str,
+        output_path: str,
+        stdout_content: str,
+    ) -> Dict[str, Any]:
+        """Collect, save and record the results of a finished customization."""
+        temp_dir, task, log_streamer = run.temp_dir, run.task, run.log_streamer
 
         files_found = os.listdir(temp_dir)
         customized_resume_path = os.path.join(temp_dir, "new_customized_resume.md")
@@ -146,7 +223,7 @@ class ClaudeCodeExecutor:
                 parsed_results["customization_summary"] = file.read()
 
         result = output_parser.save_results(parsed_results, output_path)
-        log_streamer.add_log(task_id, "Claude Code execution completed successfully")
+        log_streamer.add_log(run.task_id, "Claude Code execution completed successfully")
         
         # Read the original resume content
         original_resume_content = ""
@@ -177,35 +254,61 @@ class ClaudeCodeExecutor:
         output_path: str,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
         timeout: Optional[int] = None,
+        priority: int = 0,
     ) -> Dict[str, str]:
+        """
+        Start a customization in the background and return its task ID.
+
+        Called from a running event loop (e.g. an async endpoint), the
+        customization is queued on the customization scheduler and runs on
+        that loop once a slot is free; otherwise it runs on a new thread.
+
+        Raises:
+            QueueFullError: The scheduler's queue is full
+        """
         from app.services.claude_code.progress_tracker import progress_tracker
 
         task_id = str(uuid.uuid4())
-        progress_tracker.create_task().task_id = task_id
-        thread = threading.Thread(
-            target=self._run_customization_with_progress,
-            args=(
-                resume_path,
-                job_description_path,
-                output_path,
-                progress_callback,
-                task_id,
-                timeout,
-            ),
-            daemon=True,
+        task = progress_tracker.create_task()
+        task.task_id = task_id
+        args = (
+            resume_path,
+            job_description_path,
+            output_path,
+            progress_callback,
+            task_id,
+            timeout,
         )
-        thread.start()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            task.update("queued", 0, "Waiting for a free customization slot")
+            try:
+                get_customization_scheduler().submit(
+                    task_id,
+                    lambda: self._run_customization_with_progress_async(*args),
+                    priority,
+                )
+            except QueueFullError as exc:
+                task.set_error(str(exc))
+                raise
+        else:
+            thread = threading.Thread(
+                target=self._run_customization_with_progress,
+                args=args,
+                daemon=True,
+            )
+            thread.start()
         return {"task_id": task_id}
 
-    def _run_customization_with_progress(
+    def _progress_reporter(
         self,
-        resume_path: str,
-        job_description_path: str,
-        output_path: str,
-        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
         task_id: str,
-        timeout: Optional[int],
-    ) -> None:
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> Callable[[Optional[Exception]], None]:
         from app.services.claude_code.log_streamer import get_log_streamer
         from app.services.claude_code.progress_tracker import progress_tracker
 
@@ -218,6 +321,26 @@ class ClaudeCodeExecutor:
                 update["logs"] = logs
                 progress_callback(update)
 
+        def report(exc: Optional[Exception]) -> None:
+            if exc is None:
+                progress_tracker.get_task(task_id).update("completed", 100, "Completed")
+                callback({"task_id": task_id, "status": "completed", "progress": 100})
+            else:
+                progress_tracker.get_task(task_id).set_error(str(exc))
+                callback({"task_id": task_id, "status": "error", "progress": 0})
+
+        return report
+
+    def _run_customization_with_progress(
+        self,
+        resume_path: str,
+        job_description_path: str,
+        output_path: str,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        task_id: str,
+        timeout: Optional[int],
+    ) -> None:
+        report = self._progress_reporter(task_id, progress_callback)
         try:
             self.customize_resume(
                 resume_path=resume_path,
@@ -226,13 +349,33 @@ class ClaudeCodeExecutor:
                 task_id=task_id,
                 timeout=timeout,
             )
-            progress_tracker.get_task(task_id).update("completed", 100, "Completed")
-            if progress_callback:
-                callback({"task_id": task_id, "status": "completed", "progress": 100})
         except Exception as exc:
-            progress_tracker.get_task(task_id).set_error(str(exc))
-            if progress_callback:
-                callback({"task_id": task_id, "status": "error", "progress": 0})
+            report(exc)
+        else:
+            report(None)
+
+    async def _run_customization_with_progress_async(
+        self,
+        resume_path: str,
+        job_description_path: str,
+        output_path: str,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        task_id: str,
+        timeout: Optional[int],
+    ) -> None:
+        report = self._progress_reporter(task_id, progress_callback)
+        try:
+            await self.customize_resume_async(
+                resume_path=resume_path,
+                job_description_path=job_description_path,
+                output_path=output_path,
+                task_id=task_id,
+                timeout=timeout,
+            )
+        except Exception as exc:
+            report(exc)
+        else:
+            report(None)
 
     def validate_sdk_features(self) -> Dict[str, bool]:
         """Validate helper methods extracted into submodules."""
@@ -76,7 +76,7 @@ class Task:
             message: Detailed status message, optional
         """
         # Validate status parameter
-        valid_statuses = ["initializing", "in_progress", "completed", "error", "queued", "pending"]
+        valid_statuses = ["initializing", "in_progress", "completed", "error", "queued", "pending", "cancelled"]
         if status not in valid_statuses:
             logger.warning(f"Task {self.task_id}: Invalid status '{status}', using 'in_progress'")
             status = "in_progress"
@@ -0,0 +1,307 @@
+"""
+Bounded scheduling of Claude Code customizations.
+
+Each customization runs a ``claude`` process for minutes, so submissions are
+queued and at most a fixed number run at once. Jobs wait in a priority queue
+(first in, first out within a priority), run as asyncio tasks on the event
+loop, and can be cancelled while queued or running; cancelling a running job
+terminates its subprocess.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when a customization is submitted to a full queue."""
+
+
+class CustomizationCancelledError(Exception):
+    """Raised to waiters of a customization that was cancelled."""
+
+
+@dataclass
+class CustomizationJob:
+    """A submitted customization."""
+
+    task_id: str
+    run: Callable[[], Awaitable[Any]]
+    priority: int
+    sequence: int
+    future: asyncio.Future
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    task: Optional[asyncio.Task] = None
+    cancelled: bool = False
+
+    @property
+    def sort_key(self) -> Tuple[int, int]:
+        # Higher priority first, then submission order
+        return (-self.priority, self.sequence)
+
+    def __lt__(self, other: "CustomizationJob") -> bool:
+        return self.sort_key < other.sort_key
+
+    async def wait(self) -> Any:
+        """
+        Wait for the job and return its result.
+
+        Raises:
+            CustomizationCancelledError: The job was cancelled
+            Exception: Whatever the customization raised
+        """
+        return await asyncio.shield(self.future)
+
+
+class CustomizationScheduler:
+    """Run customizations on a fixed number of slots, queueing the rest."""
+
+    def __init__(
+        self,
+        slots: int = 2,
+        max_queue_size: int = 50,
+        default_duration_seconds: float = 300.0,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            slots: Maximum number of customizations running at once
+            max_queue_size: Maximum number of customizations waiting for a slot
+            default_duration_seconds: Run time assumed for ETAs until jobs finish
+        """
+        self.slots = max(1, slots)
+        self.max_queue_size = max_queue_size
+        self.default_duration_seconds = default_duration_seconds
+        self._queue: List[CustomizationJob] = []
+        self._queued: Dict[str, CustomizationJob] = {}
+        self._running: Dict[str, CustomizationJob] = {}
+        self._sequence = itertools.count()
+        # Run times of recent jobs, for ETAs
+        self._durations: Deque[float] = deque(maxlen=20)
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    def submit(
+        self,
+        task_id: str,
+        run: Callable[[], Awaitable[Any]],
+        priority: int = 0,
+    ) -> CustomizationJob:
+        """
+        Queue a customization, starting it right away if a slot is free.
+
+        Must be called from the event loop the jobs run on.
+
+        Args:
+            task_id: Progress tracker task ID of the customization
+            run: Function returning the coroutine that runs the customization
+            priority: Jobs with a higher priority start first
+
+        Returns:
+            The job, whose ``wait()`` gives the customization result
+
+        Raises:
+            QueueFullError: All slots are busy and the queue is full
+        """
+        if len(self._running) >= self.slots and len(self._queued) >= self.max_queue_size:
+            raise QueueFullError(
+                f"Customization queue is full ({self.max_queue_size} waiting)"
+            )
+
+        job = CustomizationJob(
+            task_id=task_id,
+            run=run,
+            priority=priority,
+            sequence=next(self._sequence),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, job)
+        self._queued[task_id] = job
+        self._dispatch()
+        return job
+
+    async def run(self, task_id: str, run: Callable[[], Awaitable[Any]], priority: int = 0) -> Any:
+        """
+        Queue a customization and wait for its result.
+
+        Args:
+            task_id: Progress tracker task ID of the customization
+            run: Function returning the coroutine that runs the customization
+            priority: Jobs with a higher priority start first
+
+        Returns:
+            The customization result
+        """
+        return await self.submit(task_id, run, priority).wait()
+
+    def cancel(self, task_id: str) -> Optional[str]:
+        """
+        Cancel a queued or running customization.
+
+        Args:
+            task_id: Task ID of the customization
+
+        Returns:
+            "queued" or "running" for the state the job was cancelled in,
+            or None if no such job is waiting or running
+        """
+        job = self._queued.pop(task_id, None)
+        if job is not None:
+            # Skipped when it reaches the top of the heap
+            job.cancelled = True
+            self.cancelled += 1
+            _set_exception(job.future, CustomizationCancelledError(f"Task {task_id} was cancelled"))
+            return "queued"
+
+        job = self._running.get(task_id)
+        if job is not None and job.task is not None:
+            job.cancelled = True
+            job.task.cancel()
+            return "running"
+        return None
+
+    def position(self, task_id: str) -> Optional[int]:
+        """
+        Get a queued job's place in line.
+
+        Args:
+            task_id: Task ID of the customization
+
+        Returns:
+            1 for the next job to start, or None if the job isn't queued
+        """
+        job = self._queued.get(task_id)
+        if job is None:
+            return None
+        return 1 + sum(1 for other in self._queued.values() if other < job)
+
+    def eta_seconds(self, task_id: str) -> Optional[float]:
+        """
+        Estimate the seconds until a job finishes.
+
+        Slots are assumed to free up as running jobs reach the average run
+        time of recent jobs, and queued jobs to start in order as they do.
+
+        Args:
+            task_id: Task ID of the customization
+
+        Returns:
+            Estimated seconds until the job finishes, or None if it is
+            neither queued nor running
+        """
+        duration = self.average_duration_seconds()
+        now = time.monotonic()
+
+        job = self._running.get(task_id)
+        if job is not None:
+            return max(duration - (now - job.started_at), 0.0)
+
+        job = self._queued.get(task_id)
+        if job is None:
+            return None
+
+        # Time until each slot is free
+        free_at = [max(duration - (now - running.started_at), 0.0) for running in self._running.values()]
+        free_at.extend([0.0] * (self.slots - len(free_at)))
+        heapq.heapify(free_at)
+        for waiting in sorted(self._queued.values()):
+            start = heapq.heappop(free_at)
+            if waiting is job:
+                return start + duration
+            heapq.heappush(free_at, start + duration)
+        return None
+
+    def average_duration_seconds(self) -> float:
+        """Get the average run time of recent jobs."""
+        if not self._durations:
+            return self.default_duration_seconds
+        return sum(self._durations) / len(self._durations)
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with slot, queue and outcome counts
+        """
+        return {
+            "slots": self.slots,
+            "running": len(self._running),
+            "queued": len(self._queued),
+            "max_queue_size": self.max_queue_size,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "average_duration_seconds": self.average_duration_seconds(),
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel every queued and running job, waiting for running ones to stop."""
+        for task_id in list(self._queued):
+            self.cancel(task_id)
+        running = [job.task for job in self._running.values() if job.task is not None]
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        while self._queue and len(self._running) < self.slots:
+            job = heapq.heappop(self._queue)
+            if job.cancelled:
+                continue
+            del self._queued[job.task_id]
+            job.started_at = time.monotonic()
+            self._running[job.task_id] = job
+            job.task = asyncio.get_running_loop().create_task(job.run())
+            # A callback rather than try/finally in a wrapper coroutine, since
+            # a task cancelled before its first step never runs its coroutine
+            job.task.add_done_callback(lambda task, job=job: self._finished(job, task))
+
+    def _finished(self, job: CustomizationJob, task: asyncio.Task) -> None:
+        del self._running[job.task_id]
+        if task.cancelled():
+            self.cancelled += 1
+            _set_exception(job.future, CustomizationCancelledError(f"Task {job.task_id} was cancelled"))
+        elif task.exception() is not None:
+            self.failed += 1
+            logger.warning("Customization %s failed: %s", job.task_id, task.exception())
+            _set_exception(job.future, task.exception())
+        else:
+            self.completed += 1
+            self._durations.append(time.monotonic() - job.started_at)
+            job.future.set_result(task.result())
+        self._dispatch()
+
+
+def _set_exception(future: asyncio.Future, exc: Exception) -> None:
+    future.set_exception(exc)
+    # Background jobs have no waiter; don't report the error as never retrieved
+    future.exception()
+
+
+_scheduler_instance: Optional[CustomizationScheduler] = None
+
+
+def get_customization_scheduler() -> CustomizationScheduler:
+    """Get or create the customization scheduler singleton."""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        from app.core.config import settings
+
+        _scheduler_instance = CustomizationScheduler(
+            slots=settings.CLAUDE_CODE_MAX_CONCURRENT,
+            max_queue_size=settings.CLAUDE_CODE_MAX_QUEUE,
+        )
+    return _scheduler_instance
@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import queue
 import subprocess
 import time
-from typing import List
+from typing import Dict, List
 
+from app.services.claude_code import output_parser
 
-def run_claude_subprocess(
-    command: List[str],
-    temp_dir: str,
-    prompt: str,
-    log_streamer,
-    task_id: str,
-    timeout_seconds: int,
-) -> str:
-    """Execute the Claude Code command and return its stdout."""
+# Longest stdout/stderr line read by the asyncio runner; stream-json events
+# carry whole file contents on one line
+STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+# Interval between progress and inactivity messages
+PROGRESS_INTERVAL_SECONDS = 30
+
+
+def _prepare_workspace(temp_dir: str, prompt: str) -> Dict[str, str]:
+    """Write the prompt and output instructions, returning the subprocess environment."""
     claude_work_dir = os.path.join(temp_dir, ".claude_work")
     os.makedirs(claude_work_dir, exist_ok=True)
     input_dir = os.path.join(claude_work_dir, "input")
@@ -47,6 +50,34 @@ def run_claude_subprocess(
             "Do not create subdirectories for output files."
         )
 
+    return env
+
+
+def _format_elapsed(elapsed: float) -> str:
+    minutes = int(elapsed // 60)
+    if minutes == 0:
+        return f"{int(elapsed)}s"
+    return f"{minutes}m {int(elapsed % 60)}s"
+
+
+def _log_stderr_line(log_streamer, task_id: str, line: str) -> None:
+    if "error" in line.lower() or "exception" in line.lower():
+        log_streamer.add_log(task_id, line, level="error")
+    else:
+        log_streamer.add_log(task_id, line, level="warning")
+
+
+def run_claude_subprocess(
+    command: List[str],
+    temp_dir: str,
+    prompt: str,
+    log_streamer,
+    task_id: str,
+    timeout_seconds: int,
+) -> str:
+    """Execute the Claude Code command and return its stdout."""
+    env = _prepare_workspace(temp_dir, prompt)
+
     process = subprocess.Popen(
         command,
         cwd=temp_dir,
@@ -109,11 +140,7 @@ def run_claude_subprocess(
 
             if time.time() - last_progress_time > 30:
                 last_progress_time = time.time()
-                minutes = int(elapsed // 60)
-                if minutes == 0:
-                    log_streamer.add_log(task_id, f"Processing... ({int(elapsed)}s elapsed)")
-                else:
-                    log_streamer.add_log(task_id, f"Processing... ({minutes}m {int(elapsed % 60)}s elapsed)")
+                log_streamer.add_log(task_id, f"Processing... ({_format_elapsed(elapsed)} elapsed)")
 
             stdout_activity = False
             try:
@@ -127,7 +154,6 @@ def run_claude_subprocess(
                     if line.strip():
                         # Try to parse as stream-json, fallback to plain logging
                         try:
-                            from app.services.claude_code import output_parser
                             parsed = output_parser.process_stream_json(line.strip(), task_id, log_streamer)
                         except Exception:
                             log_streamer.add_log(task_id, f"Claude: {line.strip()}", level="info")
@@ -142,10 +168,7 @@ def run_claude_subprocess(
                         break
                     stderr_activity = True
                     last_activity_time = time.time()
-                    if "error" in line.lower() or "exception" in line.lower():
-                        log_streamer.add_log(task_id, line, level="error")
-                    else:
-                        log_streamer.add_log(task_id, line, level="warning")
+                    _log_stderr_line(log_streamer, task_id, line)
             except queue.Empty:
                 pass
 
@@ -183,3 +206,124 @@ def run_claude_subprocess(
         stdout_thread.join(timeout=1)
         stderr_thread.join(timeout=1)
 
+
+async def _terminate(process: asyncio.subprocess.Process, log_streamer, task_id: str) -> None:
+    """Stop a running process, killing it if it ignores SIGTERM for 5 seconds."""
+    if process.returncode is not None:
+        return
+    try:
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            log_streamer.add_log(task_id, "Process did not terminate, force killing", level="error")
+            process.kill()
+            await process.wait()
+    except ProcessLookupError:
+        pass
+
+
+async def run_claude_subprocess_async(
+    command: List[str],
+    temp_dir: str,
+    prompt: str,
+    log_streamer,
+    task_id: str,
+    timeout_seconds: int,
+) -> str:
+    """
+    Execute the Claude Code command on the running event loop and return its stdout.
+
+    Output lines are handled as soon as they arrive, by coroutines rather than
+    reader threads, so many customizations can run concurrently in one worker.
+    Cancelling the caller terminates the process.
+
+    Raises:
+        subprocess.TimeoutExpired: The process ran longer than timeout_seconds
+        subprocess.CalledProcessError: The process exited with a non-zero code
+    """
+    env = _prepare_workspace(temp_dir, prompt)
+
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=temp_dir,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        limit=STREAM_LINE_LIMIT,
+    )
+
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    last_activity_time = start_time
+    all_stdout: List[str] = []
+
+    async def write_prompt() -> None:
+        try:
+            process.stdin.write(prompt.encode("utf-8"))
+            await process.stdin.drain()
+            process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            log_streamer.add_log(task_id, f"Error writing to subprocess: {e}", level="error")
+
+    async def read_stdout() -> None:
+        nonlocal last_activity_time
+        async for raw_line in process.stdout:
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            last_activity_time = loop.time()
+            all_stdout.append(line)
+            # Try to parse as stream-json, fallback to plain logging
+            try:
+                output_parser.process_stream_json(line, task_id, log_streamer)
+            except Exception:
+                log_streamer.add_log(task_id, f"Claude: {line}", level="info")
+
+    async def read_stderr() -> None:
+        nonlocal last_activity_time
+        async for raw_line in process.stderr:
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if line:
+                last_activity_time = loop.time()
+                _log_stderr_line(log_streamer, task_id, line)
+
+    async def report_progress() -> None:
+        nonlocal last_activity_time
+        while True:
+            await asyncio.sleep(PROGRESS_INTERVAL_SECONDS)
+            elapsed = loop.time() - start_time
+            log_streamer.add_log(task_id, f"Processing... ({_format_elapsed(elapsed)} elapsed)")
+            if loop.time() - last_activity_time > 60 and elapsed > 120:
+                log_streamer.add_log(
+                    task_id,
+                    "No output from process for 60 seconds, may be hanging",
+                    level="warning",
+                )
+                last_activity_time = loop.time()
+
+    progress = asyncio.create_task(report_progress())
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(write_prompt(), read_stdout(), read_stderr(), process.wait()),
+            timeout=timeout_seconds,
+        )
+    except asyncio.TimeoutError:
+        log_streamer.add_log(
+            task_id,
+            f"Process exceeded timeout limit of {timeout_seconds}s, terminating",
+            level="error",
+        )
+        raise subprocess.TimeoutExpired(command, timeout_seconds)
+    finally:
+        progress.cancel()
+        # Also reached when the caller is cancelled
+        await asyncio.shield(_terminate(process, log_streamer, task_id))
+
+    if process.returncode != 0:
+        error_output = "\n".join(all_stdout[-20:]) if all_stdout else "No output captured"
+        raise subprocess.CalledProcessError(process.returncode, command, output=error_output)
+
+    return "\n".join(all_stdout)
+
@@ -0,0 +1,22 @@
+"""
+Resume diff engine components.
+
+This package holds the lower-level building blocks used by
+``app.services.diff_service`` for comparing resume versions.
+"""
+
+from app.services.diff.cache import DiffCache, DiffCacheKey
+from app.services.diff.keywords import KeywordVectorCache, keyword_delta, keyword_vector
+from app.services.diff.myers import DEFAULT_MAX_COST, myers_opcodes
+from app.services.diff.precompute import DiffPrecomputer
+
+__all__ = [
+    'DEFAULT_MAX_COST',
+    'DiffCache',
+    'DiffCacheKey',
+    'DiffPrecomputer',
+    'KeywordVectorCache',
+    'keyword_delta',
+    'keyword_vector',
+    'myers_opcodes',
+]
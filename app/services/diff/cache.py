@@ -0,0 +1,201 @@
+"""
+Cache of computed resume diffs keyed by version pair.
+
+Resume versions are never edited once written, so the diff between two
+versions can be computed once and served from storage afterwards. Results are
+kept in an in-memory LRU in front of an optional persistent tier in the
+application database, and are dropped when their resume is deleted.
+"""
+import json
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+import logfire
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.resume import ResumeDiff
+from app.utils.lru import LRUCache
+
+
+class DiffCacheKey(NamedTuple):
+    """Identifies one stored comparison."""
+
+    original_version_id: str
+    customized_version_id: str
+    diff_format: str  # Artifact, backend and cost cap, e.g. "inline:myers:2000"
+
+
+class DiffCache:
+    """
+    LRU cache of JSON-serializable diff results.
+
+    When a database session is passed, results are also read from and written
+    to the ``resume_diffs`` table, so they survive restarts and are shared
+    between application processes. Writes are made in a savepoint of the
+    caller's transaction and become durable when the caller commits; the
+    cache never commits or rolls back that transaction. Cached values are
+    shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of results kept in memory
+        """
+        self.max_size = max_size
+        # key -> (resume_id, value)
+        self._memory: "LRUCache[DiffCacheKey, Tuple[str, Any]]" = LRUCache(max_size)
+        # Guards the persistent hit and miss counts; the LRU counts memory hits
+        self._lock = threading.Lock()
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def get(self, key: DiffCacheKey, resume_id: str, compute: Callable[[], Any],
+            db: Optional[Session] = None) -> Any:
+        """
+        Get a cached diff result, computing and storing it on a miss.
+
+        Args:
+            key: The version pair and diff format
+            resume_id: ID of the resume both versions belong to
+            compute: Function computing the result on a miss
+            db: Optional database session enabling the persistent tier
+
+        Returns:
+            The cached or freshly computed result
+        """
+        value = self.peek(key, db)
+        if value is not None:
+            return value
+
+        value = compute()
+        with self._lock:
+            self.misses += 1
+        self.put(key, resume_id, value, db)
+        return value
+
+    def peek(self, key: DiffCacheKey, db: Optional[Session] = None) -> Optional[Any]:
+        """
+        Look up a cached result without computing it.
+
+        Args:
+            key: The version pair and diff format
+            db: Optional database session enabling the persistent tier
+
+        Returns:
+            The cached result, or None if it has not been computed
+        """
+        entry = self._memory.lookup(key)
+        if entry is not None:
+            return entry[1]
+
+        if db is not None:
+            row = self._load(db, key)
+            if row is not None:
+                value = json.loads(row.payload)
+                with self._lock:
+                    self.persistent_hits += 1
+                self._memory.put(key, (row.resume_id, value))
+                return value
+
+        return None
+
+    def put(self, key: DiffCacheKey, resume_id: str, value: Any,
+            db: Optional[Session] = None) -> None:
+        """
+        Add a result computed elsewhere (e.g. in a background worker).
+
+        Args:
+            key: The version pair and diff format
+            resume_id: ID of the resume both versions belong to
+            value: The JSON-serializable result
+            db: Optional database session; the result is persisted too,
+                when the caller commits
+        """
+        self._memory.put(key, (resume_id, value))
+        if db is not None:
+            self._store(db, key, resume_id, value)
+
+    def invalidate_resume(self, resume_id: str, db: Optional[Session] = None) -> None:
+        """
+        Drop every cached diff between versions of a resume.
+
+        Args:
+            resume_id: ID of the resume being deleted
+            db: Optional database session; the persisted rows are deleted too,
+                when the caller commits
+        """
+        self._memory.remove_where(lambda key, entry: entry[0] == resume_id)
+
+        if db is not None:
+            try:
+                with db.begin_nested():
+                    db.query(ResumeDiff).filter(ResumeDiff.resume_id == resume_id).delete()
+            except SQLAlchemyError as e:
+                logfire.warning(
+                    "Failed to delete cached resume diffs",
+                    resume_id=resume_id,
+                    error=str(e),
+                )
+
+    def clear(self) -> None:
+        """Drop all in-memory results and reset the statistics."""
+        self._memory.clear()
+        with self._lock:
+            self.persistent_hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, persistent hit and miss counts and current size
+        """
+        memory = self._memory.info()
+        with self._lock:
+            return {
+                "hits": memory["hits"],
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "size": memory["size"],
+                "max_size": self.max_size,
+            }
+
+    def _load(self, db: Session, key: DiffCacheKey) -> Optional[ResumeDiff]:
+        try:
+            return db.get(ResumeDiff, tuple(key))
+        except SQLAlchemyError as e:
+            logfire.warning(
+                "Failed to load cached resume diff",
+                original_version_id=key.original_version_id,
+                customized_version_id=key.customized_version_id,
+                error=str(e),
+            )
+            return None
+
+    def _store(self, db: Session, key: DiffCacheKey, resume_id: str, value: Any) -> None:
+        try:
+            # A failed write only rolls back its savepoint, not the caller's
+            # pending changes
+            with db.begin_nested():
+                db.merge(
+                    ResumeDiff(
+                        original_version_id=key.original_version_id,
+                        customized_version_id=key.customized_version_id,
+                        diff_format=key.diff_format,
+                        resume_id=resume_id,
+                        payload=json.dumps(value),
+                    )
+                )
+        except SQLAlchemyError as e:
+            # Another request may have stored the same comparison first
+            logfire.warning(
+                "Failed to persist resume diff",
+                original_version_id=key.original_version_id,
+                customized_version_id=key.customized_version_id,
+                error=str(e),
+            )
@@ -0,0 +1,130 @@
+"""
+Keyword vectors and deltas between resume versions.
+
+A keyword vector counts every keyword in a text, so comparing versions is a
+Counter operation instead of repeated list scans. Resume versions are never
+edited once written, so each version's vector is computed once and cached by
+version ID; extending a resume history only extracts keywords for the new
+version.
+"""
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.utils.lru import LRUCache
+from app.utils.tokenizer import tokenize
+
+# Words too common to be useful as resume keywords
+COMMON_WORDS = frozenset({
+    "and", "the", "a", "an", "in", "on", "at", "to", "for", "with", "by",
+    "is", "are", "was", "were", "be", "been", "being", "have", "has", "had",
+    "do", "does", "did", "of", "from", "as", "i", "you", "he", "she", "it",
+    "we", "they", "this", "that", "these", "those", "my", "your", "his", "her",
+    "its", "our", "their", "what", "which", "who", "whom", "whose"
+})
+
+
+def keyword_vector(text: str) -> Counter:
+    """
+    Count the keywords in a text.
+
+    Args:
+        text: The text to extract keywords from
+
+    Returns:
+        Counter of keyword occurrences, in order of first occurrence
+    """
+    return Counter(
+        word for word in tokenize(text).words
+        if word not in COMMON_WORDS and len(word) > 3
+    )
+
+
+def top_keywords(vector: Counter, limit: int = 20) -> List[str]:
+    """
+    Get the most frequent keywords of a vector.
+
+    Args:
+        vector: Keyword counts
+        limit: Maximum number of keywords returned
+
+    Returns:
+        Keywords by descending frequency, ties in order of first occurrence
+    """
+    return [keyword for keyword, _ in vector.most_common(limit)]
+
+
+def keyword_delta(before: Counter, after: Counter) -> Dict[str, Any]:
+    """
+    Compare the keyword vectors of two texts.
+
+    Args:
+        before: Keyword counts of the earlier text
+        after: Keyword counts of the later text
+
+    Returns:
+        Dictionary with keywords added and removed (most frequent first) and
+        the count change of keywords present in both texts
+    """
+    return {
+        "added": [k for k, _ in after.most_common() if k not in before],
+        "removed": [k for k, _ in before.most_common() if k not in after],
+        "count_changes": {
+            keyword: count - before[keyword]
+            for keyword, count in after.items()
+            if keyword in before and count != before[keyword]
+        },
+    }
+
+
+class KeywordVectorCache:
+    """LRU cache of keyword vectors keyed by resume version ID."""
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of version vectors kept
+        """
+        self.max_size = max_size
+        # version_id -> (resume_id, vector)
+        self._vectors: "LRUCache[str, Tuple[str, Counter]]" = LRUCache(max_size)
+
+    def get(self, version_id: str, resume_id: str, content: Callable[[], str]) -> Counter:
+        """
+        Get a version's keyword vector, extracting it on a miss.
+
+        Args:
+            version_id: ID of the resume version
+            resume_id: ID of the resume the version belongs to
+            content: Function returning the version content on a miss
+
+        Returns:
+            The version's keyword vector, shared between callers
+        """
+        _, vector = self._vectors.get(
+            version_id, lambda: (resume_id, keyword_vector(content()))
+        )
+        return vector
+
+    def invalidate_resume(self, resume_id: str) -> None:
+        """
+        Drop the vectors of every version of a resume.
+
+        Args:
+            resume_id: ID of the resume being deleted
+        """
+        self._vectors.remove_where(lambda version_id, entry: entry[0] == resume_id)
+
+    def clear(self) -> None:
+        """Drop all vectors and reset the statistics."""
+        self._vectors.clear()
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit and miss counts and current size
+        """
+        return self._vectors.info()
@@ -0,0 +1,148 @@
+"""
+Myers diff with a bounded edit cost.
+
+``difflib.SequenceMatcher`` is quadratic in the worst case and its autojunk
+heuristic degrades badly on heavily rewritten text. Myers' algorithm runs in
+O((N + M) * D) time for an edit distance D, which is close to linear for the
+small edits typical of resume customizations. The search gives up once D
+exceeds a cost cap and reports the unresolved middle as one replaced block,
+so a full rewrite costs at most O((N + M) * cap) instead of hanging.
+"""
+from typing import List, Sequence, Tuple
+
+# (tag, i1, i2, j1, j2) in the format of SequenceMatcher.get_opcodes()
+Opcode = Tuple[str, int, int, int, int]
+
+# Edit steps explored before the unresolved middle is reported as replaced
+DEFAULT_MAX_COST = 2000
+
+
+def myers_opcodes(a: Sequence, b: Sequence, max_cost: int = DEFAULT_MAX_COST) -> List[Opcode]:
+    """
+    Compare two sequences and return opcodes like SequenceMatcher.get_opcodes().
+
+    Args:
+        a: The original sequence of hashable items (lines or words)
+        b: The customized sequence
+        max_cost: Maximum number of inserted plus deleted items to search
+            for; beyond it the changed region is reported as one replacement
+
+    Returns:
+        List of (tag, i1, i2, j1, j2) opcodes covering both sequences
+    """
+    # Common prefix and suffix cost nothing and are most of a typical resume
+    n, m = len(a), len(b)
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < n - prefix and suffix < m - prefix and a[n - 1 - suffix] == b[m - 1 - suffix]:
+        suffix += 1
+
+    middle_a = a[prefix:n - suffix]
+    middle_b = b[prefix:m - suffix]
+    moves = _shortest_edit(middle_a, middle_b, max_cost)
+    if moves is None:
+        # Cost cap exceeded: one replacement is a valid, if coarse, diff
+        moves = ['-'] * len(middle_a) + ['+'] * len(middle_b)
+
+    return _moves_to_opcodes(['='] * prefix + moves + ['='] * suffix)
+
+
+def _shortest_edit(a: Sequence, b: Sequence, max_cost: int):
+    """
+    Find a shortest edit script between two sequences.
+
+    Returns:
+        List of moves ('=' keep, '-' delete from a, '+' insert from b), or
+        None when every script costs more than max_cost
+    """
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return ['-'] * n + ['+'] * m
+
+    max_d = min(n + m, max_cost)
+    offset = max_d + 1
+    # v[k + offset] is the furthest x reached on diagonal k = x - y
+    v = [0] * (2 * max_d + 3)
+    # Frontier before each step, sliced to diagonals -d-1..d+1 to bound memory
+    trace = []
+
+    for d in range(max_d + 1):
+        trace.append(v[offset - d - 1:offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1 + offset] < v[k + 1 + offset]):
+                x = v[k + 1 + offset]  # Step down: insert b[y]
+            else:
+                x = v[k - 1 + offset] + 1  # Step right: delete a[x]
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k + offset] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+
+    return None
+
+
+def _backtrack(trace: List[List[int]], n: int, m: int) -> List[str]:
+    """Rebuild the edit moves from the saved frontiers, end to start."""
+    moves = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        frontier = trace[d]
+        base = d + 1  # frontier[k + base] holds diagonal k
+        k = x - y
+        if k == -d or (k != d and frontier[k - 1 + base] < frontier[k + 1 + base]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = frontier[prev_k + base]
+        prev_y = prev_x - prev_k
+
+        while x > prev_x and y > prev_y:
+            moves.append('=')
+            x -= 1
+            y -= 1
+        if d > 0:
+            moves.append('-' if x > prev_x else '+')
+        x, y = prev_x, prev_y
+
+    moves.reverse()
+    return moves
+
+
+def _moves_to_opcodes(moves: List[str]) -> List[Opcode]:
+    """Group edit moves into opcodes, merging adjacent edits into replacements."""
+    opcodes: List[Opcode] = []
+    i = j = 0
+    pos = 0
+    total = len(moves)
+    while pos < total:
+        if moves[pos] == '=':
+            start = pos
+            while pos < total and moves[pos] == '=':
+                pos += 1
+            length = pos - start
+            opcodes.append(('equal', i, i + length, j, j + length))
+            i += length
+            j += length
+        else:
+            deleted = inserted = 0
+            while pos < total and moves[pos] != '=':
+                if moves[pos] == '-':
+                    deleted += 1
+                else:
+                    inserted += 1
+                pos += 1
+            if deleted and inserted:
+                tag = 'replace'
+            elif deleted:
+                tag = 'delete'
+            else:
+                tag = 'insert'
+            opcodes.append((tag, i, i + deleted, j, j + inserted))
+            i += deleted
+            j += inserted
+    return opcodes
@@ -0,0 +1,178 @@
+"""
+Background precomputation of resume diffs.
+
+A customized version is usually opened in the diff view right after it is
+created. ``DiffPrecomputer`` computes the diff and section analysis on
+worker threads as soon as the version is committed, so the first page view
+reads a stored result instead of diffing on the request path. Queue lag (the
+time a version waits before a worker picks it up) is tracked so the number
+of workers can be sized.
+"""
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import logfire
+
+
+class DiffPrecomputer:
+    """
+    Bounded queue of version IDs processed by background worker threads.
+
+    Workers are started on first use. Enqueueing never blocks the caller;
+    when the queue is full the version is skipped and its diff is computed
+    on first view instead.
+    """
+
+    def __init__(self, task: Callable[[str], bool], workers: int = 1, max_queue_size: int = 1000):
+        """
+        Initialize the precomputer.
+
+        Args:
+            task: Function computing and storing the diff for a version ID,
+                returning False if the version has nothing to compare against
+            workers: Number of worker threads
+            max_queue_size: Maximum number of versions waiting to be processed
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.task = task
+        self.workers = workers
+        self._queue: "queue.Queue[Optional[Tuple[str, float]]]" = queue.Queue(maxsize=max_queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+        self._enqueued = 0
+        self._dropped = 0
+        self._completed = 0
+        self._skipped = 0
+        self._failed = 0
+        self._lag_seconds = 0.0
+        self._max_lag_seconds = 0.0
+        self._last_lag_seconds = 0.0
+        self._run_seconds = 0.0
+
+    @property
+    def started(self) -> bool:
+        """Whether the worker threads are running."""
+        return bool(self._threads)
+
+    def start(self) -> None:
+        """Start the worker threads if they are not running."""
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"diff-precompute-{index}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def enqueue(self, version_id: str, block: bool = False) -> bool:
+        """
+        Queue a version for precomputation.
+
+        Args:
+            version_id: ID of the customized version
+            block: Wait for room in the queue instead of skipping the version
+
+        Returns:
+            True if the version was queued, False if the queue was full
+        """
+        self.start()
+        try:
+            self._queue.put((version_id, time.time()), block=block)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            logfire.warning("Diff precompute queue full, skipping version", version_id=version_id)
+            return False
+
+        with self._lock:
+            self._enqueued += 1
+        return True
+
+    def join(self) -> None:
+        """Wait until every queued version has been processed."""
+        self._queue.join()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get queue metrics.
+
+        Returns:
+            Dictionary with queue depth, task counts, and average, maximum and
+            most recent queue lag and run time
+        """
+        with self._lock:
+            processed = self._completed + self._skipped + self._failed
+            return {
+                "workers": self.workers,
+                "started": self.started,
+                "queue_depth": self._queue.qsize(),
+                "enqueued": self._enqueued,
+                "dropped": self._dropped,
+                "completed": self._completed,
+                "skipped": self._skipped,
+                "failed": self._failed,
+                "average_lag_seconds": self._lag_seconds / processed if processed else 0.0,
+                "max_lag_seconds": self._max_lag_seconds,
+                "last_lag_seconds": self._last_lag_seconds,
+                "average_run_seconds": self._run_seconds / processed if processed else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads after the versions already queued.
+
+        Args:
+            wait: Wait for the workers to finish
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._process(*item)
+            finally:
+                self._queue.task_done()
+
+    def _process(self, version_id: str, enqueued_at: float) -> None:
+        started_at = time.time()
+        lag = started_at - enqueued_at
+        try:
+            stored = self.task(version_id)
+        except Exception as e:
+            outcome = "failed"
+            logfire.error(
+                "Diff precomputation failed",
+                version_id=version_id,
+                error=str(e),
+                exc_info=True,
+            )
+        else:
+            outcome = "completed" if stored else "skipped"
+
+        with self._lock:
+            if outcome == "completed":
+                self._completed += 1
+            elif outcome == "skipped":
+                self._skipped += 1
+            else:
+                self._failed += 1
+            self._lag_seconds += lag
+            self._max_lag_seconds = max(self._max_lag_seconds, lag)
+            self._last_lag_seconds = lag
+            self._run_seconds += time.time() - started_at
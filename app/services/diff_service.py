@@ -2,22 +2,373 @@
 Resume diff service for generating visual diffs between original and customized resumes.
 Enhanced with improved visualization and analysis features.
 """
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from difflib import SequenceMatcher
+from functools import cached_property
 import html
+import io
 import json
 import re
-from typing import Dict, List, Tuple, Union, Optional
+import zipfile
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union, Optional
 
 import logfire
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.resume import ResumeVersion
+from app.repositories.resume import ResumeRepository
+from app.services.diff.cache import DiffCache, DiffCacheKey
+from app.services.diff.keywords import KeywordVectorCache, keyword_delta, keyword_vector, top_keywords
+from app.services.diff.myers import DEFAULT_MAX_COST, Opcode, myers_opcodes
+from app.services.diff.precompute import DiffPrecomputer
+from app.utils.tokenizer import tokenize
+
+
+# A run of diff output: (opcode, original fragment, customized fragment)
+DiffSegment = Tuple[str, str, str]
+
+# Words and the whitespace between them, so joined runs rebuild the text exactly
+_WORD_PATTERN = re.compile(r'\S+|\s+')
+
+# Computes opcodes for two sequences under a cost cap (ignored by difflib)
+DiffBackend = Callable[[Sequence, Sequence, int], List[Opcode]]
+
+
+def _difflib_opcodes(a: Sequence, b: Sequence, max_cost: int) -> List[Opcode]:
+    """Compare two sequences with difflib's SequenceMatcher."""
+    return SequenceMatcher(None, a, b).get_opcodes()
+
+
+DIFF_BACKENDS: Dict[str, DiffBackend] = {
+    "difflib": _difflib_opcodes,
+    "myers": myers_opcodes,
+}
+
+
+def get_diff_backend(name: str) -> DiffBackend:
+    """
+    Look up a diff backend by name.
+
+    Args:
+        name: Backend name, one of DIFF_BACKENDS
+
+    Returns:
+        The backend's opcode function
+
+    Raises:
+        ValueError: If no backend has that name
+    """
+    try:
+        return DIFF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown diff backend '{name}', expected one of {sorted(DIFF_BACKENDS)}"
+        ) from None
+
+
+class DiffResult:
+    """
+    All diff artifacts for one pair of resume texts.
+
+    The texts are compared line by line once and each changed hunk is refined
+    to word level once. The inline HTML, side-by-side rows, statistics,
+    section analysis and keyword changes are derived from that comparison on
+    first access, so callers needing several of them pay for one diff.
+
+    Derived values are shared between callers and must not be modified.
+    """
+
+    def __init__(self, original_text: str, customized_text: str,
+                 backend: str = "difflib", max_cost: int = DEFAULT_MAX_COST):
+        """
+        Initialize the result. Nothing is computed until first accessed.
+
+        Args:
+            original_text: The original resume text
+            customized_text: The customized resume text
+            backend: Name of the diff backend used for lines and words
+            max_cost: Edit cost cap for backends that support one
+        """
+        self.original_text = original_text
+        self.customized_text = customized_text
+        self.backend = backend
+        self.max_cost = max_cost
+        self._opcodes = get_diff_backend(backend)
+
+    @cached_property
+    def original_lines(self) -> List[str]:
+        """Lines of the original text without line endings."""
+        return self.original_text.splitlines()
+
+    @cached_property
+    def customized_lines(self) -> List[str]:
+        """Lines of the customized text without line endings."""
+        return self.customized_text.splitlines()
+
+    @cached_property
+    def line_opcodes(self) -> List[Tuple[str, int, int, int, int]]:
+        """Opcodes of the line-level comparison, indexing the line lists."""
+        return self._opcodes(self.original_lines, self.customized_lines, self.max_cost)
+
+    @cached_property
+    def segments(self) -> List[DiffSegment]:
+        """
+        Word-level diff as (opcode, original, customized) runs.
+
+        Inserted and deleted lines are kept whole; replaced hunks are refined
+        to words. Joining the original or customized fragments rebuilds the
+        respective text exactly.
+        """
+        original_lines = self.original_text.splitlines(True)  # Keep line endings
+        customized_lines = self.customized_text.splitlines(True)
+
+        segments: List[DiffSegment] = []
+        for op, i1, i2, j1, j2 in self.line_opcodes:
+            if op == 'equal':
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    if original_lines[i] == customized_lines[j]:
+                        segments.append(('equal', original_lines[i], original_lines[i]))
+                    else:
+                        # Same content with a different line ending
+                        segments.extend(self._word_segments(original_lines[i], customized_lines[j]))
+            elif op == 'insert':
+                segments.extend(('insert', '', line) for line in customized_lines[j1:j2])
+            elif op == 'delete':
+                segments.extend(('delete', line, '') for line in original_lines[i1:i2])
+            elif op == 'replace':
+                segments.extend(self._word_segments(
+                    ''.join(original_lines[i1:i2]), ''.join(customized_lines[j1:j2])
+                ))
+        return segments
+
+    def _word_segments(self, original_block: str, customized_block: str) -> List[DiffSegment]:
+        """Diff two blocks of text word by word, preserving whitespace."""
+        orig_words = _WORD_PATTERN.findall(original_block)
+        cust_words = _WORD_PATTERN.findall(customized_block)
+
+        return [
+            (op, ''.join(orig_words[i1:i2]), ''.join(cust_words[j1:j2]))
+            for op, i1, i2, j1, j2 in self._opcodes(orig_words, cust_words, self.max_cost)
+        ]
+
+    @cached_property
+    def inline_html(self) -> str:
+        """Inline word-level HTML diff."""
+        return ''.join(_segment_html(segment) for segment in self.segments)
+
+    @cached_property
+    def markdown(self) -> str:
+        """Inline word-level diff in the Markdown style of generate_markdown_diff."""
+        return ''.join(_segment_markdown(segment) for segment in self.segments)
+
+    @cached_property
+    def statistics(self) -> Dict[str, int]:
+        """Counts of added, deleted, modified and unchanged lines."""
+        stats = {
+            "additions": 0,
+            "deletions": 0,
+            "modifications": 0,
+            "unchanged": 0
+        }
+
+        for op, i1, i2, j1, j2 in self.line_opcodes:
+            if op == 'equal':
+                stats["unchanged"] += i2 - i1
+            elif op == 'insert':
+                stats["additions"] += j2 - j1
+            elif op == 'delete':
+                stats["deletions"] += i2 - i1
+            elif op == 'replace':
+                stats["modifications"] += max(i2 - i1, j2 - j1)
+
+        return stats
+
+    @cached_property
+    def side_by_side(self) -> Dict[str, Union[List[Dict[str, str]], Dict[str, int]]]:
+        """Side-by-side rows and statistics, as returned by generate_side_by_side_diff."""
+        original_lines = self.original_lines
+        customized_lines = self.customized_lines
+
+        side_by_side = []
+        line_count = 1
+
+        for op, i1, i2, j1, j2 in self.line_opcodes:
+            if op == 'equal':
+                # Add unchanged lines with same line number on both sides
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    side_by_side.append({
+                        "line_number": line_count,
+                        "type": "unchanged",
+                        "original": original_lines[i],
+                        "customized": customized_lines[j]
+                    })
+                    line_count += 1
+
+            elif op == 'replace':
+                # Lines were changed, show them side by side
+                max_lines = max(i2 - i1, j2 - j1)
+                for k in range(max_lines):
+                    orig_idx = i1 + k if k < (i2 - i1) else None
+                    cust_idx = j1 + k if k < (j2 - j1) else None
+
+                    side_by_side.append({
+                        "line_number": line_count,
+                        "type": "modified",
+                        "original": original_lines[orig_idx] if orig_idx is not None else "",
+                        "customized": customized_lines[cust_idx] if cust_idx is not None else ""
+                    })
+                    line_count += 1
+
+            elif op == 'delete':
+                # Lines were deleted from original
+                for i in range(i1, i2):
+                    side_by_side.append({
+                        "line_number": line_count,
+                        "type": "deleted",
+                        "original": original_lines[i],
+                        "customized": ""
+                    })
+                    line_count += 1
+
+            elif op == 'insert':
+                # Lines were added in customized
+                for j in range(j1, j2):
+                    side_by_side.append({
+                        "line_number": line_count,
+                        "type": "added",
+                        "original": "",
+                        "customized": customized_lines[j]
+                    })
+                    line_count += 1
+
+        return {
+            "diff_data": side_by_side,
+            # Each row is one added, deleted, modified or unchanged line
+            "statistics": dict(self.statistics)
+        }
+
+    @cached_property
+    def section_analysis(self) -> Dict[str, Dict[str, Union[str, float, Dict, int]]]:
+        """Per-section change analysis, as returned by analyze_section_changes."""
+        return _analyze_sections(
+            extract_resume_sections(self.original_text),
+            extract_resume_sections(self.customized_text),
+            self.backend,
+            self.max_cost,
+        )
+
+    @cached_property
+    def keyword_changes(self) -> Dict[str, List[str]]:
+        """Added, removed and common keywords, as returned by analyze_keyword_changes."""
+        original_keywords = set(extract_keywords(self.original_text))
+        customized_keywords = set(extract_keywords(self.customized_text))
+
+        return {
+            "added_keywords": list(customized_keywords - original_keywords),
+            "removed_keywords": list(original_keywords - customized_keywords),
+            "common_keywords": list(original_keywords & customized_keywords)
+        }
+
+    def to_dict(self) -> Dict:
+        """
+        Get all diff data as one JSON-serializable structure.
+
+        Returns:
+            Dictionary in the format produced by create_diff_json
+        """
+        return {
+            "original_text": self.original_text,
+            "customized_text": self.customized_text,
+            "diff_html": self.inline_html,
+            "side_by_side_diff": self.side_by_side["diff_data"],
+            "statistics": self.statistics,
+            "section_analysis": self.section_analysis,
+            "keyword_analysis": self.keyword_changes
+        }
+
+
+def _segment_markdown(segment: DiffSegment) -> str:
+    """Render one diff segment with the Markdown diff markup."""
+    op, original, customized = segment
+    if op == 'equal':
+        return original
+    if op == 'insert':
+        return f'**++{customized}++**'
+    if op == 'delete':
+        return f'**~~{original}~~**'
+    return f'**~~{original}~~****++{customized}++**'
+
+
+def _segment_html(segment: DiffSegment) -> str:
+    """Render one diff segment with the inline diff markup."""
+    op, original, customized = segment
+    if op == 'equal':
+        return html.escape(original)
+    if op == 'insert':
+        return f'<span class="addition" title="Added content">{html.escape(customized)}</span>'
+    if op == 'delete':
+        return f'<span class="deletion" title="Removed content"><del>{html.escape(original)}</del></span>'
+    return (
+        f'<span class="deletion" title="Original content"><del>{html.escape(original)}</del></span>'
+        f'<span class="addition" title="Modified content">{html.escape(customized)}</span>'
+    )
 
 
 class DiffGenerator:
-    """Utility class for generating visual diffs between resume versions."""
+    """
+    Utility class for generating visual diffs between resume versions.
+
+    The "difflib" backend keeps the original SequenceMatcher behaviour,
+    including the character-level line diff. The "myers" backend diffs lines
+    and then words with a cost-capped Myers diff, which stays fast on
+    heavily rewritten resumes.
+    """
+
+    def __init__(self, backend: str = "difflib", max_cost: int = DEFAULT_MAX_COST):
+        """
+        Initialize the generator.
+
+        Args:
+            backend: Name of the diff backend, one of DIFF_BACKENDS
+            max_cost: Edit cost cap for backends that support one
+
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        get_diff_backend(backend)
+        self.backend = backend
+        self.max_cost = max_cost
+
+    def diff(self, original_text: str, customized_text: str) -> DiffResult:
+        """Return the lazily computed diff of the two texts."""
+        return DiffResult(original_text, customized_text, self.backend, self.max_cost)
+
+    @property
+    def cache_variant(self) -> str:
+        """Backend and cost cap, identifying this generator's output in cache keys."""
+        return f"{self.backend}:{self.max_cost}"
+
+    def inline_html(self, diff: DiffResult) -> str:
+        """
+        Render the inline HTML of a diff at this backend's granularity.
+
+        Args:
+            diff: A diff computed by this generator
+
+        Returns:
+            Character-level HTML for "difflib", word-level HTML otherwise
+        """
+        if self.backend == "difflib":
+            return generate_resume_diff(diff.original_text, diff.customized_text)
+        return diff.inline_html
 
     def line_diff(self, original_text: str, customized_text: str) -> str:
         """Return an inline HTML diff for the two texts."""
         try:
-            return generate_resume_diff(original_text, customized_text)
+            return self.inline_html(self.diff(original_text, customized_text))
         except Exception as exc:  # pragma: no cover - unexpected
             logfire.error("Line diff generation failed", error=str(exc), exc_info=True)
             raise
@@ -25,7 +376,7 @@ class DiffGenerator:
     def section_diff(self, original_text: str, customized_text: str) -> Dict[str, Dict[str, Union[str, float, Dict, int]]]:
         """Analyze section level changes between the two texts."""
         try:
-            return analyze_section_changes(original_text, customized_text)
+            return self.diff(original_text, customized_text).section_analysis
         except Exception as exc:  # pragma: no cover - unexpected
             logfire.error("Section diff analysis failed", error=str(exc), exc_info=True)
             return {}
@@ -33,11 +384,204 @@ class DiffGenerator:
     def html_diff_view(self, original_text: str, customized_text: str) -> str:
         """Generate a full HTML diff document with highlights."""
         try:
-            return generate_diff_html_document(original_text, customized_text)
+            if self.backend == "difflib":
+                return generate_diff_html_document(original_text, customized_text)
+            return render_diff_html_document(self.diff(original_text, customized_text))
         except Exception as exc:  # pragma: no cover - unexpected
             logfire.error("HTML diff generation failed", error=str(exc), exc_info=True)
             raise
 
+# Diffs between stored resume versions, which never change once written
+DIFF_CACHE = DiffCache(max_size=settings.DIFF_CACHE_SIZE)
+
+
+def get_version_diff(original_version: ResumeVersion, customized_version: ResumeVersion,
+                     generator: DiffGenerator, db: Optional[Session] = None) -> Dict[str, Any]:
+    """
+    Get the inline diff, statistics and section analysis of two stored versions.
+
+    The result is computed once per version pair, backend and cost cap and
+    then served from DIFF_CACHE. The inline diff has the granularity of
+    DiffGenerator.line_diff for the same backend.
+
+    Args:
+        original_version: The version compared against
+        customized_version: The customized version
+        generator: Diff generator selecting the backend
+        db: Optional database session enabling the persistent cache tier; a
+            newly computed diff is persisted when the caller commits
+
+    Returns:
+        Dictionary with diff_content, diff_statistics and section_analysis
+    """
+    key = DiffCacheKey(original_version.id, customized_version.id, f"inline:{generator.cache_variant}")
+
+    def compute() -> Dict[str, Any]:
+        diff = generator.diff(original_version.content, customized_version.content)
+        return {
+            "diff_content": generator.inline_html(diff),
+            "diff_statistics": diff.statistics,
+            "section_analysis": diff.section_analysis,
+        }
+
+    cache_db = db if settings.DIFF_CACHE_PERSIST else None
+    return DIFF_CACHE.get(key, customized_version.resume_id, compute, cache_db)
+
+
+def get_version_html_diff(original_version: ResumeVersion, customized_version: ResumeVersion,
+                          generator: DiffGenerator, db: Optional[Session] = None) -> str:
+    """
+    Get the full HTML diff document of two stored versions, cached like get_version_diff.
+
+    Args:
+        original_version: The version compared against
+        customized_version: The customized version
+        generator: Diff generator selecting the backend
+        db: Optional database session enabling the persistent cache tier
+
+    Returns:
+        Complete HTML document as a string
+    """
+    key = DiffCacheKey(original_version.id, customized_version.id, f"html:{generator.cache_variant}")
+
+    def compute() -> str:
+        return generator.html_diff_view(original_version.content, customized_version.content)
+
+    cache_db = db if settings.DIFF_CACHE_PERSIST else None
+    return DIFF_CACHE.get(key, customized_version.resume_id, compute, cache_db)
+
+
+def configured_diff_generator() -> DiffGenerator:
+    """Create a diff generator using the configured backend and cost cap."""
+    return DiffGenerator(backend=settings.DIFF_BACKEND, max_cost=settings.DIFF_MAX_COST)
+
+
+def store_version_diff(db: Session, version_id: str) -> bool:
+    """
+    Compute and cache the diff of a customized version against its base version.
+
+    The stored diff becomes durable when the caller commits.
+
+    Args:
+        db: Database session
+        version_id: ID of the customized version
+
+    Returns:
+        True if a diff was computed or already cached, False if the version
+        is missing, not customized or has no earlier version
+    """
+    version = db.get(ResumeVersion, version_id)
+    if version is None or not version.is_customized:
+        return False
+
+    base_version = ResumeRepository(db).get_base_version(version)
+    if base_version is None:
+        return False
+
+    get_version_diff(base_version, version, configured_diff_generator(), db)
+    return True
+
+
+def precompute_version_diff(version_id: str) -> bool:
+    """
+    Store the diff of a customized version in a session of its own.
+
+    Args:
+        version_id: ID of the customized version
+
+    Returns:
+        Whether a diff was stored, as returned by store_version_diff
+    """
+    db = SessionLocal()
+    try:
+        stored = store_version_diff(db, version_id)
+        db.commit()
+        return stored
+    finally:
+        db.close()
+
+
+# Background workers computing diffs of newly created customized versions
+DIFF_PRECOMPUTER = DiffPrecomputer(
+    precompute_version_diff,
+    workers=settings.DIFF_PRECOMPUTE_WORKERS,
+    max_queue_size=settings.DIFF_PRECOMPUTE_QUEUE_SIZE,
+)
+
+
+def backfill_version_diffs(db: Session, precomputer: DiffPrecomputer,
+                           resume_id: Optional[str] = None) -> int:
+    """
+    Queue every customized version whose diff is not stored yet.
+
+    Args:
+        db: Database session used to find the versions
+        precomputer: Precomputer that computes and stores the diffs
+        resume_id: Optional resume to restrict the backfill to
+
+    Returns:
+        Number of versions queued
+    """
+    query = db.query(ResumeVersion).filter(ResumeVersion._is_customized == 1)
+    if resume_id is not None:
+        query = query.filter(ResumeVersion.resume_id == resume_id)
+
+    repository = ResumeRepository(db)
+    diff_format = f"inline:{configured_diff_generator().cache_variant}"
+    cache_db = db if settings.DIFF_CACHE_PERSIST else None
+    queued = 0
+    for version in query.order_by(ResumeVersion.resume_id, ResumeVersion.version_number):
+        base_version = repository.get_base_version(version)
+        if base_version is None:
+            continue
+        key = DiffCacheKey(base_version.id, version.id, diff_format)
+        if DIFF_CACHE.peek(key, cache_db) is not None:
+            continue
+        precomputer.enqueue(version.id, block=True)
+        queued += 1
+    return queued
+
+# Keyword vectors of stored resume versions, keyed by version ID
+KEYWORD_CACHE = KeywordVectorCache(max_size=settings.KEYWORD_VECTOR_CACHE_SIZE)
+
+
+def get_keyword_timeline(versions: Sequence[ResumeVersion],
+                         cache: KeywordVectorCache = KEYWORD_CACHE) -> List[Dict[str, Any]]:
+    """
+    Get the keywords added and removed at each version of a resume.
+
+    Each version is compared with the version before it; the first version
+    reports all of its keywords as added. Version content is only read for
+    versions whose keyword vector is not cached, so the query may defer it.
+
+    Args:
+        versions: Versions of one resume
+        cache: Cache of per-version keyword vectors
+
+    Returns:
+        One entry per version in version_number order
+    """
+    timeline = []
+    previous = Counter()
+    for version in sorted(versions, key=lambda v: v.version_number):
+        vector = cache.get(version.id, version.resume_id, lambda: version.content)
+        delta = keyword_delta(previous, vector)
+        timeline.append({
+            "version_id": version.id,
+            "version_number": version.version_number,
+            "is_customized": version.is_customized,
+            "job_description_id": version.job_description_id,
+            "created_at": version.created_at,
+            "keyword_count": len(vector),
+            "top_keywords": top_keywords(vector),
+            "added_keywords": delta["added"],
+            "removed_keywords": delta["removed"],
+            "count_changes": delta["count_changes"],
+        })
+        previous = vector
+    return timeline
+
+
 def generate_resume_diff(original_text: str, customized_text: str) -> str:
     """
     Generate a diff between original and customized resume texts.
@@ -109,47 +653,7 @@ def generate_word_level_diff(original_text: str, customized_text: str) -> str:
     Returns:
         HTML string with styled differences at word level
     """
-    # Split text into lines
-    original_lines = original_text.splitlines(True)  # Keep line endings
-    customized_lines = customized_text.splitlines(True)
-    
-    # Compare line by line
-    diff_html = []
-    matcher = SequenceMatcher(None, original_lines, customized_lines)
-    
-    for op, i1, i2, j1, j2 in matcher.get_opcodes():
-        if op == 'equal':
-            for line in original_lines[i1:i2]:
-                diff_html.append(html.escape(line))
-        elif op == 'insert':
-            for line in customized_lines[j1:j2]:
-                diff_html.append(f'<span class="addition" title="Added content">{html.escape(line)}</span>')
-        elif op == 'delete':
-            for line in original_lines[i1:i2]:
-                diff_html.append(f'<span class="deletion" title="Removed content"><del>{html.escape(line)}</del></span>')
-        elif op == 'replace':
-            # For replaced blocks, try to do word-level diff
-            orig_block = ''.join(original_lines[i1:i2])
-            cust_block = ''.join(customized_lines[j1:j2])
-            
-            # Split into words, preserving whitespace
-            orig_words = re.findall(r'\S+|\s+', orig_block)
-            cust_words = re.findall(r'\S+|\s+', cust_block)
-            
-            # Compare words
-            word_matcher = SequenceMatcher(None, orig_words, cust_words)
-            for word_op, wi1, wi2, wj1, wj2 in word_matcher.get_opcodes():
-                if word_op == 'equal':
-                    diff_html.append(html.escape(''.join(orig_words[wi1:wi2])))
-                elif word_op == 'insert':
-                    diff_html.append(f'<span class="addition" title="Added content">{html.escape("".join(cust_words[wj1:wj2]))}</span>')
-                elif word_op == 'delete':
-                    diff_html.append(f'<span class="deletion" title="Removed content"><del>{html.escape("".join(orig_words[wi1:wi2]))}</del></span>')
-                elif word_op == 'replace':
-                    diff_html.append(f'<span class="deletion" title="Original content"><del>{html.escape("".join(orig_words[wi1:wi2]))}</del></span>')
-                    diff_html.append(f'<span class="addition" title="Modified content">{html.escape("".join(cust_words[wj1:wj2]))}</span>')
-    
-    return ''.join(diff_html)
+    return DiffResult(original_text, customized_text).inline_html
 
 def generate_side_by_side_diff(original_text: str, customized_text: str) -> Dict[str, Union[List[Dict[str, str]], Dict[str, int]]]:
     """
@@ -162,79 +666,7 @@ def generate_side_by_side_diff(original_text: str, customized_text: str) -> Dict
     Returns:
         Dictionary with line-by-line diff data and statistics
     """
-    original_lines = original_text.splitlines()
-    customized_lines = customized_text.splitlines()
-    
-    # Use SequenceMatcher for line-by-line comparison
-    matcher = SequenceMatcher(None, original_lines, customized_lines)
-    
-    side_by_side = []
-    line_count = 1
-    
-    stats = {
-        "additions": 0,
-        "deletions": 0,
-        "modifications": 0,
-        "unchanged": 0
-    }
-    
-    for op, i1, i2, j1, j2 in matcher.get_opcodes():
-        if op == 'equal':
-            # Add unchanged lines with same line number on both sides
-            for i, j in zip(range(i1, i2), range(j1, j2)):
-                side_by_side.append({
-                    "line_number": line_count,
-                    "type": "unchanged",
-                    "original": original_lines[i],
-                    "customized": customized_lines[j]
-                })
-                line_count += 1
-                stats["unchanged"] += 1
-        
-        elif op == 'replace':
-            # Lines were changed, show them side by side
-            max_lines = max(i2 - i1, j2 - j1)
-            for k in range(max_lines):
-                orig_idx = i1 + k if k < (i2 - i1) else None
-                cust_idx = j1 + k if k < (j2 - j1) else None
-                
-                side_by_side.append({
-                    "line_number": line_count,
-                    "type": "modified",
-                    "original": original_lines[orig_idx] if orig_idx is not None else "",
-                    "customized": customized_lines[cust_idx] if cust_idx is not None else ""
-                })
-                line_count += 1
-                stats["modifications"] += 1
-        
-        elif op == 'delete':
-            # Lines were deleted from original
-            for i in range(i1, i2):
-                side_by_side.append({
-                    "line_number": line_count,
-                    "type": "deleted",
-                    "original": original_lines[i],
-                    "customized": ""
-                })
-                line_count += 1
-                stats["deletions"] += 1
-        
-        elif op == 'insert':
-            # Lines were added in customized
-            for j in range(j1, j2):
-                side_by_side.append({
-                    "line_number": line_count,
-                    "type": "added",
-                    "original": "",
-                    "customized": customized_lines[j]
-                })
-                line_count += 1
-                stats["additions"] += 1
-    
-    return {
-        "diff_data": side_by_side,
-        "statistics": stats
-    }
+    return DiffResult(original_text, customized_text).side_by_side
 
 def get_diff_statistics(original_text: str, customized_text: str) -> Dict[str, int]:
     """
@@ -247,30 +679,7 @@ def get_diff_statistics(original_text: str, customized_text: str) -> Dict[str, i
     Returns:
         Dictionary with statistics about additions, deletions, and modifications
     """
-    original_lines = original_text.splitlines()
-    customized_lines = customized_text.splitlines()
-    
-    # Use SequenceMatcher for line-by-line comparison
-    matcher = SequenceMatcher(None, original_lines, customized_lines)
-    
-    stats = {
-        "additions": 0,
-        "deletions": 0,
-        "modifications": 0,
-        "unchanged": 0
-    }
-    
-    for op, i1, i2, j1, j2 in matcher.get_opcodes():
-        if op == 'equal':
-            stats["unchanged"] += i2 - i1
-        elif op == 'insert':
-            stats["additions"] += j2 - j1
-        elif op == 'delete':
-            stats["deletions"] += i2 - i1
-        elif op == 'replace':
-            stats["modifications"] += max(i2 - i1, j2 - j1)
-    
-    return stats
+    return DiffResult(original_text, customized_text).statistics
 
 def analyze_section_changes(original_text: str, customized_text: str) -> Dict[str, Dict[str, Union[str, float, Dict, int]]]:
     """
@@ -283,14 +692,39 @@ def analyze_section_changes(original_text: str, customized_text: str) -> Dict[st
     Returns:
         Dictionary with section names as keys and change statistics as values
     """
-    # Extract sections from both texts
-    original_sections = extract_resume_sections(original_text)
-    customized_sections = extract_resume_sections(customized_text)
-    
+    return DiffResult(original_text, customized_text).section_analysis
+
+def _analyze_sections(original_sections: Dict[str, str],
+                      customized_sections: Dict[str, str],
+                      backend: str = "difflib",
+                      max_cost: int = DEFAULT_MAX_COST) -> Dict[str, Dict[str, Union[str, float, Dict, int]]]:
+    """
+    Compare extracted sections of two resume versions.
+
+    Sections with the same content in both versions are reported as
+    unchanged without diffing.
+
+    Args:
+        original_sections: Section contents of the original resume by name
+        customized_sections: Section contents of the customized resume by name
+        backend: Name of the diff backend used for each section
+        max_cost: Edit cost cap for backends that support one
+
+    Returns:
+        Dictionary with section names as keys and change statistics as values
+    """
+    all_section_names = set(original_sections.keys()) | set(customized_sections.keys())
+
+    # Only sections present in both versions whose content differs need a diff
+    diffs_by_name = {
+        name: _diff_section(original_sections[name], customized_sections[name], backend, max_cost)
+        for name in all_section_names
+        if original_sections.get(name) and customized_sections.get(name)
+        and original_sections[name] != customized_sections[name]
+    }
+
     # Compare sections
     section_analysis = {}
-    all_section_names = set(original_sections.keys()) | set(customized_sections.keys())
-    
     for section_name in all_section_names:
         orig_content = original_sections.get(section_name, "")
         cust_content = customized_sections.get(section_name, "")
@@ -320,8 +754,18 @@ def analyze_section_changes(original_text: str, customized_text: str) -> Dict[st
                 "impact": "medium"
             }
         else:
-            # Section exists in both - calculate differences
-            stats = get_diff_statistics(orig_content, cust_content)
+            if section_name in diffs_by_name:
+                stats, section_diff = diffs_by_name[section_name]
+            else:
+                # Identical (or empty) in both versions, so every line is unchanged
+                stats = {
+                    "additions": 0,
+                    "deletions": 0,
+                    "modifications": 0,
+                    "unchanged": len(orig_content.splitlines())
+                }
+                section_diff = html.escape(orig_content)
+
             total_chars = stats["unchanged"] + stats["additions"] + stats["deletions"] + stats["modifications"]
             change_percentage = 0
             if total_chars > 0:
@@ -344,11 +788,6 @@ def analyze_section_changes(original_text: str, customized_text: str) -> Dict[st
                 impact = "low"
                 rationale = "Made minor adjustments to improve clarity or keyword matching"
             
-            # Get section-specific diff
-            section_diff = ""
-            if orig_content and cust_content:
-                section_diff = generate_word_level_diff(orig_content, cust_content)
-            
             section_analysis[section_name] = {
                 "status": status,
                 "change_percentage": round(change_percentage, 1),
@@ -364,6 +803,12 @@ def analyze_section_changes(original_text: str, customized_text: str) -> Dict[st
     
     return section_analysis
 
+def _diff_section(original_content: str, customized_content: str,
+                  backend: str, max_cost: int) -> Tuple[Dict[str, int], str]:
+    """Diff one section, returning its line statistics and inline HTML."""
+    result = DiffResult(original_content, customized_content, backend, max_cost)
+    return result.statistics, result.inline_html
+
 def extract_resume_sections(text: str) -> Dict[str, str]:
     """
     Extract sections from a markdown resume.
@@ -420,29 +865,8 @@ def extract_keywords(text: str) -> List[str]:
     Returns:
         List of keywords
     """
-    # Simple implementation - split by whitespace and filter common words
-    common_words = {
-        "and", "the", "a", "an", "in", "on", "at", "to", "for", "with", "by",
-        "is", "are", "was", "were", "be", "been", "being", "have", "has", "had",
-        "do", "does", "did", "of", "from", "as", "i", "you", "he", "she", "it",
-        "we", "they", "this", "that", "these", "those", "my", "your", "his", "her",
-        "its", "our", "their", "what", "which", "who", "whom", "whose"
-    }
-    
-    words = re.findall(r'\b\w+\b', text.lower())
-    keywords = [word for word in words if word not in common_words and len(word) > 3]
-    
-    # Get unique keywords
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in unique_keywords:
-            unique_keywords.append(keyword)
-    
-    # Sort by frequency (could be enhanced with better algorithms like TF-IDF)
-    keyword_freq = {k: keywords.count(k) for k in unique_keywords}
-    sorted_keywords = sorted(unique_keywords, key=lambda k: keyword_freq[k], reverse=True)
-    
-    return sorted_keywords[:20]  # Return top 20 keywords
+    # Top 20 by frequency (could be enhanced with better algorithms like TF-IDF)
+    return top_keywords(keyword_vector(text), 20)
 
 def analyze_keyword_changes(original_text: str, customized_text: str) -> Dict[str, List[str]]:
     """
@@ -455,14 +879,7 @@ def analyze_keyword_changes(original_text: str, customized_text: str) -> Dict[st
     Returns:
         Dictionary with lists of added, removed, and common keywords
     """
-    original_keywords = set(extract_keywords(original_text))
-    customized_keywords = set(extract_keywords(customized_text))
-    
-    return {
-        "added_keywords": list(customized_keywords - original_keywords),
-        "removed_keywords": list(original_keywords - customized_keywords),
-        "common_keywords": list(original_keywords & customized_keywords)
-    }
+    return DiffResult(original_text, customized_text).keyword_changes
 
 def generate_diff_html_document(original_text: str, customized_text: str, 
                                 title: str = "Resume Diff Comparison", 
@@ -479,17 +896,12 @@ def generate_diff_html_document(original_text: str, customized_text: str,
     Returns:
         Complete HTML document as a string
     """
-    # Generate various diff formats
-    inline_diff = generate_word_level_diff(original_text, customized_text)
-    stats = get_diff_statistics(original_text, customized_text)
-    section_analysis = analyze_section_changes(original_text, customized_text)
-    keyword_analysis = analyze_keyword_changes(original_text, customized_text)
-    
-    # Generate the side-by-side diff data
-    side_by_side = generate_side_by_side_diff(original_text, customized_text)
-    
-    # Create HTML template as a raw string (note the 'r' prefix)
-    html_template_str = r"""<!DOCTYPE html>
+    return render_diff_html_document(DiffResult(original_text, customized_text), title, description)
+
+# Pieces of the HTML diff document, in order, as str.format templates. The
+# section analysis, inline diff, side-by-side rows and full texts are
+# streamed between them.
+_DOCUMENT_HEAD = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -821,7 +1233,9 @@ def generate_diff_html_document(original_text: str, customized_text: str,
     <h1>{title}</h1>
     <p>{description}</p>
     
-    <!-- Summary Stats -->
+"""
+
+_DOCUMENT_SUMMARY = r"""    <!-- Summary Stats -->
     <h2>Change Summary</h2>
     <div class="stats-container">
         <div class="stats-card">
@@ -868,7 +1282,9 @@ def generate_diff_html_document(original_text: str, customized_text: str,
     <!-- Section Analysis -->
     <h2>Section-by-Section Analysis</h2>
     
-    {section_analysis_html}
+    """
+
+_DOCUMENT_DIFF_VIEWS = r"""
     
     <!-- Diff Views -->
     <h2>Full Resume Comparison</h2>
@@ -881,7 +1297,9 @@ def generate_diff_html_document(original_text: str, customized_text: str,
         </div>
         
         <div id="inline-diff" class="tab-content active">
-            {inline_diff}
+            """
+
+_DOCUMENT_SIDE_BY_SIDE = r"""
         </div>
         
         <div id="side-by-side" class="tab-content">
@@ -899,16 +1317,22 @@ def generate_diff_html_document(original_text: str, customized_text: str,
                 </div>
                 
                 <!-- Diff lines -->
-                {side_by_side_rows}
+                """
+
+_DOCUMENT_ORIGINAL = r"""
             </div>
         </div>
         
         <div id="original" class="tab-content">
-            <pre>{original_text_escaped}</pre>
+            <pre>"""
+
+_DOCUMENT_CUSTOMIZED = r"""</pre>
         </div>
         
         <div id="customized" class="tab-content">
-            <pre>{customized_text_escaped}</pre>
+            <pre>"""
+
+_DOCUMENT_TAIL = r"""</pre>
         </div>
     </div>
     
@@ -948,68 +1372,146 @@ def generate_diff_html_document(original_text: str, customized_text: str,
 </body>
 </html>"""
 
-    # Prepare data for the template
-    added_keywords = ' '.join([f'<span class="keyword added">{k}</span>' for k in keyword_analysis['added_keywords']])
-    removed_keywords = ' '.join([f'<span class="keyword removed">{k}</span>' for k in keyword_analysis['removed_keywords']])
-    common_keywords = ' '.join([f'<span class="keyword common">{k}</span>' for k in keyword_analysis['common_keywords']])
-    
-    # Section analysis HTML
-    section_analysis_parts = []
-    for section, analysis in section_analysis.items():
-        escaped_section = section.replace("'", "\\'")
-        section_analysis_parts.append(f'''
+_SECTION_TEMPLATE = '''
     <div class="section-header" onclick="toggleSection('{escaped_section}')">
         {section}
         <span class="section-stats">
-            +{analysis.get('additions', 0)} -{analysis.get('deletions', 0)} ~{analysis.get('changes', 0)}
+            +{additions} -{deletions} ~{changes}
         </span>
     </div>
-    <div id="section-{section.replace(' ', '-')}" class="section-content">
-        <p><strong>Status:</strong> {analysis.get('status', 'unknown').replace('_', ' ')}</p>
-        <p><strong>Changes:</strong> {analysis.get('change_percentage', 0)}%</p>
-        <p><strong>Rationale:</strong> {analysis.get('rationale', 'No rationale provided')}</p>
-        <p><strong>Impact:</strong> {analysis.get('impact', 'unknown')}</p>
+    <div id="section-{section_id}" class="section-content">
+        <p><strong>Status:</strong> {status}</p>
+        <p><strong>Changes:</strong> {change_percentage}%</p>
+        <p><strong>Rationale:</strong> {rationale}</p>
+        <p><strong>Impact:</strong> {impact}</p>
         <div class="section-diff">
             <h4>Section Changes</h4>
-            <pre>{analysis.get('section_diff', 'No diff available')}</pre>
+            <pre>{section_diff}</pre>
         </div>
     </div>
-    ''')
-    section_analysis_html = ''.join(section_analysis_parts)
-    
-    # Side by side rows
-    side_by_side_rows_parts = []
-    for row in side_by_side['diff_data']:
-        side_by_side_rows_parts.append(f'''
-                <div class="diff-line {row['type']}-line">
+    '''
+
+_SIDE_BY_SIDE_ROW_TEMPLATE = '''
+                <div class="diff-line {type}-line">
                     <div class="diff-column">
-                        <div class="line-number">{row['line_number']}</div>
-                        <div class="line-content">{html.escape(row['original'])}</div>
+                        <div class="line-number">{line_number}</div>
+                        <div class="line-content">{original}</div>
                     </div>
                     <div class="diff-column">
-                        <div class="line-number">{row['line_number']}</div>
-                        <div class="line-content">{html.escape(row['customized'])}</div>
+                        <div class="line-number">{line_number}</div>
+                        <div class="line-content">{customized}</div>
                     </div>
                 </div>
-                ''')
-    side_by_side_rows = ''.join(side_by_side_rows_parts)
+                '''
+
+# Streamed output is batched into chunks of roughly this many characters
+_DOCUMENT_CHUNK_SIZE = 16 * 1024
+
+
+def render_diff_html_document(diff: DiffResult,
+                              title: str = "Resume Diff Comparison",
+                              description: str = "Comparison between original and customized resume") -> str:
+    """
+    Render a complete HTML document from an existing diff result.
     
-    # Create the final HTML by formatting the template with the data
-    html_template = html_template_str.format(
-        title=title,
-        description=description,
-        stats=stats,
-        inline_diff=inline_diff,
-        added_keywords=added_keywords,
-        removed_keywords=removed_keywords,
-        common_keywords=common_keywords,
-        section_analysis_html=section_analysis_html,
-        side_by_side_rows=side_by_side_rows,
-        original_text_escaped=html.escape(original_text),
-        customized_text_escaped=html.escape(customized_text)
+    Args:
+        diff: The diff of the original and customized resume texts
+        title: The title of the HTML document
+        description: A description of the comparison
+        
+    Returns:
+        Complete HTML document as a string
+    """
+    return ''.join(iter_diff_html_document(diff, title, description))
+
+def iter_diff_html_document(diff: DiffResult,
+                            title: str = "Resume Diff Comparison",
+                            description: str = "Comparison between original and customized resume",
+                            chunk_size: int = _DOCUMENT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Render the HTML diff document incrementally.
+
+    The document head and styles are yielded before any diff work is done,
+    and the large blocks (inline diff, side-by-side rows, full texts) are
+    rendered piece by piece, so the whole document is never held in memory
+    and a browser can start rendering before generation finishes.
+
+    Args:
+        diff: The diff of the original and customized resume texts
+        title: The title of the HTML document
+        description: A description of the comparison
+        chunk_size: Approximate number of characters per yielded chunk
+
+    Yields:
+        Consecutive chunks of the document, identical when joined to
+        render_diff_html_document
+    """
+    yield _DOCUMENT_HEAD.format(title=title, description=description)
+
+    keyword_analysis = diff.keyword_changes
+    yield _DOCUMENT_SUMMARY.format(
+        stats=diff.statistics,
+        added_keywords=' '.join([f'<span class="keyword added">{k}</span>' for k in keyword_analysis['added_keywords']]),
+        removed_keywords=' '.join([f'<span class="keyword removed">{k}</span>' for k in keyword_analysis['removed_keywords']]),
+        common_keywords=' '.join([f'<span class="keyword common">{k}</span>' for k in keyword_analysis['common_keywords']]),
     )
-    
-    return html_template
+
+    yield from _batched((
+        _SECTION_TEMPLATE.format(
+            escaped_section=section.replace("'", "\\'"),
+            section=section,
+            section_id=section.replace(' ', '-'),
+            additions=analysis.get('additions', 0),
+            deletions=analysis.get('deletions', 0),
+            changes=analysis.get('changes', 0),
+            status=analysis.get('status', 'unknown').replace('_', ' '),
+            change_percentage=analysis.get('change_percentage', 0),
+            rationale=analysis.get('rationale', 'No rationale provided'),
+            impact=analysis.get('impact', 'unknown'),
+            section_diff=analysis.get('section_diff', 'No diff available'),
+        )
+        for section, analysis in diff.section_analysis.items()
+    ), chunk_size)
+
+    yield _DOCUMENT_DIFF_VIEWS.format()
+    yield from _batched((_segment_html(segment) for segment in diff.segments), chunk_size)
+
+    yield _DOCUMENT_SIDE_BY_SIDE.format()
+    yield from _batched((
+        _SIDE_BY_SIDE_ROW_TEMPLATE.format(
+            type=row['type'],
+            line_number=row['line_number'],
+            original=html.escape(row['original']),
+            customized=html.escape(row['customized']),
+        )
+        for row in diff.side_by_side['diff_data']
+    ), chunk_size)
+
+    yield _DOCUMENT_ORIGINAL.format()
+    yield from _batched(
+        (html.escape(line) for line in diff.original_text.splitlines(True)), chunk_size
+    )
+
+    yield _DOCUMENT_CUSTOMIZED.format()
+    yield from _batched(
+        (html.escape(line) for line in diff.customized_text.splitlines(True)), chunk_size
+    )
+
+    yield _DOCUMENT_TAIL.format()
+
+def _batched(parts: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Join consecutive strings into chunks of about chunk_size characters."""
+    buffer: List[str] = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield ''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
 
 def create_diff_json(original_text: str, customized_text: str) -> Dict:
     """
@@ -1022,25 +1524,7 @@ def create_diff_json(original_text: str, customized_text: str) -> Dict:
     Returns:
         Dictionary with all diff data
     """
-    # Get all the diff data
-    diff_html = generate_word_level_diff(original_text, customized_text)
-    side_by_side = generate_side_by_side_diff(original_text, customized_text)
-    stats = get_diff_statistics(original_text, customized_text)
-    section_analysis = analyze_section_changes(original_text, customized_text)
-    keyword_analysis = analyze_keyword_changes(original_text, customized_text)
-    
-    # Combine into a single JSON structure
-    diff_data = {
-        "original_text": original_text,
-        "customized_text": customized_text,
-        "diff_html": diff_html,
-        "side_by_side_diff": side_by_side["diff_data"],
-        "statistics": stats,
-        "section_analysis": section_analysis,
-        "keyword_analysis": keyword_analysis
-    }
-    
-    return diff_data
+    return DiffResult(original_text, customized_text).to_dict()
 
 def export_diff_to_files(original_text: str, customized_text: str, output_dir: str, 
                           html_filename: str = "diff_output.html",
@@ -1066,21 +1550,23 @@ def export_diff_to_files(original_text: str, customized_text: str, output_dir: s
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    # Generate the HTML document
-    html_output = generate_diff_html_document(original_text, customized_text)
+    # All three files are derived from one diff
+    diff = DiffResult(original_text, customized_text)
+
     html_path = os.path.join(output_dir, html_filename)
     
     # Generate JSON data
-    json_data = create_diff_json(original_text, customized_text)
+    json_data = diff.to_dict()
     json_path = os.path.join(output_dir, json_filename)
     
     # Get stats for simple stats file
-    stats = get_diff_statistics(original_text, customized_text)
+    stats = diff.statistics
     stats_path = os.path.join(output_dir, stats_filename)
     
-    # Write files
+    # Write files; the HTML document is written as it is rendered
     with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_output)
+        for chunk in iter_diff_html_document(diff):
+            f.write(chunk)
     
     with open(json_path, 'w', encoding='utf-8') as f:
         json.dump(json_data, f, indent=2)
@@ -1094,3 +1580,82 @@ def export_diff_to_files(original_text: str, customized_text: str, output_dir: s
         "stats_file": stats_path
     }
 
+
+# Files in a diff bundle, named like the export_diff_to_files outputs
+BUNDLE_HTML_FILENAME = "diff_output.html"
+BUNDLE_JSON_FILENAME = "diff_data.json"
+BUNDLE_STATS_FILENAME = "diff_stats.json"
+BUNDLE_MARKDOWN_FILENAME = "diff.md"
+BUNDLE_SIDE_BY_SIDE_FILENAME = "side_by_side.json"
+
+
+class _ZipStream(io.RawIOBase):
+    """Unseekable sink collecting ZIP output until the stream consumer takes it."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _json_bytes(data: Any) -> bytes:
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def iter_diff_bundle(diff: DiffResult,
+                     title: str = "Resume Diff Comparison",
+                     description: str = "Comparison between original and customized resume") -> Iterator[bytes]:
+    """
+    Stream a ZIP archive of every diff artifact built from one diff.
+
+    The archive holds the HTML document, the create_diff_json data, the
+    statistics, a Markdown diff and the side-by-side rows. The JSON and
+    Markdown files are serialized on worker threads while the HTML document
+    is compressed into the archive as it is rendered. Archive bytes are
+    yielded as they are produced; the archive is never held in memory or
+    written to disk.
+
+    Args:
+        diff: The computed diff
+        title: The title of the HTML document
+        description: A description of the comparison
+
+    Yields:
+        Consecutive pieces of the ZIP archive
+    """
+    sink = _ZipStream()
+    # Everything the files share is computed once before fanning out
+    diff_data = diff.to_dict()
+
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="diff-bundle") as executor:
+        members = {
+            BUNDLE_JSON_FILENAME: executor.submit(_json_bytes, diff_data),
+            BUNDLE_STATS_FILENAME: executor.submit(_json_bytes, diff.statistics),
+            BUNDLE_MARKDOWN_FILENAME: executor.submit(lambda: diff.markdown.encode('utf-8')),
+            BUNDLE_SIDE_BY_SIDE_FILENAME: executor.submit(_json_bytes, diff.side_by_side),
+        }
+
+        with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(BUNDLE_HTML_FILENAME, mode='w') as member:
+                for chunk in iter_diff_html_document(diff, title, description):
+                    member.write(chunk.encode('utf-8'))
+                    data = sink.drain()
+                    if data:
+                        yield data
+
+            for name, future in members.items():
+                archive.writestr(name, future.result())
+                yield sink.drain()
+
+    # Central directory, written when the archive is closed
+    yield sink.drain()
@@ -6,10 +6,10 @@ content chunking capabilities for more reliable AI processing.
 """
 
 import re
-import nltk
 from typing import List, Dict, Any, Optional
 import logfire
 
+from app.core.nltk_init import ensure_nltk_punkt
 from app.services.integration.interfaces import ContentChunkingService, SectionType
 
 
@@ -24,19 +24,10 @@ class IntegratedContentChunker(ContentChunkingService):
             default_max_chunk_size: Default maximum chunk size in characters
         """
         self.default_max_chunk_size = default_max_chunk_size
-        self._ensure_nltk_resources()
         
     def _ensure_nltk_resources(self) -> None:
-        """Ensure required NLTK resources are available."""
-        try:
-            # Try to load necessary NLTK resources
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            # Download if not available
-            try:
-                nltk.download('punkt', quiet=True)
-            except Exception as e:
-                logfire.warning(f"Could not download NLTK resources: {str(e)}")
+        """Ensure required NLTK resources are available (loaded once per process)."""
+        ensure_nltk_punkt()
     
     def chunk_content(self, content: str, section_type: Optional[SectionType] = None,
                      max_chunk_size: Optional[int] = None) -> List[str]:
@@ -160,8 +151,11 @@ class IntegratedContentChunker(ContentChunkingService):
         Returns:
             List of content chunks
         """
+        self._ensure_nltk_resources()
         try:
             # Use NLTK to split into sentences
+            import nltk
+
             sentences = nltk.sent_tokenize(content)
         except Exception as e:
             # Fallback to basic sentence splitting
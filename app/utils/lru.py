@@ -0,0 +1,153 @@
+"""
+Thread-safe least-recently-used cache.
+
+The in-memory caches (tokenizations, spaCy extractions, job description
+analyses, per-section ATS results, resume diffs and keyword vectors) are built
+on this class, so eviction, locking and hit counting live in one place.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Mapping that evicts its least recently used entries beyond a maximum size.
+
+    All methods are thread-safe. Cached values are shared between callers and
+    must not be modified.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached values (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K, compute: Callable[[], V]) -> V:
+        """
+        Get a cached value, computing and caching it on a miss.
+
+        The value is computed outside the lock, so concurrent misses on the
+        same key may each compute it.
+
+        Args:
+            key: Cache key
+            compute: Function computing the value on a miss
+
+        Returns:
+            The cached or freshly computed value
+        """
+        value = self._lookup(key)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def lookup(self, key: K) -> Optional[V]:
+        """
+        Look up a cached value without computing it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Cache a value, evicting the least recently used ones beyond max_size.
+
+        Args:
+            key: Cache key
+            value: The value
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Drop a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The dropped value, or None if it was not cached
+        """
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def remove_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """
+        Drop every cached value matching a predicate.
+
+        Args:
+            predicate: Function of (key, value) selecting the entries to drop
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            stale = [key for key, value in self._entries.items() if predicate(key, value)]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached values and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit and miss counts and current size
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, key: K):
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
@@ -0,0 +1,235 @@
+"""
+Skill alias normalization.
+
+Resumes and job descriptions spell the same skill many ways: "k8s" and
+"kubernetes", "node.js" and "node", "ci/cd" and "ci cd". The alias table in
+``app/data/skill_aliases.json`` maps each variant to one canonical form. It is
+compiled once at import into a token trie, so the tokenizer can rewrite a token
+stream in a single left-to-right pass (longest alias wins) instead of running
+a regex alternation over the text for every lookup.
+
+Aliases and canonical forms are written as text and split into tokens the same
+way the tokenizer splits content (runs of ASCII letters and digits), so
+"node.js", "nodejs" and "node js" are all matched against the token stream.
+"""
+import json
+import re
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_ALIASES_PATH = Path(__file__).resolve().parent.parent / "data" / "skill_aliases.json"
+
+# Must agree with the content token pattern in app.utils.tokenizer
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Shortest canonical token; the tokenizer drops shorter content tokens
+_MIN_CANONICAL_TOKEN_LENGTH = 3
+
+
+def split_tokens(text: str) -> Tuple[str, ...]:
+    """
+    Split text into lowercase alias tokens.
+
+    Args:
+        text: The text to split
+
+    Returns:
+        Tuple of tokens
+    """
+    return tuple(_TOKEN_RE.findall(text.lower()))
+
+
+class AliasTrie:
+    """
+    Token trie mapping alias token sequences to their canonical tokens.
+
+    Each node is a dictionary of child nodes keyed by token; a node that ends
+    an alias stores its replacement under the ``None`` key.
+    """
+
+    def __init__(self):
+        self._root: Dict[Optional[str], object] = {}
+
+    def add(self, alias: Sequence[str], canonical: Tuple[str, ...]) -> None:
+        """
+        Add an alias.
+
+        Args:
+            alias: Alias tokens
+            canonical: Tokens the alias is replaced with
+        """
+        node = self._root
+        for token in alias:
+            node = node.setdefault(token, {})
+        node[None] = canonical
+
+    def match(self, tokens: Sequence[str], start: int) -> Tuple[int, Optional[Tuple[str, ...]]]:
+        """
+        Find the longest alias starting at a position.
+
+        Args:
+            tokens: Token sequence
+            start: Position to match from
+
+        Returns:
+            (length of the match, canonical tokens), or (0, None) if no alias
+            starts at the position
+        """
+        node = self._root.get(tokens[start])
+        if node is None:
+            return 0, None
+
+        length, canonical = 0, None
+        end = start
+        while True:
+            end += 1
+            if None in node:
+                length, canonical = end - start, node[None]
+            if end == len(tokens):
+                break
+            node = node.get(tokens[end])
+            if node is None:
+                break
+        return length, canonical
+
+
+class SkillAliases:
+    """
+    Compiled skill alias table.
+
+    Attributes:
+        canonical_forms: Canonical text of every skill with aliases
+        technical_terms: Canonical text of the technical terms kept by the
+            keyword filter
+    """
+
+    def __init__(self, aliases: Mapping[str, Iterable[str]], technical_terms: Iterable[str] = ()):
+        self._aliases = AliasTrie()
+        alias_owners: Dict[Tuple[str, ...], str] = {}
+
+        for canonical, variants in aliases.items():
+            canonical_tokens = split_tokens(canonical)
+            if ' '.join(canonical_tokens) != canonical:
+                raise ValueError(f"Canonical skill {canonical!r} must be lowercase tokens joined by spaces")
+            if any(len(token) < _MIN_CANONICAL_TOKEN_LENGTH for token in canonical_tokens):
+                raise ValueError(
+                    f"Canonical skill {canonical!r} has a token shorter than "
+                    f"{_MIN_CANONICAL_TOKEN_LENGTH} characters"
+                )
+            for variant in variants:
+                variant_tokens = split_tokens(variant)
+                if not variant_tokens or variant_tokens == canonical_tokens:
+                    continue
+                owner = alias_owners.setdefault(variant_tokens, canonical)
+                if owner != canonical:
+                    raise ValueError(f"Alias {variant!r} is claimed by both {owner!r} and {canonical!r}")
+                self._aliases.add(variant_tokens, canonical_tokens)
+
+        self.canonical_forms: FrozenSet[str] = frozenset(aliases)
+
+        # Canonical forms must be fixed points, or normalization would depend
+        # on how many times it ran
+        for canonical in aliases:
+            if self.canonical_term(canonical) != canonical:
+                raise ValueError(f"Canonical skill {canonical!r} is itself rewritten by an alias")
+
+        self._technical_terms = AliasTrie()
+        canonical_terms = set()
+        for term in technical_terms:
+            tokens = split_tokens(self.canonical_term(term))
+            if tokens:
+                self._technical_terms.add(tokens, tokens)
+                canonical_terms.add(' '.join(tokens))
+        self.technical_terms: FrozenSet[str] = frozenset(canonical_terms)
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_ALIASES_PATH) -> "SkillAliases":
+        """
+        Load an alias table from a JSON file.
+
+        Args:
+            path: File with an "aliases" mapping (canonical -> variants) and an
+                optional "technical_terms" list
+
+        Returns:
+            Compiled alias table
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('aliases', {}), data.get('technical_terms', ()))
+
+    def canonicalize_tokens(self, tokens: Sequence[str]) -> List[str]:
+        """
+        Replace aliases in a token sequence with their canonical tokens.
+
+        Matching is greedy from left to right, preferring the longest alias at
+        each position, so the pass is linear in the number of tokens.
+
+        Args:
+            tokens: Lowercase tokens
+
+        Returns:
+            Canonicalized tokens
+        """
+        result: List[str] = []
+        match = self._aliases.match
+        position, count = 0, len(tokens)
+        while position < count:
+            length, canonical = match(tokens, position)
+            if canonical is None:
+                result.append(tokens[position])
+                position += 1
+            else:
+                result.extend(canonical)
+                position += length
+        return result
+
+    def canonical_term(self, term: str) -> str:
+        """
+        Normalize a whole skill name.
+
+        Args:
+            term: A skill name such as "Node.js" or "k8s"
+
+        Returns:
+            The canonical form if the entire term is an alias or a differently
+            punctuated canonical form ("scikit-learn"), otherwise the lowercased
+            term
+        """
+        lowered = term.lower()
+        tokens = split_tokens(lowered)
+        if tokens:
+            length, canonical = self._aliases.match(tokens, 0)
+            if canonical is not None and length == len(tokens):
+                return ' '.join(canonical)
+            joined = ' '.join(tokens)
+            if joined in self.canonical_forms:
+                return joined
+        return lowered
+
+    def mentions_technical_term(self, keyword: str) -> bool:
+        """
+        Check whether a keyword contains a technical term.
+
+        The keyword is canonicalized and scanned token by token, so terms only
+        match whole tokens ("ui" matches "ui design" but not "building").
+        Plurals ending in "s" also match ("projects", "apis").
+
+        Args:
+            keyword: Keyword or phrase
+
+        Returns:
+            True if any run of the keyword's tokens is a technical term
+        """
+        tokens = self.canonicalize_tokens(split_tokens(keyword))
+        singular = [token[:-1] if len(token) > 3 and token.endswith('s') else token for token in tokens]
+        match = self._technical_terms.match
+        return any(
+            match(candidate, position)[1] is not None
+            for candidate in ((tokens, singular) if singular != tokens else (tokens,))
+            for position in range(len(candidate))
+        )
+
+
+# Compiled once at import; the alias table is static
+SKILL_ALIASES = SkillAliases.from_file()
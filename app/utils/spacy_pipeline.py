@@ -0,0 +1,124 @@
+"""
+Batched spaCy processing with trimmed pipelines.
+
+Keyword and entity extraction only read a few annotations from each ``Doc``.
+``SpacyBatchExtractor`` runs ``nlp.pipe`` over a batch of texts with every
+other pipeline component disabled, reduces each ``Doc`` to the value the
+caller needs, and caches that value by text hash so repeated texts skip the
+pipeline entirely.
+"""
+from typing import Callable, FrozenSet, Generic, Iterable, List, Optional, Sequence, TypeVar
+
+from app.utils.lru import LRUCache
+from app.utils.tokenizer import text_fingerprint
+
+T = TypeVar("T")
+
+# Components needed for tokens, named entities and noun chunks. Noun chunks
+# need the dependency parse and coarse POS tags; the tagger and parser listen
+# to the shared tok2vec layer.
+KEYWORD_COMPONENTS: FrozenSet[str] = frozenset(
+    {"tok2vec", "tagger", "attribute_ruler", "parser", "ner"}
+)
+
+# Components needed for named entities only
+ENTITY_COMPONENTS: FrozenSet[str] = frozenset({"tok2vec", "ner"})
+
+
+def unused_components(nlp, required: Iterable[str]) -> List[str]:
+    """
+    List the pipeline components that are not required.
+
+    Args:
+        nlp: A loaded spaCy Language object
+        required: Names of the components whose annotations are read
+
+    Returns:
+        Names of components to disable
+    """
+    required = set(required)
+    return [name for name in nlp.pipe_names if name not in required]
+
+
+class SpacyBatchExtractor(Generic[T]):
+    """
+    Extract values from texts with ``nlp.pipe`` and cache them by text hash.
+
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def __init__(
+        self,
+        nlp,
+        extract: Callable[..., T],
+        required_components: Iterable[str],
+        batch_size: int = 32,
+        n_process: int = 1,
+        cache_size: int = 256,
+    ):
+        """
+        Initialize the extractor.
+
+        Args:
+            nlp: A loaded spaCy Language object
+            extract: Function reducing a processed Doc to the cached value
+            required_components: Components whose annotations extract reads
+            batch_size: Number of texts buffered per nlp.pipe batch
+            n_process: Default number of processes for nlp.pipe
+            cache_size: Maximum number of cached values (0 disables caching)
+        """
+        self.nlp = nlp
+        self.extract_doc = extract
+        self.disabled = unused_components(nlp, required_components)
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.cache_size = cache_size
+        self._cache: "LRUCache[str, T]" = LRUCache(cache_size)
+
+    def extract(self, texts: Sequence[str], n_process: Optional[int] = None) -> List[T]:
+        """
+        Extract values for several texts in one pipeline pass.
+
+        Args:
+            texts: Texts to process
+            n_process: Number of processes for nlp.pipe (defaults to the
+                extractor's setting)
+
+        Returns:
+            One extracted value per text, in order
+        """
+        keys = [text_fingerprint(text) for text in texts]
+        results: List[Optional[T]] = [None] * len(texts)
+
+        # Texts still to process, deduplicated by hash
+        pending = {}
+        for index, key in enumerate(keys):
+            if key in pending:
+                continue
+            results[index] = self._cache.lookup(key)
+            if results[index] is None:
+                pending[key] = texts[index]
+
+        if pending:
+            docs = self.nlp.pipe(
+                pending.values(),
+                batch_size=self.batch_size,
+                disable=self.disabled,
+                n_process=n_process or self.n_process,
+            )
+            extracted = {
+                key: self.extract_doc(doc) for key, doc in zip(pending, docs)
+            }
+
+            for key, value in extracted.items():
+                self._cache.put(key, value)
+
+            for index, key in enumerate(keys):
+                if results[index] is None:
+                    results[index] = extracted[key]
+
+        return results
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._cache.clear()
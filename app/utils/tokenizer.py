@@ -0,0 +1,230 @@
+"""
+Shared text tokenizer for keyword analysis.
+
+ATS scoring, the diff keyword analysis and the evaluation framework all need
+the same handful of token streams for a piece of text. ``tokenize`` computes
+them with precompiled regexes, interns the tokens, and memoizes the result by
+content hash so that a resume analysed by several components is only scanned
+once per stream. Content tokens are normalized with the skill alias table
+("k8s" becomes "kubernetes"), so keyword extraction and matching agree on one
+spelling per skill.
+"""
+import hashlib
+import re
+import sys
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from app.utils.lru import LRUCache
+from app.utils.skill_aliases import SKILL_ALIASES
+
+# Noise removed before extracting content tokens
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_BRACKETS_RE = re.compile(r'\[.*?\]')
+_PARENS_RE = re.compile(r'\(.*?\)')
+
+# Content tokens are runs of ASCII letters/digits
+_CONTENT_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Plain word tokens as matched by \b\w+\b
+_WORD_RE = re.compile(r'\w+')
+
+# Content tokens shorter than this are dropped
+MIN_TOKEN_LENGTH = 3
+
+# n-grams (joined with spaces) must be longer than this to be counted
+MIN_NGRAM_LENGTH = 4
+
+_CACHE_SIZE = 256
+
+
+def text_fingerprint(text: str) -> str:
+    """
+    Compute a stable content hash for a piece of text.
+
+    Args:
+        text: The text to fingerprint
+
+    Returns:
+        Hex digest identifying the text content
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class TokenizedText:
+    """
+    Token streams for one text, computed lazily and memoized.
+
+    Attributes:
+        text: The lowercased source text
+        fingerprint: Content hash of the original text
+    """
+
+    def __init__(self, text: str, fingerprint: str):
+        self.text = text.lower()
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._content: Optional[Tuple[Tuple[str, ...], Tuple[int, ...]]] = None
+        self._words: Optional[Tuple[Tuple[str, ...], Tuple[bool, ...]]] = None
+        self._stop_flags: Dict[FrozenSet[str], Tuple[bool, ...]] = {}
+        self._ngram_counts: Dict[Tuple[FrozenSet[str], int], Dict[str, int]] = {}
+
+    def _scan_content(self) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+        if self._content is None:
+            cleaned = _URL_RE.sub('', self.text)
+            cleaned = _BRACKETS_RE.sub('', cleaned)
+            cleaned = _PARENS_RE.sub('', cleaned)
+
+            tokens: List[str] = []
+            # Index of the first token on each line
+            line_starts: List[int] = []
+            intern = sys.intern
+            canonicalize = SKILL_ALIASES.canonicalize_tokens
+            # Aliases are resolved per line, before short tokens are dropped,
+            # so "ci/cd" and "node.js" are seen whole and a line's tokens
+            # don't depend on its neighbours
+            for line in cleaned.split('\n'):
+                line_starts.append(len(tokens))
+                for token in canonicalize(_CONTENT_TOKEN_RE.findall(line)):
+                    if len(token) >= MIN_TOKEN_LENGTH:
+                        tokens.append(intern(token))
+            self._content = (tuple(tokens), tuple(line_starts))
+        return self._content
+
+    def _scan_words(self) -> Tuple[Tuple[str, ...], Tuple[bool, ...]]:
+        if self._words is None:
+            words: List[str] = []
+            # Whether each word is followed by exactly one space and then the next word
+            spaced: List[bool] = []
+            intern = sys.intern
+            previous_end = None
+            for match in _WORD_RE.finditer(self.text):
+                if previous_end is not None:
+                    spaced.append(match.start() - previous_end == 1 and self.text[previous_end] == ' ')
+                words.append(intern(match.group()))
+                previous_end = match.end()
+            self._words = (tuple(words), tuple(spaced))
+        return self._words
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """
+        Content tokens: URLs and bracketed/parenthesised text removed,
+        punctuation treated as whitespace, skill aliases replaced by their
+        canonical form, tokens shorter than three characters dropped.
+        """
+        return self._scan_content()[0]
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """Every word character run in the text, in order."""
+        return self._scan_words()[0]
+
+    def line_tokens(self) -> List[Tuple[str, ...]]:
+        """
+        Content tokens grouped by source line.
+
+        Returns:
+            One tuple of tokens per line of ``text.split('\\n')``
+        """
+        tokens, line_starts = self._scan_content()
+        bounds = list(line_starts) + [len(tokens)]
+        return [tokens[bounds[i]:bounds[i + 1]] for i in range(len(line_starts))]
+
+    def stopword_flags(self, stop_words: FrozenSet[str]) -> Tuple[bool, ...]:
+        """
+        Flag which content tokens are stopwords.
+
+        Args:
+            stop_words: The stopword set to test against
+
+        Returns:
+            Tuple with one boolean per content token
+        """
+        flags = self._stop_flags.get(stop_words)
+        if flags is None:
+            flags = tuple(token in stop_words for token in self.tokens)
+            with self._lock:
+                self._stop_flags[stop_words] = flags
+        return flags
+
+    def ngram_counts(self, stop_words: FrozenSet[str], max_n: int = 3) -> Dict[str, int]:
+        """
+        Count 1..max_n-grams over the content tokens.
+
+        Multi-word grams containing a stopword are skipped, as are grams whose
+        text is shorter than MIN_NGRAM_LENGTH characters.
+
+        Args:
+            stop_words: Stopwords excluded from multi-word grams
+            max_n: Largest gram size
+
+        Returns:
+            Dictionary mapping n-gram text to frequency (shared; do not mutate)
+        """
+        key = (stop_words, max_n)
+        counts = self._ngram_counts.get(key)
+        if counts is not None:
+            return counts
+
+        tokens = self.tokens
+        flags = self.stopword_flags(stop_words)
+        counts = {}
+        for n in range(1, max_n + 1):
+            for i in range(len(tokens) - n + 1):
+                if n > 1 and any(flags[i:i + n]):
+                    continue
+                gram_text = tokens[i] if n == 1 else ' '.join(tokens[i:i + n])
+                if len(gram_text) >= MIN_NGRAM_LENGTH:
+                    counts[gram_text] = counts.get(gram_text, 0) + 1
+
+        with self._lock:
+            self._ngram_counts[key] = counts
+        return counts
+
+    def word_phrases(self, min_n: int = 2, max_n: int = 3) -> List[str]:
+        """
+        Build phrases from consecutive alphabetic words that occur in the text.
+
+        Args:
+            min_n: Minimum number of words in a phrase
+            max_n: Maximum number of words in a phrase
+
+        Returns:
+            List of phrases in order of gram size, then position
+        """
+        words, spaced = self._scan_words()
+        alpha = [word.isalpha() for word in words]
+        phrases = []
+        for n in range(min_n, max_n + 1):
+            for i in range(len(words) - n + 1):
+                if not all(alpha[i:i + n]):
+                    continue
+                phrase = ' '.join(words[i:i + n])
+                # Words joined by single spaces are known to occur verbatim;
+                # anything else needs a substring check
+                if all(spaced[i:i + n - 1]) or phrase in self.text:
+                    phrases.append(phrase)
+        return phrases
+
+
+_cache: "LRUCache[str, TokenizedText]" = LRUCache(_CACHE_SIZE)
+
+
+def tokenize(text: str) -> TokenizedText:
+    """
+    Tokenize text, reusing earlier results for identical content.
+
+    Args:
+        text: The text to tokenize
+
+    Returns:
+        Memoized TokenizedText for the content
+    """
+    fingerprint = text_fingerprint(text)
+    return _cache.get(fingerprint, lambda: TokenizedText(text, fingerprint))
+
+
+def clear_tokenizer_cache() -> None:
+    """Drop all memoized tokenizations."""
+    _cache.clear()
@@ -0,0 +1,44 @@
+"""
+Performance benchmarks.
+
+Benchmarks run offline against a reproducible synthetic corpus and write
+their results as JSON, so runs on different commits can be compared:
+
+    python -m benchmarks.ats --output ats.json
+    python -m benchmarks.ats --compare ats.json
+    python -m benchmarks.diff --output diff.json --max-ms 2000
+"""
+
+from benchmarks.corpus import (
+    CorpusCase,
+    DiffCase,
+    generate_corpus,
+    generate_customized_resume,
+    generate_diff_corpus,
+    generate_job_description,
+    generate_resume,
+)
+from benchmarks.harness import (
+    StageStats,
+    check_limits,
+    compare_results,
+    measure,
+    percentile,
+    write_results,
+)
+
+__all__ = [
+    'CorpusCase',
+    'DiffCase',
+    'StageStats',
+    'check_limits',
+    'compare_results',
+    'generate_corpus',
+    'generate_customized_resume',
+    'generate_diff_corpus',
+    'generate_job_description',
+    'generate_resume',
+    'measure',
+    'percentile',
+    'write_results',
+]
@@ -0,0 +1,220 @@
+"""
+ATS analysis benchmark.
+
+Times each stage of the ATS analysis separately over a synthetic corpus of
+resumes and job descriptions from 1 KB to 50 KB. The analysis is
+algorithmic, so no model provider is needed and the benchmark runs offline.
+Module-level memoization (section headers, technical terms) stays warm
+between runs, as it does in a long-running server; the job description and
+section caches are cleared before the "cold" stages.
+
+Usage:
+    python -m benchmarks.ats --output results/ats.json
+    python -m benchmarks.ats --compare results/ats.json --threshold 0.2
+"""
+import argparse
+import itertools
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import logfire
+
+from benchmarks.corpus import DEFAULT_SIZES_KB, CorpusCase, generate_corpus
+from benchmarks.harness import compare_results, environment_info, measure, write_results
+
+STAGES = (
+    "process_job_description",
+    "identify_sections",
+    "extract_keywords_batch",
+    "extract_ngrams",
+    "perform_matching",
+    "calculate_section_scores",
+    "generate_enhanced_suggestions",
+    "analyze_resume_for_ats_cold",
+    "analyze_resume_for_ats_warm",
+)
+
+
+def _stage_calls(case: CorpusCase) -> Dict[str, Callable[[], Any]]:
+    from app.services import ats_service as ats
+
+    resume, job_description = case.resume, case.job_description
+
+    # Inputs for the later stages, computed once outside the timed calls
+    job_type, jd_elements, job_ngrams = ats.analyze_job_description(job_description)
+    sections = ats.identify_sections(resume)
+    match_results = ats.perform_matching(
+        resume, sections, job_description, jd_elements, job_ngrams
+    )
+    section_scores = ats.calculate_section_scores(sections, jd_elements, job_type)
+
+    return {
+        "process_job_description": lambda: ats.process_job_description(job_description),
+        "identify_sections": lambda: ats.identify_sections(resume),
+        "extract_keywords_batch": lambda: ats.extract_keywords_batch([resume, job_description]),
+        "extract_ngrams": lambda: ats.extract_ngrams(resume),
+        "perform_matching": lambda: ats.perform_matching(
+            resume, sections, job_description, jd_elements, job_ngrams
+        ),
+        "calculate_section_scores": lambda: ats.calculate_section_scores(
+            sections, jd_elements, job_type
+        ),
+        "generate_enhanced_suggestions": lambda: ats.generate_enhanced_suggestions(
+            resume, job_description, match_results, section_scores, job_type
+        ),
+        "analyze_resume_for_ats_cold": lambda: ats.analyze_resume_for_ats_sync(
+            resume, job_description
+        ),
+        "analyze_resume_for_ats_warm": lambda: ats.analyze_resume_for_ats_sync(
+            resume, job_description
+        ),
+    }
+
+
+def _clear_caches() -> None:
+    from app.services import ats_service as ats
+
+    ats.JOB_ANALYSIS_CACHE.clear()
+    ats.SECTION_CACHE.clear()
+
+
+def run_ats_benchmark(
+    sizes_kb: Sequence[int] = DEFAULT_SIZES_KB,
+    samples: int = 3,
+    repeat: int = 5,
+    seed: int = 0,
+    stages: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark the ATS analysis stages.
+
+    Each stage is timed ``repeat`` times per sample, cycling through the
+    samples of a size, so the percentiles cover every sample.
+
+    Args:
+        sizes_kb: Document sizes in KB
+        samples: Number of resume and job description pairs per size
+        repeat: Timed runs per sample
+        seed: Corpus seed
+        stages: Stages to run (defaults to all)
+
+    Returns:
+        Benchmark results, with per-stage statistics for each size under ``cases``
+    """
+    from app.core.nltk_init import SPACY_RESOURCE, STOPWORDS_RESOURCE, warm_up_nlp
+
+    stages = list(stages or STAGES)
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    # Load NLP resources up front so they aren't timed as part of a stage
+    nlp = warm_up_nlp([STOPWORDS_RESOURCE, SPACY_RESOURCE])
+
+    corpus = generate_corpus(sizes_kb, samples, seed)
+    cases: Dict[str, Dict[str, Any]] = {}
+    for size_kb in sizes_kb:
+        size_cases = [case for case in corpus if case.size_kb == size_kb]
+        calls = [_stage_calls(case) for case in size_cases]
+
+        results = {}
+        for stage in stages:
+            next_call = itertools.cycle([stage_calls[stage] for stage_calls in calls])
+            setup = _clear_caches if stage.endswith("_cold") else None
+            stats = measure(
+                lambda: next(next_call)(),
+                repeat=repeat * len(calls),
+                warmup=len(calls),
+                setup=setup,
+            )
+            results[stage] = stats.to_dict()
+        cases[f"{size_kb}kb"] = results
+
+    return {
+        "benchmark": "ats",
+        "environment": environment_info(),
+        "config": {
+            "sizes_kb": list(sizes_kb),
+            "samples": samples,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "nlp": [
+            {"name": load["name"], "available": load["available"]} for load in nlp
+        ],
+        "cases": cases,
+    }
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """
+    Format benchmark results as a plain-text table.
+
+    Args:
+        results: Benchmark results
+
+    Returns:
+        The table
+    """
+    lines = [f"{'case':<8} {'stage':<32} {'p50 ms':>10} {'p95 ms':>10} {'peak KiB':>10}"]
+    for case, stages in results["cases"].items():
+        for stage, stats in stages.items():
+            lines.append(
+                f"{case:<8} {stage:<32} {stats['p50_ms']:>10.2f} {stats['p95_ms']:>10.2f} "
+                f"{stats['peak_alloc_bytes'] / 1024:>10.1f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code: 1 if a comparison found regressions, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the ATS analysis stages")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES_KB),
+                        help="Document sizes in KB")
+    parser.add_argument("--samples", type=int, default=3, help="Documents per size")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per document")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, help="Stages to run")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative p50 slowdown when comparing")
+    args = parser.parse_args(argv)
+
+    # Keep the benchmark offline and its output readable
+    logfire.configure(send_to_logfire=False, console=False)
+
+    results = run_ats_benchmark(args.sizes, args.samples, args.repeat, args.seed, args.stages)
+    print(format_results(results))
+    if args.output:
+        write_results(args.output, results)
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_results(baseline, results, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['case']} {regression['stage']}: "
+                f"{regression['baseline']:.2f} ms -> {regression['current']:.2f} ms "
+                f"({regression['ratio']:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print(f"\nNo regressions against {args.compare}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
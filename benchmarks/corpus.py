@@ -0,0 +1,282 @@
+"""
+Reproducible synthetic resumes and job descriptions.
+
+Documents are built from the skills taxonomy and a fixed vocabulary with a
+seeded random generator, so the same seed and size always give the same
+text on every machine and Python version.
+"""
+import random
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from app.services.ats.taxonomy import SKILLS_TAXONOMY
+
+# Document sizes in KB
+DEFAULT_SIZES_KB = (1, 5, 10, 25, 50)
+
+# Share of resume lines changed by a customization; 1.0 is a full rewrite
+DEFAULT_EDIT_RATIOS = (0.01, 0.1, 0.5, 1.0)
+
+SKILLS = sorted({
+    term
+    for category, terms in SKILLS_TAXONOMY.items()
+    for term in [category, *terms]
+})
+
+VERBS = [
+    "Built", "Designed", "Led", "Migrated", "Improved", "Automated", "Owned",
+    "Delivered", "Scaled", "Maintained", "Launched", "Mentored", "Reduced",
+]
+
+OBJECTS = [
+    "data pipelines", "REST APIs", "internal tools", "the billing platform",
+    "customer dashboards", "deployment workflows", "search infrastructure",
+    "reporting services", "a design system", "the onboarding flow",
+]
+
+OUTCOMES = [
+    "cutting latency by {n}%", "serving {n}k daily users", "saving {n} hours a week",
+    "raising conversion by {n}%", "with {n}% test coverage", "across {n} teams",
+]
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+
+ROLES = [
+    "Software Engineer", "Senior Backend Engineer", "Data Scientist", "Frontend Developer",
+    "DevOps Engineer", "Engineering Manager", "Machine Learning Engineer",
+]
+
+REQUIREMENT_PHRASES = [
+    "{n}+ years of experience with {skill}",
+    "Strong knowledge of {skill} and {other}",
+    "Hands-on experience building services with {skill}",
+    "Familiarity with {skill} is a plus",
+    "Must have experience with {skill}",
+]
+
+RESPONSIBILITY_PHRASES = [
+    "Design and build {object} using {skill}",
+    "Own {object} end to end",
+    "Collaborate with product and design on {object}",
+    "Improve the reliability of {object}",
+]
+
+
+@dataclass(frozen=True)
+class CorpusCase:
+    """One synthetic resume and job description pair."""
+
+    size_kb: int
+    index: int
+    resume: str
+    job_description: str
+
+
+@dataclass(frozen=True)
+class DiffCase:
+    """One synthetic resume and a customized version of it."""
+
+    size_kb: int
+    edit_ratio: float
+    original: str
+    customized: str
+
+
+def _rng(seed: int, kind: str, size_kb: int, index: int) -> random.Random:
+    # String seeds are hashed deterministically, unlike hash() of a tuple
+    return random.Random(f"{seed}:{kind}:{size_kb}:{index}")
+
+
+def _fit(parts: List[str], size_bytes: int) -> str:
+    text = "\n".join(parts)
+    if len(text.encode("utf-8")) <= size_bytes:
+        return text
+    # Cut on a line boundary so the last line isn't a partial word
+    cut = text.encode("utf-8")[:size_bytes].decode("utf-8", "ignore")
+    return cut.rsplit("\n", 1)[0]
+
+
+def generate_resume(size_kb: int, seed: int = 0, index: int = 0) -> str:
+    """
+    Generate a Markdown resume of about the given size.
+
+    Args:
+        size_kb: Target size in KB
+        seed: Corpus seed
+        index: Index of the resume among those of the same size
+
+    Returns:
+        The resume text
+    """
+    rng = _rng(seed, "resume", size_kb, index)
+    size_bytes = size_kb * 1024
+    skills = rng.sample(SKILLS, 12)
+
+    parts = [
+        f"# Candidate {index}",
+        "",
+        "## Summary",
+        f"{rng.choice(ROLES)} with experience in {', '.join(skills[:3])} and {skills[3]}.",
+        "",
+        "## Skills",
+        ", ".join(skills),
+        "",
+        "## Education",
+        "BSc Computer Science",
+        "",
+        "## Experience",
+    ]
+
+    while len("\n".join(parts).encode("utf-8")) < size_bytes:
+        parts.append("")
+        parts.append(f"### {rng.choice(ROLES)} at {rng.choice(COMPANIES)}")
+        for _ in range(rng.randint(3, 6)):
+            parts.append(_bullet(rng, skills))
+
+    return _fit(parts, size_bytes)
+
+
+def _bullet(rng: random.Random, skills: Sequence[str]) -> str:
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(2, 90))
+    return (
+        f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} with "
+        f"{rng.choice(skills)} and {rng.choice(SKILLS)}, {outcome}"
+    )
+
+
+def generate_customized_resume(resume: str, edit_ratio: float, seed: int = 0) -> str:
+    """
+    Edit a share of a resume's lines, as a customization would.
+
+    Most edited lines are replaced with a new bullet; some are deleted or get
+    a new bullet inserted after them. A ratio of 1.0 replaces every line
+    except headings and blank lines, so the sections still line up.
+
+    Args:
+        resume: The resume text
+        edit_ratio: Share of lines to edit, between 0 and 1
+        seed: Corpus seed
+
+    Returns:
+        The customized resume text
+    """
+    rng = random.Random(f"{seed}:customize:{edit_ratio}:{len(resume)}")
+    skills = rng.sample(SKILLS, 12)
+    lines = resume.split("\n")
+
+    if edit_ratio >= 1:
+        return "\n".join(
+            line if not line.strip() or line.startswith("#") else _bullet(rng, skills)
+            for line in lines
+        )
+
+    count = max(1, round(len(lines) * edit_ratio)) if edit_ratio > 0 else 0
+    # From the end, so earlier indexes stay valid as lines are added and removed
+    for i in sorted(rng.sample(range(len(lines)), count), reverse=True):
+        action = rng.random()
+        if action < 0.7:
+            lines[i] = _bullet(rng, skills)
+        elif action < 0.85:
+            del lines[i]
+        else:
+            lines.insert(i + 1, _bullet(rng, skills))
+    return "\n".join(lines)
+
+
+def generate_job_description(size_kb: int, seed: int = 0, index: int = 0) -> str:
+    """
+    Generate a job description of about the given size.
+
+    Args:
+        size_kb: Target size in KB
+        seed: Corpus seed
+        index: Index of the job description among those of the same size
+
+    Returns:
+        The job description text
+    """
+    rng = _rng(seed, "job", size_kb, index)
+    size_bytes = size_kb * 1024
+    skills = rng.sample(SKILLS, 15)
+
+    parts = [
+        rng.choice(ROLES),
+        f"{rng.choice(COMPANIES)} is hiring.",
+        "",
+        "Requirements:",
+    ]
+    parts.extend(
+        "- " + rng.choice(REQUIREMENT_PHRASES).format(
+            n=rng.randint(2, 8), skill=skill, other=rng.choice(skills)
+        )
+        for skill in skills[:8]
+    )
+    parts.extend(["", "Responsibilities:"])
+
+    while len("\n".join(parts).encode("utf-8")) < size_bytes:
+        parts.append(
+            "- " + rng.choice(RESPONSIBILITY_PHRASES).format(
+                object=rng.choice(OBJECTS), skill=rng.choice(skills)
+            )
+        )
+
+    return _fit(parts, size_bytes)
+
+
+def generate_corpus(
+    sizes_kb: Sequence[int] = DEFAULT_SIZES_KB,
+    samples: int = 3,
+    seed: int = 0
+) -> List[CorpusCase]:
+    """
+    Generate resume and job description pairs across document sizes.
+
+    Args:
+        sizes_kb: Document sizes in KB
+        samples: Number of pairs per size
+        seed: Corpus seed
+
+    Returns:
+        List of corpus cases, ordered by size
+    """
+    return [
+        CorpusCase(
+            size_kb=size_kb,
+            index=index,
+            resume=generate_resume(size_kb, seed, index),
+            job_description=generate_job_description(size_kb, seed, index),
+        )
+        for size_kb in sizes_kb
+        for index in range(samples)
+    ]
+
+
+def generate_diff_corpus(
+    sizes_kb: Sequence[int] = DEFAULT_SIZES_KB,
+    edit_ratios: Sequence[float] = DEFAULT_EDIT_RATIOS,
+    seed: int = 0
+) -> List[DiffCase]:
+    """
+    Generate resume and customized version pairs across sizes and edit ratios.
+
+    Args:
+        sizes_kb: Resume sizes in KB
+        edit_ratios: Shares of lines edited in the customized version
+        seed: Corpus seed
+
+    Returns:
+        List of diff cases, ordered by size and then edit ratio
+    """
+    cases = []
+    for size_kb in sizes_kb:
+        original = generate_resume(size_kb, seed)
+        cases.extend(
+            DiffCase(
+                size_kb=size_kb,
+                edit_ratio=edit_ratio,
+                original=original,
+                customized=generate_customized_resume(original, edit_ratio, seed),
+            )
+            for edit_ratio in edit_ratios
+        )
+    return cases
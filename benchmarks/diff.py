@@ -0,0 +1,235 @@
+"""
+Resume diff benchmark.
+
+Times the diff service over synthetic resumes and customized versions of
+them, from a 1% edit to a full rewrite, at several sizes. The stages run
+through a DiffGenerator for the configured diff backend (or the one given),
+so the numbers are those of the backend the endpoints use. Each stage starts
+from a fresh diff, so shared work (line comparison, section extraction) is
+timed in every stage that does it.
+
+Besides comparing against a baseline run, the benchmark can fail on absolute
+limits, so it can guard the diff endpoints' latency and memory in CI.
+
+Usage:
+    python -m benchmarks.diff --output results/diff.json
+    python -m benchmarks.diff --backend myers --max-cost 500
+    python -m benchmarks.diff --compare results/diff.json --threshold 0.2
+    python -m benchmarks.diff --max-ms 2000 --max-peak-kib 65536
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import logfire
+
+from benchmarks.corpus import DEFAULT_EDIT_RATIOS, DiffCase, generate_diff_corpus
+from benchmarks.harness import (
+    check_limits,
+    compare_results,
+    environment_info,
+    measure,
+    write_results,
+)
+
+# Named after the diff service functions they correspond to for the difflib
+# backend; generate_resume_diff is the generator's line_diff
+STAGES = (
+    "generate_resume_diff",
+    "generate_word_level_diff",
+    "generate_side_by_side_diff",
+    "analyze_section_changes",
+    "generate_diff_html_document",
+)
+
+# The character-level generate_resume_diff takes seconds on 50 KB rewrites
+DEFAULT_SIZES_KB = (1, 5, 10, 25)
+
+
+def case_name(case: DiffCase) -> str:
+    """
+    Name a diff case by size and edit ratio, e.g. "10kb_edit10" or "10kb_rewrite".
+
+    Args:
+        case: The diff case
+
+    Returns:
+        The case name
+    """
+    if case.edit_ratio >= 1:
+        return f"{case.size_kb}kb_rewrite"
+    return f"{case.size_kb}kb_edit{case.edit_ratio * 100:g}"
+
+
+def _stage_calls(case: DiffCase, generator: Any) -> Dict[str, Callable[[], Any]]:
+    original, customized = case.original, case.customized
+    return {
+        "generate_resume_diff": lambda: generator.line_diff(original, customized),
+        "generate_word_level_diff": lambda: generator.diff(original, customized).inline_html,
+        "generate_side_by_side_diff": lambda: generator.diff(original, customized).side_by_side,
+        "analyze_section_changes": lambda: generator.section_diff(original, customized),
+        "generate_diff_html_document": lambda: generator.html_diff_view(original, customized),
+    }
+
+
+def run_diff_benchmark(
+    sizes_kb: Sequence[int] = DEFAULT_SIZES_KB,
+    edit_ratios: Sequence[float] = DEFAULT_EDIT_RATIOS,
+    repeat: int = 5,
+    seed: int = 0,
+    stages: Optional[Sequence[str]] = None,
+    backend: Optional[str] = None,
+    max_cost: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark the diff service.
+
+    Args:
+        sizes_kb: Resume sizes in KB
+        edit_ratios: Shares of lines edited in the customized versions
+        repeat: Timed runs per case
+        seed: Corpus seed
+        stages: Stages to run (defaults to all)
+        backend: Diff backend (defaults to settings.DIFF_BACKEND)
+        max_cost: Edit cost cap (defaults to settings.DIFF_MAX_COST)
+
+    Returns:
+        Benchmark results, with per-stage statistics for each case under ``cases``
+    """
+    from app.services.diff_service import DiffGenerator, configured_diff_generator
+
+    stages = list(stages or STAGES)
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    generator = configured_diff_generator()
+    if backend is not None or max_cost is not None:
+        generator = DiffGenerator(
+            backend=backend or generator.backend,
+            max_cost=generator.max_cost if max_cost is None else max_cost,
+        )
+
+    cases: Dict[str, Dict[str, Any]] = {}
+    for case in generate_diff_corpus(sizes_kb, edit_ratios, seed):
+        calls = _stage_calls(case, generator)
+        cases[case_name(case)] = {
+            stage: measure(calls[stage], repeat=repeat).to_dict() for stage in stages
+        }
+
+    return {
+        "benchmark": "diff",
+        "environment": environment_info(),
+        "config": {
+            "sizes_kb": list(sizes_kb),
+            "edit_ratios": list(edit_ratios),
+            "repeat": repeat,
+            "seed": seed,
+            "backend": generator.backend,
+            "max_cost": generator.max_cost,
+        },
+        "cases": cases,
+    }
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """
+    Format benchmark results as a plain-text table.
+
+    Args:
+        results: Benchmark results
+
+    Returns:
+        The table
+    """
+    lines = [f"{'case':<14} {'stage':<28} {'p50 ms':>10} {'p95 ms':>10} {'peak KiB':>10}"]
+    for case, stages in results["cases"].items():
+        for stage, stats in stages.items():
+            lines.append(
+                f"{case:<14} {stage:<28} {stats['p50_ms']:>10.2f} {stats['p95_ms']:>10.2f} "
+                f"{stats['peak_alloc_bytes'] / 1024:>10.1f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code: 1 if a limit was exceeded or a comparison found
+        regressions, 0 otherwise
+    """
+    from app.services.diff_service import DIFF_BACKENDS
+
+    parser = argparse.ArgumentParser(description="Benchmark the resume diff service")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES_KB),
+                        help="Resume sizes in KB")
+    parser.add_argument("--edit-ratios", type=float, nargs="+",
+                        default=list(DEFAULT_EDIT_RATIOS),
+                        help="Shares of lines edited; 1.0 is a full rewrite")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, help="Stages to run")
+    parser.add_argument("--backend", choices=sorted(DIFF_BACKENDS),
+                        help="Diff backend (defaults to DIFF_BACKEND)")
+    parser.add_argument("--max-cost", type=int,
+                        help="Edit cost cap (defaults to DIFF_MAX_COST)")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative p50 slowdown when comparing")
+    parser.add_argument("--max-ms", type=float, help="Fail if any stage's p95 exceeds this")
+    parser.add_argument("--max-peak-kib", type=float,
+                        help="Fail if any stage's peak allocation exceeds this")
+    args = parser.parse_args(argv)
+
+    # Keep the benchmark offline and its output readable
+    logfire.configure(send_to_logfire=False, console=False)
+
+    results = run_diff_benchmark(
+        args.sizes, args.edit_ratios, args.repeat, args.seed, args.stages,
+        args.backend, args.max_cost,
+    )
+    print(format_results(results))
+    if args.output:
+        write_results(args.output, results)
+        print(f"\nWrote {args.output}")
+
+    failed = False
+    limits = {}
+    if args.max_ms is not None:
+        limits["p95_ms"] = args.max_ms
+    if args.max_peak_kib is not None:
+        limits["peak_alloc_bytes"] = args.max_peak_kib * 1024
+    for violation in check_limits(results, limits):
+        print(
+            f"LIMIT {violation['case']} {violation['stage']}: {violation['metric']} "
+            f"{violation['value']:.2f} > {violation['limit']:.2f}"
+        )
+        failed = True
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_results(baseline, results, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['case']} {regression['stage']}: "
+                f"{regression['baseline']:.2f} ms -> {regression['current']:.2f} ms "
+                f"({regression['ratio']:.2f}x)"
+            )
+        if regressions:
+            failed = True
+        else:
+            print(f"\nNo regressions against {args.compare}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Timing, allocation tracking and result files for benchmarks.
+"""
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class StageStats:
+    """Timings and allocations of one benchmarked stage."""
+
+    runs: int
+    p50_ms: float
+    p95_ms: float
+    mean_ms: float
+    min_ms: float
+    peak_alloc_bytes: int
+    alloc_blocks: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the statistics to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary of the statistics
+        """
+        return asdict(self)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Compute a percentile with linear interpolation between samples.
+
+    Args:
+        values: Samples
+        q: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or 0.0 for no samples
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure(
+    fn: Callable[[], Any],
+    repeat: int = 5,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Any]] = None
+) -> StageStats:
+    """
+    Time a function and measure its allocations.
+
+    Allocations are measured in a separate run, since tracing them slows
+    the function down.
+
+    Args:
+        fn: Function to benchmark
+        repeat: Number of timed runs
+        warmup: Number of untimed runs first
+        setup: Optional untimed function run before each run, e.g. to clear caches
+
+    Returns:
+        The stage statistics
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    if setup is not None:
+        setup()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    # Net new blocks still alive after the call (results and cache entries)
+    blocks = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+
+    return StageStats(
+        runs=repeat,
+        p50_ms=percentile(timings, 50),
+        p95_ms=percentile(timings, 95),
+        mean_ms=sum(timings) / len(timings) if timings else 0.0,
+        min_ms=min(timings) if timings else 0.0,
+        peak_alloc_bytes=max(peak - baseline, 0),
+        alloc_blocks=blocks,
+    )
+
+
+def environment_info() -> Dict[str, Any]:
+    """
+    Describe where the benchmark ran, so results can be matched to a commit.
+
+    Returns:
+        Dictionary with the git commit, Python version, platform and time
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=10,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def write_results(path: Path, results: Dict[str, Any]) -> None:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        path: Output file
+        results: Benchmark results
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.2,
+    metric: str = "p50_ms"
+) -> List[Dict[str, Any]]:
+    """
+    Find stages that got slower than a baseline run.
+
+    Both results map case names to stage names to stage statistics under a
+    ``cases`` key. Cases or stages missing from either run are skipped.
+
+    Args:
+        baseline: Results of the baseline run
+        current: Results of the current run
+        threshold: Allowed relative slowdown, e.g. 0.2 for 20%
+        metric: Statistic to compare
+
+    Returns:
+        One dictionary per regressed stage, slowest first
+    """
+    regressions = []
+    for case, stages in current.get("cases", {}).items():
+        baseline_stages = baseline.get("cases", {}).get(case, {})
+        for stage, stats in stages.items():
+            before = baseline_stages.get(stage, {}).get(metric)
+            after = stats.get(metric)
+            if not before or after is None:
+                continue
+            ratio = after / before
+            if ratio > 1 + threshold:
+                regressions.append({
+                    "case": case,
+                    "stage": stage,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": ratio,
+                })
+    return sorted(regressions, key=lambda regression: regression["ratio"], reverse=True)
+
+
+def check_limits(results: Dict[str, Any], limits: Dict[str, float]) -> List[Dict[str, Any]]:
+    """
+    Find stages whose statistics exceed absolute limits.
+
+    Args:
+        results: Benchmark results, with stage statistics under ``cases``
+        limits: Maximum allowed value per statistic, e.g. {"p95_ms": 500}
+
+    Returns:
+        One dictionary per exceeded limit, furthest over the limit first
+    """
+    violations = []
+    for case, stages in results.get("cases", {}).items():
+        for stage, stats in stages.items():
+            for metric, limit in limits.items():
+                value = stats.get(metric)
+                if value is not None and value > limit:
+                    violations.append({
+                        "case": case,
+                        "stage": stage,
+                        "metric": metric,
+                        "limit": limit,
+                        "value": value,
+                        "ratio": value / limit if limit else math.inf,
+                    })
+    return sorted(violations, key=lambda violation: violation["ratio"], reverse=True)
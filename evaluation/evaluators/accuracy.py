@@ -11,6 +11,7 @@ import re
 import time
 import difflib
 from typing import Any, Dict, List, Set, Tuple, Optional, Union
+from app.utils.skill_aliases import SKILL_ALIASES
 from .base import BaseEvaluator
 from ..test_data.models import TestCase, EvaluationResult
 
@@ -57,6 +58,17 @@ class JobParsingAccuracyEvaluator(BaseEvaluator):
             "fullstack": ["fullstack", "full-stack", "full stack"],
         }
         
+        # Variation -> normalized name, built once. Exact spellings win; the
+        # canonical form of each variation catches other spellings of the
+        # same alias (e.g. "Node-JS")
+        self._skill_lookup: Dict[str, str] = {}
+        for normalized_name, variations in self.skill_normalizations.items():
+            for variation in variations:
+                self._skill_lookup.setdefault(variation, normalized_name)
+        for normalized_name, variations in self.skill_normalizations.items():
+            for variation in variations:
+                self._skill_lookup.setdefault(SKILL_ALIASES.canonical_term(variation), normalized_name)
+        
         # Configure all thresholds from config with sensible defaults
         if config:
             self.confidence_thresholds = {
@@ -165,16 +177,13 @@ class JobParsingAccuracyEvaluator(BaseEvaluator):
             skill_lower = skill.lower().strip()
             
             # Check against normalizations
-            found_match = False
-            for normalized_name, variations in self.skill_normalizations.items():
-                if skill_lower in variations:
-                    normalized.add(normalized_name)
-                    found_match = True
-                    break
-            
-            # If no normalization found, add the cleaned skill
-            if not found_match:
-                # Clean the skill name
+            normalized_name = self._skill_lookup.get(skill_lower)
+            if normalized_name is None:
+                normalized_name = self._skill_lookup.get(SKILL_ALIASES.canonical_term(skill_lower))
+            if normalized_name is not None:
+                normalized.add(normalized_name)
+            else:
+                # If no normalization found, add the cleaned skill
                 cleaned = re.sub(r'[^\w\s]', '', skill_lower)
                 cleaned = re.sub(r'\s+', ' ', cleaned).strip()
                 if cleaned:
@@ -13,44 +13,59 @@ import time
 from collections import Counter
 from typing import Any, Dict, List, Set, Tuple
 import textstat
+from app.core.nltk_init import get_spacy_model
+from app.utils.spacy_pipeline import ENTITY_COMPONENTS, SpacyBatchExtractor
+from app.utils.tokenizer import tokenize
 from .base import BaseEvaluator
 from ..test_data.models import TestCase, EvaluationResult
 
 
+# Marks an NLP resource that has not been loaded yet
+_UNSET = object()
+
+
+def _entity_labels(doc) -> Dict[str, str]:
+    """Map each named entity in a processed document to its label."""
+    return {ent.text.lower(): ent.label_ for ent in doc.ents}
+
+
 class TruthfulnessEvaluator(BaseEvaluator):
     """Evaluates truthfulness of resume optimizations to prevent fabrication."""
     
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("truthfulness", config)
-        self._setup_nlp_models()
+        # NLP models are loaded on first use, not when the evaluator is built
+        self._nlp = _UNSET
+        self._vectorizer = _UNSET
     
-    def _setup_nlp_models(self):
-        """Initialize NLP models and similarity tools."""
-        try:
-            import spacy
-            import nltk
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.metrics.pairwise import cosine_similarity
-            
-            # Try to load spacy model, fallback to basic if not available
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
+    @property
+    def nlp(self):
+        """The shared spaCy model, or None if unavailable."""
+        if self._nlp is _UNSET:
+            self._nlp = get_spacy_model()
+            if self._nlp is None:
                 self.logger.warning("spaCy en_core_web_sm model not found, using basic tokenization")
-                self.nlp = None
-            
-            self.vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
-            
-            # Download NLTK data if needed
+        return self._nlp
+    
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
+    
+    @property
+    def vectorizer(self):
+        """TF-IDF vectorizer for content similarity, or None if unavailable."""
+        if self._vectorizer is _UNSET:
             try:
-                nltk.data.find('tokenizers/punkt')
-            except LookupError:
-                nltk.download('punkt', quiet=True)
-                
-        except ImportError as e:
-            self.logger.error(f"Failed to import required NLP libraries: {e}")
-            self.nlp = None
-            self.vectorizer = None
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                self._vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
+            except ImportError as e:
+                self.logger.error(f"Failed to import required NLP libraries: {e}")
+                self._vectorizer = None
+        return self._vectorizer
+    
+    @vectorizer.setter
+    def vectorizer(self, value):
+        self._vectorizer = value
     
     async def evaluate(self, test_case: TestCase, actual_output: Any) -> EvaluationResult:
         """
@@ -176,18 +191,23 @@ class TruthfulnessEvaluator(BaseEvaluator):
             self.logger.error(f"Error calculating content similarity: {e}")
             return 0.0
     
+    def _get_entity_extractor(self) -> SpacyBatchExtractor:
+        """Get the batched entity extractor for the current spaCy model."""
+        extractor = getattr(self, "_entity_extractor", None)
+        if extractor is None or extractor.nlp is not self.nlp:
+            # Entity checks only read NER output, so the rest of the pipeline is disabled
+            extractor = SpacyBatchExtractor(self.nlp, _entity_labels, ENTITY_COMPONENTS)
+            self._entity_extractor = extractor
+        return extractor
+    
     def _analyze_entity_consistency(self, original: str, optimized: str) -> Dict[str, Any]:
         """Analyze consistency of named entities between original and optimized content."""
         result = {"consistency_score": 1.0, "violations": []}
         
         if self.nlp:
             try:
-                orig_doc = self.nlp(original)
-                opt_doc = self.nlp(optimized)
-                
-                # Extract entities
-                orig_entities = {ent.text.lower(): ent.label_ for ent in orig_doc.ents}
-                opt_entities = {ent.text.lower(): ent.label_ for ent in opt_doc.ents}
+                # Extract entities from both texts in one nlp.pipe call
+                orig_entities, opt_entities = self._get_entity_extractor().extract([original, optimized])
                 
                 # Check for new organizations/people that weren't in original
                 new_orgs = set()
@@ -817,6 +837,13 @@ class ContentQualityEvaluator(BaseEvaluator):
 class RelevanceImpactEvaluator(BaseEvaluator):
     """Evaluates impact of optimizations on job relevance."""
     
+    # Common technical skills and keywords
+    TECH_KEYWORDS = frozenset([
+        'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
+        'sql', 'postgresql', 'mongodb', 'git', 'ci/cd', 'agile', 'scrum', 'api', 'rest',
+        'microservices', 'cloud', 'devops', 'machine learning', 'ai', 'data', 'analytics'
+    ])
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("relevance_impact", config)
         self.min_score_improvement = config.get("min_score_improvement", 0.05) if config else 0.05
@@ -1066,26 +1093,13 @@ class RelevanceImpactEvaluator(BaseEvaluator):
     def _extract_keywords(self, job_description: str) -> list:
         """Extract important keywords from job description."""
         # Simple keyword extraction - could be enhanced with NLP libraries
-        import re
-        
-        # Common technical skills and keywords
-        tech_keywords = [
-            'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 'kubernetes',
-            'sql', 'postgresql', 'mongodb', 'git', 'ci/cd', 'agile', 'scrum', 'api', 'rest',
-            'microservices', 'cloud', 'devops', 'machine learning', 'ai', 'data', 'analytics'
-        ]
+        # Tokenization is memoized, so repeated calls for the same job are cheap
+        words = tokenize(job_description).words
         
-        # Extract words from job description
-        words = re.findall(r'\b\w+\b', job_description.lower())
-        
-        # Find technical keywords
-        keywords = []
-        for word in words:
-            if word in tech_keywords or len(word) > 6:  # Include longer words as potential keywords
-                keywords.append(word)
+        # Find technical keywords, including longer words as potential keywords
+        keywords = {word for word in words if word in self.TECH_KEYWORDS or len(word) > 6}
         
-        # Remove duplicates and return
-        return list(set(keywords))
+        return list(keywords)
     
     def _calculate_keyword_coverage(self, resume: str, keywords: list) -> int:
         """Calculate how many keywords are covered in the resume."""
@@ -0,0 +1,63 @@
+"""
+Precompute stored diffs for existing customized resume versions.
+
+Versions created before background precomputation was enabled have their
+diff computed on first view. This queues every customized version whose diff
+is not stored yet and waits for the workers to finish. It requires
+DIFF_CACHE_PERSIST, since diffs are only stored in the database then.
+
+Usage:
+    python -m scripts.backfill_resume_diffs [--resume-id ID] [--workers N]
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from app.core.config import settings
+from app.db.session import Base, SessionLocal, engine
+from app.services.diff.precompute import DiffPrecomputer
+from app.services.diff_service import backfill_version_diffs, precompute_version_diff
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the backfill from the command line.
+
+    Args:
+        argv: Command line arguments, defaulting to sys.argv
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Precompute diffs of existing customized resume versions")
+    parser.add_argument("--resume-id", help="Only backfill versions of this resume")
+    parser.add_argument("--workers", type=int, default=2, help="Worker threads computing diffs")
+    args = parser.parse_args(argv)
+
+    if not settings.DIFF_CACHE_PERSIST:
+        # Diffs would only reach this process's in-memory cache and be lost
+        print("DIFF_CACHE_PERSIST is disabled; nothing to backfill", file=sys.stderr)
+        return 1
+
+    # Make sure the resume_diffs table exists on databases created before it
+    Base.metadata.create_all(bind=engine)
+
+    precomputer = DiffPrecomputer(precompute_version_diff, workers=args.workers)
+    db = SessionLocal()
+    try:
+        queued = backfill_version_diffs(db, precomputer, resume_id=args.resume_id)
+    finally:
+        db.close()
+
+    print(f"Queued {queued} versions")
+    precomputer.join()
+    precomputer.shutdown()
+
+    metrics = precomputer.metrics()
+    print(json.dumps(metrics, indent=2))
+    return 1 if metrics["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -78,6 +78,17 @@ def sample_resume() -> str:
     return "EXPERIENCE\nWorked at Example Corp\nSKILLS\nPython, SQL"
 
 
+@pytest.fixture
+def nltk_stopwords():
+    """Skip tests that need the NLTK stopwords corpus when it isn't installed."""
+    import nltk
+
+    try:
+        nltk.data.find("corpora/stopwords")
+    except LookupError:
+        pytest.skip("NLTK stopwords corpus is not installed")
+
+
 @pytest.fixture
 def sample_job_description() -> str:
     """Provide a simple job description for tests."""
@@ -94,7 +105,7 @@ def client():
     from sqlalchemy.pool import StaticPool
 
     from app.db.session import Base, get_db
-    from app.api.endpoints import auth, jobs, resumes, export, requirements, websockets
+    from app.api.endpoints import ats, auth, jobs, resumes, export, requirements, websockets
 
     # Create FastAPI app instance
     app = FastAPI()
@@ -120,6 +131,7 @@ def client():
     app.include_router(jobs.router, prefix=f"{api_prefix}/jobs")
     app.include_router(resumes.router, prefix=f"{api_prefix}/resumes")
     app.include_router(export.router, prefix=f"{api_prefix}/export")
+    app.include_router(ats.router, prefix=f"{api_prefix}/ats")
     app.include_router(requirements.router, prefix=f"{api_prefix}/requirements")
     app.include_router(websockets.router, prefix=f"{api_prefix}/progress")
 
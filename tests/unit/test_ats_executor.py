@@ -0,0 +1,63 @@
+import asyncio
+import math
+import operator
+import time
+
+import pytest
+
+from app.services.ats.executor import ATSExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = ATSExecutor(max_workers=1, start_method="fork")
+    yield executor
+    executor.shutdown()
+
+
+def test_run_returns_worker_result(executor):
+    assert asyncio.run(executor.run(operator.add, 2, 3)) == 5
+
+    metrics = executor.metrics()
+    assert metrics["submitted"] == 1
+    assert metrics["completed"] == 1
+    assert metrics["failed"] == 0
+    assert metrics["average_run_seconds"] >= 0
+
+
+def test_worker_exceptions_propagate(executor):
+    with pytest.raises(ValueError):
+        asyncio.run(executor.run(math.sqrt, -1))
+
+    assert executor.metrics()["failed"] == 1
+
+
+def test_queue_depth_tracks_waiting_tasks(executor):
+    futures = [executor.submit(time.sleep, 0.2) for _ in range(3)]
+
+    metrics = executor.metrics()
+    assert metrics["active_workers"] == 1
+    assert metrics["utilization"] == 1.0
+    assert metrics["queue_depth"] == 2
+
+    for future in futures:
+        future.result(timeout=10)
+
+    metrics = executor.metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["peak_queue_depth"] == 2
+    assert metrics["busy_ratio"] > 0
+
+
+def test_start_warms_workers(executor):
+    assert not executor.started
+
+    executor.start()
+
+    assert executor.started
+    assert executor.metrics()["warm_up_seconds"] > 0
+
+
+def test_requires_a_worker():
+    with pytest.raises(ValueError):
+        ATSExecutor(max_workers=0)
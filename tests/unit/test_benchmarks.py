@@ -0,0 +1,150 @@
+import json
+
+import pytest
+
+from benchmarks import ats as ats_benchmark
+from benchmarks import diff as diff_benchmark
+from benchmarks.corpus import (
+    generate_corpus,
+    generate_customized_resume,
+    generate_diff_corpus,
+    generate_job_description,
+    generate_resume,
+)
+from benchmarks.harness import check_limits, compare_results, measure, percentile
+
+
+def test_corpus_is_reproducible_and_sized():
+    assert generate_resume(5, seed=1) == generate_resume(5, seed=1)
+    assert generate_resume(5, seed=1) != generate_resume(5, seed=2)
+
+    for size_kb in (1, 10):
+        for text in (generate_resume(size_kb), generate_job_description(size_kb)):
+            assert size_kb * 1024 * 0.9 <= len(text.encode("utf-8")) <= size_kb * 1024
+
+    cases = generate_corpus([1, 5], samples=2)
+    assert [(case.size_kb, case.index) for case in cases] == [(1, 0), (1, 1), (5, 0), (5, 1)]
+    assert "## Experience" in cases[0].resume
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([0.0, 10.0], 95) == pytest.approx(9.5)
+
+
+def test_measure_runs_setup_before_each_run():
+    calls = []
+    stats = measure(lambda: calls.append("run"), repeat=3, warmup=1,
+                    setup=lambda: calls.append("setup"))
+
+    # Warmup, three timed runs and the allocation run
+    assert calls == ["setup", "run"] * 5
+    assert stats.runs == 3
+    assert 0 <= stats.p50_ms <= stats.p95_ms
+
+
+def test_compare_results_flags_slower_stages():
+    baseline = {"cases": {"1kb": {"a": {"p50_ms": 10.0}, "b": {"p50_ms": 10.0}}}}
+    current = {"cases": {
+        "1kb": {"a": {"p50_ms": 11.0}, "b": {"p50_ms": 15.0}, "new": {"p50_ms": 1.0}},
+        "5kb": {"a": {"p50_ms": 100.0}},
+    }}
+
+    regressions = compare_results(baseline, current, threshold=0.2)
+    assert [(r["case"], r["stage"]) for r in regressions] == [("1kb", "b")]
+    assert regressions[0]["ratio"] == pytest.approx(1.5)
+
+
+def test_ats_benchmark_writes_comparable_results(tmp_path, monkeypatch, nltk_stopwords):
+    monkeypatch.setattr(ats_benchmark.logfire, "configure", lambda **kwargs: None)
+    output = tmp_path / "ats.json"
+    args = ["--sizes", "1", "--samples", "1", "--repeat", "1",
+            "--stages", "perform_matching", "analyze_resume_for_ats_cold"]
+
+    assert ats_benchmark.main([*args, "--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert set(results["cases"]["1kb"]) == {"perform_matching", "analyze_resume_for_ats_cold"}
+    assert results["cases"]["1kb"]["perform_matching"]["p95_ms"] > 0
+
+    assert ats_benchmark.main([*args, "--compare", str(output), "--threshold", "100"]) == 0
+
+
+def test_ats_benchmark_rejects_unknown_stages():
+    with pytest.raises(ValueError):
+        ats_benchmark.run_ats_benchmark([1], samples=1, repeat=1, stages=["nope"])
+
+
+def test_customized_resumes_follow_edit_ratio():
+    resume = generate_resume(10)
+    lines = resume.split("\n")
+    for ratio in (0.01, 0.1, 0.5):
+        customized = generate_customized_resume(resume, ratio)
+        assert customized == generate_customized_resume(resume, ratio)
+        kept = len(set(lines) & set(customized.split("\n")))
+        assert kept >= len(set(lines)) * (1 - ratio) - 1
+
+    rewrite = generate_customized_resume(resume, 1.0).split("\n")
+    assert [line for line in rewrite if line.startswith("#")] == [
+        line for line in lines if line.startswith("#")
+    ]
+    assert not set(line for line in lines if line.startswith("- ")) & set(rewrite)
+
+    cases = generate_diff_corpus([1, 5], [0.1, 1.0])
+    assert [(case.size_kb, case.edit_ratio) for case in cases] == [
+        (1, 0.1), (1, 1.0), (5, 0.1), (5, 1.0)
+    ]
+    assert [diff_benchmark.case_name(case) for case in cases[:2]] == ["1kb_edit10", "1kb_rewrite"]
+
+
+def test_check_limits_flags_exceeded_statistics():
+    results = {"cases": {"1kb": {
+        "a": {"p95_ms": 5.0, "peak_alloc_bytes": 100},
+        "b": {"p95_ms": 50.0, "peak_alloc_bytes": 4096},
+    }}}
+
+    violations = check_limits(results, {"p95_ms": 10.0, "peak_alloc_bytes": 1024})
+    assert [(v["stage"], v["metric"]) for v in violations] == [
+        ("b", "p95_ms"), ("b", "peak_alloc_bytes")
+    ]
+    assert check_limits(results, {}) == []
+
+
+def test_diff_benchmark_writes_results_and_enforces_limits(tmp_path, monkeypatch):
+    monkeypatch.setattr(diff_benchmark.logfire, "configure", lambda **kwargs: None)
+    output = tmp_path / "diff.json"
+    args = ["--sizes", "1", "--edit-ratios", "0.1", "1.0", "--repeat", "1"]
+
+    assert diff_benchmark.main([*args, "--output", str(output), "--max-ms", "60000"]) == 0
+    results = json.loads(output.read_text())
+    assert set(results["cases"]) == {"1kb_edit10", "1kb_rewrite"}
+    assert set(results["cases"]["1kb_rewrite"]) == set(diff_benchmark.STAGES)
+    assert results["cases"]["1kb_rewrite"]["generate_diff_html_document"]["peak_alloc_bytes"] > 0
+
+    assert diff_benchmark.main([*args, "--compare", str(output), "--threshold", "100"]) == 0
+    assert diff_benchmark.main([*args, "--max-peak-kib", "0.001"]) == 1
+
+
+
+def test_diff_benchmark_uses_the_configured_backend(monkeypatch):
+    from app.services import diff_service
+
+    monkeypatch.setattr(diff_service.settings, "DIFF_BACKEND", "myers")
+    monkeypatch.setattr(diff_service.settings, "DIFF_MAX_COST", 50)
+    backends = []
+    diff = diff_service.DiffGenerator.diff
+
+    def recording_diff(self, original, customized):
+        backends.append((self.backend, self.max_cost))
+        return diff(self, original, customized)
+
+    monkeypatch.setattr(diff_service.DiffGenerator, "diff", recording_diff)
+    results = diff_benchmark.run_diff_benchmark([1], [0.1], repeat=1)
+
+    assert (results["config"]["backend"], results["config"]["max_cost"]) == ("myers", 50)
+    assert backends and set(backends) == {("myers", 50)}
+
+    results = diff_benchmark.run_diff_benchmark(
+        [1], [0.1], repeat=1, stages=["generate_resume_diff"], backend="difflib"
+    )
+    assert results["config"]["backend"] == "difflib"
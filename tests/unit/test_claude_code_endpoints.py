@@ -1,11 +1,12 @@
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api.endpoints import claude_code
 from app.api.endpoints.claude_code import ClaudeCodeExecutionError, progress_tracker
+from app.services.claude_code.scheduler import QueueFullError
 
 test_app = FastAPI()
 test_app.include_router(claude_code.router, prefix="/api/v1")
@@ -27,7 +28,7 @@ def _build_request(resume: str, job: str) -> dict:
 @patch("app.schemas.resume.CustomizeResumeRequest", create=True)
 def test_customize_resume_success(mock_schema, mock_read_file, mock_get_executor, sample_resume, sample_job_description):
     mock_exec = MagicMock()
-    mock_exec.customize_resume.return_value = None
+    mock_exec.customize_resume_async = AsyncMock(return_value=None)
     mock_get_executor.return_value = mock_exec
     mock_read_file.side_effect = ["customized", "summary"]
 
@@ -42,7 +43,9 @@ def test_customize_resume_success(mock_schema, mock_read_file, mock_get_executor
 @patch("app.schemas.resume.CustomizeResumeRequest", create=True)
 def test_customize_resume_timeout_error(mock_schema, mock_get_executor, sample_resume, sample_job_description):
     mock_exec = MagicMock()
-    mock_exec.customize_resume.side_effect = ClaudeCodeExecutionError("timeout exceeded")
+    mock_exec.customize_resume_async = AsyncMock(
+        side_effect=ClaudeCodeExecutionError("timeout exceeded")
+    )
     mock_get_executor.return_value = mock_exec
 
     resp = client.post("/api/v1/customize-resume", json=_build_request(sample_resume, sample_job_description))
@@ -102,3 +105,53 @@ def test_get_customize_status(mock_get_task, mock_get_log_streamer):
 def test_get_customize_status_not_found(mock_get_task):
     resp = client.get("/api/v1/customize-resume/status/unknown")
     assert resp.status_code == 404
+
+
+@patch("app.api.endpoints.claude_code.get_customization_scheduler")
+@patch.object(progress_tracker, "get_task")
+def test_get_customize_status_reports_queue_position(mock_get_task, mock_get_scheduler):
+    task = SimpleNamespace(task_id="t1")
+    task.to_dict = lambda: {
+        "task_id": "t1",
+        "status": "queued",
+        "message": "Waiting for a free customization slot",
+        "result": None,
+        "error": None,
+        "created_at": 1.0,
+        "updated_at": 2.0,
+        "progress": 0,
+    }
+    mock_get_task.return_value = task
+    mock_get_scheduler.return_value.position.return_value = 3
+    mock_get_scheduler.return_value.eta_seconds.return_value = 900.0
+
+    resp = client.get("/api/v1/customize-resume/status/t1", params={"include_logs": False})
+    assert resp.status_code == 200
+    assert resp.json()["queue_position"] == 3
+    assert resp.json()["eta_seconds"] == 900.0
+
+
+@patch("app.api.endpoints.claude_code.get_customization_scheduler")
+def test_cancel_customization(mock_get_scheduler):
+    task = progress_tracker.create_task()
+    mock_get_scheduler.return_value.cancel.return_value = "queued"
+
+    resp = client.post(f"/api/v1/customize-resume/cancel/{task.task_id}")
+    assert resp.status_code == 200
+    assert resp.json() == {"task_id": task.task_id, "status": "cancelled"}
+    assert task.status == "cancelled"
+    mock_get_scheduler.return_value.cancel.assert_called_once_with(task.task_id)
+
+    mock_get_scheduler.return_value.cancel.return_value = None
+    assert client.post(f"/api/v1/customize-resume/cancel/{task.task_id}").status_code == 409
+    assert client.post("/api/v1/customize-resume/cancel/unknown").status_code == 404
+
+
+@patch("app.api.endpoints.claude_code.get_claude_code_executor")
+def test_customize_resume_async_rejects_when_queue_full(mock_get_executor, sample_resume, sample_job_description):
+    mock_exec = MagicMock()
+    mock_exec.customize_resume_with_progress.side_effect = QueueFullError("full")
+    mock_get_executor.return_value = mock_exec
+
+    resp = client.post("/api/v1/customize-resume/async/", json=_build_request(sample_resume, sample_job_description))
+    assert resp.status_code == 503
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from app.services.claude_code.scheduler import (
+    CustomizationCancelledError,
+    CustomizationScheduler,
+    QueueFullError,
+)
+
+
+def _job(started, release, name):
+    async def run():
+        started.append(name)
+        await release.wait()
+        return name
+
+    return lambda: run()
+
+
+async def test_scheduler_limits_running_jobs_and_keeps_priority_order():
+    scheduler = CustomizationScheduler(slots=2, max_queue_size=10)
+    started, release = [], asyncio.Event()
+
+    jobs = [scheduler.submit(name, _job(started, release, name)) for name in ("a", "b", "c", "d")]
+    jobs.append(scheduler.submit("urgent", _job(started, release, "urgent"), priority=5))
+    await asyncio.sleep(0)
+
+    assert started == ["a", "b"]
+    assert scheduler.info()["running"] == 2
+    assert [scheduler.position(name) for name in ("urgent", "c", "d")] == [1, 2, 3]
+    assert scheduler.position("a") is None
+
+    release.set()
+    assert await asyncio.gather(*(job.wait() for job in jobs)) == ["a", "b", "c", "d", "urgent"]
+    assert started == ["a", "b", "urgent", "c", "d"]
+    assert scheduler.info()["completed"] == 5
+
+
+async def test_scheduler_estimates_completion_from_slots():
+    scheduler = CustomizationScheduler(slots=1, default_duration_seconds=100)
+    started, release = [], asyncio.Event()
+    for name in ("a", "b", "c"):
+        scheduler.submit(name, _job(started, release, name))
+    await asyncio.sleep(0)
+
+    assert scheduler.eta_seconds("a") == pytest.approx(100, abs=1)
+    assert scheduler.eta_seconds("b") == pytest.approx(200, abs=1)
+    assert scheduler.eta_seconds("c") == pytest.approx(300, abs=1)
+    assert scheduler.eta_seconds("unknown") is None
+    release.set()
+
+
+async def test_scheduler_rejects_submissions_when_queue_is_full():
+    scheduler = CustomizationScheduler(slots=1, max_queue_size=1)
+    started, release = [], asyncio.Event()
+    scheduler.submit("a", _job(started, release, "a"))
+    scheduler.submit("b", _job(started, release, "b"))
+
+    with pytest.raises(QueueFullError):
+        scheduler.submit("c", _job(started, release, "c"))
+    release.set()
+
+
+async def test_scheduler_cancels_queued_and_running_jobs():
+    scheduler = CustomizationScheduler(slots=1)
+    started, release = [], asyncio.Event()
+    running = scheduler.submit("a", _job(started, release, "a"))
+    queued = scheduler.submit("b", _job(started, release, "b"))
+    after = scheduler.submit("c", _job(started, release, "c"))
+    await asyncio.sleep(0)
+
+    assert scheduler.cancel("b") == "queued"
+    assert scheduler.position("c") == 1
+    with pytest.raises(CustomizationCancelledError):
+        await queued.wait()
+
+    assert scheduler.cancel("a") == "running"
+    with pytest.raises(CustomizationCancelledError):
+        await running.wait()
+
+    # The freed slot goes to the next job that wasn't cancelled
+    release.set()
+    assert await after.wait() == "c"
+    assert started == ["a", "c"]
+    assert scheduler.cancel("c") is None
+    assert scheduler.info()["cancelled"] == 2
+
+
+async def test_scheduler_passes_errors_to_waiters_and_continues():
+    scheduler = CustomizationScheduler(slots=1)
+
+    async def fail():
+        raise ValueError("boom")
+
+    async def succeed():
+        return "ok"
+
+    failed = scheduler.submit("a", fail)
+    succeeded = scheduler.submit("b", succeed)
+    with pytest.raises(ValueError):
+        await failed.wait()
+    assert await succeeded.wait() == "ok"
+    assert scheduler.info()["failed"] == 1
@@ -0,0 +1,110 @@
+import asyncio
+import subprocess
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.claude_code import subprocess_runner
+from app.services.claude_code.subprocess_runner import run_claude_subprocess_async
+
+
+def _command(script: str):
+    return [sys.executable, "-c", script]
+
+
+async def test_async_runner_streams_output_and_logs(tmp_path):
+    script = (
+        "import sys\n"
+        "prompt = sys.stdin.read()\n"
+        "print('{\"type\": \"status\", \"status\": \"ok\", \"message\": \"started\"}')\n"
+        "print('plain ' + prompt)\n"
+        "print('Exception: bad thing', file=sys.stderr)\n"
+        "print('x' * 200000)\n"
+    )
+    log_streamer = MagicMock()
+
+    stdout = await run_claude_subprocess_async(
+        _command(script), str(tmp_path), "hello", log_streamer, "t1", timeout_seconds=30
+    )
+
+    lines = stdout.split("\n")
+    assert lines[1:] == ["plain hello", "x" * 200000]
+    logged = [(c.args[1], c.kwargs.get("level")) for c in log_streamer.add_log.call_args_list]
+    assert ("Status: ok - started", "info") in logged
+    # Output the parser doesn't recognize is kept but not echoed to the log
+    assert not any(message.startswith("Claude: ") for message, _ in logged)
+    assert ("Exception: bad thing", "error") in logged
+    assert (tmp_path / ".claude_work" / "input" / "prompt.txt").read_text() == "hello"
+
+
+async def test_async_runner_reports_exit_code(tmp_path):
+    script = "import sys\nprint('partial')\nsys.exit(3)\n"
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        await run_claude_subprocess_async(
+            _command(script), str(tmp_path), "", MagicMock(), "t1", timeout_seconds=30
+        )
+    assert exc_info.value.returncode == 3
+    assert exc_info.value.output == "partial"
+
+
+async def test_async_runner_times_out_and_terminates(tmp_path, monkeypatch):
+    processes = []
+    create = asyncio.create_subprocess_exec
+
+    async def tracking_create(*args, **kwargs):
+        process = await create(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(subprocess_runner.asyncio, "create_subprocess_exec", tracking_create)
+    with pytest.raises(subprocess.TimeoutExpired):
+        await run_claude_subprocess_async(
+            _command("import time\ntime.sleep(60)"), str(tmp_path), "", MagicMock(), "t1",
+            timeout_seconds=0.5,
+        )
+    assert processes[0].returncode is not None
+
+
+async def test_async_runner_cancellation_terminates_process(tmp_path, monkeypatch):
+    processes = []
+    create = asyncio.create_subprocess_exec
+
+    async def tracking_create(*args, **kwargs):
+        process = await create(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(subprocess_runner.asyncio, "create_subprocess_exec", tracking_create)
+    run = asyncio.create_task(run_claude_subprocess_async(
+        _command("import time\ntime.sleep(60)"), str(tmp_path), "", MagicMock(), "t1",
+        timeout_seconds=60,
+    ))
+    while not processes:
+        await asyncio.sleep(0.01)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    assert processes[0].returncode is not None
+
+
+async def test_background_customization_runs_on_event_loop(tmp_path, monkeypatch):
+    from app.services.claude_code.executor import ClaudeCodeExecutor
+    from app.services.claude_code.progress_tracker import progress_tracker
+
+    executor = ClaudeCodeExecutor(working_dir=str(tmp_path))
+    finished = asyncio.Event()
+
+    async def customize(**kwargs):
+        finished.set()
+        return {}
+
+    monkeypatch.setattr(executor, "customize_resume_async", customize)
+    threads = threading.active_count()
+
+    task_id = executor.customize_resume_with_progress("r.md", "j.md", "out.md")["task_id"]
+    assert threading.active_count() == threads
+    await asyncio.wait_for(finished.wait(), timeout=5)
+    await asyncio.sleep(0)
+    assert progress_tracker.get_task(task_id).status == "completed"
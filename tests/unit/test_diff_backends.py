@@ -0,0 +1,149 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from app.services.diff.myers import myers_opcodes
+from app.services.diff_service import (
+    DiffGenerator,
+    DiffResult,
+    generate_resume_diff,
+    generate_side_by_side_diff,
+    generate_word_level_diff,
+    get_diff_statistics,
+)
+
+# Output of generate_resume_diff, generate_word_level_diff,
+# generate_side_by_side_diff and get_diff_statistics captured from the
+# original difflib implementation, before the diff backends existed
+GOLDEN = json.loads((Path(__file__).parent / "fixtures" / "diff_golden.json").read_text())
+
+# Pairs on which the shortest edit script is the one difflib finds
+MYERS_PARITY_CASES = [
+    "inserted_word",
+    "deleted_and_appended_lines",
+    "appended_skill",
+    "html_special_characters",
+    "whitespace_only",
+    "added_from_empty",
+    "removed_to_empty",
+    "unchanged",
+]
+
+
+def _as_json(value):
+    # The fixture stores tuples as lists
+    return json.loads(json.dumps(value))
+
+
+def _apply(a, b, opcodes):
+    """Check the opcodes cover both sequences and return the edit cost."""
+    i = j = cost = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        else:
+            cost += (i2 - i1) + (j2 - j1)
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return cost
+
+
+def _lcs_length(a, b):
+    rows = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            rows[i + 1][j + 1] = rows[i][j] + 1 if x == y else max(rows[i][j + 1], rows[i + 1][j])
+    return rows[-1][-1]
+
+
+def test_myers_finds_shortest_edit_script():
+    rng = random.Random(7)
+    for _ in range(500):
+        a = [rng.choice("abc") for _ in range(rng.randint(0, 10))]
+        b = [rng.choice("abc") for _ in range(rng.randint(0, 10))]
+        cost = _apply(a, b, myers_opcodes(a, b))
+        assert cost == len(a) + len(b) - 2 * _lcs_length(a, b)
+
+
+def test_myers_matches_difflib_on_simple_edits():
+    a = ["A", "B", "C"]
+    b = ["A", "C", "D"]
+    assert myers_opcodes(a, b) == [
+        ("equal", 0, 1, 0, 1),
+        ("delete", 1, 2, 1, 1),
+        ("equal", 2, 3, 1, 2),
+        ("insert", 3, 3, 2, 3),
+    ]
+
+
+def test_myers_cost_cap_degrades_to_replacement():
+    a = [f"old {i}" for i in range(5000)]
+    b = ["keep"] + [f"new {i}" for i in range(5000)] + ["tail"]
+    a = ["keep"] + a + ["tail"]
+    opcodes = myers_opcodes(a, b, max_cost=50)
+    assert opcodes == [
+        ("equal", 0, 1, 0, 1),
+        ("replace", 1, 5001, 1, 5001),
+        ("equal", 5001, 5002, 5001, 5002),
+    ]
+
+
+@pytest.mark.parametrize("case", sorted(GOLDEN))
+def test_diff_functions_match_golden_output(case):
+    golden = GOLDEN[case]
+    orig, cust = golden["original"], golden["customized"]
+    assert generate_resume_diff(orig, cust) == golden["resume_diff"]
+    assert generate_word_level_diff(orig, cust) == golden["word_level_diff"]
+    assert _as_json(generate_side_by_side_diff(orig, cust)) == golden["side_by_side"]
+    assert get_diff_statistics(orig, cust) == golden["statistics"]
+
+
+@pytest.mark.parametrize("case", sorted(GOLDEN))
+def test_difflib_backend_matches_golden_output(case):
+    golden = GOLDEN[case]
+    orig, cust = golden["original"], golden["customized"]
+    generator = DiffGenerator(backend="difflib")
+    diff = generator.diff(orig, cust)
+    assert generator.line_diff(orig, cust) == golden["resume_diff"]
+    assert generator.inline_html(diff) == golden["resume_diff"]
+    assert diff.inline_html == golden["word_level_diff"]
+    assert _as_json(diff.side_by_side) == golden["side_by_side"]
+    assert diff.statistics == golden["statistics"]
+
+
+@pytest.mark.parametrize("case", MYERS_PARITY_CASES)
+def test_myers_backend_output_parity(case):
+    golden = GOLDEN[case]
+    diff = DiffResult(golden["original"], golden["customized"], backend="myers")
+    assert diff.inline_html == golden["word_level_diff"]
+    assert _as_json(diff.side_by_side) == golden["side_by_side"]
+    assert diff.statistics == golden["statistics"]
+
+
+def test_myers_backend_rebuilds_rewritten_documents():
+    rng = random.Random(3)
+    words = "python java lead built scaled team api data platform".split()
+    for _ in range(50):
+        orig = "\n".join(" ".join(rng.choices(words, k=rng.randint(1, 6))) for _ in range(20))
+        cust = "\n".join(" ".join(rng.choices(words, k=rng.randint(1, 6))) for _ in range(20))
+        segments = DiffResult(orig, cust, backend="myers", max_cost=10).segments
+        assert "".join(seg[1] for seg in segments) == orig
+        assert "".join(seg[2] for seg in segments) == cust
+
+
+def test_diff_generator_selects_backend():
+    orig, cust = "Hello world", "Hello brave world"
+    assert DiffGenerator().line_diff(orig, cust) == generate_resume_diff(orig, cust)
+    myers = DiffGenerator(backend="myers")
+    assert myers.line_diff(orig, cust) == (
+        "Hello <span class=\"addition\" title=\"Added content\">brave </span>world"
+    )
+    assert myers.diff(orig, cust).backend == "myers"
+
+
+def test_diff_generator_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        DiffGenerator(backend="patience")
@@ -0,0 +1,178 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.session import Base
+from app.models.resume import Resume, ResumeDiff, ResumeVersion
+from app.services import diff_service
+from app.services.diff.cache import DiffCache, DiffCacheKey
+from app.services.diff_service import DiffGenerator, get_version_diff
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def versions(db):
+    db.add(Resume(id="r1", title="Resume"))
+    original = ResumeVersion(id="v1", resume_id="r1", content="# Skills\nPython\n", version_number=1)
+    customized = ResumeVersion(
+        id="v2", resume_id="r1", content="# Skills\nPython, Go\n", version_number=2, is_customized=True
+    )
+    db.add_all([original, customized])
+    db.commit()
+    return original, customized
+
+
+def _counting(calls, value):
+    def compute():
+        calls.append(1)
+        return value
+
+    return compute
+
+
+def test_repeated_views_skip_computation():
+    cache = DiffCache()
+    key = DiffCacheKey("v1", "v2", "inline:myers")
+    calls = []
+
+    first = cache.get(key, "r1", _counting(calls, {"diff_content": "x"}))
+    second = cache.get(key, "r1", _counting(calls, {"diff_content": "y"}))
+
+    assert second is first
+    assert len(calls) == 1
+    assert cache.info()["hits"] == 1
+    assert cache.info()["misses"] == 1
+
+
+def test_formats_are_cached_separately():
+    cache = DiffCache()
+    calls = []
+    cache.get(DiffCacheKey("v1", "v2", "inline:myers"), "r1", _counting(calls, "a"))
+    cache.get(DiffCacheKey("v1", "v2", "html:myers"), "r1", _counting(calls, "b"))
+    assert len(calls) == 2
+
+
+def test_lru_evicts_least_recently_used():
+    cache = DiffCache(max_size=2)
+    calls = []
+    for pair in ["a", "b", "a", "c", "a", "b"]:
+        cache.get(DiffCacheKey(pair, "z", "inline"), "r1", _counting(calls, pair))
+    # "b" was evicted by "c" and recomputed
+    assert len(calls) == 4
+
+
+def test_persistent_tier_survives_new_cache(db):
+    key = DiffCacheKey("v1", "v2", "inline:myers")
+    DiffCache().get(key, "r1", lambda: {"stats": {"additions": 1}}, db)
+
+    calls = []
+    fresh = DiffCache()
+    value = fresh.get(key, "r1", _counting(calls, None), db)
+    assert value == {"stats": {"additions": 1}}
+    assert calls == []
+    assert fresh.info()["persistent_hits"] == 1
+
+
+def test_invalidate_resume_drops_memory_and_rows(db):
+    cache = DiffCache()
+    cache.get(DiffCacheKey("v1", "v2", "inline"), "r1", lambda: "one", db)
+    cache.get(DiffCacheKey("v3", "v4", "inline"), "r2", lambda: "two", db)
+
+    cache.invalidate_resume("r1", db)
+
+    assert cache.peek(DiffCacheKey("v1", "v2", "inline")) is None
+    assert cache.peek(DiffCacheKey("v3", "v4", "inline")) == "two"
+    assert [row.resume_id for row in db.query(ResumeDiff).all()] == ["r2"]
+
+
+def test_persistent_writes_join_the_callers_transaction(db):
+    db.add(Resume(id="r1", title="Resume"))
+
+    DiffCache().get(DiffCacheKey("v1", "v2", "inline"), "r1", lambda: "diff", db)
+    db.rollback()
+
+    # Neither the caller's pending resume nor the diff was committed early
+    assert db.query(Resume).count() == 0
+    assert db.query(ResumeDiff).count() == 0
+
+
+def test_failed_store_keeps_the_callers_changes(db, monkeypatch):
+    db.add(Resume(id="r1", title="Resume"))
+
+    def fail(*args, **kwargs):
+        raise SQLAlchemyError("database is locked")
+
+    monkeypatch.setattr(db, "merge", fail)
+    value = DiffCache().get(DiffCacheKey("v1", "v2", "inline"), "r1", lambda: "diff", db)
+    db.commit()
+
+    assert value == "diff"
+    assert db.query(Resume).count() == 1
+    assert db.query(ResumeDiff).count() == 0
+
+
+def test_invalidate_resume_is_part_of_the_callers_transaction(db, versions):
+    cache = DiffCache()
+    cache.get(DiffCacheKey("v1", "v2", "inline"), "r1", lambda: "one", db)
+    db.commit()
+
+    db.delete(db.get(Resume, "r1"))
+    cache.invalidate_resume("r1", db)
+    db.rollback()
+
+    # The purge is undone along with the caller's delete
+    assert db.query(Resume).count() == 1
+    assert db.query(ResumeDiff).count() == 1
+
+
+def test_get_version_diff_caches_per_backend(db, versions, monkeypatch):
+    monkeypatch.setattr(diff_service, "DIFF_CACHE", DiffCache())
+    original, customized = versions
+
+    myers = get_version_diff(original, customized, DiffGenerator(backend="myers"), db)
+    again = get_version_diff(original, customized, DiffGenerator(backend="myers"), db)
+    difflib = get_version_diff(original, customized, DiffGenerator(), db)
+
+    assert again is myers
+    assert myers["diff_statistics"] == {"additions": 0, "deletions": 0, "modifications": 1, "unchanged": 1}
+    assert set(myers["section_analysis"]) == {"Skills"}
+    assert difflib["diff_statistics"] == myers["diff_statistics"]
+    assert difflib["section_analysis"] == myers["section_analysis"]
+    assert db.query(ResumeDiff).count() == 2
+
+
+def test_get_version_diff_matches_line_diff_granularity(db, versions, monkeypatch):
+    monkeypatch.setattr(diff_service, "DIFF_CACHE", DiffCache())
+    original, customized = versions
+
+    for generator in (DiffGenerator(), DiffGenerator(backend="myers")):
+        diff = get_version_diff(original, customized, generator, db)
+        assert diff["diff_content"] == generator.line_diff(original.content, customized.content)
+
+
+def test_get_version_diff_caches_per_cost_cap(db, versions, monkeypatch):
+    monkeypatch.setattr(diff_service, "DIFF_CACHE", DiffCache())
+    original, customized = versions
+
+    get_version_diff(original, customized, DiffGenerator(backend="myers", max_cost=2000), db)
+    get_version_diff(original, customized, DiffGenerator(backend="myers", max_cost=1), db)
+
+    assert sorted(row.diff_format for row in db.query(ResumeDiff).all()) == [
+        "inline:myers:1", "inline:myers:2000"
+    ]
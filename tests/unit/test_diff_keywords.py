@@ -0,0 +1,85 @@
+from collections import Counter
+from unittest.mock import patch
+
+from app.services.diff import keywords
+from app.services.diff.keywords import (
+    COMMON_WORDS,
+    KeywordVectorCache,
+    keyword_delta,
+    keyword_vector,
+)
+from app.services.diff_service import extract_keywords, get_keyword_timeline
+from app.utils.tokenizer import tokenize
+
+
+def _quadratic_keywords(text):
+    """The list-based extraction keyword vectors replaced."""
+    words = [w for w in tokenize(text).words if w not in COMMON_WORDS and len(w) > 3]
+    unique = []
+    for word in words:
+        if word not in unique:
+            unique.append(word)
+    return sorted(unique, key=words.count, reverse=True)[:20]
+
+
+def test_extract_keywords_matches_list_based_ranking():
+    text = (
+        "Python developer building Python services and data pipelines. "
+        "Led teams shipping services; mentored developer teams in Python, "
+        "Kubernetes, Terraform, Postgres, Redis, Kafka, Airflow, Spark, Django, "
+        "Flask, FastAPI, React, GraphQL, Docker and Linux tooling."
+    )
+    assert extract_keywords(text) == _quadratic_keywords(text)
+
+
+def test_keyword_delta_reports_added_removed_and_counts():
+    before = Counter({"python": 2, "django": 1, "java": 1})
+    after = Counter({"python": 3, "django": 1, "kubernetes": 2, "golang": 1})
+    delta = keyword_delta(before, after)
+    assert delta["added"] == ["kubernetes", "golang"]
+    assert delta["removed"] == ["java"]
+    assert delta["count_changes"] == {"python": 1}
+
+
+def test_keyword_vector_cache_extracts_each_version_once():
+    cache = KeywordVectorCache(max_size=2)
+    with patch.object(keywords, "keyword_vector", wraps=keyword_vector) as vector:
+        first = cache.get("v1", "r1", lambda: "Python services")
+        assert cache.get("v1", "r1", lambda: "ignored") is first
+        cache.get("v2", "r2", lambda: "Golang services")
+    assert vector.call_count == 2
+    assert cache.info()["hits"] == 1
+
+    cache.invalidate_resume("r1")
+    assert cache.info()["size"] == 1
+
+
+class _Version:
+    def __init__(self, number, content):
+        self.id = f"v{number}"
+        self.resume_id = "r1"
+        self.version_number = number
+        self.content = content
+        self.is_customized = number > 1
+        self.job_description_id = None
+        self.created_at = None
+
+
+def test_keyword_timeline_compares_consecutive_versions():
+    versions = [
+        _Version(3, "Python Kubernetes Terraform"),
+        _Version(1, "Python Django"),
+        _Version(2, "Python Django Kubernetes"),
+    ]
+    cache = KeywordVectorCache()
+    timeline = get_keyword_timeline(versions, cache)
+    assert [entry["version_number"] for entry in timeline] == [1, 2, 3]
+    assert timeline[0]["added_keywords"] == ["python", "django"]
+    assert timeline[1]["added_keywords"] == ["kubernetes"]
+    assert timeline[2]["added_keywords"] == ["terraform"]
+    assert timeline[2]["removed_keywords"] == ["django"]
+
+    # A longer history only extracts the new version
+    versions.append(_Version(4, "Python Terraform"))
+    get_keyword_timeline(versions, cache)
+    assert cache.info()["misses"] == 4
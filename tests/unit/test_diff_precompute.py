@@ -0,0 +1,174 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.session import Base
+from app.models.resume import Resume, ResumeDiff, ResumeVersion
+from app.repositories.resume import ResumeRepository
+from app.services import diff_service
+from app.services.diff.cache import DiffCache
+from app.services.diff.precompute import DiffPrecomputer
+from app.services.diff_service import backfill_version_diffs, store_version_diff
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = DiffCache()
+    monkeypatch.setattr(diff_service, "DIFF_CACHE", cache)
+    return cache
+
+
+def _add_versions(db, resume_id, flags):
+    """Add versions with the given customized flags, returning them in order."""
+    db.add(Resume(id=resume_id, title="Resume"))
+    versions = [
+        ResumeVersion(
+            id=f"{resume_id}-v{number}",
+            resume_id=resume_id,
+            content=f"# Summary\nVersion {number}\n",
+            version_number=number,
+            is_customized=customized,
+        )
+        for number, customized in enumerate(flags, start=1)
+    ]
+    db.add_all(versions)
+    db.commit()
+    return versions
+
+
+def test_precomputer_runs_tasks_and_reports_lag():
+    outcomes = {"a": True, "b": False}
+
+    def task(version_id):
+        if version_id == "boom":
+            raise RuntimeError("failed")
+        return outcomes[version_id]
+
+    precomputer = DiffPrecomputer(task, workers=2)
+    for version_id in ["a", "b", "boom"]:
+        assert precomputer.enqueue(version_id)
+    precomputer.join()
+
+    metrics = precomputer.metrics()
+    assert metrics["enqueued"] == 3
+    assert metrics["completed"] == 1
+    assert metrics["skipped"] == 1
+    assert metrics["failed"] == 1
+    assert metrics["queue_depth"] == 0
+    assert metrics["max_lag_seconds"] >= metrics["average_lag_seconds"] >= 0
+    precomputer.shutdown()
+    assert not precomputer.started
+
+
+def test_precomputer_drops_versions_when_queue_is_full():
+    release = threading.Event()
+    precomputer = DiffPrecomputer(lambda version_id: release.wait(5), max_queue_size=1)
+    precomputer.enqueue("running")
+    # Wait for the worker to take the first version off the queue
+    while precomputer.metrics()["queue_depth"]:
+        time.sleep(0.01)
+    assert precomputer.enqueue("queued")
+    assert not precomputer.enqueue("dropped")
+    release.set()
+    precomputer.join()
+    assert precomputer.metrics()["dropped"] == 1
+    precomputer.shutdown()
+
+
+def test_base_version_prefers_latest_non_customized(db):
+    versions = _add_versions(db, "r1", [False, False, True, True])
+    repository = ResumeRepository(db)
+    assert repository.get_base_version(versions[3]).id == "r1-v2"
+    assert repository.get_base_version(versions[0]) is None
+
+    only_customized = _add_versions(db, "r2", [True, True])
+    assert ResumeRepository(db).get_base_version(only_customized[1]).id == "r2-v1"
+
+
+def test_store_version_diff_persists_inline_diff(db, fresh_cache):
+    versions = _add_versions(db, "r1", [False, True])
+
+    assert not store_version_diff(db, "r1-v1")  # Not customized
+    assert store_version_diff(db, "r1-v2")
+
+    row = db.query(ResumeDiff).one()
+    assert (row.original_version_id, row.customized_version_id) == ("r1-v1", "r1-v2")
+    assert row.diff_format == f"inline:{diff_service.configured_diff_generator().cache_variant}"
+    assert fresh_cache.info()["size"] == 1
+
+
+def test_backfill_queues_only_missing_diffs(db, fresh_cache):
+    _add_versions(db, "r1", [False, True, True])
+    _add_versions(db, "r2", [True])  # Nothing to compare against
+    store_version_diff(db, "r1-v2")
+
+    precomputer = DiffPrecomputer(lambda version_id: store_version_diff(db, version_id))
+    assert backfill_version_diffs(db, precomputer) == 1
+    precomputer.join()
+    precomputer.shutdown()
+
+    assert db.query(ResumeDiff).count() == 2
+    assert backfill_version_diffs(db, precomputer) == 0
+
+
+def test_backfill_ignores_stored_diffs_without_persistence(db, fresh_cache, monkeypatch):
+    _add_versions(db, "r1", [False, True])
+    store_version_diff(db, "r1-v2")
+    fresh_cache.clear()
+    monkeypatch.setattr(diff_service.settings, "DIFF_CACHE_PERSIST", False)
+
+    # Stored rows are not read back, as with every other cache lookup
+    assert backfill_version_diffs(db, MagicMock()) == 1
+
+
+def test_backfill_script_requires_persistence(monkeypatch):
+    from scripts import backfill_resume_diffs
+
+    monkeypatch.setattr(backfill_resume_diffs.settings, "DIFF_CACHE_PERSIST", False)
+    with patch.object(backfill_resume_diffs, "backfill_version_diffs") as backfill:
+        assert backfill_resume_diffs.main([]) == 1
+    backfill.assert_not_called()
+
+
+def test_creating_customized_version_queues_precomputation(client):
+    from app.api.endpoints import resumes
+
+    resume = client.post("/api/v1/resumes/", json={"title": "R", "content": "Old"}).json()
+    precomputer = MagicMock()
+    with patch.object(resumes, "DIFF_PRECOMPUTER", precomputer):
+        plain = client.post(
+            f"/api/v1/resumes/{resume['id']}/versions", json={"content": "Edit"}
+        ).json()
+        customized = client.post(
+            f"/api/v1/resumes/{resume['id']}/versions",
+            json={"content": "New", "is_customized": True},
+        ).json()
+
+    assert plain["is_customized"] is False
+    precomputer.enqueue.assert_called_once_with(customized["id"])
+
+
+def test_precompute_metrics_endpoint(client):
+    response = client.get("/api/v1/resumes/diff-precompute/metrics")
+    assert response.status_code == 200
+    assert {"queue_depth", "average_lag_seconds", "max_lag_seconds"} <= set(response.json())
@@ -1,11 +1,25 @@
+import io
+import json
+import zipfile
+from unittest.mock import patch
+
 import pytest
 
+from app.services import diff_service
 from app.services.diff_service import (
+    DiffResult,
+    create_diff_json,
+    export_diff_to_files,
+    generate_diff_html_document,
     generate_resume_diff,
+    iter_diff_bundle,
+    iter_diff_html_document,
+    render_diff_html_document,
     generate_word_level_diff,
     generate_side_by_side_diff,
     get_diff_statistics,
     analyze_section_changes,
+    extract_resume_sections,
 )
 
 
@@ -65,3 +79,107 @@ def test_analyze_section_changes_returns_sections():
     assert analysis["Sec3"]["additions"] == 1
     assert analysis["Sec3"]["deletions"] == 0
     assert "<span class=\"addition\"" in analysis["Sec1"]["section_diff"]
+
+
+def test_analyze_section_changes_skips_identical_sections():
+    orig = "# Sec1\nA & B\nC\n\n# Sec2\nD\n\n# Sec3\nE\n"
+    cust = "# Sec1\nA & B\nC\n\n# Sec2\nD new\n\n# Sec3\nE\n"
+    with patch.object(
+        diff_service, "_diff_section", wraps=diff_service._diff_section
+    ) as diff_section:
+        analysis = analyze_section_changes(orig, cust)
+    assert diff_section.call_count == 1
+    assert analysis["Sec2"]["status"] != "unchanged"
+
+    # Skipped sections report exactly what diffing them would have
+    section = extract_resume_sections(orig)["Sec1"]
+    diffed = DiffResult(section, section)
+    assert analysis["Sec1"]["status"] == "unchanged"
+    assert analysis["Sec1"]["stats"] == diffed.statistics
+    assert analysis["Sec1"]["section_diff"] == diffed.inline_html
+
+
+def test_diff_result_matches_standalone_functions():
+    orig = "# Sec1\nA\nB\n\n# Sec2\nC\n"
+    cust = "# Sec1\nA\nB new\n\n# Sec2\nC\nD\n"
+    diff = DiffResult(orig, cust)
+    assert diff.inline_html == generate_word_level_diff(orig, cust)
+    assert diff.statistics == get_diff_statistics(orig, cust)
+    assert diff.side_by_side == generate_side_by_side_diff(orig, cust)
+    assert diff.section_analysis == analyze_section_changes(orig, cust)
+    assert diff.to_dict() == create_diff_json(orig, cust)
+
+
+def test_diff_result_runs_line_comparison_once():
+    orig = "A\nB\nC\n"
+    cust = "A\nC\nD\n"
+    diff = DiffResult(orig, cust)
+    with patch.object(
+        diff_service, "SequenceMatcher", wraps=diff_service.SequenceMatcher
+    ) as matcher:
+        diff.statistics
+        diff.side_by_side
+        diff.inline_html
+        diff.inline_html
+    # Only the whole-document line comparison; no hunk needed word refinement
+    assert matcher.call_count == 1
+
+
+def test_diff_result_segments_rebuild_both_texts():
+    orig = "Python developer\nBuilt APIs"
+    cust = "Senior Python developer\nBuilt APIs\nLed team\n"
+    segments = DiffResult(orig, cust).segments
+    assert "".join(seg[1] for seg in segments) == orig
+    assert "".join(seg[2] for seg in segments) == cust
+
+
+def test_iter_diff_html_document_matches_rendered_document():
+    orig = "# Sec1\nA <b>\nB\n\n# Sec2\nC\n" * 20
+    cust = "# Sec1\nA <b>\nB new\n\n# Sec2\nC\nD\n" * 20
+    chunks = list(iter_diff_html_document(DiffResult(orig, cust), chunk_size=256))
+    assert len(chunks) > 5
+    assert "".join(chunks) == render_diff_html_document(DiffResult(orig, cust))
+    assert "".join(chunks) == generate_diff_html_document(orig, cust)
+
+
+def test_iter_diff_html_document_yields_head_before_diffing():
+    diff = DiffResult("A\n", "B\n")
+    chunks = iter_diff_html_document(diff, title="Title")
+    head = next(chunks)
+    assert head.startswith("<!DOCTYPE html>")
+    assert "<h1>Title</h1>" in head
+    assert "line_opcodes" not in vars(diff)
+
+
+def test_export_diff_to_files_writes_streamed_document(tmp_path):
+    orig, cust = "A\nB\n", "A\nC\n"
+    paths = export_diff_to_files(orig, cust, str(tmp_path))
+    with open(paths["html_file"], encoding="utf-8") as f:
+        assert f.read() == generate_diff_html_document(orig, cust)
+
+
+def test_diff_result_markdown_rebuilds_both_texts():
+    orig = "Python developer\nBuilt APIs\n"
+    cust = "Senior Python developer\nBuilt APIs\nLed team\n"
+    markdown = DiffResult(orig, cust).markdown
+    assert "**++Senior ++**" in markdown
+    assert "**++Led team\n++**" in markdown
+    assert markdown.replace("**++Senior ++**", "").replace("**++Led team\n++**", "") == orig
+
+
+def test_iter_diff_bundle_streams_every_artifact():
+    orig = "# Sec1\nA <b>\nB\n\n# Sec2\nC\n" * 50
+    cust = "# Sec1\nA <b>\nB new\n\n# Sec2\nC\nD\n" * 50
+    chunks = list(iter_diff_bundle(DiffResult(orig, cust)))
+    assert len(chunks) > 2
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        files = {name: archive.read(name).decode("utf-8") for name in archive.namelist()}
+
+    diff = DiffResult(orig, cust)
+    assert files["diff_output.html"] == render_diff_html_document(diff)
+    assert json.loads(files["diff_data.json"]) == create_diff_json(orig, cust)
+    assert json.loads(files["diff_stats.json"]) == diff.statistics
+    assert json.loads(files["side_by_side.json"]) == diff.side_by_side
+    assert files["diff.md"] == diff.markdown
@@ -0,0 +1,326 @@
+import asyncio
+import json
+
+import pytest
+
+from app.services import ats_service
+from app.services.ats import executor as ats_pool
+from app.services.ats.executor import ATSExecutor, analyze_resume_for_ats
+from app.services.ats_service import (
+    analyze_resume_for_ats_batch,
+    analyze_resume_for_ats_incremental,
+    analyze_resume_for_ats_sync,
+)
+
+RESUME = """# Jane Doe
+
+## Summary
+Backend engineer building Python services and data pipelines.
+
+## Experience
+- Built REST APIs with Python, Flask and PostgreSQL
+- Deployed services with Docker and Kubernetes on AWS
+- Improved pipeline throughput by 40%
+
+## Skills
+Python, SQL, Docker, Kubernetes, machine learning
+"""
+
+JOBS = {
+    "backend": "Senior Backend Engineer\nRequired: Python, Flask, PostgreSQL, Docker.\n- Build REST APIs",
+    "frontend": "Frontend Developer\n- React, TypeScript and CSS\n- Design systems experience",
+    "data": "Data Scientist\nMust have machine learning, statistics and Python. Experience with pandas.",
+}
+
+
+@pytest.fixture(autouse=True)
+def ats_executor(monkeypatch):
+    # A single forked worker keeps the tests fast
+    executor = ATSExecutor(max_workers=1, start_method="fork")
+    monkeypatch.setattr(ats_pool, "_ats_executor", executor)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_batch_matches_single_analysis():
+    results = analyze_resume_for_ats_batch(RESUME, list(JOBS.items()))
+
+    assert [r["match_score"] for r in results] == sorted(
+        (r["match_score"] for r in results), reverse=True
+    )
+    for result in results:
+        single = analyze_resume_for_ats_sync(RESUME, JOBS[result["job_description_id"]])
+        for field in ("match_score", "matching_keywords", "missing_keywords",
+                      "improvements", "job_type", "confidence"):
+            assert result[field] == single[field]
+        assert abs(result["keyword_density"] - single["keyword_density"]) < 1e-9
+        # Batch and single scoring share the vectorized section scoring
+        assert result["section_scores"] == single["section_scores"]
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_async_analysis_runs_in_pool(ats_executor):
+    result = asyncio.run(analyze_resume_for_ats(RESUME, JOBS["backend"]))
+
+    assert result == {
+        **analyze_resume_for_ats_sync(RESUME, JOBS["backend"]),
+        "processing_time": result["processing_time"],
+    }
+    assert ats_executor.metrics()["completed"] == 1
+
+
+def _without_timing(result):
+    return {key: value for key, value in result.items() if key != "processing_time"}
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_incremental_matches_full_analysis_across_edits():
+    versions = [
+        RESUME,
+        RESUME.replace("Flask", "Flask and REST APIs"),
+        # Keyword split across a section header
+        RESUME.replace("Improved pipeline throughput by 40%", "Senior Backend"),
+        RESUME + "\n## Education\nBSc Computer Science",
+    ]
+    for job_description in JOBS.values():
+        for version in versions:
+            assert _without_timing(
+                analyze_resume_for_ats_incremental(version, job_description)
+            ) == _without_timing(analyze_resume_for_ats_sync(version, job_description))
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_incremental_only_recomputes_changed_sections():
+    from app.services.ats_service import SECTION_CACHE
+
+    SECTION_CACHE.clear()
+    analyze_resume_for_ats_incremental(RESUME, JOBS["backend"])
+    first_misses = SECTION_CACHE.info()["misses"]
+
+    edited = RESUME.replace("machine learning", "machine learning, Flask")
+    analyze_resume_for_ats_incremental(edited, JOBS["backend"])
+
+    # One block (tokens and counts, keyword hits) and one section score
+    assert SECTION_CACHE.info()["misses"] - first_misses == 3
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_async_incremental_analysis_shares_the_section_cache(ats_executor):
+    from app.services.ats_service import JOB_ANALYSIS_CACHE, SECTION_CACHE
+
+    SECTION_CACHE.clear()
+    JOB_ANALYSIS_CACHE.clear()
+    asyncio.run(analyze_resume_for_ats(RESUME, JOBS["backend"], incremental=True))
+    first_misses = SECTION_CACHE.info()["misses"]
+
+    edited = RESUME.replace("machine learning", "machine learning, Flask")
+    result = asyncio.run(analyze_resume_for_ats(edited, JOBS["backend"], incremental=True))
+
+    # Successive saves hit the same cache, whichever pool worker is free
+    assert SECTION_CACHE.info()["misses"] - first_misses == 3
+    assert _without_timing(result) == _without_timing(
+        analyze_resume_for_ats_sync(edited, JOBS["backend"])
+    )
+    # The job description was analyzed once, in the pool
+    assert ats_executor.metrics()["completed"] == 1
+
+
+def test_batch_with_no_jobs():
+    assert analyze_resume_for_ats_batch(RESUME, []) == []
+
+
+def _create_resume_and_jobs(client):
+    resume = client.post("/api/v1/resumes/", json={"title": "Jane", "content": RESUME}).json()
+    job_ids = {}
+    for title, description in JOBS.items():
+        job = client.post("/api/v1/jobs/", json={"title": title, "description": description})
+        job_ids[title] = job.json()["id"]
+    return resume["id"], job_ids
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_analyze_endpoint_scores_latest_version(client):
+    resume_id, job_ids = _create_resume_and_jobs(client)
+
+    for incremental in (True, False):
+        response = client.post(
+            "/api/v1/ats/analyze",
+            json={
+                "resume_id": resume_id,
+                "job_description_id": job_ids["backend"],
+                "incremental": incremental,
+            },
+        )
+        assert response.status_code == 200
+        assert response.json()["match_score"] == analyze_resume_for_ats_sync(
+            RESUME, JOBS["backend"]
+        )["match_score"]
+
+    response = client.post(
+        "/api/v1/ats/analyze",
+        json={"resume_id": resume_id, "job_description_id": "missing"},
+    )
+    assert response.status_code == 404
+
+
+def test_analyze_endpoint_scores_in_the_pool_by_default(client, monkeypatch):
+    from app.api.endpoints import ats as ats_endpoints
+
+    resume_id, job_ids = _create_resume_and_jobs(client)
+    calls = []
+
+    async def fake_analyze(resume_content, job_description, db, incremental=False):
+        calls.append(incremental)
+        return {
+            "match_score": 50, "matching_keywords": [], "missing_keywords": [],
+            "improvements": [], "job_type": "technical", "section_scores": [],
+            "confidence": "low", "keyword_density": 0.0, "processing_time": 0.0,
+        }
+
+    monkeypatch.setattr(ats_endpoints, "analyze_resume_for_ats", fake_analyze)
+    response = client.post(
+        "/api/v1/ats/analyze",
+        json={"resume_id": resume_id, "job_description_id": job_ids["backend"]},
+    )
+
+    assert response.status_code == 200
+    assert calls == [False]
+
+
+def _parse_sse(body):
+    events = []
+    for chunk in body.strip().split("\n\n"):
+        event, data = chunk.split("\n")
+        events.append((event[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_analyze_stream_sends_score_first_and_suggestions_last(client):
+    resume_id, job_ids = _create_resume_and_jobs(client)
+    request = {"resume_id": resume_id, "job_description_id": job_ids["backend"]}
+
+    response = client.post("/api/v1/ats/analyze/stream", json=request)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(response.text)
+    assert [event for event, _ in events] == [
+        "score", "sections", "keywords", "improvements", "complete"
+    ]
+    complete = events[-1][1]
+    assert events[0][1]["match_score"] == complete["match_score"]
+    assert events[3][1]["improvements"] == complete["improvements"]
+
+    full = client.post("/api/v1/ats/analyze", json=request).json()
+    assert _without_timing(complete) == _without_timing(full)
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_analyze_stream_reports_errors_as_events(client, monkeypatch):
+    resume_id, job_ids = _create_resume_and_jobs(client)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(ats_service, "suggest_ats_improvements", fail)
+    response = client.post(
+        "/api/v1/ats/analyze/stream",
+        json={"resume_id": resume_id, "job_description_id": job_ids["backend"]},
+    )
+    events = _parse_sse(response.text)
+    assert [event for event, _ in events][-2:] == ["keywords", "error"]
+
+    response = client.post(
+        "/api/v1/ats/analyze/stream",
+        json={"resume_id": "missing", "job_description_id": job_ids["backend"]},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_batch_endpoint_ranks_all_jobs(client):
+    resume_id, job_ids = _create_resume_and_jobs(client)
+
+    response = client.post("/api/v1/ats/batch", json={"resume_id": resume_id})
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["job_count"] == 3
+    assert {r["job_description_id"] for r in data["results"]} == set(job_ids.values())
+    scores = [r["match_score"] for r in data["results"]]
+    assert scores == sorted(scores, reverse=True)
+    assert data["results"][0]["title"] in JOBS
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_batch_endpoint_selected_jobs_and_limit(client):
+    resume_id, job_ids = _create_resume_and_jobs(client)
+
+    response = client.post(
+        "/api/v1/ats/batch",
+        json={
+            "resume_id": resume_id,
+            "job_description_ids": [job_ids["backend"], job_ids["frontend"]],
+            "limit": 1,
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["job_count"] == 2
+    assert len(data["results"]) == 1
+
+
+def test_batch_endpoint_not_found(client):
+    resume_id, _ = _create_resume_and_jobs(client)
+
+    response = client.post("/api/v1/ats/batch", json={"resume_id": "missing"})
+    assert response.status_code == 404
+
+    response = client.post(
+        "/api/v1/ats/batch",
+        json={"resume_id": resume_id, "job_description_ids": ["missing"]},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_job_update_invalidates_cached_analysis(client):
+    from app.services.ats_service import JOB_ANALYSIS_CACHE
+    from app.utils.tokenizer import text_fingerprint
+
+    resume_id, job_ids = _create_resume_and_jobs(client)
+    client.post("/api/v1/ats/batch", json={"resume_id": resume_id})
+    old_hash = text_fingerprint(JOBS["backend"])
+    assert old_hash in JOB_ANALYSIS_CACHE._memory
+
+    response = client.put(
+        f"/api/v1/jobs/{job_ids['backend']}", json={"description": "Go developer"}
+    )
+    assert response.status_code == 200
+    assert old_hash not in JOB_ANALYSIS_CACHE._memory
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_executor_metrics_endpoint(client):
+    resume_id, _ = _create_resume_and_jobs(client)
+    client.post("/api/v1/ats/batch", json={"resume_id": resume_id})
+
+    response = client.get("/api/v1/ats/executor/metrics")
+    assert response.status_code == 200
+    metrics = response.json()
+    assert metrics["max_workers"] == 1
+    assert metrics["completed"] == 1
+    assert metrics["queue_depth"] == 0
+
+
+def test_nlp_status_endpoint(client):
+    from app.core.nltk_init import NLP_REGISTRY, STOPWORDS_RESOURCE
+
+    NLP_REGISTRY.get(STOPWORDS_RESOURCE)
+
+    response = client.get("/api/v1/ats/nlp/status")
+    assert response.status_code == 200
+    names = [entry["name"] for entry in response.json()["resources"]]
+    assert STOPWORDS_RESOURCE in names
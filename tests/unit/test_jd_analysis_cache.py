@@ -0,0 +1,121 @@
+from collections import defaultdict
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.session import Base
+from app.models.job import JobDescription, JobDescriptionAnalysis
+from app.services.ats.jd_cache import JobAnalysisCache
+from app.utils.tokenizer import text_fingerprint
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _analyzer(calls):
+    def analyze(text):
+        calls.append(text)
+        keywords = defaultdict(float, {word: 1.5 for word in text.split()})
+        return "technical", {"title": text, "keywords": keywords}, defaultdict(int, {text: 1})
+
+    return analyze
+
+
+def test_memory_hits_skip_the_analyzer():
+    calls = []
+    cache = JobAnalysisCache(_analyzer(calls))
+
+    first = cache.get("python developer")
+    second = cache.get("python developer")
+
+    assert second is first
+    assert first.content_hash == text_fingerprint("python developer")
+    assert calls == ["python developer"]
+    assert cache.info()["hits"] == 1
+    assert cache.info()["misses"] == 1
+
+
+def test_lru_evicts_least_recently_used():
+    calls = []
+    cache = JobAnalysisCache(_analyzer(calls), max_size=2)
+
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")  # evicts "b"
+    cache.get("a")
+    cache.get("b")
+
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.info()["size"] == 2
+
+
+def test_persistent_tier_survives_memory_clear(db):
+    calls = []
+    cache = JobAnalysisCache(_analyzer(calls))
+
+    computed = cache.get("python sql", db)
+    cache.clear()
+    loaded = cache.get("python sql", db)
+
+    assert calls == ["python sql"]
+    assert cache.info()["persistent_hits"] == 1
+    assert loaded.job_type == "technical"
+    assert loaded.elements == computed.elements
+    assert isinstance(loaded.elements["keywords"], defaultdict)
+    assert loaded.ngrams == {"python sql": 1}
+
+
+def test_invalidate_removes_both_tiers(db):
+    calls = []
+    cache = JobAnalysisCache(_analyzer(calls))
+
+    cache.get("rust engineer", db)
+    cache.invalidate("rust engineer", db)
+
+    assert db.query(JobDescriptionAnalysis).count() == 0
+    cache.get("rust engineer", db)
+    assert calls == ["rust engineer", "rust engineer"]
+
+
+def test_persistent_writes_join_the_callers_transaction(db):
+    cache = JobAnalysisCache(_analyzer([]))
+    db.add(JobDescription(id="job", title="Engineer", description="go developer"))
+
+    cache.get("go developer", db)
+    db.rollback()
+
+    # Neither the caller's pending job nor the analysis was committed early
+    assert db.query(JobDescription).count() == 0
+    assert db.query(JobDescriptionAnalysis).count() == 0
+
+
+def test_failed_store_keeps_the_callers_changes(db, monkeypatch):
+    cache = JobAnalysisCache(_analyzer([]))
+    db.add(JobDescription(id="job", title="Engineer", description="go developer"))
+
+    def fail(*args, **kwargs):
+        raise SQLAlchemyError("database is locked")
+
+    monkeypatch.setattr(db, "merge", fail)
+    analysis = cache.get("go developer", db)
+    db.commit()
+
+    assert analysis.job_type == "technical"
+    assert db.query(JobDescription).count() == 1
+    assert db.query(JobDescriptionAnalysis).count() == 0
@@ -0,0 +1,237 @@
+import asyncio
+import math
+import os
+from collections import defaultdict
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.db.session import Base, get_db
+from app.models.job import JobCorpusTerm
+from app.services import ats_service
+from app.services.ats import corpus
+from app.services.ats import executor as ats_pool
+from app.services.ats.corpus import BM25Scorer, IDFTable
+from app.services.ats.executor import ATSExecutor
+
+DOCUMENTS = [
+    ({"python", "docker", "sql"}, 100),
+    ({"python", "react"}, 60),
+    ({"python", "kubernetes", "docker"}, 80),
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _frequencies(db):
+    return dict(db.query(JobCorpusTerm.term, JobCorpusTerm.document_frequency))
+
+
+def test_rebuild_counts_documents(db):
+    assert corpus.corpus_totals(db) is None
+    assert corpus.rebuild(db, DOCUMENTS) == 3
+
+    assert corpus.corpus_totals(db) == (3, 240)
+    assert _frequencies(db) == {
+        "python": 3, "docker": 2, "sql": 1, "react": 1, "kubernetes": 1,
+    }
+
+
+def test_incremental_updates_match_rebuild(db):
+    corpus.rebuild(db, DOCUMENTS[:1])
+    assert corpus.add_document(db, *DOCUMENTS[1])
+    assert corpus.add_document(db, *DOCUMENTS[2])
+    assert corpus.add_document(db, {"go", "sql"}, 40)
+    assert corpus.remove_document(db, {"go", "sql"}, 40)
+    incremental = (corpus.corpus_totals(db), _frequencies(db))
+
+    corpus.rebuild(db, DOCUMENTS)
+    assert incremental == (corpus.corpus_totals(db), _frequencies(db))
+    assert "go" not in _frequencies(db)
+
+
+def test_updates_before_build_are_skipped(db):
+    assert not corpus.add_document(db, {"python"}, 10)
+    assert not corpus.remove_document(db, {"python"}, 10)
+    assert corpus.corpus_totals(db) is None
+    assert corpus.load_idf_table(db, ["python"]) is None
+
+
+def test_idf_table_reads_requested_terms(db):
+    corpus.rebuild(db, DOCUMENTS)
+    table = corpus.load_idf_table(db, ["python", "sql", "rust"])
+
+    assert table.document_frequencies == {"python": 3, "sql": 1}
+    assert table.average_length == 80
+    assert table.idf("sql") == pytest.approx(math.log(1 + 2.5 / 1.5))
+    # Unseen terms are the most discriminative; common terms still count
+    assert table.idf("rust") > table.idf("sql") > table.idf("python") > 0
+
+
+def test_keyword_weights_move_weight_to_rare_terms():
+    table = IDFTable(
+        document_count=100,
+        average_length=50.0,
+        document_frequencies={"communication": 90, "kubernetes": 5},
+    )
+    weights = {"communication": 2.0, "kubernetes": 2.0}
+    scaled = BM25Scorer(table).keyword_weights(weights)
+
+    assert sum(scaled.values()) == pytest.approx(sum(weights.values()))
+    assert scaled["kubernetes"] > scaled["communication"]
+
+
+def test_bm25_score_saturates_and_normalizes_length():
+    table = IDFTable(document_count=10, average_length=100.0, document_frequencies={"python": 2})
+    scorer = BM25Scorer(table, k1=1.2, b=0.75)
+
+    one, two, many = (scorer.score({"python": n}, 100, ["python"]) for n in (1, 2, 50))
+    assert 0 < one < two < many < table.idf("python") * (scorer.k1 + 1)
+    assert scorer.score({"python": 2}, 400, ["python"]) < two
+    assert scorer.score({}, 100, ["python"]) == 0
+
+
+def _session(client):
+    return next(client.app.dependency_overrides[get_db]())
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_job_endpoints_keep_corpus_current(client):
+    db = _session(client)
+    corpus.rebuild_job_corpus(db)
+    assert corpus.corpus_totals(db) == (0, 0)
+
+    job_ids = []
+    for description in ("Python and Docker engineer", "React developer", "Python data work"):
+        response = client.post(
+            "/api/v1/jobs/", json={"title": "Job", "description": description}
+        )
+        job_ids.append(response.json()["id"])
+    client.put(f"/api/v1/jobs/{job_ids[1]}", json={"description": "Go and Docker developer"})
+    client.delete(f"/api/v1/jobs/{job_ids[2]}")
+
+    db.expire_all()
+    incremental = (corpus.corpus_totals(db), _frequencies(db))
+    assert incremental[0][0] == 2
+
+    corpus.rebuild_job_corpus(db)
+    assert incremental == (corpus.corpus_totals(db), _frequencies(db))
+
+
+@pytest.mark.usefixtures("nltk_stopwords")
+def test_batch_reports_bm25_once_corpus_is_large_enough(client, monkeypatch):
+    executor = ATSExecutor(max_workers=1, start_method="fork")
+    monkeypatch.setattr(ats_pool, "_ats_executor", executor)
+
+    resume = client.post(
+        "/api/v1/resumes/", json={"title": "Jane", "content": "Python, Docker and SQL"}
+    ).json()
+    jobs = {"backend": "Python and Docker engineer", "frontend": "React and CSS developer"}
+    for title, description in jobs.items():
+        client.post("/api/v1/jobs/", json={"title": title, "description": description})
+    corpus.rebuild_job_corpus(_session(client))
+
+    try:
+        monkeypatch.setattr(settings, "ATS_CORPUS_MIN_DOCUMENTS", 3)
+        response = client.post("/api/v1/ats/batch", json={"resume_id": resume["id"]})
+        assert all(r["bm25_score"] is None for r in response.json()["results"])
+
+        monkeypatch.setattr(settings, "ATS_CORPUS_MIN_DOCUMENTS", 2)
+        response = client.post("/api/v1/ats/batch", json={"resume_id": resume["id"]})
+        scores = {r["title"]: r["bm25_score"] for r in response.json()["results"]}
+        assert scores["backend"] > scores["frontend"] == 0
+    finally:
+        executor.shutdown()
+
+
+API_PID = os.getpid()
+
+
+def _fake_job_analysis(text):
+    # Forked workers inherit this analyzer; the API process must not call it
+    assert os.getpid() != API_PID, "job description analyzed on the event loop"
+    return "technical", {"keywords": defaultdict(float, {word: 1.0 for word in text.split()})}, {}
+
+
+def _scorer_terms(scorer=None):
+    return sorted(scorer.idf_table.document_frequencies)
+
+
+def test_corpus_weighting_analyzes_new_jobs_in_the_pool(db, monkeypatch):
+    monkeypatch.setattr(ats_service.JOB_ANALYSIS_CACHE, "analyzer", _fake_job_analysis)
+    monkeypatch.setattr(settings, "ATS_CORPUS_MIN_DOCUMENTS", 1)
+    executor = ATSExecutor(max_workers=1, start_method="fork")
+    monkeypatch.setattr(ats_pool, "_ats_executor", executor)
+    corpus.rebuild(db, [({"python", "rust"}, 10)])
+
+    try:
+        terms = asyncio.run(ats_pool.run_ats_analysis(
+            _scorer_terms, (), ["python golang", "python golang"], db
+        ))
+        # The analysis computed in the pool was cached in the API process
+        assert ats_service.JOB_ANALYSIS_CACHE.peek("python golang") is not None
+    finally:
+        executor.shutdown()
+        ats_service.JOB_ANALYSIS_CACHE.clear()
+
+    assert terms == ["python"]
+    assert executor.metrics()["completed"] == 2
+
+
+def _failing_job_analysis(text):
+    raise LookupError("Resource stopwords not found")
+
+
+def _inline_job_analysis(text):
+    return "technical", {"keywords": defaultdict(float, {word: 1.0 for word in text.split()})}, {}
+
+
+def test_job_crud_survives_failed_corpus_update(client, monkeypatch):
+    db = _session(client)
+    corpus.rebuild_job_corpus(db)
+    monkeypatch.setattr(ats_service.JOB_ANALYSIS_CACHE, "analyzer", _failing_job_analysis)
+
+    response = client.post("/api/v1/jobs/", json={"title": "Job", "description": "Rust engineer"})
+    assert response.status_code == 201
+    job_id = response.json()["id"]
+    assert client.put(f"/api/v1/jobs/{job_id}", json={"description": "Go"}).status_code == 200
+    assert client.delete(f"/api/v1/jobs/{job_id}").status_code == 204
+
+    # The statistics are marked stale rather than left drifting
+    db.expire_all()
+    assert corpus.corpus_totals(db) is None
+
+
+def test_stale_corpus_is_rebuilt_on_next_job_write(client, monkeypatch):
+    from app.repositories.job import JobRepository
+
+    monkeypatch.setattr(ats_service.JOB_ANALYSIS_CACHE, "analyzer", _inline_job_analysis)
+    db = _session(client)
+    corpus.rebuild_job_corpus(db)
+
+    # Written without analysis, so the statistics are marked stale
+    JobRepository(db).create(obj_in={"title": "Job", "description": "python rust"})
+    assert corpus.corpus_totals(db) is None
+
+    client.post("/api/v1/jobs/", json={"title": "Job", "description": "python golang"})
+
+    db.expire_all()
+    assert corpus.corpus_totals(db)[0] == 2
+    assert _frequencies(db) == {"python": 2, "rust": 1, "golang": 1}
+    ats_service.JOB_ANALYSIS_CACHE.clear()
@@ -0,0 +1,73 @@
+from app.services.ats.keyword_matcher import KeywordAutomaton
+
+
+def _automaton(*patterns):
+    automaton = KeywordAutomaton()
+    for pattern in patterns:
+        automaton.add(pattern, pattern.split())
+    return automaton.build()
+
+
+def test_find_all_reports_positions_for_each_pattern():
+    automaton = _automaton("python", "machine learning", "docker")
+    tokens = "python engineer machine learning python docker".split()
+
+    assert automaton.find_all(tokens) == {
+        "python": [0, 4],
+        "machine learning": [2],
+        "docker": [5],
+    }
+
+
+def test_overlapping_and_nested_patterns_all_match():
+    automaton = _automaton("data", "data science", "science team", "big data science")
+    tokens = "big data science team".split()
+
+    matches = sorted(automaton.iter_matches(tokens))
+    assert matches == [
+        (0, "big data science"),
+        (1, "data"),
+        (1, "data science"),
+        (2, "science team"),
+    ]
+
+
+def test_failure_links_recover_partial_prefix():
+    automaton = _automaton("project management", "management tools")
+    tokens = "project project management tools".split()
+
+    assert automaton.find_all(tokens) == {
+        "project management": [1],
+        "management tools": [2],
+    }
+
+
+def test_no_matches_and_membership():
+    automaton = _automaton("kubernetes")
+
+    assert automaton.find_all("python flask".split()) == {}
+    assert "kubernetes" in automaton
+    assert len(automaton) == 1
+
+
+def test_patterns_added_after_build_are_recognised():
+    automaton = _automaton("python")
+    automaton.find_all(["python"])
+    automaton.add("python developer", ["python", "developer"])
+
+    assert automaton.find_all("python developer".split()) == {
+        "python": [0],
+        "python developer": [0],
+    }
+
+
+def test_find_crossing_only_reports_matches_spanning_the_split():
+    automaton = _automaton("python", "python developer", "senior python developer")
+    tokens = "senior python developer python".split()
+
+    assert automaton.max_length == 3
+    assert automaton.find_crossing(tokens, 2) == {
+        "python developer": [1],
+        "senior python developer": [0],
+    }
+    assert automaton.find_crossing(tokens, 3) == {}
@@ -0,0 +1,35 @@
+import numpy as np
+
+from app.services.ats.keyword_matrix import KeywordMatrix
+
+
+def test_rows_share_vocabulary():
+    matrix = KeywordMatrix([
+        {"python": 2.0, "docker": 1.0},
+        {"docker": 3.0, "sql": 1.5},
+    ])
+
+    assert matrix.terms == ["python", "docker", "sql"]
+    assert len(matrix) == 2
+    np.testing.assert_array_equal(
+        matrix.weights.toarray(),
+        [[2.0, 1.0, 0.0], [0.0, 3.0, 1.5]],
+    )
+    np.testing.assert_array_equal(matrix.indicator.toarray(), [[1, 1, 0], [0, 1, 1]])
+    np.testing.assert_array_equal(matrix.keyword_counts, [2, 2])
+
+
+def test_row_order_is_preserved():
+    matrix = KeywordMatrix([{"sql": 1.0}, {"python": 2.0, "sql": 0.5}])
+
+    assert [matrix.terms[c] for c in matrix.row_columns(1)] == ["python", "sql"]
+    np.testing.assert_array_equal(matrix.row_weights(1), [2.0, 0.5])
+
+
+def test_term_vector_products():
+    matrix = KeywordMatrix([{"python": 2.0, "docker": 1.0}, {"sql": 4.0}, {}])
+    present = matrix.term_vector({"python": 1.0, "kotlin": 1.0})
+
+    np.testing.assert_array_equal(present, [1.0, 0.0, 0.0])
+    np.testing.assert_array_equal(matrix.weights @ present, [2.0, 0.0, 0.0])
+    np.testing.assert_array_equal(matrix.keyword_counts, [2, 1, 0])
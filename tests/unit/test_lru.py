@@ -0,0 +1,44 @@
+from app.utils.lru import LRUCache
+
+
+def test_lookup_counts_hits_and_misses():
+    cache = LRUCache(max_size=4)
+
+    assert cache.lookup("a") is None
+    cache.put("a", 1)
+    assert cache.lookup("a") == 1
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 4}
+
+
+def test_put_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.lookup("a")
+    cache.put("c", 3)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_zero_size_caches_nothing():
+    cache = LRUCache(max_size=0)
+    calls = []
+
+    cache.get("a", lambda: calls.append(1))
+    cache.get("a", lambda: calls.append(1))
+
+    assert calls == [1, 1]
+    assert len(cache) == 0
+
+
+def test_pop_and_remove_where():
+    cache = LRUCache()
+    for key, owner in [("v1", "r1"), ("v2", "r1"), ("v3", "r2")]:
+        cache.put(key, (owner, key))
+
+    assert cache.pop("v1") == ("r1", "v1")
+    assert cache.pop("v1") is None
+    assert cache.remove_where(lambda key, value: value[0] == "r1") == 1
+    assert "v3" in cache and len(cache) == 1
@@ -0,0 +1,102 @@
+"""Tests for the lazy NLP resource registry."""
+import threading
+import time
+
+from app.core.nltk_init import NLP_REGISTRY, SPACY_RESOURCE, NLPRegistry
+
+
+def test_resource_loaded_on_first_use_only():
+    registry = NLPRegistry()
+    calls = []
+    registry.register("model", lambda: calls.append(1) or "loaded")
+
+    assert not registry.is_loaded("model")
+    assert calls == []
+
+    assert registry.get("model") == "loaded"
+    assert registry.get("model") == "loaded"
+    assert calls == [1]
+    assert registry.is_loaded("model")
+
+
+def test_concurrent_gets_load_once():
+    registry = NLPRegistry()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    registry.register("model", slow_loader)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("model")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_failed_load_is_recorded_and_not_retried():
+    registry = NLPRegistry()
+    calls = []
+
+    def failing_loader():
+        calls.append(1)
+        raise RuntimeError("model missing")
+
+    registry.register("model", failing_loader)
+
+    assert registry.get("model") is None
+    assert registry.get("model") is None
+    assert calls == [1]
+
+    (entry,) = registry.report()
+    assert entry["name"] == "model"
+    assert entry["available"] is False
+    assert "model missing" in entry["error"]
+
+
+def test_warm_up_reports_each_resource():
+    registry = NLPRegistry()
+    registry.register("stopwords", lambda: True)
+    registry.register("parser", lambda: False)
+    registry.register("unused", lambda: "never loaded")
+
+    loads = registry.warm_up(["stopwords", "parser"])
+
+    assert [load.name for load in loads] == ["stopwords", "parser"]
+    assert [load.available for load in loads] == [True, False]
+    assert all(load.seconds >= 0 for load in loads)
+    assert not registry.is_loaded("unused")
+
+
+def test_reset_forces_reload():
+    registry = NLPRegistry()
+    calls = []
+    registry.register("model", lambda: calls.append(1) or len(calls))
+
+    assert registry.get("model") == 1
+    registry.reset("model")
+    assert registry.report() == []
+    assert registry.get("model") == 2
+
+
+def test_importing_ats_service_does_not_load_spacy():
+    NLP_REGISTRY.reset(SPACY_RESOURCE)
+
+    import app.services.ats_service  # noqa: F401
+    from evaluation.evaluators.quality import TruthfulnessEvaluator
+    from app.services.integration.content_chunking import IntegratedContentChunker
+
+    TruthfulnessEvaluator()
+    IntegratedContentChunker()
+
+    assert not NLP_REGISTRY.is_loaded(SPACY_RESOURCE)
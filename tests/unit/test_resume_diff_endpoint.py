@@ -6,6 +6,8 @@ with patch("fastapi.templating.Jinja2Templates") as _templates:
     _templates.return_value = object()
     from app.api.api import app
     from app.api.endpoints import resumes
+    from app.services import diff_service
+    from app.services.diff.cache import DiffCache
 
 
 def test_resume_diff_endpoint_generates_html():
@@ -67,6 +69,9 @@ def test_resume_diff_endpoint_generates_html():
                 return QueryA()
             return QueryB()
 
+        def commit(self):
+            pass
+
     def override_db():
         yield DummySession()
 
@@ -76,7 +81,9 @@ def test_resume_diff_endpoint_generates_html():
     app.dependency_overrides[resumes.get_db] = override_db
     app.dependency_overrides[resumes.get_optional_current_user] = override_user
 
-    with patch.object(resumes, "DiffGenerator") as mock_gen:
+    with patch.object(resumes, "configured_diff_generator") as mock_gen, patch.object(
+        diff_service, "DIFF_CACHE", DiffCache()
+    ), patch.object(diff_service.settings, "DIFF_CACHE_PERSIST", False):
         mock_gen.return_value.html_diff_view.return_value = diff_html
         client = TestClient(app)
         resp = client.get(
@@ -88,3 +95,84 @@ def test_resume_diff_endpoint_generates_html():
         mock_gen.return_value.html_diff_view.assert_called_once_with("old", "new")
 
     app.dependency_overrides = {}
+
+
+def test_diff_document_endpoint_streams_html(client):
+    from app.services.diff_service import DiffGenerator, render_diff_html_document
+
+    resume = client.post("/api/v1/resumes/", json={"title": "R", "content": "# Skills\nPython\n"}).json()
+    source_id = resume["current_version"]["id"]
+    with patch.object(resumes, "DIFF_PRECOMPUTER"):
+        target = client.post(
+            f"/api/v1/resumes/{resume['id']}/versions",
+            json={"content": "# Skills\nPython, Go\n", "is_customized": True},
+        ).json()
+
+    with patch.object(diff_service, "DIFF_CACHE", DiffCache()):
+        resp = client.get(
+            f"/api/v1/resumes/{resume['id']}/diff/document",
+            params={"source_version_id": source_id, "target_version_id": target["id"]},
+        )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/html")
+    expected = DiffGenerator(backend=resumes.settings.DIFF_BACKEND).diff(
+        "# Skills\nPython\n", "# Skills\nPython, Go\n"
+    )
+    assert resp.text == render_diff_html_document(expected)
+
+    missing = client.get(
+        f"/api/v1/resumes/{resume['id']}/diff/document",
+        params={"source_version_id": source_id, "target_version_id": "nope"},
+    )
+    assert missing.status_code == 404
+
+
+def test_keyword_timeline_endpoint(client):
+    resume = client.post(
+        "/api/v1/resumes/", json={"title": "R", "content": "# Skills\nPython Django\n"}
+    ).json()
+    with patch.object(resumes, "DIFF_PRECOMPUTER"):
+        client.post(
+            f"/api/v1/resumes/{resume['id']}/versions",
+            json={"content": "# Skills\nPython Kubernetes\n", "is_customized": True},
+        )
+
+    resp = client.get(f"/api/v1/resumes/{resume['id']}/keywords/timeline")
+    assert resp.status_code == 200
+    timeline = resp.json()["versions"]
+    assert [entry["version_number"] for entry in timeline] == [1, 2]
+    assert timeline[1]["added_keywords"] == ["kubernetes"]
+    assert timeline[1]["removed_keywords"] == ["django"]
+    assert timeline[1]["is_customized"] is True
+
+    missing = client.get("/api/v1/resumes/nope/keywords/timeline")
+    assert missing.status_code == 404
+
+
+def test_diff_bundle_endpoint_streams_zip(client):
+    import io
+    import zipfile
+
+    resume = client.post("/api/v1/resumes/", json={"title": "R", "content": "# Skills\nPython\n"}).json()
+    source_id = resume["current_version"]["id"]
+    with patch.object(resumes, "DIFF_PRECOMPUTER"):
+        target = client.post(
+            f"/api/v1/resumes/{resume['id']}/versions",
+            json={"content": "# Skills\nPython, Go\n", "is_customized": True},
+        ).json()
+
+    resp = client.get(
+        f"/api/v1/resumes/{resume['id']}/diff/bundle",
+        params={"source_version_id": source_id, "target_version_id": target["id"]},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/zip"
+    assert "resume-diff-v1-v2.zip" in resp.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(resp.content)) as archive:
+        assert sorted(archive.namelist()) == [
+            "diff.md",
+            "diff_data.json",
+            "diff_output.html",
+            "diff_stats.json",
+            "side_by_side.json",
+        ]
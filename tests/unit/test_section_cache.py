@@ -0,0 +1,35 @@
+from app.services.ats.section_cache import SectionCache
+
+
+def test_get_computes_once_per_key():
+    cache = SectionCache(max_size=4)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get(("block", "abc"), compute) == 1
+    assert cache.get(("block", "abc"), compute) == 1
+    assert calls == [1]
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 4}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SectionCache(max_size=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+
+    assert cache.get("a", lambda: "recomputed") == 1
+    assert cache.get("b", lambda: "recomputed") == "recomputed"
+
+
+def test_clear_resets_entries_and_statistics():
+    cache = SectionCache()
+    cache.get("a", lambda: 1)
+    cache.clear()
+
+    assert cache.info()["size"] == 0
+    assert cache.info()["misses"] == 0
@@ -0,0 +1,187 @@
+"""
+Property tests: the vectorized scoring must match the scalar formulas exactly.
+
+The reference implementations below are the per-keyword loops the
+vectorized code replaced. Inputs are generated from seeded random number
+generators, so failures are reproducible.
+"""
+import math
+import random
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from app.services.ats import section_scoring
+from app.services.ats_service import (
+    SECTION_WEIGHTS,
+    calculate_calibrated_score,
+    calculate_section_scores,
+)
+from app.utils.tokenizer import tokenize
+
+WORDS = ["python", "sql", "docker", "aws", "react", "lead", "team", "data", "api", "go"]
+SECTION_NAMES = ["summary", "experience", "skills", "education", "projects", "unknown", "awards"]
+JOB_TYPES = list(SECTION_WEIGHTS) + ["unlisted"]
+SEEDS = range(200)
+
+
+def reference_section_scores(resume_sections, jd_elements, job_type):
+    section_scores = {}
+    section_weights = SECTION_WEIGHTS.get(job_type, SECTION_WEIGHTS['default'])
+    for section_name, section_content in resume_sections.items():
+        if section_name == "unknown":
+            continue
+        section_weight = section_weights.get(section_name, 1.0)
+        if not section_content.strip():
+            section_scores[section_name] = 0
+            continue
+        section_tokens = tokenize(section_content).tokens
+        section_text = ' '.join(section_tokens)
+        section_token_set = set(section_tokens)
+        matches = 0
+        total_keywords = 0
+        for keyword, weight in jd_elements['keywords'].items():
+            total_keywords += 1
+            if ' ' in keyword:
+                if keyword in section_text:
+                    matches += weight
+            else:
+                if keyword in section_token_set:
+                    matches += weight
+        if total_keywords > 0:
+            raw_score = (matches / total_keywords) * 100
+            weighted_score = raw_score * section_weight
+            section_scores[section_name] = min(round(weighted_score, 2), 100)
+        else:
+            section_scores[section_name] = 0
+    return section_scores
+
+
+def reference_calibrated_score(match_results, section_scores):
+    exact_match_score = 0
+    if match_results['total_job_keywords'] > 0:
+        raw_match_ratio = match_results['weighted_match_score'] / (match_results['total_job_keywords'] * 2)
+        exact_match_score = (1 / (1 + math.exp(-12 * (raw_match_ratio - 0.4)))) * 55
+    important_sections = ['experience', 'skills', 'education', 'summary']
+    covered_sections = sum(1 for section in important_sections if section in section_scores and section_scores[section] > 0)
+    section_coverage_score = (covered_sections / len(important_sections)) * 12
+    semantic_match_score = min(len(match_results['semantic_matches']) * 1.8, 18)
+    optimal_density = 5.0
+    density = match_results.get('keyword_density', 0)
+    if density <= optimal_density:
+        density_score = (density / optimal_density) * 10
+    else:
+        density_score = 10 - min(((density - optimal_density) / 7) * 10, 8)
+    high_value_keywords = sum(1 for kw in match_results.get('exact_matches', {})
+                              if kw in match_results.get('top_matching_keywords', [])[:5])
+    high_value_bonus = min(high_value_keywords * 1.5, 5)
+    raw_score = 30 + (
+        exact_match_score + semantic_match_score + section_coverage_score +
+        density_score + high_value_bonus
+    ) * 0.8
+    return max(0, min(100, raw_score))
+
+
+def random_keywords(rng):
+    keywords = defaultdict(float)
+    for _ in range(rng.randint(0, 25)):
+        term = " ".join(rng.sample(WORDS, rng.choice([1, 1, 1, 2, 3])))
+        keywords[term] = rng.choice([0.5, 1.0, 1.2, 1.5, 2.0, rng.uniform(0.1, 3.0)])
+    return keywords
+
+
+def random_sections(rng):
+    sections = {}
+    for name in rng.sample(SECTION_NAMES, rng.randint(0, len(SECTION_NAMES))):
+        if rng.random() < 0.15:
+            sections[name] = rng.choice(["", "   \n"])
+        else:
+            sections[name] = " ".join(rng.choice(WORDS + ["and", "built"]) for _ in range(rng.randint(1, 40)))
+    return sections
+
+
+def random_match_results(rng):
+    exact = [f"k{i}" for i in range(rng.randint(0, 10))]
+    total = rng.choice([0, rng.randint(1, 60)])
+    return {
+        'weighted_match_score': rng.uniform(0, 3) * total,
+        'total_job_keywords': total,
+        'semantic_matches': {f"s{i}": {} for i in range(rng.randint(0, 15))},
+        'keyword_density': rng.choice([0, 5.0, rng.uniform(0, 25)]),
+        'exact_matches': dict.fromkeys(exact),
+        'top_matching_keywords': rng.sample(exact + ["x", "y"], min(len(exact) + 2, 8)),
+    }
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_section_scores_match_scalar_formula(seed):
+    rng = random.Random(seed)
+    sections = random_sections(rng)
+    jd_elements = {'keywords': random_keywords(rng)}
+    job_type = rng.choice(JOB_TYPES)
+
+    expected = reference_section_scores(sections, jd_elements, job_type)
+    actual = calculate_section_scores(sections, jd_elements, job_type)
+    assert actual == expected
+    assert list(actual) == list(expected)
+    assert [type(score) for score in actual.values()] == [type(score) for score in expected.values()]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_calibrated_score_matches_scalar_formula(seed):
+    rng = random.Random(seed)
+    match_results = random_match_results(rng)
+    section_scores = {name: rng.choice([0, 0.0, 12.5, 100]) for name in rng.sample(SECTION_NAMES, 4)}
+
+    assert calculate_calibrated_score(match_results, section_scores) == reference_calibrated_score(
+        match_results, section_scores
+    )
+
+
+def test_batch_scoring_matches_single_scoring():
+    rng = random.Random(7)
+    for _ in range(50):
+        sections = random_sections(rng)
+        section_names = [name for name in sections if name != "unknown"]
+        contents = [sections[name] for name in section_names]
+        jobs = [random_keywords(rng) for _ in range(rng.randint(1, 6))]
+        job_types = [rng.choice(JOB_TYPES) for _ in jobs]
+
+        vocabulary = {}
+        for keywords in jobs:
+            for term in keywords:
+                vocabulary.setdefault(term, len(vocabulary))
+        presence = section_scoring.keyword_presence(contents, list(vocabulary))
+        totals = section_scoring.section_match_totals(
+            presence,
+            [np.array([vocabulary[term] for term in keywords], dtype=np.int64) for keywords in jobs],
+            [np.array(list(keywords.values())) for keywords in jobs],
+        )
+        batch = section_scoring.section_scores(
+            section_names,
+            contents,
+            totals,
+            [len(keywords) for keywords in jobs],
+            section_scoring.section_weight_matrix(job_types, section_names, SECTION_WEIGHTS),
+        )
+
+        for keywords, job_type, scores in zip(jobs, job_types, batch):
+            assert scores == reference_section_scores(sections, {'keywords': keywords}, job_type)
+
+        match_results = [random_match_results(rng) for _ in jobs]
+        features = [
+            section_scoring.calibration_features(results, scores)
+            for results, scores in zip(match_results, batch)
+        ]
+        assert section_scoring.calibrated_scores(features).tolist() == [
+            reference_calibrated_score(results, scores)
+            for results, scores in zip(match_results, batch)
+        ]
+
+
+def test_empty_inputs():
+    assert calculate_section_scores({}, {'keywords': {}}, "technical") == {}
+    assert calculate_section_scores({"skills": "python"}, {'keywords': {}}, "technical") == {"skills": 0}
+    assert section_scoring.section_match_totals(np.zeros((0, 2)), [], []).shape == (0, 2)
+    assert section_scoring.calibrated_scores(np.zeros((0, 6))).shape == (0,)
@@ -0,0 +1,47 @@
+import pytest
+
+from app.utils.skill_aliases import SKILL_ALIASES, SkillAliases, split_tokens
+
+
+def test_canonicalize_tokens_prefers_longest_alias():
+    aliases = SkillAliases({"node": ["node js"], "javascript": ["js"], "gcp": ["google cloud platform"]})
+
+    assert aliases.canonicalize_tokens(split_tokens("node.js and js on google cloud platform")) == [
+        "node", "and", "javascript", "on", "gcp",
+    ]
+    # A partial multi-token alias is left alone
+    assert aliases.canonicalize_tokens(["google", "cloud"]) == ["google", "cloud"]
+
+
+def test_canonical_term_requires_a_whole_alias():
+    assert SKILL_ALIASES.canonical_term("K8s") == "kubernetes"
+    assert SKILL_ALIASES.canonical_term("postgres") == "postgresql"
+    assert SKILL_ALIASES.canonical_term("ci cd") == "cicd"
+    assert SKILL_ALIASES.canonical_term("k8s operators") == "k8s operators"
+    assert SKILL_ALIASES.canonical_term("Python") == "python"
+
+
+def test_canonical_forms_are_fixed_points():
+    for canonical in SKILL_ALIASES.canonical_forms:
+        assert SKILL_ALIASES.canonical_term(canonical) == canonical
+        assert SKILL_ALIASES.canonicalize_tokens(split_tokens(canonical)) == list(split_tokens(canonical))
+
+
+def test_technical_terms_match_whole_tokens():
+    assert SKILL_ALIASES.mentions_technical_term("ui design")
+    assert SKILL_ALIASES.mentions_technical_term("k8s clusters")
+    assert SKILL_ALIASES.mentions_technical_term("ci/cd pipelines")
+    assert SKILL_ALIASES.mentions_technical_term("REST APIs")
+    assert not SKILL_ALIASES.mentions_technical_term("building")
+    assert not SKILL_ALIASES.mentions_technical_term("quarterly report")
+
+
+@pytest.mark.parametrize("aliases", [
+    {"k8s": ["kubernetes"], "kubernetes": ["kube"]},
+    {"node": ["nodejs"], "javascript": ["nodejs"]},
+    {"ml": ["machine learning"]},
+    {"Node": ["nodejs"]},
+])
+def test_invalid_tables_are_rejected(aliases):
+    with pytest.raises(ValueError):
+        SkillAliases(aliases)
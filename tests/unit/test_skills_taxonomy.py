@@ -0,0 +1,65 @@
+import pytest
+
+from app.services.ats.taxonomy import SKILLS_TAXONOMY, TAXONOMY_INDEX, SkillsTaxonomyIndex
+from app.utils.skill_aliases import SKILL_ALIASES
+
+
+def test_terms_include_categories_and_skills():
+    expected = set(SKILLS_TAXONOMY)
+    for skills in SKILLS_TAXONOMY.values():
+        expected.update(skills)
+
+    assert TAXONOMY_INDEX.terms == {SKILL_ALIASES.canonical_term(term) for term in expected}
+    assert "kubernetes" in TAXONOMY_INDEX
+    assert "underwater basket weaving" not in TAXONOMY_INDEX
+
+
+def test_terms_are_normalized_with_skill_aliases():
+    assert "node" in TAXONOMY_INDEX and "node.js" not in TAXONOMY_INDEX
+    assert "cicd" in TAXONOMY_INDEX and "ci/cd" not in TAXONOMY_INDEX
+    # "scikit-learn" and "sklearn" collapse into one skill
+    assert TAXONOMY_INDEX.related_categories("scikit learn") == ("python", "data_science")
+    assert TAXONOMY_INDEX.category_skills["javascript"].count("node") == 1
+    assert TAXONOMY_INDEX.related_categories("node") == ("javascript", "web_development")
+
+
+def test_related_categories_follow_taxonomy_order():
+    # "python" is a skill of programming, a category itself, then a data skill
+    assert TAXONOMY_INDEX.related_categories("python") == (
+        "programming",
+        "python",
+        "data_science",
+        "data_analysis",
+    )
+    assert TAXONOMY_INDEX.related_categories("docker") == ("devops", "cloud")
+    assert TAXONOMY_INDEX.related_categories("unknown") == ()
+
+
+def test_category_skills_and_is_category():
+    assert TAXONOMY_INDEX.category_skills["java"][0] == "spring"
+    assert TAXONOMY_INDEX.is_category("devops")
+    assert not TAXONOMY_INDEX.is_category("docker")
+
+
+def test_index_is_read_only():
+    index = SkillsTaxonomyIndex({"cloud": ["aws"]})
+
+    with pytest.raises(TypeError):
+        index.category_skills["new"] = ("x",)
+    with pytest.raises(AttributeError):
+        index.terms.add("x")
+
+
+def test_suggested_missing_keywords_keep_weight_order():
+    from app.services.ats_service import generate_enhanced_suggestions
+
+    # Non-taxonomy keywords outweighing recognised skills stay ahead of them
+    missing = ["stakeholder", "kubernetes", "roadmap", "docker", "budget", "terraform"]
+    match_results = {"top_missing_keywords": missing, "keyword_density": 5}
+
+    improvements = generate_enhanced_suggestions("", "", match_results, {}, "default")
+
+    assert improvements[0].category == "Missing Keywords"
+    assert improvements[0].suggestion.endswith(
+        "stakeholder, kubernetes, roadmap, docker, budget"
+    )
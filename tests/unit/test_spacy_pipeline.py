@@ -0,0 +1,59 @@
+import pytest
+
+spacy = pytest.importorskip("spacy")
+from spacy.language import Language
+
+from app.utils.spacy_pipeline import SpacyBatchExtractor, unused_components
+
+CALLS = []
+
+
+@Language.component("test_recorder")
+def _recorder(doc):
+    CALLS.append(doc.text)
+    return doc
+
+
+@pytest.fixture
+def nlp():
+    CALLS.clear()
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("test_recorder")
+    return nlp
+
+
+def _token_count(doc):
+    return len(doc)
+
+
+def test_unused_components(nlp):
+    assert unused_components(nlp, {"sentencizer"}) == ["test_recorder"]
+
+
+def test_disabled_components_do_not_run(nlp):
+    extractor = SpacyBatchExtractor(nlp, _token_count, {"sentencizer"})
+
+    assert extractor.extract(["one two", "three"]) == [2, 1]
+    assert CALLS == []
+
+
+def test_results_are_cached_by_text(nlp):
+    extractor = SpacyBatchExtractor(nlp, _token_count, {"sentencizer", "test_recorder"})
+
+    assert extractor.extract(["a b c", "a b c", "d"]) == [3, 3, 1]
+    assert CALLS == ["a b c", "d"]
+
+    assert extractor.extract(["d", "e f"]) == [1, 2]
+    assert CALLS == ["a b c", "d", "e f"]
+
+
+def test_cache_size_bounds_entries(nlp):
+    extractor = SpacyBatchExtractor(
+        nlp, _token_count, {"sentencizer", "test_recorder"}, cache_size=1
+    )
+
+    extractor.extract(["a", "b"])
+    extractor.extract(["a"])
+
+    assert CALLS == ["a", "b", "a"]
@@ -0,0 +1,60 @@
+from app.utils.tokenizer import clear_tokenizer_cache, text_fingerprint, tokenize
+
+
+def test_content_tokens_strip_noise_and_short_tokens():
+    text = "Built APIs (REST) with Python, see https://example.com [link] on AWS"
+
+    assert tokenize(text).tokens == ("built", "apis", "with", "python", "see", "aws")
+
+
+def test_content_tokens_canonicalize_skill_aliases():
+    text = "Ran K8s and Node.js services\nCI/CD on Google Cloud Platform"
+
+    assert tokenize(text).line_tokens() == [
+        ("ran", "kubernetes", "and", "node", "services"),
+        ("cicd", "gcp"),
+    ]
+
+
+def test_words_keep_every_word_run():
+    assert tokenize("C++ and node.js, k8s").words == ("c", "and", "node", "js", "k8s")
+
+
+def test_line_tokens_follow_source_lines():
+    text = "Requirements\n- Python, Flask\n\nDocker"
+
+    assert tokenize(text).line_tokens() == [
+        ("requirements",),
+        ("python", "flask"),
+        (),
+        ("docker",),
+    ]
+
+
+def test_ngram_counts_skip_stopwords_in_phrases():
+    stop_words = frozenset({"and"})
+    counts = tokenize("python and flask python flask").ngram_counts(stop_words)
+
+    assert counts["python"] == 2
+    assert counts["python flask"] == 1
+    assert counts["flask python"] == 1
+    assert "python and" not in counts
+    assert "and" not in counts  # shorter than the minimum n-gram length
+
+
+def test_word_phrases_only_return_alphabetic_runs_present_in_text():
+    phrases = tokenize("machine  learning for k8s clusters").word_phrases(2, 2)
+
+    # "machine learning" is not verbatim in the text (double space)
+    assert phrases == ["learning for"]
+
+
+def test_tokenize_is_memoized_by_content():
+    clear_tokenizer_cache()
+    first = tokenize("Senior Python Engineer")
+
+    assert tokenize("Senior Python Engineer") is first
+    assert first.fingerprint == text_fingerprint("Senior Python Engineer")
+
+    clear_tokenizer_cache()
+    assert tokenize("Senior Python Engineer") is not first